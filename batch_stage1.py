@@ -0,0 +1,278 @@
+"""
+Stage1 배치 실행 - InputState JSONL의 여러 주제를 한 프로세스에서 동시에 실행
+
+모든 실행이 프로세스 전역 모델 풀(utils.model_factory)과 모델별 rate limiter(utils.rate_limiter)를
+공유하므로, 실행 수와 관계없이 LLM 동시 호출 수 / 분당 한도는 rate_limits 설정 하나로 제어된다.
+
+output_dir 구성:
+    manifest.json        실행별 상태 / 그래프 경로 / 통계 요약 (실행이 끝날 때마다 갱신)
+    graphs/<run_id>.json 완료된 실행의 CharacterNetwork
+    checkpoints.sqlite   진행 중인 실행의 checkpoint (완료되면 삭제)
+    llm_responses.sqlite --cache-responses일 때 재개용 응답 캐시 (모든 실행이 완료되면 삭제)
+
+같은 output_dir로 다시 실행하면 완료된 실행은 건너뛰고, 실패 / 중단된 실행은 마지막 checkpoint부터 재개한다.
+
+입력 JSONL 한 줄 = InputState 필드 (topic, conflict, vibe, max_iterations, model, extractor_type).
+"id"가 있으면 run_id로 사용하고, 없으면 줄 번호와 내용 해시로 만든다.
+
+실행:
+    python batch_stage1.py topics.jsonl --output batch_runs/nightly --concurrency 8
+    python batch_stage1.py topics.jsonl --output batch_runs/nightly --llm-concurrency 16 --graph-format .cnet
+    python batch_stage1.py topics.jsonl --output batch_runs/nightly --graph-offload process
+    python batch_stage1.py topics.jsonl --output batch_runs/nightly --cache-responses
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import time
+from contextlib import nullcontext
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from langchain_core.runnables import RunnableConfig
+
+from character_network import BINARY_SNAPSHOT_EXTENSION
+from states.stage1_states import InputState
+from utils.checkpointer import create_checkpointer
+from utils.graph_offload import OFFLOAD_MODES
+from utils.response_cache import enable_response_cache
+from workflow_stage1 import arun_workflow
+
+MANIFEST_FILENAME = "manifest.json"
+CHECKPOINT_FILENAME = "checkpoints.sqlite"
+RESPONSE_CACHE_FILENAME = "llm_responses.sqlite"
+GRAPH_FORMATS = (".json", BINARY_SNAPSHOT_EXTENSION)
+
+
+def load_batch(path: str) -> List[Tuple[str, Dict[str, Any]]]:
+    """
+    JSONL에서 (run_id, InputState 필드) 목록 로드
+
+    Raises:
+        ValueError: JSON / InputState 검증 실패 또는 run_id 중복 (줄 번호 포함)
+    """
+    runs = []
+    seen = set()
+    with open(path, "r", encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                run_id = str(record.pop("id", "") or "")
+                InputState(**record)
+            except Exception as e:
+                raise ValueError(f"{path}:{line_number} 잘못된 입력: {e}") from e
+            if not run_id:
+                digest = hashlib.sha1(
+                    json.dumps(record, ensure_ascii=False, sort_keys=True).encode()
+                ).hexdigest()[:8]
+                run_id = f"{line_number:04d}-{digest}"
+            if run_id in seen:
+                raise ValueError(f"{path}:{line_number} 중복된 id: {run_id}")
+            seen.add(run_id)
+            runs.append((run_id, record))
+    return runs
+
+
+# ============ Manifest ============
+def load_manifest(output_dir: str) -> Dict[str, Any]:
+    """output_dir의 manifest (없으면 빈 manifest)"""
+    path = os.path.join(output_dir, MANIFEST_FILENAME)
+    if not os.path.exists(path):
+        return {"runs": {}}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _write_manifest(output_dir: str, manifest: Dict[str, Any]):
+    """중간에 종료돼도 manifest가 깨지지 않도록 임시 파일에 쓴 뒤 교체"""
+    path = os.path.join(output_dir, MANIFEST_FILENAME)
+    manifest["updated_at"] = datetime.now().isoformat(timespec="seconds")
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    os.replace(path + ".tmp", path)
+
+
+def _is_completed(output_dir: str, entry: Optional[Dict[str, Any]]) -> bool:
+    return bool(
+        entry
+        and entry.get("status") == "completed"
+        and os.path.exists(os.path.join(output_dir, entry["graph_path"]))
+    )
+
+
+# ============ 실행 ============
+async def _run_one(
+    run_id: str,
+    record: Dict[str, Any],
+    output_dir: str,
+    graph_format: str,
+    checkpointer,
+    config: RunnableConfig,
+    metrics_dir: Optional[str],
+) -> Dict[str, Any]:
+    """실행 하나를 시작 / 재개하고 그래프를 저장한 뒤 manifest 항목 반환 (예외는 failed 항목으로)"""
+    start = time.perf_counter()
+    try:
+        result = await arun_workflow(
+            record,
+            run_id,
+            checkpointer=checkpointer,
+            config=config,
+            metrics_dir=metrics_dir,
+        )
+    except Exception as e:
+        return {
+            "status": "failed",
+            "topic": record.get("topic"),
+            "error": f"{type(e).__name__}: {e}",
+            "seconds": time.perf_counter() - start,
+        }
+
+    graph_path = os.path.join("graphs", f"{run_id}{graph_format}")
+    result["graph"].save_to_file(os.path.join(output_dir, graph_path))
+    # 결과 파일과 manifest가 정본이므로 완료된 실행의 checkpoint는 정리
+    await checkpointer.adelete_thread(run_id)
+    return {
+        "status": "completed",
+        "topic": record.get("topic"),
+        "graph_path": graph_path,
+        "stats": result["graph"].get_statistics(),
+        "failed_branches": len(result.get("failed_branches") or []),
+        "seconds": time.perf_counter() - start,
+    }
+
+
+async def arun_batch(
+    input_path: str,
+    output_dir: str,
+    concurrency: int = 4,
+    config: Optional[RunnableConfig] = None,
+    graph_format: str = ".json",
+    cache_responses: bool = False,
+    metrics_dir: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    JSONL의 Stage1 실행들을 최대 concurrency개씩 동시에 실행하고 manifest 반환
+
+    Args:
+        input_path: InputState JSONL 경로
+        output_dir: 그래프 / manifest / checkpoint 저장 디렉토리 (재개 시 같은 경로 사용)
+        concurrency: 동시에 진행할 실행 수
+        config: 모든 실행에 공통으로 전달할 config (rate_limits 등 configurable 옵션)
+        graph_format: 결과 그래프 포맷 (".json" 또는 ".cnet")
+        cache_responses: 응답 캐시가 꺼져 있으면 output_dir의 배치 전용 캐시를 readwrite로 켜서
+            재개 시 끝난 LLM 호출을 재생 (run_workflow 참고). 모든 실행이 완료되면 캐시 파일을 삭제
+        metrics_dir: 지정하면 실행별 LLM 호출 요약 저장 (utils.instrumentation)
+    """
+    if graph_format not in GRAPH_FORMATS:
+        raise ValueError(f"지원하지 않는 graph_format: {graph_format}. 지원: {GRAPH_FORMATS}")
+    if concurrency < 1:
+        raise ValueError("concurrency는 1 이상이어야 합니다")
+    if (config or {}).get("configurable", {}).get("graph_journal_path"):
+        # 모든 실행의 연산이 한 저널에 섞이므로 실행별 기본 경로(thread_id 포함)를 사용해야 함
+        raise ValueError("배치 실행에서는 graph_journal_path를 공유할 수 없습니다")
+
+    runs = load_batch(input_path)
+    os.makedirs(os.path.join(output_dir, "graphs"), exist_ok=True)
+    manifest = load_manifest(output_dir)
+    manifest["input"] = os.path.abspath(input_path)
+    entries = manifest["runs"]
+
+    pending = [
+        (run_id, record)
+        for run_id, record in runs
+        if not _is_completed(output_dir, entries.get(run_id))
+    ]
+    skipped = len(runs) - len(pending)
+    if skipped:
+        print(f"완료된 실행 {skipped}개 건너뜀, 남은 실행 {len(pending)}개")
+
+    checkpointer = create_checkpointer(os.path.join(output_dir, CHECKPOINT_FILENAME))
+    semaphore = asyncio.Semaphore(concurrency)
+    done = [skipped]
+
+    async def worker(run_id: str, record: Dict[str, Any]):
+        async with semaphore:
+            entry = await _run_one(
+                run_id,
+                record,
+                output_dir,
+                graph_format,
+                checkpointer,
+                config,
+                metrics_dir,
+            )
+        entries[run_id] = entry
+        done[0] += 1
+        _write_manifest(output_dir, manifest)
+        print(f"[{done[0]}/{len(runs)}] {run_id} {entry['status']} ({entry['seconds']:.1f}s)")
+
+    cache_path = os.path.join(output_dir, RESPONSE_CACHE_FILENAME)
+    try:
+        with enable_response_cache(path=cache_path) if cache_responses else nullcontext():
+            await asyncio.gather(*(worker(run_id, record) for run_id, record in pending))
+    finally:
+        checkpointer.close()
+
+    manifest["summary"] = {
+        "total": len(runs),
+        "completed": sum(_is_completed(output_dir, entries.get(run_id)) for run_id, _ in runs),
+        "failed": sum(entries.get(run_id, {}).get("status") == "failed" for run_id, _ in runs),
+    }
+    _write_manifest(output_dir, manifest)
+    if manifest["summary"]["completed"] == len(runs) and os.path.exists(cache_path):
+        # 재개할 실행이 없으므로 재생용 응답도 필요 없음 (다음 배치에 이전 응답이 재생되지 않게 삭제)
+        os.remove(cache_path)
+    return manifest
+
+
+def run_batch(input_path: str, output_dir: str, **kwargs) -> Dict[str, Any]:
+    """arun_batch의 동기 진입점"""
+    return asyncio.run(arun_batch(input_path, output_dir, **kwargs))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("input", help="InputState JSONL 경로")
+    parser.add_argument("--output", required=True, help="결과 / manifest / checkpoint 디렉토리")
+    parser.add_argument("--concurrency", type=int, default=4, help="동시에 진행할 실행 수")
+    parser.add_argument(
+        "--llm-concurrency", type=int, default=None, help="모든 실행이 공유하는 모델별 최대 동시 LLM 호출 수"
+    )
+    parser.add_argument("--graph-format", default=".json", choices=GRAPH_FORMATS)
+    parser.add_argument("--metrics-dir", default=None, help="실행별 LLM 호출 요약 저장 경로")
+    parser.add_argument(
+        "--graph-offload",
+        default=None,
+        choices=OFFLOAD_MODES,
+        help="그래프 변경 / 저장을 전용 스레드 또는 워커 프로세스에서 실행 (utils.graph_offload)",
+    )
+    parser.add_argument(
+        "--cache-responses",
+        action="store_true",
+        help="재개 시 끝난 LLM 호출을 재생하도록 output_dir에 배치 전용 응답 캐시 사용",
+    )
+    args = parser.parse_args()
+
+    configurable: Dict[str, Any] = {}
+    if args.llm_concurrency:
+        configurable["rate_limits"] = {"default": {"max_concurrency": args.llm_concurrency}}
+    if args.graph_offload:
+        configurable["graph_offload"] = args.graph_offload
+    batch_config = {"configurable": configurable} if configurable else None
+    result = run_batch(
+        args.input,
+        args.output,
+        concurrency=args.concurrency,
+        config=batch_config,
+        graph_format=args.graph_format,
+        cache_responses=args.cache_responses,
+        metrics_dir=args.metrics_dir,
+    )
+    summary = result["summary"]
+    print(f"\n완료 {summary['completed']}/{summary['total']}, 실패 {summary['failed']}")
@@ -0,0 +1,3 @@
+"""
+벤치마크 스크립트 모음 (LLM 호출 없이 로컬에서 실행)
+"""
@@ -0,0 +1,237 @@
+"""
+Stage1 / 플롯 v2 파이프라인 벤치마크 - Fake LLM(utils.fake_llm)으로 파이프라인 자체의 오버헤드 측정
+
+- stage1: build_workflow()로 scale개 주제를 한 번에 batch 실행
+  (Stage1은 빈 그래프에서 시작하고 한 실행의 크기가 스키마 개수 제한으로 정해지므로 주제 수로 규모를 키움)
+- plot: workflow_plot_v2.plot을 scale × 10명 캐릭터의 합성 그래프로 실행
+
+규모별로 처리량(LLM 호출 / 생성 노드 per sec), 최대 메모리(tracemalloc), 노드별 누적 시간을 출력한다.
+
+실행:
+    python -m benchmarks.pipeline_benchmark --scales 1 10 100
+    python -m benchmarks.pipeline_benchmark --workflows plot --latency 0.05 --top 5
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+from benchmarks.synthetic_graph import build_synthetic_graph
+from utils.fake_llm import configure_fake_llm
+from utils.instrumentation import record_run
+
+WORKFLOWS = ("stage1", "plot")
+PLOT_CHARACTERS_PER_SCALE = 10
+TOPICS = ["권력의 본질", "기억과 망각", "구원의 대가", "배신의 계보", "질서와 자유"]
+
+
+class NodeTimer(BaseCallbackHandler):
+    """그래프 노드별 누적 실행 시간 (서브그래프 노드는 "부모/노드" 경로로 구분)"""
+
+    def __init__(self):
+        super().__init__()
+        self._lock = threading.Lock()
+        self._started: Dict[UUID, tuple] = {}
+        self.totals: Dict[str, Dict[str, float]] = {}
+
+    def on_chain_start(
+        self,
+        serialized: Optional[Dict[str, Any]],
+        inputs: Any,
+        *,
+        run_id: UUID,
+        metadata: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> None:
+        node = (metadata or {}).get("langgraph_node")
+        # 노드 안의 Runnable도 같은 metadata를 물려받으므로 노드 자체의 run만 측정
+        if node is None or kwargs.get("name") != node:
+            return
+        namespace = metadata.get("langgraph_checkpoint_ns", node)
+        path = "/".join(part.split(":")[0] for part in namespace.split("|"))
+        with self._lock:
+            self._started[run_id] = (path, time.perf_counter())
+
+    def _finish(self, run_id: UUID):
+        with self._lock:
+            started = self._started.pop(run_id, None)
+            if started is None:
+                return
+            path, start = started
+            totals = self.totals.setdefault(path, {"calls": 0, "seconds": 0.0})
+            totals["calls"] += 1
+            totals["seconds"] += time.perf_counter() - start
+
+    def on_chain_end(self, outputs: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        self._finish(run_id)
+
+    def on_chain_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        self._finish(run_id)
+
+
+@contextmanager
+def _working_dir(path: str):
+    """saved_graphs / saved_plots 출력이 저장소에 쌓이지 않도록 임시 디렉토리에서 실행"""
+    previous = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
+
+def _stage1_inputs(scale: int, iterations: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            "topic": f"{TOPICS[index % len(TOPICS)]} {index}",
+            "conflict": "개인과 집단",
+            "vibe": "어둡고 냉소적",
+            "max_iterations": iterations,
+            "model": "fake",
+        }
+        for index in range(scale)
+    ]
+
+
+def _plot_inputs(scale: int, tmp_dir: str) -> List[Dict[str, Any]]:
+    graph = build_synthetic_graph(characters=scale * PLOT_CHARACTERS_PER_SCALE)
+    path = os.path.join(tmp_dir, f"plot_graph_{scale}.json")
+    graph.save_to_file(path)
+    return [
+        {
+            "graph_filepath": path,
+            "topic": graph.topic,
+            "conflict": "개인과 집단",
+            "vibe": "어둡고 냉소적",
+            "model": "fake",
+        }
+    ]
+
+
+def _run_once(app, inputs: List[Dict[str, Any]], config: Dict[str, Any], use_async: bool):
+    if use_async:
+        return asyncio.run(app.abatch(inputs, config))
+    return app.batch(inputs, config)
+
+
+def measure(
+    workflow: str,
+    scale: int,
+    iterations: int = 1,
+    use_async: bool = False,
+    memory: bool = True,
+) -> Dict[str, Any]:
+    """workflow 하나를 scale 규모로 실행하고 처리량 / 메모리 / 노드별 시간 반환"""
+    from workflow_plot_v2 import plot
+    from workflow_stage1 import build_workflow
+
+    app = build_workflow() if workflow == "stage1" else plot
+    with tempfile.TemporaryDirectory() as tmp_dir, _working_dir(tmp_dir):
+        if workflow == "stage1":
+            inputs = _stage1_inputs(scale, iterations)
+        else:
+            inputs = _plot_inputs(scale, tmp_dir)
+
+        timer = NodeTimer()
+        config = {"callbacks": [timer], "max_concurrency": max(len(inputs), 1)}
+        with record_run(f"{workflow}-{scale}") as recorder:
+            start = time.perf_counter()
+            results = _run_once(app, inputs, config, use_async)
+            seconds = time.perf_counter() - start
+
+        peak_mb = None
+        if memory:
+            # tracemalloc은 실행을 느리게 하므로 시간 측정과 별도로 한 번 더 실행
+            tracemalloc.start()
+            try:
+                _run_once(app, inputs, {"max_concurrency": config["max_concurrency"]}, use_async)
+                peak_mb = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+            finally:
+                tracemalloc.stop()
+
+    graph_nodes = sum(len(result["graph"].nodes) for result in results)
+    calls = recorder.summary()["totals"]["calls"]
+    return {
+        "workflow": workflow,
+        "scale": scale,
+        "runs": len(inputs),
+        "graph_nodes": graph_nodes,
+        "seconds": seconds,
+        "llm_calls": calls,
+        "calls_per_sec": calls / seconds if seconds else 0.0,
+        "nodes_per_sec": graph_nodes / seconds if seconds else 0.0,
+        "peak_mb": peak_mb,
+        "node_times": timer.totals,
+    }
+
+
+def run(
+    workflows,
+    scales,
+    iterations: int = 1,
+    latency: float = 0.0,
+    use_async: bool = False,
+    memory: bool = True,
+    top: int = 8,
+    output: Optional[str] = None,
+):
+    configure_fake_llm(seed=0, latency=latency)
+    results = []
+    print(
+        f"{'workflow':>8} {'scale':>6} {'runs':>5} {'nodes':>8} {'sec':>8} "
+        f"{'calls':>7} {'calls/s':>9} {'nodes/s':>9} {'peak MB':>8}"
+    )
+    for workflow in workflows:
+        for scale in scales:
+            result = measure(workflow, scale, iterations, use_async, memory)
+            results.append(result)
+            peak = f"{result['peak_mb']:>8.1f}" if result["peak_mb"] is not None else f"{'-':>8}"
+            print(
+                f"{workflow:>8} {scale:>6} {result['runs']:>5} {result['graph_nodes']:>8} "
+                f"{result['seconds']:>8.2f} {result['llm_calls']:>7} "
+                f"{result['calls_per_sec']:>9.1f} {result['nodes_per_sec']:>9.1f} {peak}"
+            )
+
+    for result in results:
+        print(f"\n--- {result['workflow']} x{result['scale']} 노드별 누적 시간 (상위 {top}) ---")
+        ranked = sorted(result["node_times"].items(), key=lambda item: -item[1]["seconds"])
+        for path, totals in ranked[:top]:
+            print(f"{path:<60} {totals['calls']:>6} {totals['seconds'] * 1000:>10.1f} ms")
+
+    if output:
+        with open(output, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workflows", nargs="+", default=list(WORKFLOWS), choices=WORKFLOWS)
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--iterations", type=int, default=1, help="Stage1 max_iterations")
+    parser.add_argument("--latency", type=float, default=0.0, help="Fake LLM 호출당 지연(초)")
+    parser.add_argument("--async", dest="use_async", action="store_true", help="abatch로 실행")
+    parser.add_argument("--no-memory", dest="memory", action="store_false", help="tracemalloc 측정 생략")
+    parser.add_argument("--top", type=int, default=8, help="출력할 노드 수")
+    parser.add_argument("--output", default=None, help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+    run(
+        args.workflows,
+        args.scales,
+        args.iterations,
+        args.latency,
+        args.use_async,
+        args.memory,
+        args.top,
+        args.output,
+    )
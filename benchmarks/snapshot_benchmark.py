@@ -0,0 +1,50 @@
+"""
+CharacterNetwork 저장/로드 벤치마크 - JSON vs 바이너리 스냅샷(.cnet)
+
+실행:
+    python -m benchmarks.snapshot_benchmark --sizes 10 100 500
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from benchmarks.synthetic_graph import build_synthetic_graph
+from character_network import BINARY_SNAPSHOT_EXTENSION, CharacterNetwork
+
+
+def _best_of(repeat: int, func) -> float:
+    """repeat번 실행 중 최소 시간(ms)"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def run(sizes, repeat: int = 3):
+    print(
+        f"{'chars':>6} {'nodes':>8} {'format':>7} {'save ms':>9} {'load ms':>9} {'size KB':>9}"
+    )
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for characters in sizes:
+            graph = build_synthetic_graph(characters=characters)
+            for extension in (".json", BINARY_SNAPSHOT_EXTENSION):
+                path = os.path.join(tmp_dir, f"graph_{characters}{extension}")
+                save_ms = _best_of(repeat, lambda: graph.save_to_file(path))
+                load_ms = _best_of(repeat, lambda: CharacterNetwork.load_from_file(path))
+                size_kb = os.path.getsize(path) / 1024
+                print(
+                    f"{characters:>6} {len(graph.nodes):>8} {extension:>7} "
+                    f"{save_ms:>9.1f} {load_ms:>9.1f} {size_kb:>9.1f}"
+                )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 500])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    run(args.sizes, args.repeat)
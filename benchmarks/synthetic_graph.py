@@ -0,0 +1,47 @@
+"""
+벤치마크용 합성 CharacterNetwork 생성
+"""
+
+import random
+
+from character_network import CharacterNetwork
+
+
+def build_synthetic_graph(
+    characters: int = 50,
+    infos_per_character: int = 10,
+    placeholders_per_event: int = 2,
+    seed: int = 0,
+) -> CharacterNetwork:
+    """Stage1 결과와 비슷한 모양의 그래프 생성
+
+    캐릭터마다 Info를 만들고, Info마다 Event 하나와 PlaceHolder 여러 개를 연결한다.
+    """
+    rng = random.Random(seed)
+    roles = [f"(역할 {index})" for index in range(max(characters, 1) * 2)]
+    graph = CharacterNetwork("합성 그래프")
+
+    for char_index in range(characters):
+        char_id = graph.add_character(role=f"(인물 {char_index})", created_at=0)
+        for info_index in range(infos_per_character):
+            info_id = graph.add_info(
+                info_type=rng.choice(["desire", "fear", "trauma", "secret"]),
+                content=f"{char_index}번 인물의 {info_index}번째 속성 " * 3,
+                owner_id=char_id,
+                created_at=0,
+            )
+            graph.connect_nodes(info_id, char_id)
+
+            placeholder_roles = rng.sample(roles, placeholders_per_event)
+            event_id = graph.add_event(
+                summary=" 그리고 ".join(placeholder_roles) + "와(과) 얽힌 사건",
+                target_info_type="desire",
+                owner_id=char_id,
+                created_at=0,
+            )
+            graph.connect_nodes(info_id, event_id)
+            for role in placeholder_roles:
+                ph_id = graph.add_placeholder(role=role, owner_id=event_id, created_at=0)
+                graph.connect_nodes(event_id, ph_id)
+
+    return graph
@@ -10,9 +10,14 @@ Info와 PlaceHolder 노드 타입을 포함한 캐릭터 관계망
 """
 import os
 import json
-from dataclasses import dataclass, field
+import re
+import struct
+import sys
+from array import array
+from collections.abc import Set as AbstractSet
+from contextlib import contextmanager
 from enum import Enum
-from typing import Any, Dict, List, Optional, Set, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 
 class NodeType(Enum):
@@ -22,30 +27,132 @@ class NodeType(Enum):
     PLACEHOLDER = "placeholder"
 
 
-@dataclass
+# 인접 배열 column 위치 (NodeType → 정수)
+_TYPE_ORDINAL = {node_type: ordinal for ordinal, node_type in enumerate(NodeType)}
+_ORDINAL_TYPE = list(NodeType)
+
+# 바이너리 스냅샷 포맷 (save_to_file / load_from_file에서 확장자로 선택)
+BINARY_SNAPSHOT_EXTENSION = ".cnet"
+_SNAPSHOT_MAGIC = b"CNET"
+_SNAPSHOT_VERSION = 1
+_SNAPSHOT_PREAMBLE = struct.Struct("<4sHH")  # magic, version, reserved
+_SNAPSHOT_LENGTH = struct.Struct("<I")
+
+
+class EdgeView(AbstractSet):
+    """Node.edges 호환 뷰 - 네트워크의 정수 인접 배열을 노드 ID 집합처럼 노출 (읽기 전용)"""
+
+    __slots__ = ("_network", "_index")
+
+    def __init__(self, network: Optional["CharacterNetwork"], index: int):
+        self._network = network
+        self._index = index
+
+    def _arrays(self) -> Iterator[array]:
+        if self._network is None:
+            return
+        for column in self._network._adjacency:
+            neighbors = column[self._index]
+            if neighbors:
+                yield neighbors
+
+    def __iter__(self) -> Iterator[str]:
+        slots = self._network._slots if self._network is not None else ()
+        for neighbors in self._arrays():
+            for neighbor_index in neighbors:
+                yield slots[neighbor_index].id
+
+    def __len__(self) -> int:
+        return sum(len(neighbors) for neighbors in self._arrays())
+
+    def __contains__(self, node_id: object) -> bool:
+        if self._network is None:
+            return False
+        other = self._network.nodes.get(node_id)
+        if other is None:
+            return False
+        neighbors = self._network._adjacency[_TYPE_ORDINAL[other.type]][self._index]
+        return neighbors is not None and other._index in neighbors
+
+    def __repr__(self) -> str:
+        return "{" + ", ".join(repr(node_id) for node_id in self) + "}"
+
+
 class Node:
-    """모든 노드의 기본 클래스"""
+    """모든 노드의 기본 클래스
+
+    __slots__ 기반 경량 객체. 연결 정보는 노드가 아니라 CharacterNetwork의
+    정수 인접 배열에 저장되며, edges는 이를 노드 ID 집합처럼 보여주는 읽기 전용 뷰다.
+    """
+
+    __slots__ = ("id", "type", "data", "_index", "_network")
+
+    def __init__(
+        self,
+        id: str,
+        type: NodeType,
+        data: Optional[Dict[str, Any]] = None,
+        _index: int = -1,
+        _network: Optional["CharacterNetwork"] = None,
+    ):
+        self.id = id
+        self.type = type
+        self.data = data if data is not None else {}
+        self._index = _index
+        self._network = _network
 
-    id: str
-    type: NodeType
-    data: Dict[str, Any] = field(default_factory=dict)
-    edges: Set[str] = field(default_factory=set)
+    @property
+    def edges(self) -> EdgeView:
+        return EdgeView(self._network, self._index)
+
+    def __repr__(self) -> str:
+        return f"Node(id={self.id!r}, type={self.type}, data={self.data!r}, edges={self.edges!r})"
 
 
 class CharacterNetwork:
-    """Info와 PlaceHolder를 지원하는 캐릭터 네트워크"""
+    """Info와 PlaceHolder를 지원하는 캐릭터 네트워크
+
+    저장 구조:
+    - nodes: 노드 ID → Node (기존 인터페이스 유지)
+    - _slots: 정수 인덱스 → Node (삭제된 자리는 None, _free_slots로 재사용)
+    - _adjacency: 이웃 타입별 column. _adjacency[타입][노드 인덱스] = 이웃 인덱스 array("I")
+    인덱스:
+    - _type_index: 타입별 노드 ID (삽입 순서 유지)
+    - _edge_count: 현재 (무방향) 연결 수
+    모든 값은 add_node / connect_nodes / remove_node / merge_nodes에서 함께 갱신되므로
+    노드 제거는 O(degree), 타입별 이웃 조회는 O(k), 통계 조회는 O(1)로 처리된다.
+
+    저널:
+    start_journal() 이후의 변경 연산(add / connect / remove / merge / summary 치환 / 정리)은
+    _journal에 JSON 문자열로 누적되며, graph_journal.GraphJournal이 파일에 기록/재생한다.
+    같은 레코드는 start_delta() 이후 _delta에도 누적되어, utils.graph_offload가 다른 프로세스의
+    그래프 복제본을 동기화하는 데 사용한다.
+    node.data를 직접 수정한 내용은 기록되지 않는다.
+    """
 
     def __init__(self, topic: str):
         self.topic = topic
         self.nodes: Dict[str, Node] = {}
         self._node_id = {"character": 0, "event": 0, "info": 0, "placeholder": 0}
+        self._type_index: Dict[NodeType, Dict[str, None]] = {
+            node_type: {} for node_type in NodeType
+        }
+        self._slots: List[Optional[Node]] = []
+        self._free_slots: List[int] = []
+        self._adjacency: List[List[Optional[array]]] = [[] for _ in NodeType]
+        self._edge_count = 0
+        self._journal: Optional[List[str]] = None
+        self._journal_ops_since_snapshot = 0
+        self._journal_checkpoints = 0
+        self.journal_path: Optional[str] = None
+        self._delta: Optional[List[str]] = None
 
     @property
     def _node_counter(self) -> Dict[str, int]:
-        node_counter = {"character": 0, "event": 0, "info": 0, "placeholder": 0}
-        for node in self.nodes.values():
-            node_counter[node.type.value] += 1
-        return node_counter
+        return {
+            node_type.value: len(node_ids)
+            for node_type, node_ids in self._type_index.items()
+        }
 
     def _generate_node_id(self, node_type: NodeType) -> str:
         """노드 타입별로 고유 ID 생성"""
@@ -77,11 +184,118 @@ class CharacterNetwork:
 
         return False
 
+    def _insert_node(self, node_id: str, node_type: NodeType, data: Dict[str, Any]) -> Node:
+        """노드를 저장소와 인덱스에 등록 (ID 생성 없음)"""
+        node_id = sys.intern(node_id)
+        if self._free_slots:
+            index = self._free_slots.pop()
+        else:
+            index = len(self._slots)
+            self._slots.append(None)
+            for column in self._adjacency:
+                column.append(None)
+
+        node = Node(id=node_id, type=node_type, data=data, _index=index, _network=self)
+        self._slots[index] = node
+        self.nodes[node_id] = node
+        self._type_index[node_type][node_id] = None
+        return node
+
+    def _neighbor_indices(self, node: Node, node_type: NodeType) -> array:
+        """node의 node_type 이웃 인덱스 배열 (없으면 빈 배열)"""
+        return self._adjacency[_TYPE_ORDINAL[node_type]][node._index] or array("I")
+
+    def _link(self, node1: Node, node2: Node) -> bool:
+        """양방향 연결 및 인접 인덱스 갱신 (규칙 검증 없음)"""
+        column1 = self._adjacency[_TYPE_ORDINAL[node2.type]]
+        neighbors1 = column1[node1._index]
+        if neighbors1 is None:
+            neighbors1 = column1[node1._index] = array("I")
+        elif node2._index in neighbors1:
+            return False
+
+        column2 = self._adjacency[_TYPE_ORDINAL[node1.type]]
+        neighbors2 = column2[node2._index]
+        if neighbors2 is None:
+            neighbors2 = column2[node2._index] = array("I")
+
+        neighbors1.append(node2._index)
+        neighbors2.append(node1._index)
+        self._edge_count += 1
+        return True
+
+    def _unlink(self, node1: Node, node2: Node) -> bool:
+        """양방향 연결 해제 및 인접 인덱스 갱신"""
+        neighbors1 = self._adjacency[_TYPE_ORDINAL[node2.type]][node1._index]
+        if neighbors1 is None or node2._index not in neighbors1:
+            return False
+        neighbors1.remove(node2._index)
+        self._adjacency[_TYPE_ORDINAL[node1.type]][node2._index].remove(node1._index)
+        self._edge_count -= 1
+        return True
+
+    # ============ 연산 저널 ============
+    @property
+    def is_journaling(self) -> bool:
+        return self._journal is not None
+
+    def start_journal(self, path: Optional[str] = None):
+        """이후의 변경 연산을 저널 버퍼에 기록 시작"""
+        self._journal = []
+        self._journal_ops_since_snapshot = 0
+        self._journal_checkpoints = 0
+        self.journal_path = path
+
+    def drain_journal(self) -> List[str]:
+        """마지막 drain 이후 기록된 연산(JSON 문자열)을 반환하고 버퍼를 비움"""
+        if self._journal is None:
+            return []
+        ops, self._journal = self._journal, []
+        self._journal_ops_since_snapshot += len(ops)
+        return ops
+
+    def start_delta(self):
+        """이후의 변경 연산을 delta 버퍼에 기록 시작 (저널과 독립적으로 drain)"""
+        self._delta = []
+
+    def drain_delta(self) -> List[str]:
+        """마지막 drain 이후 기록된 연산(JSON 문자열)을 반환하고 delta 버퍼를 비움"""
+        if self._delta is None:
+            return []
+        ops, self._delta = self._delta, []
+        return ops
+
+    def _record(self, op: str, **fields):
+        """저널 / delta 기록 (data는 기록 시점 값으로 직렬화)"""
+        if self._journal is None and self._delta is None:
+            return
+        record = json.dumps({"op": op, **fields}, ensure_ascii=False)
+        if self._journal is not None:
+            self._journal.append(record)
+        if self._delta is not None:
+            self._delta.append(record)
+
+    @contextmanager
+    def _journal_suspended(self):
+        """복합 연산 내부의 세부 연산이 중복 기록되지 않도록 저널 / delta 일시 중단"""
+        journal, self._journal = self._journal, None
+        delta, self._delta = self._delta, None
+        try:
+            yield
+        finally:
+            self._journal = journal
+            self._delta = delta
+
     def add_node(self, node_type: NodeType, data: Dict[str, Any]) -> str:
-        """노드 추가"""
+        """노드 추가
+
+        Enum 값(InfoType 등)은 .value로 저장한다. 저널 재생 / 스냅샷 복원 / 오프로드된 그래프와
+        같은 data를 갖도록 하여, 어느 경로로 만든 그래프든 프롬프트에 같은 문자열이 들어간다.
+        """
+        data = {key: value.value if isinstance(value, Enum) else value for key, value in data.items()}
         node_id = self._generate_node_id(node_type)
-        node = Node(id=node_id, type=node_type, data=data)
-        self.nodes[node_id] = node
+        self._insert_node(node_id, node_type, data)
+        self._record("add", id=node_id, type=node_type.value, data=data)
         return node_id
 
     def connect_nodes(self, node1_id: str, node2_id: str) -> bool:
@@ -97,10 +311,21 @@ class CharacterNetwork:
                 f"Invalid connection: {node1.type.value} cannot connect to {node2.type.value}"
             )
 
-        node1.edges.add(node2_id)
-        node2.edges.add(node1_id)
+        self._link(node1, node2)
+        self._record("connect", ids=[node1_id, node2_id])
         return True
 
+    def get_neighbors(
+        self, node_id: str, node_type: Optional[NodeType] = None
+    ) -> List[str]:
+        """연결된 노드 ID 반환 (node_type 지정 시 해당 타입만, O(k))"""
+        if node_id not in self.nodes:
+            return []
+        node = self.nodes[node_id]
+        if node_type is None:
+            return list(node.edges)
+        return [self._slots[index].id for index in self._neighbor_indices(node, node_type)]
+
     def add_character(self, role: str, name: Optional[str] = None, **kwargs) -> str:
         """캐릭터 노드 추가 (이름은 선택)"""
         data = {"role": role, "name": name, **kwargs}
@@ -128,10 +353,10 @@ class CharacterNetwork:
         """PlaceHolder와 연결된 Event들 반환 (Consolidation 입력용)"""
         result = []
 
-        for node_id, node in self.nodes.items():
-            if node.type == NodeType.PLACEHOLDER:
-                event = self.nodes[node.data.get("owner_id", "Unknown")]
-                result.append((node_id, event))
+        for node_id in self._type_index[NodeType.PLACEHOLDER]:
+            node = self.nodes[node_id]
+            event = self.nodes[node.data.get("owner_id", "Unknown")]
+            result.append((node_id, event))
         return result
 
     def merge_nodes(self, node_ids: List[str], target_id: str) -> bool:
@@ -143,45 +368,95 @@ class CharacterNetwork:
         """
         if not node_ids:
             return False
+        return self.merge_node_groups([(node_ids, target_id)]) > 0
 
-        # target_id가 node_ids에 포함된 경우 제외
-        source_ids = [nid for nid in node_ids if nid != target_id]
+    def merge_node_groups(self, groups: List[Tuple[List[str], str]]) -> int:
+        """여러 통합 그룹을 한 번에 처리 (Consolidation 일괄 반영용)
 
-        if target_id not in self.nodes:
-            return False
+        모든 그룹의 연결을 한 번의 순회로 재배선하고, 고아 노드 정리는 마지막에 한 번만 수행한다.
+
+        Args:
+            groups: (통합할 노드 ID 리스트, 통합 대상 노드 ID) 튜플 리스트
 
-        target_node = self.nodes[target_id]
+        Returns:
+            실제로 통합이 수행된 그룹 수 (target이 없거나 빈 그룹은 제외)
+        """
+        self._record(
+            "merge", groups=[[list(node_ids), target_id] for node_ids, target_id in groups]
+        )
+        with self._journal_suspended():
+            return self._merge_node_groups(groups)
 
-        # 모든 source 노드들의 연결을 target으로 이동
-        for source_id in source_ids:
-            if source_id not in self.nodes:
+    def _merge_node_groups(self, groups: List[Tuple[List[str], str]]) -> int:
+        """merge_node_groups 본체 (저널 기록 없음)"""
+        merged_groups = 0
+
+        for node_ids, target_id in groups:
+            if not node_ids or target_id not in self.nodes:
                 continue
 
-            source_node = self.nodes[source_id]
+            target_node = self.nodes[target_id]
 
-            # 순회 중 변경 안전성을 위해 snapshot 사용
-            for edge_id in list(source_node.edges):
-                if edge_id not in self.nodes:
-                    continue
-                if edge_id == target_id:
-                    # self-loop 방지: source -> target 기존 연결은 source 삭제 시 자연 제거됨
+            # 모든 source 노드들의 연결을 target으로 이동 (target_id가 포함된 경우 제외)
+            for source_id in node_ids:
+                if source_id == target_id or source_id not in self.nodes:
                     continue
 
-                edge_node = self.nodes[edge_id]
+                source_node = self.nodes[source_id]
 
-                # 먼저 기존 연결(source) 제거하여 고아 참조 방지
-                edge_node.edges.discard(source_id)
+                # 순회 중 변경 안전성을 위해 snapshot 사용
+                for edge_id in list(source_node.edges):
+                    if edge_id == target_id:
+                        # self-loop 방지: source -> target 기존 연결은 source 삭제 시 자연 제거됨
+                        continue
 
-                # 연결 규칙 검증 후 재배선
-                if self._validate_connection(target_node, edge_node):
-                    edge_node.edges.add(target_id)
-                    target_node.edges.add(edge_id)
+                    edge_node = self.nodes[edge_id]
 
-            # source 노드 제거 (양방향 참조 정리 포함)
-            self.remove_node(source_id)
-        self.clean_redundant_nodes()
+                    # 먼저 기존 연결(source) 제거하여 고아 참조 방지
+                    self._unlink(source_node, edge_node)
 
-        return True
+                    # 연결 규칙 검증 후 재배선
+                    if self._validate_connection(target_node, edge_node):
+                        self._link(target_node, edge_node)
+
+                # source 노드 제거 (양방향 참조 정리 포함)
+                self.remove_node(source_id)
+            merged_groups += 1
+
+        if merged_groups:
+            self.clean_redundant_nodes()
+
+        return merged_groups
+
+    def replace_in_event_summaries(self, replacements: Dict[str, Dict[str, str]]) -> int:
+        """이벤트별 summary 문자열 치환을 한 번에 수행
+
+        각 이벤트의 summary는 모든 패턴을 합친 정규식으로 한 번만 재작성된다.
+        긴 패턴이 먼저 매칭되며, 치환 결과가 다시 치환되지는 않는다.
+
+        Args:
+            replacements: {event_id: {원본 문자열: 바꿀 문자열}}
+
+        Returns:
+            summary가 변경된 이벤트 수
+        """
+        self._record("replace_summaries", replacements=replacements)
+        updated = 0
+        for event_id, mapping in replacements.items():
+            mapping = {old: new for old, new in mapping.items() if old}
+            if event_id not in self.nodes or not mapping:
+                continue
+
+            pattern = re.compile(
+                "|".join(re.escape(old) for old in sorted(mapping, key=len, reverse=True))
+            )
+            event_node = self.nodes[event_id]
+            old_summary = event_node.data.get("summary", "")
+            new_summary = pattern.sub(lambda m: mapping[m.group(0)], old_summary)
+            if new_summary != old_summary:
+                event_node.data["summary"] = new_summary
+                updated += 1
+        return updated
 
     def get_character_infos(self, character_id: str) -> List[Dict[str, Any]]:
         """캐릭터에 연결된 모든 Info 노드 정보 반환"""
@@ -193,16 +468,15 @@ class CharacterNetwork:
             return []
 
         infos = []
-        for edge_id in char_node.edges:
-            if edge_id in self.nodes and self.nodes[edge_id].type == NodeType.INFO:
-                info_node = self.nodes[edge_id]
-                infos.append(
-                    {
-                        "id": edge_id,
-                        "type": info_node.data.get("type"),
-                        "content": info_node.data.get("content"),
-                    }
-                )
+        for index in self._neighbor_indices(char_node, NodeType.INFO):
+            info_node = self._slots[index]
+            infos.append(
+                {
+                    "id": info_node.id,
+                    "type": info_node.data.get("type"),
+                    "content": info_node.data.get("content"),
+                }
+            )
 
         return infos
 
@@ -215,52 +489,67 @@ class CharacterNetwork:
         if event_node.type != NodeType.EVENT:
             return {"infos": [], "placeholders": []}
 
-        result = {"infos": [], "placeholders": []}
-
-        for edge_id in event_node.edges:
-            if edge_id in self.nodes:
-                edge_node = self.nodes[edge_id]
-                if edge_node.type == NodeType.INFO:
-                    result["infos"].append(edge_id)
-                elif edge_node.type == NodeType.PLACEHOLDER:
-                    result["placeholders"].append(edge_id)
-
-        return result
+        return {
+            "infos": self.get_neighbors(event_id, NodeType.INFO),
+            "placeholders": self.get_neighbors(event_id, NodeType.PLACEHOLDER),
+        }
 
     def remove_node(self, node_id: str):
         """노드와 관련 연결 제거"""
         if node_id not in self.nodes:
             return
 
-        # 연결된 노드들의 edges에서 이 노드 제거
-        for other_node in self.nodes.values():
-            if node_id in other_node.edges:
-                other_node.edges.remove(node_id)
+        self._record("remove", id=node_id)
+        node = self.nodes[node_id]
+        index = node._index
+        back_column = self._adjacency[_TYPE_ORDINAL[node.type]]
+
+        # 연결된 노드들의 인접 배열에서 이 노드 제거 (O(degree))
+        for column in self._adjacency:
+            neighbors = column[index]
+            if not neighbors:
+                column[index] = None
+                continue
+            for neighbor_index in neighbors:
+                back_column[neighbor_index].remove(index)
+            self._edge_count -= len(neighbors)
+            column[index] = None
 
-        # 노드 자체 제거
+        # 노드 자체 및 인덱스 제거 (슬롯은 재사용, 남은 참조는 분리된 노드가 됨)
+        del self._type_index[node.type][node_id]
         del self.nodes[node_id]
+        self._slots[index] = None
+        self._free_slots.append(index)
+        node._network = None
 
     def get_statistics(self) -> Dict[str, Any]:
-        """그래프 통계 정보"""
-        total_edges = sum(len(node.edges) for node in self.nodes.values()) // 2
-
-        placeholder_count = len(
-            [n for n in self.nodes.values() if n.type == NodeType.PLACEHOLDER]
-        )
+        """그래프 통계 정보 (증분 유지되는 카운터 사용, O(1))"""
+        node_counter = self._node_counter
 
         return {
             "total_nodes": len(self.nodes),
-            "node_counts": self._node_counter,
-            "total_edges": total_edges,
-            "placeholder_count": placeholder_count,
-            "characters": self._node_counter.get("character", 0),
-            "events": self._node_counter.get("event", 0),
-            "infos": self._node_counter.get("info", 0),
-            "placeholders": self._node_counter.get("placeholder", 0),
+            "node_counts": node_counter,
+            "total_edges": self._edge_count,
+            "placeholder_count": node_counter["placeholder"],
+            "characters": node_counter["character"],
+            "events": node_counter["event"],
+            "infos": node_counter["info"],
+            "placeholders": node_counter["placeholder"],
         }
 
     def save_to_file(self, filename: str):
-        """그래프를 JSON 파일에 저장 (직렬화 가능하도록 수정)"""
+        """그래프를 파일에 저장
+
+        확장자가 BINARY_SNAPSHOT_EXTENSION(.cnet)이면 바이너리 스냅샷, 그 외에는 JSON으로 저장한다.
+        임시 파일에 쓴 뒤 교체하므로 같은 경로에 동시에 저장해도 섞인 파일이 남지 않는다.
+        """
+        tmp_path = f"{filename}.{os.getpid()}.{id(self)}.tmp"
+        if filename.endswith(BINARY_SNAPSHOT_EXTENSION):
+            with open(tmp_path, "wb") as f:
+                f.write(self.to_bytes())
+            os.replace(tmp_path, filename)
+            return
+
         serializable_nodes = {}
         for node_id, node in self.nodes.items():
             serializable_nodes[node_id] = {
@@ -277,12 +566,17 @@ class CharacterNetwork:
             "nodes": serializable_nodes,
         }
 
-        with open(filename, "w", encoding="utf-8") as f:
+        with open(tmp_path, "w", encoding="utf-8") as f:
             json.dump(graph_data, f, indent=4, ensure_ascii=False)
+        os.replace(tmp_path, filename)
 
     @classmethod
     def load_from_file(cls, filepath: str) -> "CharacterNetwork":
-        """JSON 파일에서 CharacterNetwork 객체를 로드합니다."""
+        """JSON 또는 바이너리 스냅샷(.cnet) 파일에서 CharacterNetwork 객체를 로드합니다."""
+        if filepath.endswith(BINARY_SNAPSHOT_EXTENSION):
+            with open(filepath, "rb") as f:
+                return cls.from_bytes(f.read())
+
         with open(filepath, 'r', encoding='utf-8') as f:
             data = json.load(f)
         
@@ -290,44 +584,195 @@ class CharacterNetwork:
         graph_instance = cls(topic)
         graph_instance._node_id = data.get("_node_id", {"character": 0, "event": 0, "info": 0, "placeholder": 0})
         
-        loaded_nodes = {}
-        for node_id, node_data in data.get("nodes", {}).items():
-            loaded_nodes[node_id] = Node(
-                id=node_data["id"],
-                type=NodeType(node_data["type"]),
-                data=node_data["data"],
-                edges=set(node_data["edges"])
+        nodes_data = data.get("nodes", {})
+        for node_id, node_data in nodes_data.items():
+            graph_instance._insert_node(
+                node_data["id"], NodeType(node_data["type"]), node_data["data"]
             )
-        graph_instance.nodes = loaded_nodes
-        
+
+        # 인접 인덱스를 함께 채우기 위해 edges는 노드 등록 후 연결
+        for node_id, node_data in nodes_data.items():
+            node = graph_instance.nodes[node_id]
+            for edge_id in node_data["edges"]:
+                if edge_id in graph_instance.nodes:
+                    graph_instance._link(node, graph_instance.nodes[edge_id])
+
+        return graph_instance
+
+    def to_bytes(self) -> bytes:
+        """그래프를 바이너리 스냅샷으로 직렬화
+
+        레이아웃 (little-endian):
+        - preamble: magic "CNET", version(u16), reserved(u16)
+        - header: u32 길이 + JSON (topic, _node_id, _node_counter, node_count, edge_count)
+        - ids: u32 길이 + "\n"으로 이은 UTF-8 노드 ID
+        - types: node_count 바이트 (NodeType 순번)
+        - data: u32 길이 + 노드 data의 JSON 배열
+        - edges: CSR 형식. offsets(u32 × node_count+1), neighbors(u32 × offsets[-1])
+          각 연결은 인덱스가 작은 쪽에 한 번만 기록
+        """
+        nodes = list(self.nodes.values())
+        compact_index = {node._index: position for position, node in enumerate(nodes)}
+
+        offsets = array("I", [0])
+        neighbors = array("I")
+        for position, node in enumerate(nodes):
+            for column in self._adjacency:
+                for neighbor_slot in column[node._index] or ():
+                    neighbor_position = compact_index[neighbor_slot]
+                    if neighbor_position > position:
+                        neighbors.append(neighbor_position)
+            offsets.append(len(neighbors))
+        if sys.byteorder == "big":
+            offsets.byteswap()
+            neighbors.byteswap()
+
+        header = json.dumps(
+            {
+                "topic": self.topic,
+                "_node_id": self._node_id,
+                "_node_counter": self._node_counter,
+                "node_count": len(nodes),
+                "edge_count": self._edge_count,
+            },
+            ensure_ascii=False,
+        ).encode("utf-8")
+        ids = "\n".join(node.id for node in nodes).encode("utf-8")
+        types = bytes(_TYPE_ORDINAL[node.type] for node in nodes)
+        data = json.dumps(
+            [node.data for node in nodes], ensure_ascii=False, separators=(",", ":")
+        ).encode("utf-8")
+
+        return b"".join(
+            [
+                _SNAPSHOT_PREAMBLE.pack(_SNAPSHOT_MAGIC, _SNAPSHOT_VERSION, 0),
+                _SNAPSHOT_LENGTH.pack(len(header)),
+                header,
+                _SNAPSHOT_LENGTH.pack(len(ids)),
+                ids,
+                types,
+                _SNAPSHOT_LENGTH.pack(len(data)),
+                data,
+                offsets.tobytes(),
+                neighbors.tobytes(),
+            ]
+        )
+
+    @staticmethod
+    def _parse_snapshot_header(payload: bytes) -> Tuple[Dict[str, Any], int]:
+        """스냅샷 preamble/헤더 검증 후 (헤더, 본문 시작 위치) 반환"""
+        if len(payload) < _SNAPSHOT_PREAMBLE.size + _SNAPSHOT_LENGTH.size:
+            raise ValueError("Truncated CharacterNetwork snapshot")
+        magic, version, _ = _SNAPSHOT_PREAMBLE.unpack_from(payload, 0)
+        if magic != _SNAPSHOT_MAGIC:
+            raise ValueError("Not a CharacterNetwork snapshot")
+        if version != _SNAPSHOT_VERSION:
+            raise ValueError(
+                f"Unsupported snapshot version: {version} (expected {_SNAPSHOT_VERSION})"
+            )
+        offset = _SNAPSHOT_PREAMBLE.size
+        (header_length,) = _SNAPSHOT_LENGTH.unpack_from(payload, offset)
+        offset += _SNAPSHOT_LENGTH.size
+        header = json.loads(bytes(payload[offset : offset + header_length]).decode("utf-8"))
+        return header, offset + header_length
+
+    @classmethod
+    def read_snapshot_header(cls, filepath: str) -> Dict[str, Any]:
+        """바이너리 스냅샷 파일의 헤더만 읽기 (topic, _node_counter 등, 노드 복원 없음)"""
+        with open(filepath, "rb") as f:
+            prefix = f.read(_SNAPSHOT_PREAMBLE.size + _SNAPSHOT_LENGTH.size)
+            if len(prefix) < _SNAPSHOT_PREAMBLE.size + _SNAPSHOT_LENGTH.size:
+                raise ValueError("Truncated CharacterNetwork snapshot")
+            (header_length,) = _SNAPSHOT_LENGTH.unpack_from(prefix, _SNAPSHOT_PREAMBLE.size)
+            header, _ = cls._parse_snapshot_header(prefix + f.read(header_length))
+        return header
+
+    @classmethod
+    def from_bytes(cls, payload: bytes) -> "CharacterNetwork":
+        """to_bytes로 만든 바이너리 스냅샷에서 CharacterNetwork 복원"""
+        header, offset = cls._parse_snapshot_header(payload)
+        node_count = header["node_count"]
+
+        (ids_length,) = _SNAPSHOT_LENGTH.unpack_from(payload, offset)
+        offset += _SNAPSHOT_LENGTH.size
+        ids_blob = payload[offset : offset + ids_length].decode("utf-8")
+        ids = ids_blob.split("\n") if node_count else []
+        offset += ids_length
+
+        types = payload[offset : offset + node_count]
+        offset += node_count
+
+        (data_length,) = _SNAPSHOT_LENGTH.unpack_from(payload, offset)
+        offset += _SNAPSHOT_LENGTH.size
+        data = json.loads(payload[offset : offset + data_length].decode("utf-8"))
+        offset += data_length
+
+        offsets = array("I")
+        offsets.frombytes(payload[offset : offset + 4 * (node_count + 1)])
+        offset += 4 * (node_count + 1)
+        neighbors = array("I")
+        neighbors.frombytes(payload[offset : offset + 4 * offsets[-1]])
+        if sys.byteorder == "big":
+            offsets.byteswap()
+            neighbors.byteswap()
+
+        graph_instance = cls(header["topic"])
+        graph_instance._node_id = header["_node_id"]
+
+        # 빈 그래프에 순서대로 채우므로 슬롯 번호 = 스냅샷 위치. column은 한 번에 할당
+        graph_instance._slots = nodes = [None] * node_count
+        graph_instance._adjacency = [[None] * node_count for _ in NodeType]
+        type_index = graph_instance._type_index
+        for position, (node_id, type_ordinal, node_data) in enumerate(zip(ids, types, data)):
+            node_id = sys.intern(node_id)
+            node_type = _ORDINAL_TYPE[type_ordinal]
+            node = Node(node_id, node_type, node_data, position, graph_instance)
+            nodes[position] = node
+            graph_instance.nodes[node_id] = node
+            type_index[node_type][node_id] = None
+
+        # 스냅샷의 연결은 중복이 없으므로 멤버십 검사 없이 인접 배열에 바로 추가
+        adjacency = graph_instance._adjacency
+        for position, node in enumerate(nodes):
+            own_column = adjacency[types[position]]
+            for neighbor_position in neighbors[offsets[position] : offsets[position + 1]]:
+                neighbor = nodes[neighbor_position]
+                forward = adjacency[types[neighbor_position]]
+                if forward[node._index] is None:
+                    forward[node._index] = array("I")
+                forward[node._index].append(neighbor._index)
+                if own_column[neighbor._index] is None:
+                    own_column[neighbor._index] = array("I")
+                own_column[neighbor._index].append(node._index)
+        graph_instance._edge_count = len(neighbors)
+
         return graph_instance
 
     def get_placeholders(self) -> List[str]:
         """PlaceHolder 노드들 반환"""
         return [
-            (node_id, node)
-            for node_id, node in self.nodes.items()
-            if node.type == NodeType.PLACEHOLDER
+            (node_id, self.nodes[node_id])
+            for node_id in self._type_index[NodeType.PLACEHOLDER]
         ]
 
     def get_characters(self) -> List:
         """캐릭터 노드들 반환"""
         return [
-            (node_id, node)
-            for node_id, node in self.nodes.items()
-            if node.type == NodeType.CHARACTER
+            (node_id, self.nodes[node_id])
+            for node_id in self._type_index[NodeType.CHARACTER]
         ]
 
     def get_events(self) -> List:
         """이벤트 노드들 반환"""
         return [
-            (node_id, node)
-            for node_id, node in self.nodes.items()
-            if node.type == NodeType.EVENT
+            (node_id, self.nodes[node_id])
+            for node_id in self._type_index[NodeType.EVENT]
         ]
 
     def clean_redundant_nodes(self):
         """엣지가 없는 노드들 제거"""
-        for node_id, node in list(self.nodes.items()):
-            if not node.edges:
-                del self.nodes[node_id]
+        self._record("clean")
+        with self._journal_suspended():
+            for node_id, node in list(self.nodes.items()):
+                if not node.edges:
+                    self.remove_node(node_id)
@@ -0,0 +1,212 @@
+"""
+GraphJournal - CharacterNetwork 연산 저널 (append-only JSON Lines)
+
+매 저장마다 전체 그래프를 새 파일로 쓰는 대신, 마지막 checkpoint 이후의 연산만 하나의 파일에 덧붙인다.
+
+레코드 종류 (한 줄에 하나):
+- snapshot: 전체 그래프 (CharacterNetwork.to_bytes의 base64). 재생 시작점
+- add / connect / remove / merge / replace_summaries / clean: CharacterNetwork 변경 연산
+- checkpoint: iteration 경계 표시. replay()의 대상
+"""
+
+import base64
+import json
+import os
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional
+
+from character_network import CharacterNetwork, NodeType
+
+JOURNAL_EXTENSION = ".journal.jsonl"
+
+
+def apply_journal_op(graph: CharacterNetwork, record: Dict[str, Any]) -> None:
+    """저널 연산 하나를 그래프에 적용 (snapshot / checkpoint 제외)"""
+    op = record["op"]
+    if op == "add":
+        node_type = NodeType(record["type"])
+        graph._insert_node(record["id"], node_type, record["data"])
+        # ID 생성 카운터도 함께 복원
+        sequence = int(record["id"].rsplit("_", 1)[1])
+        graph._node_id[node_type.value] = max(graph._node_id[node_type.value], sequence)
+    elif op == "connect":
+        graph.connect_nodes(*record["ids"])
+    elif op == "remove":
+        graph.remove_node(record["id"])
+    elif op == "merge":
+        graph.merge_node_groups(
+            [(node_ids, target_id) for node_ids, target_id in record["groups"]]
+        )
+    elif op == "replace_summaries":
+        graph.replace_in_event_summaries(record["replacements"])
+    elif op == "clean":
+        graph.clean_redundant_nodes()
+    else:
+        raise ValueError(f"Unknown journal op: {op}")
+
+
+class GraphJournal:
+    """CharacterNetwork 저널 파일 관리 (checkpoint 기록, 재생, compaction)"""
+
+    def __init__(self, path: str, snapshot_interval: int = 5000):
+        """
+        Args:
+            path: 저널 파일 경로
+            snapshot_interval: 마지막 snapshot 이후 연산이 이 수를 넘으면 checkpoint 때
+                snapshot을 다시 기록하여 재생 비용을 제한
+        """
+        self.path = path
+        self.snapshot_interval = snapshot_interval
+
+    # ============ 기록 ============
+    def _snapshot_record(self, graph: CharacterNetwork) -> str:
+        payload = base64.b64encode(graph.to_bytes()).decode("ascii")
+        return json.dumps({"op": "snapshot", "payload": payload})
+
+    def _checkpoint_record(
+        self, graph: CharacterNetwork, iteration: int, label: Optional[str]
+    ) -> str:
+        return json.dumps(
+            {
+                "op": "checkpoint",
+                "iteration": iteration,
+                "label": label,
+                "timestamp": datetime.now().isoformat(timespec="seconds"),
+                "statistics": graph.get_statistics(),
+            },
+            ensure_ascii=False,
+        )
+
+    def checkpoint(self, graph: CharacterNetwork, iteration: int, label: Optional[str] = None):
+        """마지막 checkpoint 이후의 연산과 checkpoint 표시를 파일에 덧붙임
+
+        저널을 기록 중이 아닌 그래프는 snapshot을 먼저 쓰고 기록을 시작한다.
+        """
+        lines = []
+        if not graph.is_journaling:
+            lines.append(self._snapshot_record(graph))
+            graph.start_journal(self.path)
+        else:
+            lines.extend(graph.drain_journal())
+            if graph._journal_ops_since_snapshot > self.snapshot_interval:
+                lines.append(self._snapshot_record(graph))
+                graph._journal_ops_since_snapshot = 0
+        lines.append(self._checkpoint_record(graph, iteration, label))
+        graph._journal_checkpoints += 1
+
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+
+    # ============ 읽기 / 재생 ============
+    def records(self) -> Iterator[Dict[str, Any]]:
+        """저널 레코드를 순서대로 반환"""
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+    def checkpoints(self) -> List[Dict[str, Any]]:
+        """checkpoint 레코드 목록 (replay의 checkpoint 인덱스 기준)"""
+        return [record for record in self.records() if record["op"] == "checkpoint"]
+
+    def replay(
+        self, iteration: Optional[int] = None, checkpoint: Optional[int] = None
+    ) -> CharacterNetwork:
+        """저널을 재생하여 특정 시점의 그래프 복원
+
+        Args:
+            iteration: 해당 iteration의 마지막 checkpoint까지 재생
+            checkpoint: checkpoints() 목록의 인덱스 (음수 허용). iteration보다 우선
+            둘 다 없으면 마지막 checkpoint까지 재생
+        """
+        records = list(self.records())
+        target = self._find_checkpoint(records, iteration, checkpoint)
+        return self._replay_records(records[: target + 1])
+
+    def _find_checkpoint(
+        self,
+        records: List[Dict[str, Any]],
+        iteration: Optional[int],
+        checkpoint: Optional[int],
+    ) -> int:
+        positions = [i for i, record in enumerate(records) if record["op"] == "checkpoint"]
+        if not positions:
+            raise ValueError(f"No checkpoint in journal: {self.path}")
+        if checkpoint is not None:
+            return positions[checkpoint]
+        if iteration is None:
+            return positions[-1]
+        matches = [i for i in positions if records[i]["iteration"] == iteration]
+        if not matches:
+            available = sorted({records[i]["iteration"] for i in positions})
+            raise ValueError(
+                f"Iteration {iteration} not found in journal. Available: {available}"
+            )
+        return matches[-1]
+
+    @staticmethod
+    def _replay_records(records: List[Dict[str, Any]]) -> CharacterNetwork:
+        # 대상 이전의 마지막 snapshot부터 재생
+        start = max(
+            (i for i, record in enumerate(records) if record["op"] == "snapshot"),
+            default=None,
+        )
+        if start is None:
+            raise ValueError("Journal has no snapshot to replay from")
+
+        graph = CharacterNetwork.from_bytes(base64.b64decode(records[start]["payload"]))
+        for record in records[start + 1 :]:
+            if record["op"] not in ("snapshot", "checkpoint"):
+                apply_journal_op(graph, record)
+        return graph
+
+    # ============ Compaction ============
+    def compact_if_needed(
+        self, graph: CharacterNetwork, keep_last: int, every: Optional[int] = None
+    ) -> int:
+        """checkpoint가 keep_last보다 every개 이상 쌓였을 때만 compact (파일을 읽지 않고 판단)
+
+        매 checkpoint마다 compact하면 저장이 다시 O(그래프 + 저널)이 되므로, 저널 파일은
+        최대 keep_last + every개 checkpoint까지 덧붙이기만 한다. 개수는 이 그래프가 기록한
+        checkpoint 수(graph._journal_checkpoints) 기준이다.
+
+        Args:
+            every: compaction 간격 (기본값: keep_last)
+
+        Returns:
+            제거된 레코드 수 (compact하지 않았으면 0)
+        """
+        every = every or keep_last
+        if keep_last < 1 or graph._journal_checkpoints < keep_last + every:
+            return 0
+        removed = self.compact(keep_last)
+        graph._journal_checkpoints = keep_last
+        return removed
+
+    def compact(self, keep_last: int) -> int:
+        """최근 keep_last개 checkpoint만 재생 가능하도록 저널을 다시 씀
+
+        가장 오래된 보존 checkpoint 시점의 그래프를 snapshot 하나로 접고 그 이후 레코드만 남긴다.
+        파일은 임시 파일에 쓴 뒤 교체한다.
+
+        Returns:
+            제거된 레코드 수
+        """
+        records = list(self.records())
+        positions = [i for i, record in enumerate(records) if record["op"] == "checkpoint"]
+        if keep_last < 1 or len(positions) <= keep_last:
+            return 0
+
+        oldest_kept = positions[-keep_last]
+        base_graph = self._replay_records(records[: oldest_kept + 1])
+        compacted = [self._snapshot_record(base_graph)]
+        compacted.extend(
+            json.dumps(record, ensure_ascii=False) for record in records[oldest_kept:]
+        )
+
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write("\n".join(compacted) + "\n")
+        os.replace(tmp_path, self.path)
+        return len(records) - len(compacted)
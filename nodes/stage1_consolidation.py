@@ -1,106 +1,404 @@
 import warnings
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Set, Union
 
-from langchain_core.messages import SystemMessage
+from langchain_core.runnables import RunnableConfig
 from langgraph.graph import END, START, StateGraph
 from langgraph.types import Send
 
 from character_network import CharacterNetwork
 from nodes.stage1_nodes import initialize_accumulated_state, save_graph_to_file
 from prompts.stage1_prompts import CONSOLIDATION_PREPARE_PROMPT, CONSOLIDATION_PROMPT
-from pydantics.stage1_pydantics import ConsolidationPrepareResult, ConsolidationResult
+from pydantics.stage1_pydantics import (
+    ConsolidatedRole,
+    ConsolidationPrepareResult,
+    ConsolidationResult,
+)
 from states.stage1_states import ConsolidationState
-from utils import create_unified_extractor
+from utils.branch_retry import branch_node
+from utils.graph_offload import graph_update_node
+from utils.llm_call import acall_extractor, call_extractor, sync_async_node
+from utils.progress import progress_node, report_fanout
+from utils.role_similarity import RoleSimilarityIndex, normalize_role, pack_shards
+
+# shard 분할 시 같은 shard에 모을 역할명 n-gram 유사도 기준
+DEFAULT_SHARD_SIMILARITY = 0.5
+# LLM 없이 바로 통합할 역할명 n-gram 유사도 기준 (켜면 통합 결과가 달라지므로 기본은 사용 안 함)
+DEFAULT_AUTO_MERGE_SIMILARITY: Optional[float] = None
 
 
 # ============ 노드 함수들 ============
 
-def prepare_consolidation_node(state: Dict[str, Any]) -> Dict[str, Any]:
-    """PlaceHolder들을 받아서 헷갈릴 수 있는 Role들을 선별하는 LLM 노드"""
+def _owner_event_ids(graph: CharacterNetwork, placeholder_id: str) -> List[str]:
+    """PlaceHolder가 속한 Event id 목록"""
+    owner = graph.nodes[placeholder_id].data.get("owner_id")
+    # 이미 통합된 PlaceHolder는 owner_id가 Event id 리스트
+    event_ids = owner if isinstance(owner, list) else [owner]
+    return [event_id for event_id in event_ids if event_id in graph.nodes]
+
+
+def _central_characters(graph: CharacterNetwork, placeholder_id: str) -> Set[str]:
+    """PlaceHolder가 속한 Event들의 중심 인물 id"""
+    return {
+        graph.nodes[event_id].data.get("owner_id")
+        for event_id in _owner_event_ids(graph, placeholder_id)
+    }
+
+
+def _consolidation_candidates(state: Dict[str, Any]) -> List[str]:
+    """LLM 통합 대상 PlaceHolder id (shard 실행이면 해당 shard, 아니면 사전 필터 결과 또는 전체)"""
+    if state.get("placeholder_ids") is not None:
+        return state["placeholder_ids"]
+    if state.get("consolidation_candidates") is not None:
+        return state["consolidation_candidates"]
+    return [placeholder_id for placeholder_id, _ in state["graph"].get_placeholders()]
+
+
+def find_duplicate_placeholders(
+    graph: CharacterNetwork, index: RoleSimilarityIndex, threshold: float
+) -> List[List[str]]:
+    """
+    명백한 중복 PlaceHolder 그룹 탐색 (LLM 호출 없음)
+
+    역할명 유사도가 threshold 이상이고 중심 인물이 같으면서 서로 다른 Event에 속한
+    PlaceHolder들만 묶는다. 같은 Event의 PlaceHolder는 역할명이 비슷해도 다른 인물로 본다.
+    """
+    parent: Dict[str, str] = {}
+    events: Dict[str, Set[str]] = {}
+    characters: Dict[str, Set[str]] = {}
+
+    def find(item_id: str) -> str:
+        parent.setdefault(item_id, item_id)
+        while parent[item_id] != item_id:
+            parent[item_id] = parent[parent[item_id]]
+            item_id = parent[item_id]
+        return item_id
+
+    def group_context(root: str):
+        if root not in events:
+            events[root] = set(_owner_event_ids(graph, root))
+            characters[root] = _central_characters(graph, root)
+        return events[root], characters[root]
+
+    pairs = sorted(index.similar_pairs(threshold), key=lambda pair: -pair[2])
+    for a, b, _ in pairs:
+        root_a, root_b = find(a), find(b)
+        if root_a == root_b:
+            continue
+        events_a, characters_a = group_context(root_a)
+        events_b, characters_b = group_context(root_b)
+        if events_a & events_b or not characters_a & characters_b:
+            continue
+        parent[root_b] = root_a
+        events_a |= events_b
+        characters_a |= characters_b
+
+    groups: Dict[str, List[str]] = {}
+    for item_id in parent:
+        groups.setdefault(find(item_id), []).append(item_id)
+    return [sorted(group, key=index.order) for group in groups.values() if len(group) >= 2]
+
+
+def auto_merge_placeholders_node(
+    state: Dict[str, Any], config: Optional[RunnableConfig] = None
+) -> Dict[str, Any]:
+    """
+    역할명이 거의 같은 PlaceHolder를 LLM 없이 통합하고 LLM 통합 대상을 추림
+
+    config["configurable"] 옵션:
+    - consolidation_auto_merge_similarity: 바로 통합할 역할명 유사도 (기본 None = 사용 안 함, 예: 0.8)
+    - consolidation_llm_min_similarity: 다른 PlaceHolder와 이 유사도 이상인 것만 LLM에 전달
+      (기본 0 = 남은 PlaceHolder 전체 전달)
+    """
+    graph: CharacterNetwork = state["graph"]
+    configurable = (config or {}).get("configurable", {})
+    auto_merge_similarity = configurable.get(
+        "consolidation_auto_merge_similarity", DEFAULT_AUTO_MERGE_SIMILARITY
+    )
+    llm_min_similarity = configurable.get("consolidation_llm_min_similarity", 0)
+    if not auto_merge_similarity and not llm_min_similarity:
+        return {"consolidation_candidates": None}
+
+    index = RoleSimilarityIndex()
+    for placeholder_id, placeholder_node in graph.get_placeholders():
+        index.add(placeholder_id, placeholder_node.data.get("role", ""))
+
+    roles = []
+    if auto_merge_similarity:
+        for group in find_duplicate_placeholders(graph, index, auto_merge_similarity):
+            group_roles = [graph.nodes[ph_id].data.get("role", "") for ph_id in group]
+            # 가장 많이 쓰인 역할명 (동률이면 먼저 생성된 PlaceHolder의 역할명)
+            unified_role = max(group_roles, key=group_roles.count)
+            roles.append(
+                ConsolidatedRole.model_construct(
+                    unified_role=unified_role,
+                    original_placeholders=dict(zip(group, group_roles)),
+                )
+            )
+        if roles:
+            apply_consolidated_roles(graph, roles, state["current_iteration"])
+
+    candidates = None
+    if llm_min_similarity:
+        # 통합 후 남은 PlaceHolder 중 비슷한 상대가 있는 것만 (통합으로 생긴 PlaceHolder 포함)
+        index = RoleSimilarityIndex()
+        for placeholder_id, placeholder_node in graph.get_placeholders():
+            index.add(placeholder_id, placeholder_node.data.get("role", ""))
+        paired = set()
+        for a, b, _ in index.similar_pairs(llm_min_similarity):
+            paired.update((a, b))
+        candidates = [placeholder_id for placeholder_id in index.ids() if placeholder_id in paired]
+    return {"graph": graph, "consolidation_candidates": candidates}
+
+
+def shard_placeholders_node(
+    state: Dict[str, Any], config: Optional[RunnableConfig] = None
+) -> Dict[str, Any]:
+    """
+    PlaceHolder가 많으면 역할명 유사도로 로컬 클러스터링 후 shard로 분할
+
+    config["configurable"] 옵션:
+    - consolidation_shard_size: shard당 최대 PlaceHolder 수 (기본 0 = 분할하지 않음)
+    - consolidation_shard_similarity: 같은 shard로 묶을 역할명 유사도 (기본 0.5)
+    """
+    graph: CharacterNetwork = state["graph"]
+    configurable = (config or {}).get("configurable", {})
+    shard_size = configurable.get("consolidation_shard_size", 0)
+    placeholder_ids = _consolidation_candidates(state)
+    if not shard_size or len(placeholder_ids) <= shard_size:
+        return {"placeholder_shards": None}
+
+    index = RoleSimilarityIndex()
+    for placeholder_id in placeholder_ids:
+        index.add(placeholder_id, graph.nodes[placeholder_id].data.get("role", ""))
+    clusters = index.clusters(
+        configurable.get("consolidation_shard_similarity", DEFAULT_SHARD_SIMILARITY)
+    )
+    # 같은 중심 인물의 PlaceHolder가 가까운 shard에 모이도록 정렬 (안정 정렬)
+    clusters.sort(key=lambda cluster: min(_central_characters(graph, cluster[0]), default=""))
+    return {"placeholder_shards": pack_shards(clusters, shard_size)}
+
+
+def _prepare_consolidation_prompt(state: Dict[str, Any]) -> str:
     graph: CharacterNetwork = state["graph"]
-    placeholders = graph.get_placeholders()
     placeholder_list = []
-    for placeholder_id, placeholder_node in placeholders:
+    for placeholder_id in _consolidation_candidates(state):
+        placeholder_node = graph.nodes[placeholder_id]
         placeholder_list.append(
             f"- {placeholder_node.data.get('role', 'Unknown')} (id: {placeholder_id})"
         )
     placeholder_list = "\n".join(placeholder_list)
-    prompt = CONSOLIDATION_PREPARE_PROMPT.format(placeholder_list=placeholder_list)
-    extractor = create_unified_extractor(
-        model_name=state.get("model"),
-        extractor_type=state.get("extractor_type", "default"),
-        tools=[ConsolidationPrepareResult],
-        tool_choice="ConsolidationPrepareResult",
+    return CONSOLIDATION_PREPARE_PROMPT.format(placeholder_list=placeholder_list)
+
+
+def prepare_consolidation_node(state: Dict[str, Any]) -> Dict[str, Any]:
+    """PlaceHolder들을 받아서 헷갈릴 수 있는 Role들을 선별하는 LLM 노드"""
+    result = call_extractor(state, _prepare_consolidation_prompt(state), ConsolidationPrepareResult)
+    return {"chunked_placeholders": result.chunked_placeholders}
+
+
+async def aprepare_consolidation_node(state: Dict[str, Any]) -> Dict[str, Any]:
+    """prepare_consolidation_node의 비동기 버전"""
+    result = await acall_extractor(
+        state, _prepare_consolidation_prompt(state), ConsolidationPrepareResult
     )
-    response = extractor.invoke([SystemMessage(content=prompt)])
-    if hasattr(response, "responses") and response["responses"][0]:
-        parsed = response["responses"][0]
-    else:  # trustcall의 emtpy response 문제 때문에 임시 처리
-        args = response["messages"][0].tool_calls[0]["args"]
-        parsed = ConsolidationPrepareResult(**args)
-    result = parsed
     return {"chunked_placeholders": result.chunked_placeholders}
 
 
+def prepare_consolidation_shard_node(state: Dict[str, Any]) -> Dict[str, Any]:
+    """shard 하나의 PlaceHolder들만 그룹화하는 LLM 노드"""
+    result = call_extractor(state, _prepare_consolidation_prompt(state), ConsolidationPrepareResult)
+    return {"shard_chunks": result.chunked_placeholders}
+
+
+async def aprepare_consolidation_shard_node(state: Dict[str, Any]) -> Dict[str, Any]:
+    """prepare_consolidation_shard_node의 비동기 버전"""
+    result = await acall_extractor(
+        state, _prepare_consolidation_prompt(state), ConsolidationPrepareResult
+    )
+    return {"shard_chunks": result.chunked_placeholders}
+
+
+def reconcile_shard_chunks_node(state: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    shard별 그룹 결과를 하나로 합침 (LLM 호출 없음)
+
+    다른 shard의 id를 참조하거나 이미 다른 그룹에 포함된 id는 제외하고,
+    2개 미만이 된 그룹은 버린다.
+    """
+    shard_of = {
+        ph_id: shard_index
+        for shard_index, shard in enumerate(state["placeholder_shards"])
+        for ph_id in shard
+    }
+    claimed = set()
+    chunks = []
+    for chunk in state["shard_chunks"]:
+        shard_index = next((shard_of[ph_id] for ph_id in chunk if ph_id in shard_of), None)
+        kept = [
+            ph_id
+            for ph_id in dict.fromkeys(chunk)
+            if shard_of.get(ph_id) == shard_index and ph_id not in claimed
+        ]
+        if len(kept) < len(chunk):
+            warnings.warn(f"Warning: 통합 그룹 {chunk}에서 다른 shard이거나 중복된 id를 제외합니다.")
+        if len(kept) >= 2:
+            claimed.update(kept)
+            chunks.append(kept)
+    return {"chunked_placeholders": chunks}
+
+
 def consolidate_node(state: Dict[str, Any]) -> Dict[str, Any]:
     """PlaceHolder들을 받아서 통합된 Role들을 생성하는 LLM 노드"""
-    placeholder_info = state["placeholder_info"]
+    prompt = CONSOLIDATION_PROMPT.format(placeholder_info=state["placeholder_info"])
+    result = call_extractor(state, prompt, ConsolidationResult)
+    return {"consolidated_roles": result.consolidated_roles}
 
-    prompt = CONSOLIDATION_PROMPT.format(placeholder_info=placeholder_info)
 
-    extractor = create_unified_extractor(
-        model_name=state.get("model"),
-        extractor_type=state.get("extractor_type", "default"),
-        tools=[ConsolidationResult],
-        tool_choice="ConsolidationResult",
-    )
-    response = extractor.invoke([SystemMessage(content=prompt)])
-    if hasattr(response, "responses") and response["responses"][0]:
-        parsed = response["responses"][0]
-    else:  # trustcall의 emtpy response 문제 때문에 임시 처리
-        args = response["messages"][0].tool_calls[0]["args"]
-        parsed = ConsolidationResult(**args)
-    result = parsed
+async def aconsolidate_node(state: Dict[str, Any]) -> Dict[str, Any]:
+    """consolidate_node의 비동기 버전"""
+    prompt = CONSOLIDATION_PROMPT.format(placeholder_info=state["placeholder_info"])
+    result = await acall_extractor(state, prompt, ConsolidationResult)
     return {"consolidated_roles": result.consolidated_roles}
 
 
+def reconcile_cross_shard_roles(
+    graph: CharacterNetwork,
+    consolidated_roles: List[ConsolidatedRole],
+    placeholder_shards: List[List[str]],
+) -> List[ConsolidatedRole]:
+    """
+    서로 다른 shard에서 같은 이름으로 통합된 역할을 하나로 합침 (LLM 호출 없음)
+
+    통합 역할명이 (괄호/공백 제외) 같고 중심 인물이 겹치는 경우에만 합쳐서
+    "다른 중심 인물의 이야기면 분리" 규칙을 유지한다.
+    """
+    shard_of = {
+        ph_id: shard_index
+        for shard_index, shard in enumerate(placeholder_shards)
+        for ph_id in shard
+    }
+    reconciled: List[ConsolidatedRole] = []
+    role_shards: List[Set[Optional[int]]] = []
+    role_characters: List[Set[str]] = []
+    by_name: Dict[str, List[int]] = {}  # 정규화된 통합 역할명 → reconciled 인덱스
+    for role in consolidated_roles:
+        original_ids = list((role.original_placeholders or {}).keys())
+        shards = {shard_of.get(ph_id) for ph_id in original_ids}
+        characters = set()
+        for ph_id in original_ids:
+            if ph_id in graph.nodes:
+                characters |= _central_characters(graph, ph_id)
+
+        candidates = by_name.setdefault(normalize_role(role.unified_role), [])
+        target = next(
+            (
+                i
+                for i in candidates
+                if role.unified_role
+                and not role_shards[i] & shards
+                and role_characters[i] & characters
+            ),
+            None,
+        )
+        if target is None:
+            candidates.append(len(reconciled))
+            reconciled.append(role)
+            role_shards.append(shards)
+            role_characters.append(characters)
+            continue
+
+        merged = reconciled[target]
+        reconciled[target] = ConsolidatedRole(
+            unified_role=merged.unified_role,
+            original_placeholders={
+                **merged.original_placeholders,
+                **role.original_placeholders,
+            },
+        )
+        role_shards[target] |= shards
+        role_characters[target] |= characters
+    return reconciled
+
+
 def update_graph_after_consolidation(state: Dict[str, Any]) -> Dict[str, Any]:
     """Consolidation 결과를 Graph에 반영"""
     graph: CharacterNetwork = state["graph"]
     consolidated_roles = state["consolidated_roles"]
-    current_iteration = state["current_iteration"]
-    # 노드 통합
+    if state.get("placeholder_shards"):
+        consolidated_roles = reconcile_cross_shard_roles(
+            graph, consolidated_roles, state["placeholder_shards"]
+        )
+    apply_consolidated_roles(graph, consolidated_roles, state["current_iteration"])
+    return {"graph": graph}
+
+
+def apply_consolidated_roles(
+    graph: CharacterNetwork, consolidated_roles: List[ConsolidatedRole], current_iteration: int
+):
+    """통합 역할마다 새 PlaceHolder를 만들고 원본 PlaceHolder들을 통합"""
+    merge_groups = []
+    summary_replacements: Dict[str, Dict[str, str]] = {}
+    claimed_ids = set()
     for role in consolidated_roles:
         original_ids = list(role.original_placeholders.keys())
         owner_ids = []
         for original_id in original_ids:
-            if original_id not in graph.nodes:
+            # 앞선 role에서 이미 통합된 id도 그래프에서 사라진 것으로 취급
+            if original_id not in graph.nodes or original_id in claimed_ids:
                 raise ValueError(f"Original id {original_id} not found in graph")
-            owner_ids.append(graph.nodes[original_id].data.get("owner_id", "Unknown"))
+            claimed_ids.add(original_id)
+            event_ids = _owner_event_ids(graph, original_id)
+            owner_ids.extend(event_ids)
             original_role = graph.nodes[original_id].data.get("role", "Unknown")
             if original_role != role.original_placeholders[original_id]:
                 warnings.warn(
                     f"Warning: Original role {original_role} does not match {role.original_placeholders[original_id]}"
                 )
 
-        # Event summary 업데이트: 원본 PlaceHolder 역할명을 통합된 역할명으로 치환
-        for original_id, original_role_name in role.original_placeholders.items():
-            event_id = graph.nodes[original_id].data.get("owner_id")
-            if event_id in graph.nodes:
-                event_node = graph.nodes[event_id]
-                old_summary = event_node.data.get("summary", "")
-                # 원본: "(엄격한 아버지)" → 통합: "(권위적인 조언자)" (모두 괄호 포함)
-                new_summary = old_summary.replace(original_role_name, role.unified_role)
-                event_node.data["summary"] = new_summary
+            # Event summary 치환 목록 수집: 원본 PlaceHolder 역할명 → 통합된 역할명
+            # 원본: "(엄격한 아버지)" → 통합: "(권위적인 조언자)" (모두 괄호 포함)
+            # 같은 Event에서 같은 역할명이 여러 통합 역할로 나뉘면 앞선 role의 치환만 반영
+            original = role.original_placeholders[original_id]
+            for event_id in event_ids:
+                replacements = summary_replacements.setdefault(event_id, {})
+                applied = replacements.setdefault(original, role.unified_role)
+                if applied != role.unified_role:
+                    warnings.warn(
+                        f"Warning: {event_id}의 {original}가 여러 통합 역할({applied}, {role.unified_role})로 치환됩니다. {applied}만 반영합니다."
+                    )
 
         unified_id = graph.add_placeholder(
             role.unified_role, owner_ids, created_at=current_iteration
         )
-        graph.merge_nodes(original_ids, unified_id)
-    return {"graph": graph}
+        merge_groups.append((original_ids, unified_id))
+
+    # Event summary는 이벤트당 한 번, 노드 통합과 고아 정리는 한 번에 반영
+    graph.replace_in_event_summaries(summary_replacements)
+    graph.merge_node_groups(merge_groups)
 
 
 # ============ 조건부 엣지 함수들 ============
+def route_prepare_consolidation(state: ConsolidationState) -> Union[str, List[Send]]:
+    """shard가 없으면 전체를 한 번에, 있으면 shard별 그룹화를 병렬로 분배"""
+    if len(_consolidation_candidates(state)) < 2:
+        return "update_consolidation_graph"  # 통합할 후보가 없으면 LLM 호출 생략
+    placeholder_shards = state.get("placeholder_shards")
+    if not placeholder_shards:
+        return "prepare_consolidation"
+    return report_fanout([
+        Send(
+            "prepare_consolidation_shard",
+            {
+                "graph": state["graph"],
+                "placeholder_ids": shard,
+                "model": state.get("model"),
+                "extractor_type": state.get("extractor_type"),
+            },
+        )
+        for shard in placeholder_shards
+    ])
+
+
 def distribute_consolidation(state: ConsolidationState) -> List[Send]:
     """Consolidation을 위한 Send 분배"""
     graph: CharacterNetwork = state["graph"]
@@ -112,13 +410,14 @@ def distribute_consolidation(state: ConsolidationState) -> List[Send]:
         for ph_id in chunked_placeholder:
             ph_node = graph.nodes[ph_id]
             role = ph_node.data.get("role", "Unknown")
-            event_node = graph.nodes[ph_node.data.get("owner_id", "Unknown")]
-            owner_id = event_node.data.get("owner_id", "Unknown")
-            owner_role = graph.nodes[owner_id].data.get("role", "Unknown")
-            summary = event_node.data.get("summary", "Unknown event")
-            placeholder_info.append(
-                f"- {role} (id: {ph_id}) (중심 인물: {owner_role} (id: {owner_id}), 관련 사건 요약: {summary})"
-            )
+            for event_id in _owner_event_ids(graph, ph_id):
+                event_node = graph.nodes[event_id]
+                owner_id = event_node.data.get("owner_id", "Unknown")
+                owner_role = graph.nodes[owner_id].data.get("role", "Unknown")
+                summary = event_node.data.get("summary", "Unknown event")
+                placeholder_info.append(
+                    f"- {role} (id: {ph_id}) (중심 인물: {owner_role} (id: {owner_id}), 관련 사건 요약: {summary})"
+                )
         placeholder_info = "\n".join(placeholder_info)
         send_state = {
             "placeholder_info": placeholder_info,
@@ -126,7 +425,7 @@ def distribute_consolidation(state: ConsolidationState) -> List[Send]:
             "extractor_type": state.get("extractor_type"),
         }
         sends.append(Send("consolidate", send_state))
-    return sends
+    return report_fanout(sends)
 
 
 # ============ 서브그래프 구현 ============
@@ -134,17 +433,38 @@ def build_consolidation_subgraph():
     """Consolidation 서브그래프"""
     subgraph = StateGraph(ConsolidationState)
 
-    subgraph.add_node("initialize_accumulated_state", initialize_accumulated_state)
-    subgraph.add_node("prepare_consolidation", prepare_consolidation_node)
-    subgraph.add_node("consolidate", consolidate_node)
-    subgraph.add_node("update_consolidation_graph", update_graph_after_consolidation)
-    subgraph.add_node("save_graph_to_file", save_graph_to_file)
+    subgraph.add_node("initialize_accumulated_state", progress_node(initialize_accumulated_state))
+    subgraph.add_node("auto_merge_placeholders", progress_node(auto_merge_placeholders_node))
+    subgraph.add_node("shard_placeholders", progress_node(shard_placeholders_node))
+    subgraph.add_node(
+        "prepare_consolidation",
+        sync_async_node(prepare_consolidation_node, aprepare_consolidation_node),
+    )
+    subgraph.add_node(
+        "prepare_consolidation_shard",
+        branch_node(prepare_consolidation_shard_node, aprepare_consolidation_shard_node),
+    )
+    subgraph.add_node("reconcile_shard_chunks", progress_node(reconcile_shard_chunks_node))
+    subgraph.add_node("consolidate", branch_node(consolidate_node, aconsolidate_node))
+    subgraph.add_node("update_consolidation_graph", graph_update_node(update_graph_after_consolidation))
+    subgraph.add_node("save_graph_to_file", progress_node(save_graph_to_file))
 
     subgraph.add_edge(START, "initialize_accumulated_state")
-    subgraph.add_edge("initialize_accumulated_state", "prepare_consolidation")
+    subgraph.add_edge("initialize_accumulated_state", "auto_merge_placeholders")
+    subgraph.add_edge("auto_merge_placeholders", "shard_placeholders")
+    subgraph.add_conditional_edges(
+        "shard_placeholders",
+        route_prepare_consolidation,
+        ["prepare_consolidation", "prepare_consolidation_shard", "update_consolidation_graph"],
+    )
     subgraph.add_conditional_edges(
         "prepare_consolidation", distribute_consolidation, ["consolidate"]
     )
+    # shard 결과는 모두 모인 뒤 한 번만 분배
+    subgraph.add_edge("prepare_consolidation_shard", "reconcile_shard_chunks")
+    subgraph.add_conditional_edges(
+        "reconcile_shard_chunks", distribute_consolidation, ["consolidate"]
+    )
     subgraph.add_edge("consolidate", "update_consolidation_graph")
     subgraph.add_edge("update_consolidation_graph", "save_graph_to_file")
     subgraph.add_edge("save_graph_to_file", END)
@@ -4,13 +4,19 @@ from langchain_core.messages import SystemMessage
 from langgraph.graph import END, START, StateGraph
 from langgraph.types import Send
 
-from nodes.stage1_nodes import create_character_node, update_graph_with_character
+from nodes.stage1_nodes import (
+    acreate_character_node,
+    create_character_node,
+    update_graph_with_character,
+)
 
 from character_network import CharacterNetwork
 from prompts.stage1_prompts import CHARACTER_PROMPT
 from pydantics.stage1_pydantics import Character
 from states.stage1_states import CharacterCreationState
 from utils import create_unified_extractor
+from utils.branch_retry import branch_node
+from utils.progress import progress_node, report_fanout
 
 
 # ============ 노드 함수들 ============
@@ -111,7 +117,7 @@ def distribute_character_creation(state: CharacterCreationState) -> List[Send]:
         }
         sends.append(Send("create_character", send_state))
 
-    return sends
+    return report_fanout(sends)
 
 
 # ============ 서브그래프 구현 ============
@@ -119,9 +125,11 @@ def build_character_subgraph():
     """캐릭터 생성 서브그래프 (이벤트는 메인에서 처리)"""
     subgraph = StateGraph(CharacterCreationState)
 
-    subgraph.add_node("initialize_accumulated_state", initialize_accumulated_state)
-    subgraph.add_node("create_character", create_character_node)
-    subgraph.add_node("update_character_graph", update_graph_with_character)
+    subgraph.add_node("initialize_accumulated_state", progress_node(initialize_accumulated_state))
+    subgraph.add_node(
+        "create_character", branch_node(create_character_node, acreate_character_node)
+    )
+    subgraph.add_node("update_character_graph", progress_node(update_graph_with_character))
 
     subgraph.add_edge(START, "initialize_accumulated_state")
     subgraph.add_conditional_edges(
@@ -1,29 +1,33 @@
-from typing import Any, Dict, List
+import asyncio
+import warnings
+from enum import Enum
+from typing import Any, Dict, List, Optional, Tuple
 
-from langchain_core.messages import SystemMessage
+from langchain_core.runnables import RunnableConfig
 from langgraph.graph import END, START, StateGraph
 from langgraph.types import Send
+from pydantic import ValidationError
 
-from character_network import CharacterNetwork
+from character_network import CharacterNetwork, NodeType
 from nodes.stage1_nodes import initialize_accumulated_state, save_graph_to_file
-from prompts.stage1_prompts import EVENT_PROMPT
-from pydantics.stage1_pydantics import Event
+from prompts.stage1_prompts import EVENT_BATCH_PROMPT, EVENT_PROMPT
+from pydantics.stage1_pydantics import Event, Events, EventWithInfoId
 from states.stage1_states import EventCreationState
-from utils import create_unified_extractor
+from utils.branch_retry import aretry_branch, branch_node, retry_branch
+from utils.graph_offload import graph_update_node
+from utils.llm_call import RESPONSE_PARSE_ERRORS, acall_extractor, call_extractor
+from utils.progress import progress_node, report_fanout
 
 
 # ============ 노드 함수들 ============
-def create_event_node(state: Dict[str, Any]) -> Dict[str, Any]:
-    """EventCreationState를 받아서 Event와 PlaceHolder를 생성하는 LLM 노드"""
+def _event_prompt(state: Dict[str, Any]) -> str:
     role = state["role"]
     conflict = state["conflict"]
     vibe = state["vibe"]
-    char_id = state["char_id"]
-    info_id = state["info_id"]
     current_info_type = state["current_info_type"]
     current_info_content = state["current_info_content"]
 
-    prompt = EVENT_PROMPT.format(
+    return EVENT_PROMPT.format(
         character_role=role,
         conflict=conflict,
         vibe=vibe,
@@ -31,21 +35,127 @@ def create_event_node(state: Dict[str, Any]) -> Dict[str, Any]:
         info_content=current_info_content,
     )
 
-    extractor = create_unified_extractor(
-        model_name=state.get("model"),
-        extractor_type=state.get("extractor_type", "default"),
-        tools=[Event],
-        tool_choice="Event",
+
+def create_event_node(state: Dict[str, Any]) -> Dict[str, Any]:
+    """EventCreationState를 받아서 Event와 PlaceHolder를 생성하는 LLM 노드"""
+    event = call_extractor(state, _event_prompt(state), Event)
+    return {"generated_event": [(state["char_id"], state["info_id"], event)]}
+
+
+async def acreate_event_node(state: Dict[str, Any]) -> Dict[str, Any]:
+    """create_event_node의 비동기 버전"""
+    event = await acall_extractor(state, _event_prompt(state), Event)
+    return {"generated_event": [(state["char_id"], state["info_id"], event)]}
+
+
+def _event_batch_prompt(state: Dict[str, Any]) -> str:
+    info_items = "\n".join(
+        f"- {item['info_id']} | {item['role']} | {item['current_info_type']} - {item['current_info_content']}"
+        for item in state["items"]
+    )
+    return EVENT_BATCH_PROMPT.format(
+        conflict=state["conflict"],
+        vibe=state["vibe"],
+        info_items=info_items,
     )
-    response = extractor.invoke([SystemMessage(content=prompt)])
-    if hasattr(response, "responses") and response["responses"][0]:
-        parsed = response["responses"][0]
-    else:  # trustcall의 emtpy response 문제 때문에 임시 처리
-        args = response["messages"][0].tool_calls[0]["args"]
-        parsed = Event(**args)
-    event = parsed
 
-    return {"generated_event": [(char_id, info_id, event)]}
+
+def _info_type_value(info_type: Any) -> str:
+    return info_type.value if isinstance(info_type, Enum) else info_type
+
+
+def _match_batch_events(
+    state: Dict[str, Any], events: Events
+) -> Tuple[List[Tuple[str, str, Any]], List[Dict[str, Any]]]:
+    """
+    배치 응답을 info_id 기준으로 요청 항목과 매칭
+
+    Returns:
+        (검증을 통과한 (char_id, info_id, event) 목록, 개별 호출로 다시 생성할 항목 목록)
+    """
+    items = {item["info_id"]: item for item in state["items"]}
+    generated = []
+    retry = []
+    for entry in events.events:
+        # Events는 항목별로만 검증하므로 실패한 항목은 dict가 아닌 값일 수도 있음
+        try:
+            event = EventWithInfoId.model_validate(entry)
+        except ValidationError as error:
+            info_id = entry.get("info_id") if isinstance(entry, dict) else None
+            item = items.pop(info_id, None) if isinstance(info_id, str) else None
+            if item is None:
+                # 매칭되지 않은 요청 항목은 아래에서 누락으로 처리
+                warnings.warn(f"Warning: 요청 항목과 매칭할 수 없는 Event가 생성되었습니다. 무시합니다.\n{error}")
+                continue
+            warnings.warn(f"Warning: {info_id}의 Event가 검증에 실패했습니다. 개별 생성합니다.\n{error}")
+            retry.append(item)
+            continue
+        info_id = event.info_id
+        item = items.pop(info_id, None)
+        if item is None:
+            warnings.warn(
+                f"Warning: 요청하지 않았거나 중복된 info_id '{info_id}'의 Event가 생성되었습니다. 무시합니다."
+            )
+            continue
+        requested_type = _info_type_value(item["current_info_type"])
+        if event.target_info_type.value != requested_type:
+            warnings.warn(
+                f"Warning: {info_id}의 Event가 다른 유형({event.target_info_type.value})을 대상으로 합니다. "
+                f"요청 유형: {requested_type}. 개별 생성합니다."
+            )
+            retry.append(item)
+            continue
+        generated.append((item["char_id"], info_id, event))
+
+    if items:
+        warnings.warn(f"Warning: Event가 생성되지 않은 info_id: {list(items)}. 개별 생성합니다.")
+        retry.extend(items.values())
+    return generated, retry
+
+
+# 배치 안의 개별 생성은 항목별로 재시도 / 건너뛰기 (한 항목이 실패해도 배치를 다시 호출하지 않고 나머지 Event는 유지)
+_create_event_item = retry_branch(create_event_node, report_progress=False)
+_acreate_event_item = aretry_branch(acreate_event_node, report_progress=False)
+
+
+def _merge_item_results(
+    generated: List[Tuple[str, str, Any]], results: List[Dict[str, Any]]
+) -> Dict[str, Any]:
+    failed = []
+    for result in results:
+        generated.extend(result.get("generated_event", []))
+        failed.extend(result.get("failed_branches", []))
+    output: Dict[str, Any] = {"generated_event": generated}
+    if failed:
+        output["failed_branches"] = failed
+    return output
+
+
+def create_event_batch_node(state: Dict[str, Any]) -> Dict[str, Any]:
+    """여러 Info에 대한 Event를 한 번의 LLM 호출로 생성하는 노드 (실패 항목은 개별 호출, 개별 호출도 실패하면 failed_branches에 기록)"""
+    try:
+        events = call_extractor(state, _event_batch_prompt(state), Events)
+    except RESPONSE_PARSE_ERRORS as error:
+        warnings.warn(f"Warning: 배치 Event 응답을 처리하지 못했습니다. 전체를 개별 생성합니다.\n{error}")
+        generated, retry = [], state["items"]
+    else:
+        generated, retry = _match_batch_events(state, events)
+
+    return _merge_item_results(generated, [_create_event_item(item) for item in retry])
+
+
+async def acreate_event_batch_node(state: Dict[str, Any]) -> Dict[str, Any]:
+    """create_event_batch_node의 비동기 버전 (실패 항목은 동시에 개별 호출)"""
+    try:
+        events = await acall_extractor(state, _event_batch_prompt(state), Events)
+    except RESPONSE_PARSE_ERRORS as error:
+        warnings.warn(f"Warning: 배치 Event 응답을 처리하지 못했습니다. 전체를 개별 생성합니다.\n{error}")
+        generated, retry = [], state["items"]
+    else:
+        generated, retry = _match_batch_events(state, events)
+
+    results = await asyncio.gather(*(_acreate_event_item(item) for item in retry))
+    return _merge_item_results(generated, list(results))
 
 
 def update_graph_with_event(state: Dict[str, Any]) -> Dict[str, Any]:
@@ -73,44 +183,64 @@ def update_graph_with_event(state: Dict[str, Any]) -> Dict[str, Any]:
 
 
 # ============ 조건부 엣지 함수들 ============
-def distribute_event_creation(state: EventCreationState) -> List[Send]:
-    """그래프의 모든 캐릭터-Info 쌍에 대해 이벤트 생성을 위한 Send 분배"""
+def distribute_event_creation(
+    state: EventCreationState, config: Optional[RunnableConfig] = None
+) -> List[Send]:
+    """그래프의 모든 캐릭터-Info 쌍에 대해 이벤트 생성을 위한 Send 분배
+
+    config["configurable"] 옵션:
+    - event_batch_size: 한 번의 LLM 호출로 생성할 Event 수 (기본 1 = Info마다 호출)
+    - event_batch_by_character: True면 같은 캐릭터의 Info끼리만 배치로 묶음
+    """
     graph: CharacterNetwork = state["graph"]
+    configurable = (config or {}).get("configurable", {})
+    batch_size = configurable.get("event_batch_size", 1)
+    by_character = configurable.get("event_batch_by_character", False)
 
     sends = []
+    batches: List[List[Dict[str, Any]]] = [[]]
     # 모든 캐릭터 노드에 대해
-    for char_id, char_node in graph.nodes.items():
-        if char_node.type.value == "character":
-            # 해당 캐릭터의 Info들 찾기
-            infos = graph.get_character_infos(char_id)
-            character_role = char_node.data.get("role", "")
-
-            for info in infos:
-                edges = graph.nodes[info["id"]].edges
-                # info와 연결된 노드중에 event가 없는 경우 이벤트 생성
-                # info와 연결된 노드들 중에서 event 타입이 하나도 없으면 True
-                event_connected = False
-                for edge_id in edges:
-                    if (
-                        edge_id in graph.nodes
-                        and graph.nodes[edge_id].type.value == "event"
-                    ):
-                        event_connected = True
-                        break
-                if not event_connected:
-                    event_state = {
-                        "char_id": char_id,
-                        "info_id": info["id"],
-                        "role": character_role,
-                        "conflict": state["conflict"],
-                        "vibe": state["vibe"],
-                        "current_info_type": info["type"],
-                        "current_info_content": info["content"],
-                        "model": state.get("model"),
-                        "extractor_type": state.get("extractor_type"),
-                    }
+    for char_id, char_node in graph.get_characters():
+        # 해당 캐릭터의 Info들 찾기
+        infos = graph.get_character_infos(char_id)
+        character_role = char_node.data.get("role", "")
+
+        for info in infos:
+            # info와 연결된 노드중에 event가 없는 경우 이벤트 생성
+            if not graph.get_neighbors(info["id"], NodeType.EVENT):
+                event_state = {
+                    "char_id": char_id,
+                    "info_id": info["id"],
+                    "role": character_role,
+                    "conflict": state["conflict"],
+                    "vibe": state["vibe"],
+                    "current_info_type": info["type"],
+                    "current_info_content": info["content"],
+                    "model": state.get("model"),
+                    "extractor_type": state.get("extractor_type"),
+                }
+                if batch_size <= 1:
                     sends.append(Send("create_event", event_state))
-    return sends
+                    continue
+                if len(batches[-1]) >= batch_size:
+                    batches.append([])
+                batches[-1].append(event_state)
+        if by_character and batches[-1]:
+            batches.append([])
+
+    for batch in batches:
+        if len(batch) == 1:
+            sends.append(Send("create_event", batch[0]))
+        elif batch:
+            batch_state = {
+                "items": batch,
+                "conflict": state["conflict"],
+                "vibe": state["vibe"],
+                "model": state.get("model"),
+                "extractor_type": state.get("extractor_type"),
+            }
+            sends.append(Send("create_event_batch", batch_state))
+    return report_fanout(sends)
 
 
 # ============ 서브그래프 구현 ============
@@ -118,18 +248,23 @@ def build_event_subgraph():
     """이벤트 생성 서브그래프"""
     subgraph = StateGraph(EventCreationState)
 
-    subgraph.add_node("initialize_accumulated_state", initialize_accumulated_state)
-    subgraph.add_node("create_event", create_event_node)
-    subgraph.add_node("update_event_graph", update_graph_with_event)
-    subgraph.add_node("save_graph_to_file", save_graph_to_file)
+    subgraph.add_node("initialize_accumulated_state", progress_node(initialize_accumulated_state))
+    subgraph.add_node("create_event", branch_node(create_event_node, acreate_event_node))
+    subgraph.add_node(
+        "create_event_batch",
+        branch_node(create_event_batch_node, acreate_event_batch_node),
+    )
+    subgraph.add_node("update_event_graph", graph_update_node(update_graph_with_event))
+    subgraph.add_node("save_graph_to_file", progress_node(save_graph_to_file))
 
     subgraph.add_edge(START, "initialize_accumulated_state")
     subgraph.add_conditional_edges(
         "initialize_accumulated_state",
         distribute_event_creation,
-        ["create_event"],
+        ["create_event", "create_event_batch"],
     )
     subgraph.add_edge("create_event", "update_event_graph")
+    subgraph.add_edge("create_event_batch", "update_event_graph")
     subgraph.add_edge("update_event_graph", "save_graph_to_file")
     subgraph.add_edge("save_graph_to_file", END)
     return subgraph.compile()
@@ -5,8 +5,12 @@
 from typing import Any, Dict
 from langgraph.graph import END, START, StateGraph
 
-from nodes.stage1_nodes import create_inciting_and_macro_node
+from nodes.stage1_nodes import (
+    acreate_inciting_and_macro_node,
+    create_inciting_and_macro_node,
+)
 from states.stage1_plot_states import IncitingMacroState
+from utils.llm_call import sync_async_node
 
 
 def build_inciting_macro_graph():
@@ -15,7 +19,10 @@ def build_inciting_macro_graph():
     workflow = StateGraph(IncitingMacroState)
     
     # 노드 추가
-    workflow.add_node("create_inciting_macro", create_inciting_and_macro_node)
+    workflow.add_node(
+        "create_inciting_macro",
+        sync_async_node(create_inciting_and_macro_node, acreate_inciting_and_macro_node),
+    )
     
     # 엣지 추가
     workflow.add_edge(START, "create_inciting_macro")
@@ -5,8 +5,13 @@
 from typing import Any, Dict
 from langgraph.graph import END, START, StateGraph
 
-from nodes.stage1_nodes import generate_integrated_plot_node, save_plot_to_file
+from nodes.stage1_nodes import (
+    agenerate_integrated_plot_node,
+    generate_integrated_plot_node,
+    save_plot_to_file,
+)
 from states.stage1_plot_states import IntegratedPlotState
+from utils.llm_call import sync_async_node
 
 
 def build_integrated_plot_graph():
@@ -15,7 +20,10 @@ def build_integrated_plot_graph():
     workflow = StateGraph(IntegratedPlotState)
     
     # 노드 추가
-    workflow.add_node("generate_plot", generate_integrated_plot_node)
+    workflow.add_node(
+        "generate_plot",
+        sync_async_node(generate_integrated_plot_node, agenerate_integrated_plot_node),
+    )
     workflow.add_node("save_plot", save_plot_to_file)
     
     # 엣지 추가
@@ -7,8 +7,9 @@ from langchain_core.messages import SystemMessage
 from langgraph.graph import END, START, StateGraph
 
 from character_network import CharacterNetwork
-from nodes.stage1_nodes import analyze_narrative_poles_node
+from nodes.stage1_nodes import aanalyze_narrative_poles_node, analyze_narrative_poles_node
 from states.stage1_plot_states import NarrativePolesState
+from utils.llm_call import sync_async_node
 
 
 def build_narrative_poles_graph():
@@ -17,7 +18,10 @@ def build_narrative_poles_graph():
     workflow = StateGraph(NarrativePolesState)
     
     # 노드 추가
-    workflow.add_node("analyze_poles", analyze_narrative_poles_node)
+    workflow.add_node(
+        "analyze_poles",
+        sync_async_node(analyze_narrative_poles_node, aanalyze_narrative_poles_node),
+    )
     
     # 엣지 추가
     workflow.add_edge(START, "analyze_poles")
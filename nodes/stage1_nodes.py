@@ -3,13 +3,16 @@ LangGraph 노드 구현 - 단일 책임 원칙에 따라 각 노드는 하나의
 """
 
 import os
-import warnings
+import re
 from datetime import datetime
-from typing import Any, Dict
+from functools import lru_cache
+from typing import Any, Dict, Optional
 
 from langchain_core.messages import SystemMessage
+from langchain_core.runnables import RunnableConfig
 
-from character_network import CharacterNetwork
+from character_network import CharacterNetwork, NodeType
+from graph_journal import JOURNAL_EXTENSION, GraphJournal
 from prompts.stage1_prompts import (
     CHARACTER_PROMPT,
     CONSOLIDATION_PREPARE_PROMPT,
@@ -26,6 +29,7 @@ from pydantics.stage1_pydantics import (
     ConsolidationResult,
     Event,
     Infos,
+    InfoType,
     # Plot,
     # PlotCandidates,
     Roles,
@@ -33,6 +37,9 @@ from pydantics.stage1_pydantics import (
 
 # LLM 설정
 from utils import create_unified_extractor
+from utils.graph_offload import save_graph
+from utils.llm_call import acall_extractor, call_extractor
+from utils.progress import emit_progress
 
 # ============ LLM 호출 노드들 (Input/Output 명시) ============
 
@@ -84,36 +91,30 @@ from utils import create_unified_extractor
 #     return {"plot": plot}
 
 
+def _roles_prompt(state: Dict[str, Any]) -> str:
+    topic = state["topic"]
+    conflict = state["conflict"]
+    vibe = state["vibe"]
+
+    return ROLES_PROMPT.format(topic=topic, conflict=conflict, vibe=vibe)
+
+
 def define_main_character_roles(state: Dict[str, Any]) -> Dict[str, Any]:
     """
     legacy : Topic을 받아서 Roles를 생성하는 LLM 노드
     현재는 RoleInfo를 생성해야함.
     """
-    topic = state["topic"]
-    conflict = state["conflict"]
-    vibe = state["vibe"]
+    roles = call_extractor(state, _roles_prompt(state), Roles)
+    return {"roles": roles.roles}
 
-    prompt = ROLES_PROMPT.format(topic=topic, conflict=conflict, vibe=vibe)
-
-    extractor = create_unified_extractor(
-        model_name=state.get("model"),
-        extractor_type=state.get("extractor_type", "default"),
-        tools=[Roles],
-        tool_choice="Roles",
-    )
-    response = extractor.invoke([SystemMessage(content=prompt)])
-    if hasattr(response, "responses") and response["responses"][0]:
-        parsed = response["responses"][0]
-    else:  # trustcall의 emtpy response 문제 때문에 임시 처리
-        args = response["messages"][0].tool_calls[0]["args"]
-        parsed = Roles(**args)
-    roles = parsed
 
+async def adefine_main_character_roles(state: Dict[str, Any]) -> Dict[str, Any]:
+    """define_main_character_roles의 비동기 버전"""
+    roles = await acall_extractor(state, _roles_prompt(state), Roles)
     return {"roles": roles.roles}
 
 
-def create_character_node(state: Dict[str, Any]) -> Dict[str, Any]:
-    """CharacterCreationState를 받아서 Character와 Info를 생성하는 LLM 노드"""
+def _character_prompt(state: Dict[str, Any]) -> str:
     role = state["role"]
     topic = state["topic"]
     conflict = state["conflict"]
@@ -123,22 +124,18 @@ def create_character_node(state: Dict[str, Any]) -> Dict[str, Any]:
     #Chracter는 Vibe 고착화될까봐 쓰지 않음.
 
     # 초기 캐릭터 생성
-    prompt = CHARACTER_PROMPT.format(topic=topic, role=role, conflict=conflict, role_info=role_info_str)
+    return CHARACTER_PROMPT.format(topic=topic, role=role, conflict=conflict, role_info=role_info_str)
 
-    extractor = create_unified_extractor(
-        model_name=state.get("model"),
-        extractor_type=state.get("extractor_type", "default"),
-        tools=[Character],
-        tool_choice="Character",
-    )
-    response = extractor.invoke([SystemMessage(content=prompt)])
-    if hasattr(response, "responses") and response["responses"][0]:
-        parsed = response["responses"][0]
-    else:  # trustcall의 emtpy response 문제 때문에 임시 처리
-        args = response["messages"][0].tool_calls[0]["args"]
-        parsed = Character(**args)
-    character = parsed
 
+def create_character_node(state: Dict[str, Any]) -> Dict[str, Any]:
+    """CharacterCreationState를 받아서 Character와 Info를 생성하는 LLM 노드"""
+    character = call_extractor(state, _character_prompt(state), Character)
+    return {"generated_character": [character]}
+
+
+async def acreate_character_node(state: Dict[str, Any]) -> Dict[str, Any]:
+    """create_character_node의 비동기 버전"""
+    character = await acall_extractor(state, _character_prompt(state), Character)
     return {"generated_character": [character]}
 
 
@@ -309,126 +306,62 @@ def update_graph_with_character(state: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
-def update_graph_with_event(state: Dict[str, Any]) -> Dict[str, Any]:
-    """생성된 Event와 PlaceHolder를 Graph에 추가"""
-    graph: CharacterNetwork = state["graph"]
-    events = state["generated_event"]
-    current_iteration = state["current_iteration"]
-    for char_id, info_id, event in events:
-        event_id = graph.add_event(
-            summary=event.summary,
-            target_info_type=event.target_info_type,
-            owner_id=char_id,
-            created_at=current_iteration,
-        )
-        graph.connect_nodes(info_id, event_id)
-        # PlaceHolder 노드들 추가 및 Event와 연결
-        for placeholder in event.placeholders:
-            ph_id = graph.add_placeholder(
-                role=placeholder.role,
-                owner_id=event_id,
-                created_at=current_iteration,
-            )
-            graph.connect_nodes(event_id, ph_id)
-    return {"graph": graph}
+def _path_safe(name: str) -> str:
+    return re.sub(r"[^\w.-]", "_", name)
 
 
-def update_graph_after_consolidation(state: Dict[str, Any]) -> Dict[str, Any]:
-    """Consolidation 결과를 Graph에 반영"""
-    graph: CharacterNetwork = state["graph"]
-    consolidated_roles = state["consolidated_roles"]
-    current_iteration = state["current_iteration"]
-    # 노드 통합
-    for role in consolidated_roles:
-        original_ids = list(role.original_placeholders.keys())
-        owner_ids = []
-        for original_id in original_ids:
-            if original_id not in graph.nodes:
-                raise ValueError(f"Original id {original_id} not found in graph")
-            owner_ids.append(graph.nodes[original_id].data.get("owner_id", "Unknown"))
-            original_role = graph.nodes[original_id].data.get("role", "Unknown")
-            if original_role != role.original_placeholders[original_id]:
-                warnings.warn(
-                    f"Warning: Original role {original_role} does not match {role.original_placeholders[original_id]}"
-                )
-
-        # Event summary 업데이트: 원본 PlaceHolder 역할명을 통합된 역할명으로 치환
-        for original_id, original_role_name in role.original_placeholders.items():
-            event_id = graph.nodes[original_id].data.get("owner_id")
-            if event_id in graph.nodes:
-                event_node = graph.nodes[event_id]
-                old_summary = event_node.data.get("summary", "")
-                # 원본: "(엄격한 아버지)" → 통합: "(권위적인 조언자)" (모두 괄호 포함)
-                new_summary = old_summary.replace(original_role_name, role.unified_role)
-                event_node.data["summary"] = new_summary
-
-        unified_id = graph.add_placeholder(
-            role.unified_role, owner_ids, created_at=current_iteration
-        )
-        graph.merge_nodes(original_ids, unified_id)
-    return {"graph": graph}
+def save_graph_to_file(
+    state: Dict[str, Any], config: Optional[RunnableConfig] = None
+) -> Dict[str, Any]:
+    """Graph를 파일에 저장
 
+    config["configurable"] 옵션:
+    - graph_file_extension: 저장 포맷 (기본 ".json", ".cnet"이면 바이너리 스냅샷)
+    - graph_journal: True면 매번 새 파일 대신 하나의 저널 파일에 변경 연산만 덧붙임
+    - graph_journal_path: 저널 파일 경로 (기본 saved_graphs/story_graph_[<thread_id>_]<시각>.journal.jsonl)
+    - graph_journal_keep: 지정 시 최근 N개 checkpoint만 남기도록 저널 compaction
+    - graph_journal_compact_every: compaction 간격 (기본 graph_journal_keep, checkpoint가 이만큼 더 쌓였을 때만 compact)
+    - graph_offload: "thread" / "process"면 파일 직렬화를 전용 스레드 / 워커 프로세스에서 실행 (utils.graph_offload)
+    - stream_progress: True면 통계를 print 대신 graph_saved 이벤트로 전송
 
-def update_graph_with_infos(state: Dict[str, Any]) -> Dict[str, Any]:
-    """새로운 Character를 생성하고 입력받은 Info들을 연결하고 PlaceHolder 제거"""
-    graph: CharacterNetwork = state["graph"]
-    generated_infos = state["generated_infos"]
-    current_iteration = state["current_iteration"]
-
-    for placeholder_id, infos in generated_infos:
-        placeholder_node = graph.nodes[placeholder_id]
-        placeholder_role = placeholder_node.data.get("role", "Unknown")
-
-        # PlaceHolder와 연결된 유효한 Event 목록 수집
-        valid_event_ids = set()
-        for edge_id in placeholder_node.edges:
-            if edge_id.startswith("event_"):
-                valid_event_ids.add(edge_id)
-
-        char_id = graph.add_character(
-            role=placeholder_role, created_at=current_iteration
-        )
-        for info in infos:
-            info_id = graph.add_info(
-                info_type=info.type,
-                content=info.content,
-                owner_id=char_id,
-                created_at=current_iteration,
-            )
-            if info.event_id != "미정":
-                # 검증: event_id가 실제로 Graph에 존재하는지 확인
-                if info.event_id not in graph.nodes:
-                    warnings.warn(
-                        f"Warning: {placeholder_role}의 Info가 존재하지 않는 event_id '{info.event_id}'를 참조합니다. 연결하지 않습니다."
-                    )
-                    continue
-
-                # 검증: event_id가 PlaceHolder와 실제로 연결되어 있는지 확인
-                if info.event_id not in valid_event_ids:
-                    warnings.warn(
-                        f"""Warning: {placeholder_role}의 Info가 연결되지 않은 event_id '{info.event_id}'를 참조합니다.
-                        유효한 event_id: {list(valid_event_ids)}
-                        연결하지 않습니다."""
-                    )
-                    continue
-
-                graph.connect_nodes(info_id, info.event_id)
-            graph.connect_nodes(info_id, char_id)
-        graph.remove_node(placeholder_id)
-    return {"graph": graph}
-
-
-def save_graph_to_file(state: Dict[str, Any]) -> Dict[str, Any]:
-    """Graph를 파일에 저장"""
+    thread_id가 있으면 파일 이름에 넣어, 같은 프로세스에서 동시에 진행 중인 실행(batch_stage1)끼리
+    같은 초에 같은 iteration을 저장해도 서로 덮어쓰지 않는다.
+    """
     graph: CharacterNetwork = state["graph"]
     current_iteration = state["current_iteration"]
+    configurable = (config or {}).get("configurable", {})
     output_dir = "saved_graphs"
     os.makedirs(output_dir, exist_ok=True)
 
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    graph.save_to_file(f"{output_dir}/story_graph_{timestamp}_{current_iteration}.json")
+    file_tag = datetime.now().strftime("%Y%m%d_%H%M%S")
+    if configurable.get("thread_id"):
+        file_tag = f"{_path_safe(str(configurable['thread_id']))}_{file_tag}"
+    if configurable.get("graph_journal"):
+        journal_path = (
+            graph.journal_path
+            or configurable.get("graph_journal_path")
+            or f"{output_dir}/story_graph_{file_tag}{JOURNAL_EXTENSION}"
+        )
+        # 어느 서브그래프에서 저장했는지 checkpoint 라벨로 남김 (예: run_event_subgraph)
+        checkpoint_ns = (config or {}).get("metadata", {}).get("langgraph_checkpoint_ns", "")
+        label = checkpoint_ns.split("|")[0].split(":")[0] or None
+        journal = GraphJournal(journal_path)
+        journal.checkpoint(graph, current_iteration, label=label)
+        if configurable.get("graph_journal_keep"):
+            journal.compact_if_needed(
+                graph,
+                keep_last=configurable["graph_journal_keep"],
+                every=configurable.get("graph_journal_compact_every"),
+            )
+        saved_path = journal_path
+    else:
+        extension = configurable.get("graph_file_extension", ".json")
+        saved_path = f"{output_dir}/story_graph_{file_tag}_{current_iteration}{extension}"
+        save_graph(graph, saved_path, config)
 
     stats = graph.get_statistics()
+    if emit_progress("graph_saved", path=saved_path, iteration=current_iteration, stats=stats):
+        return state
     print("\n=== 워크플로우 완료 ===")
     print(f"주제: {state['topic']}")
     print(f"총 노드: {stats['total_nodes']}")
@@ -478,15 +411,14 @@ from pydantics.stage1_plot_pydantics import (
     IntegratedPlot,
 )
 
+THEME_LIST_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "utils", "theme_list.txt"
+)
 
-def analyze_narrative_poles_node(state: Dict[str, Any]) -> Dict[str, Any]:
-    """캐릭터 네트워크를 분석하여 서사적 양극을 설정하는 노드"""
-    graph: CharacterNetwork = state["graph"]
-    topic = state["topic"]
-    conflict = state["conflict"]
-    vibe = state["vibe"]
-    
-    # 캐릭터 네트워크 분석 정보 추출
+
+# ---- 프롬프트 context (이전 단계 결과와 무관하므로 워크플로우에서 미리 병렬로 만들 수 있음) ----
+def build_character_network_analysis(graph: CharacterNetwork) -> str:
+    """서사적 양극 분석용 캐릭터 네트워크 분석 텍스트"""
     character_analysis = []
     characters = graph.get_characters()
     
@@ -503,12 +435,11 @@ def analyze_narrative_poles_node(state: Dict[str, Any]) -> Dict[str, Any]:
         )
         # --------------------
         infos = []
-        for edge_id in char_node.edges:
-            if edge_id.startswith("info_"):
-                info_node = graph.nodes[edge_id]
-                info_type = info_node.data.get("info_type", "")
-                content = info_node.data.get("content", "")
-                infos.append(f"{info_type}: {content}")
+        for edge_id in graph.get_neighbors(char_id, NodeType.INFO):
+            info_node = graph.nodes[edge_id]
+            info_type = info_node.data.get("type", "")
+            content = info_node.data.get("content", "")
+            infos.append(f"{info_type}: {content}")
         
         # character_analysis.append(f"\n{role}:\n" + "\n".join(infos))
         # --- [핵심 수정] ---
@@ -516,58 +447,93 @@ def analyze_narrative_poles_node(state: Dict[str, Any]) -> Dict[str, Any]:
         character_analysis.append(f"\n{role}:\n{analysis_str}\n  [세부 속성]\n" + "\n".join(infos))
         # --------------------
     
-    character_network_analysis = "\n".join(character_analysis)
+    return "\n".join(character_analysis)
+
+
+def build_main_characters_summary(graph: CharacterNetwork) -> str:
+    """Sub-theme 선정용 주연 캐릭터 desire / fear 요약"""
+    main_characters = []
+    for char_id, char_node in graph.get_characters()[:5]:  # 주연 5명까지
+        role = char_node.data.get("role", "Unknown")
+        # Desire와 Fear 정보 찾기
+        for edge_id in graph.get_neighbors(char_id, NodeType.INFO):
+            info_node = graph.nodes[edge_id]
+            info_type = info_node.data.get("type")
+            if info_type in (InfoType.DESIRE.value, InfoType.FEAR.value):
+                main_characters.append(f"{role} - {info_type}: {info_node.data.get('content')}")
+    
+    return "\n".join(main_characters)
+
+
+def build_character_conflict_analysis(graph: CharacterNetwork) -> str:
+    """기폭사건 생성용 Event / PlaceHolder 갈등 분석 텍스트"""
+    conflict_analysis = []
     
-    prompt = NARRATIVE_POLES_PROMPT.format(
+    # Event 패턴 분석
+    events = graph.get_events()
+    for event_id, event_node in events[:10]:  # 최대 10개 이벤트 분석
+        summary = event_node.data.get("summary", "")
+        conflict_analysis.append(f"과거 사건 패턴: {summary}")
+    
+    # PlaceHolder 분석
+    placeholders = graph.get_placeholders()
+    for ph_id, ph_node in placeholders[:5]:  # 최대 5개 PlaceHolder
+        role = ph_node.data.get("role", "")
+        conflict_analysis.append(f"잠재적 갈등 인물: {role}")
+    
+    return "\n".join(conflict_analysis)
+
+
+@lru_cache(maxsize=1)
+def load_theme_list() -> str:
+    """utils/theme_list.txt 내용 (프로세스당 한 번만 읽음)"""
+    with open(THEME_LIST_PATH, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def _analyze_narrative_poles_prompt(state: Dict[str, Any]) -> str:
+    topic = state["topic"]
+    conflict = state["conflict"]
+    vibe = state["vibe"]
+    
+    # 캐릭터 네트워크 분석 정보 (워크플로우에서 미리 만든 값이 있으면 사용)
+    character_network_analysis = state.get("character_network_analysis")
+    if character_network_analysis is None:
+        character_network_analysis = build_character_network_analysis(state["graph"])
+    
+    return NARRATIVE_POLES_PROMPT.format(
         topic=topic,
         conflict=conflict,
         vibe=vibe,
         character_network_analysis=character_network_analysis
     )
-    
-    extractor = create_unified_extractor(
-        model_name=state.get("model"),
-        extractor_type=state.get("extractor_type", "default"),
-        tools=[NarrativePoles],
-        tool_choice="NarrativePoles",
-    )
-    
-    response = extractor.invoke([SystemMessage(content=prompt)])
-    if hasattr(response, "responses") and response["responses"][0]:
-        parsed = response["responses"][0]
-    else:
-        args = response["messages"][0].tool_calls[0]["args"]
-        parsed = NarrativePoles(**args)
-    
+
+
+def analyze_narrative_poles_node(state: Dict[str, Any]) -> Dict[str, Any]:
+    """캐릭터 네트워크를 분석하여 서사적 양극을 설정하는 노드"""
+    parsed = call_extractor(state, _analyze_narrative_poles_prompt(state), NarrativePoles)
     return {"narrative_poles": parsed}
 
 
-def select_sub_themes_node(state: Dict[str, Any]) -> Dict[str, Any]:
-    """Act별 Sub-theme을 선정하는 노드"""
+async def aanalyze_narrative_poles_node(state: Dict[str, Any]) -> Dict[str, Any]:
+    """analyze_narrative_poles_node의 비동기 버전"""
+    parsed = await acall_extractor(state, _analyze_narrative_poles_prompt(state), NarrativePoles)
+    return {"narrative_poles": parsed}
+
+
+def _select_sub_themes_prompt(state: Dict[str, Any]) -> str:
     topic = state["topic"]
     conflict = state["conflict"]
     vibe = state["vibe"]
     narrative_poles = state["narrative_poles"]
 
-    # 주연 캐릭터 정보 요약
-    graph: CharacterNetwork = state["graph"]
-    main_characters = []
-    for char_id, char_node in graph.get_characters()[:5]:  # 주연 5명까지
-        role = char_node.data.get("role", "Unknown")
-        # Desire와 Fear 정보 찾기
-        for edge_id in char_node.edges:
-            if edge_id.startswith("info_"):
-                info_node = graph.nodes[edge_id]
-                if info_node.data.get("info_type") in ["desire", "fear"]:
-                    main_characters.append(f"{role} - {info_node.data.get('info_type')}: {info_node.data.get('content')}")
+    # 주연 캐릭터 정보 요약 / theme 목록 (워크플로우에서 미리 만든 값이 있으면 사용)
+    main_characters_summary = state.get("main_characters_summary")
+    if main_characters_summary is None:
+        main_characters_summary = build_main_characters_summary(state["graph"])
+    theme_list = state.get("theme_list") or load_theme_list()
     
-    main_characters_summary = "\n".join(main_characters)
-    
-    # theme_list.txt 읽기
-    with open("utils/theme_list.txt", "r", encoding="utf-8") as f:
-        theme_list = f.read()
-    
-    prompt = SUB_THEME_SELECTION_PROMPT.format(
+    return SUB_THEME_SELECTION_PROMPT.format(
         topic=topic,
         conflict=conflict,
         vibe=vibe,
@@ -576,26 +542,21 @@ def select_sub_themes_node(state: Dict[str, Any]) -> Dict[str, Any]:
         main_characters_summary=main_characters_summary,
         theme_list=theme_list
     )
-    
-    extractor = create_unified_extractor(
-        model_name=state.get("model"),
-        extractor_type=state.get("extractor_type", "default"),
-        tools=[ActSubThemes],
-        tool_choice="ActSubThemes",
-    )
-    
-    response = extractor.invoke([SystemMessage(content=prompt)])
-    if hasattr(response, "responses") and response["responses"][0]:
-        parsed = response["responses"][0]
-    else:
-        args = response["messages"][0].tool_calls[0]["args"]
-        parsed = ActSubThemes(**args)
-    
+
+
+def select_sub_themes_node(state: Dict[str, Any]) -> Dict[str, Any]:
+    """Act별 Sub-theme을 선정하는 노드"""
+    parsed = call_extractor(state, _select_sub_themes_prompt(state), ActSubThemes)
     return {"sub_themes": parsed}
 
 
-def create_inciting_and_macro_node(state: Dict[str, Any]) -> Dict[str, Any]:
-    """기폭사건과 Macro Cliffhanger를 생성하는 노드"""
+async def aselect_sub_themes_node(state: Dict[str, Any]) -> Dict[str, Any]:
+    """select_sub_themes_node의 비동기 버전"""
+    parsed = await acall_extractor(state, _select_sub_themes_prompt(state), ActSubThemes)
+    return {"sub_themes": parsed}
+
+
+def _create_inciting_and_macro_prompt(state: Dict[str, Any]) -> str:
     topic = state["topic"]
     conflict = state["conflict"]
     vibe = state["vibe"]
@@ -603,30 +564,17 @@ def create_inciting_and_macro_node(state: Dict[str, Any]) -> Dict[str, Any]:
     sub_themes = state["sub_themes"]
 
 
-    # 캐릭터 충돌 분석
-    graph: CharacterNetwork = state["graph"]
-    conflict_analysis = []
-    
-    # Event 패턴 분석
-    events = graph.get_events()
-    for event_id, event_node in events[:10]:  # 최대 10개 이벤트 분석
-        summary = event_node.data.get("summary", "")
-        conflict_analysis.append(f"과거 사건 패턴: {summary}")
-    
-    # PlaceHolder 분석
-    placeholders = graph.get_placeholders()
-    for ph_id, ph_node in placeholders[:5]:  # 최대 5개 PlaceHolder
-        role = ph_node.data.get("role", "")
-        conflict_analysis.append(f"잠재적 갈등 인물: {role}")
-    
-    character_conflict_analysis = "\n".join(conflict_analysis)
+    # 캐릭터 충돌 분석 (워크플로우에서 미리 만든 값이 있으면 사용)
+    character_conflict_analysis = state.get("character_conflict_analysis")
+    if character_conflict_analysis is None:
+        character_conflict_analysis = build_character_conflict_analysis(state["graph"])
     
     # Sub-themes 정보 포매팅
     sub_themes_text = f"""Act 1: {sub_themes.act1_theme.theme}
 Act 2: {sub_themes.act2_theme.theme}
 Act 3: {sub_themes.act3_theme.theme}"""
     
-    prompt = INCITING_INCIDENT_AND_MACRO_CLIFFHANGERS_PROMPT.format(
+    return INCITING_INCIDENT_AND_MACRO_CLIFFHANGERS_PROMPT.format(
         topic=topic,
         conflict=conflict,
         vibe=vibe,
@@ -635,26 +583,21 @@ Act 3: {sub_themes.act3_theme.theme}"""
         sub_themes=sub_themes_text,
         character_conflict_analysis=character_conflict_analysis
     )
-    
-    extractor = create_unified_extractor(
-        model_name=state.get("model"),
-        extractor_type=state.get("extractor_type", "default"),
-        tools=[IncitingAndMacroStructure],
-        tool_choice="IncitingAndMacroStructure",
-    )
-    
-    response = extractor.invoke([SystemMessage(content=prompt)])
-    if hasattr(response, "responses") and response["responses"][0]:
-        parsed = response["responses"][0]
-    else:
-        args = response["messages"][0].tool_calls[0]["args"]
-        parsed = IncitingAndMacroStructure(**args)
-    
+
+
+def create_inciting_and_macro_node(state: Dict[str, Any]) -> Dict[str, Any]:
+    """기폭사건과 Macro Cliffhanger를 생성하는 노드"""
+    parsed = call_extractor(state, _create_inciting_and_macro_prompt(state), IncitingAndMacroStructure)
     return {"inciting_and_macro": parsed}
 
 
-def design_structural_tempo_node(state: Dict[str, Any]) -> Dict[str, Any]:
-    """구조적 템포를 설계하는 노드"""
+async def acreate_inciting_and_macro_node(state: Dict[str, Any]) -> Dict[str, Any]:
+    """create_inciting_and_macro_node의 비동기 버전"""
+    parsed = await acall_extractor(state, _create_inciting_and_macro_prompt(state), IncitingAndMacroStructure)
+    return {"inciting_and_macro": parsed}
+
+
+def _design_structural_tempo_prompt(state: Dict[str, Any]) -> str:
     narrative_poles = state["narrative_poles"]
     inciting_and_macro = state["inciting_and_macro"]
     sub_themes = state["sub_themes"]
@@ -672,33 +615,28 @@ def design_structural_tempo_node(state: Dict[str, Any]) -> Dict[str, Any]:
 Act 2: {sub_themes.act2_theme.theme}
 Act 3: {sub_themes.act3_theme.theme}"""
     
-    prompt = STRUCTURAL_TEMPO_PROMPT.format(
+    return STRUCTURAL_TEMPO_PROMPT.format(
         starting_point=narrative_poles.starting_point.description,
         ending_point=narrative_poles.ending_point.description,
         inciting_incident=inciting_and_macro.inciting_incident.event_description,
         macro_cliffhangers=macro_cliffhangers_text,
         sub_themes=sub_themes_text
     )
-    
-    extractor = create_unified_extractor(
-        model_name=state.get("model"),
-        extractor_type=state.get("extractor_type", "default"),
-        tools=[StructuralTempo],
-        tool_choice="StructuralTempo",
-    )
-    
-    response = extractor.invoke([SystemMessage(content=prompt)])
-    if hasattr(response, "responses") and response["responses"][0]:
-        parsed = response["responses"][0]
-    else:
-        args = response["messages"][0].tool_calls[0]["args"]
-        parsed = StructuralTempo(**args)
-    
+
+
+def design_structural_tempo_node(state: Dict[str, Any]) -> Dict[str, Any]:
+    """구조적 템포를 설계하는 노드"""
+    parsed = call_extractor(state, _design_structural_tempo_prompt(state), StructuralTempo)
     return {"structural_tempo": parsed}
 
 
-def generate_integrated_plot_node(state: Dict[str, Any]) -> Dict[str, Any]:
-    """통합 플롯을 생성하는 노드"""
+async def adesign_structural_tempo_node(state: Dict[str, Any]) -> Dict[str, Any]:
+    """design_structural_tempo_node의 비동기 버전"""
+    parsed = await acall_extractor(state, _design_structural_tempo_prompt(state), StructuralTempo)
+    return {"structural_tempo": parsed}
+
+
+def _generate_integrated_plot_prompt(state: Dict[str, Any]) -> str:
     narrative_poles = state["narrative_poles"]
     sub_themes = state["sub_themes"]
     inciting_and_macro = state["inciting_and_macro"]
@@ -724,27 +662,23 @@ Act 3: {sub_themes.act3_theme.theme} ({sub_themes.act3_theme.relationship_to_cor
 중간아크 총 화수: {structural_tempo.episode_distribution.get('intermediate_arcs', 0)}화
 독자 경험: {structural_tempo.reader_experience_flow}"""
     
-    prompt = INTEGRATED_PLOT_GENERATION_PROMPT.format(
+    return INTEGRATED_PLOT_GENERATION_PROMPT.format(
         narrative_poles=narrative_poles_text,
         sub_themes_result=sub_themes_result_text,
         inciting_and_macro=inciting_and_macro_text,
         structural_tempo=structural_tempo_text
     )
-    
-    extractor = create_unified_extractor(
-        model_name=state.get("model"),
-        extractor_type=state.get("extractor_type", "default"),
-        tools=[IntegratedPlot],
-        tool_choice="IntegratedPlot",
-    )
-    
-    response = extractor.invoke([SystemMessage(content=prompt)])
-    if hasattr(response, "responses") and response["responses"][0]:
-        parsed = response["responses"][0]
-    else:
-        args = response["messages"][0].tool_calls[0]["args"]
-        parsed = IntegratedPlot(**args)
-    
+
+
+def generate_integrated_plot_node(state: Dict[str, Any]) -> Dict[str, Any]:
+    """통합 플롯을 생성하는 노드"""
+    parsed = call_extractor(state, _generate_integrated_plot_prompt(state), IntegratedPlot)
+    return {"integrated_plot": parsed}
+
+
+async def agenerate_integrated_plot_node(state: Dict[str, Any]) -> Dict[str, Any]:
+    """generate_integrated_plot_node의 비동기 버전"""
+    parsed = await acall_extractor(state, _generate_integrated_plot_prompt(state), IntegratedPlot)
     return {"integrated_plot": parsed}
 
 
@@ -778,6 +712,8 @@ def save_plot_to_file(state: Dict[str, Any]) -> Dict[str, Any]:
     with open(filename, "w", encoding="utf-8") as f:
         json.dump(full_analysis, f, ensure_ascii=False, indent=2)
     
+    if emit_progress("plot_saved", path=filename, plot_summary=plot.plot_summary):
+        return state
     print(f"\n=== 플롯 생성 완료 ===")
     print(f"플롯 파일 저장: {filename}")
     print(f"\n한 줄 요약: {plot.plot_summary}")
@@ -1,16 +1,21 @@
+import asyncio
 import warnings
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
-from langchain_core.messages import SystemMessage
+from langchain_core.runnables import RunnableConfig
 from langgraph.graph import END, START, StateGraph
 from langgraph.types import Send
+from pydantic import ValidationError
 
-from character_network import CharacterNetwork
+from character_network import CharacterNetwork, NodeType
 from nodes.stage1_nodes import initialize_accumulated_state, save_graph_to_file
-from prompts.stage1_prompts import PLACEHOLDER_INFO_PROMPT
-from pydantics.stage1_pydantics import Infos
+from prompts.stage1_prompts import PLACEHOLDER_INFO_BATCH_PROMPT, PLACEHOLDER_INFO_PROMPT
+from pydantics.stage1_pydantics import Infos, PlaceHolderInfosBatch
 from states.stage1_states import PlaceHolderReplaceState
-from utils import create_unified_extractor
+from utils.branch_retry import aretry_branch, branch_node, retry_branch
+from utils.graph_offload import graph_update_node
+from utils.llm_call import RESPONSE_PARSE_ERRORS, acall_extractor, call_extractor
+from utils.progress import progress_node, report_fanout
 
 
 # ============ 노드 함수들 ============
@@ -21,55 +26,145 @@ def prepare_placeholders_node(state: Dict[str, Any]) -> Dict[str, Any]:
     placeholders = []
 
     # 모든 PlaceHolder 노드 찾기
-    for node_id, node in graph.nodes.items():
-        if node.type.value == "placeholder":
-            connected_events = []
-            for edge_id in node.edges:
-                if (
-                    edge_id in graph.nodes
-                    and graph.nodes[edge_id].type.value == "event"
-                ):
-                    connected_events.append(edge_id)
-            placeholders.append((node_id, connected_events))
+    for node_id, node in graph.get_placeholders():
+        connected_events = graph.get_neighbors(node_id, NodeType.EVENT)
+        placeholders.append((node_id, connected_events))
     return {
         "placeholders": placeholders,
     }
 
 
-def create_info_for_placeholder_node(state: Dict[str, Any]) -> Dict[str, Any]:
-    """PlaceHolder와 연결된 Event context로 Info 생성 (LLM 호출)"""
-    placeholder_id = state["placeholder_id"]
+def _placeholder_info_prompt(state: Dict[str, Any]) -> str:
     placeholder_role = state["placeholder_role"]
     event_contexts = state["event_contexts"]
     valid_event_ids = state.get("valid_event_ids", [])  # 유효한 event_id 목록 가져오기
 
     # 프롬프트 생성 (유효한 event_id 목록 포함)
-    prompt = PLACEHOLDER_INFO_PROMPT.format(
+    return PLACEHOLDER_INFO_PROMPT.format(
         placeholder_role=placeholder_role,
         event_contexts=event_contexts,
         valid_event_ids=valid_event_ids,  # 유효한 event_id 명시
     )
 
-    # LLM 호출하여 Info 생성
-    extractor = create_unified_extractor(
-        model_name=state.get("model"),
-        extractor_type=state.get("extractor_type", "default"),
-        tools=[Infos],
-        tool_choice="Infos",
-    )
-    response = extractor.invoke([SystemMessage(content=prompt)])
-    if hasattr(response, "responses") and response["responses"][0]:
-        parsed = response["responses"][0]
-    else:  # trustcall의 emtpy response 문제 때문에 임시 처리
-        args = response["messages"][0].tool_calls[0]["args"]
-        parsed = Infos(**args)
-    infos = parsed
 
+def create_info_for_placeholder_node(state: Dict[str, Any]) -> Dict[str, Any]:
+    """PlaceHolder와 연결된 Event context로 Info 생성 (LLM 호출)"""
+    infos = call_extractor(state, _placeholder_info_prompt(state), Infos)
+    return {
+        "generated_infos": [(state["placeholder_id"], infos.infos)],
+    }
+
+
+async def acreate_info_for_placeholder_node(state: Dict[str, Any]) -> Dict[str, Any]:
+    """create_info_for_placeholder_node의 비동기 버전"""
+    infos = await acall_extractor(state, _placeholder_info_prompt(state), Infos)
     return {
-        "generated_infos": [(placeholder_id, infos.infos)],
+        "generated_infos": [(state["placeholder_id"], infos.infos)],
     }
 
 
+def _placeholder_batch_prompt(state: Dict[str, Any]) -> str:
+    placeholder_items = "\n\n".join(
+        f"PlaceHolder: {item['placeholder_id']} \"{item['placeholder_role']}\"\n"
+        f"관련 사건:\n{item['event_contexts']}\n"
+        f"사용가능 event_id: {item['valid_event_ids']}"
+        for item in state["items"]
+    )
+    return PLACEHOLDER_INFO_BATCH_PROMPT.format(placeholder_items=placeholder_items)
+
+
+def _match_batch_infos(
+    state: Dict[str, Any], batch: PlaceHolderInfosBatch
+) -> Tuple[List[Tuple[str, List[Any]]], List[Dict[str, Any]]]:
+    """
+    배치 응답을 placeholder_id 기준으로 요청 항목과 매칭
+
+    Returns:
+        (검증을 통과한 (placeholder_id, infos) 목록, 개별 호출로 다시 생성할 항목 목록)
+    """
+    items = {item["placeholder_id"]: item for item in state["items"]}
+    generated = []
+    retry = []
+    for entry in batch.placeholders:
+        item = items.pop(entry.placeholder_id, None)
+        if item is None:
+            warnings.warn(
+                f"Warning: 요청하지 않았거나 중복된 placeholder_id '{entry.placeholder_id}'의 Info가 생성되었습니다. 무시합니다."
+            )
+            continue
+        # 개수 / event_id 중복 규칙은 PlaceHolder별로 검증
+        try:
+            infos = Infos(infos=entry.infos)
+        except ValidationError as error:
+            warnings.warn(
+                f"Warning: {entry.placeholder_id}의 Info가 검증에 실패했습니다. 개별 생성합니다.\n{error}"
+            )
+            retry.append(item)
+            continue
+        # 배치 프롬프트에는 여러 PlaceHolder의 event_id가 함께 있으므로 다른 항목의 id를 가져오지 않았는지 확인
+        allowed_event_ids = set(item["valid_event_ids"]) | {"미정"}
+        foreign_ids = [info.event_id for info in infos.infos if info.event_id not in allowed_event_ids]
+        if foreign_ids:
+            warnings.warn(
+                f"Warning: {entry.placeholder_id}의 Info가 연결되지 않은 event_id {foreign_ids}를 참조합니다. 개별 생성합니다."
+            )
+            retry.append(item)
+            continue
+        generated.append((entry.placeholder_id, infos.infos))
+
+    if items:
+        warnings.warn(f"Warning: Info가 생성되지 않은 placeholder_id: {list(items)}. 개별 생성합니다.")
+        retry.extend(items.values())
+    return generated, retry
+
+
+# 배치 안의 개별 생성은 항목별로 재시도 / 건너뛰기 (한 항목이 실패해도 배치를 다시 호출하지 않고 나머지 Info는 유지)
+_create_info_item = retry_branch(create_info_for_placeholder_node, report_progress=False)
+_acreate_info_item = aretry_branch(acreate_info_for_placeholder_node, report_progress=False)
+
+
+def _merge_item_results(
+    generated: List[Tuple[str, List[Any]]], results: List[Dict[str, Any]]
+) -> Dict[str, Any]:
+    failed = []
+    for result in results:
+        generated.extend(result.get("generated_infos", []))
+        failed.extend(result.get("failed_branches", []))
+    output: Dict[str, Any] = {"generated_infos": generated}
+    if failed:
+        output["failed_branches"] = failed
+    return output
+
+
+def create_info_batch_node(state: Dict[str, Any]) -> Dict[str, Any]:
+    """여러 PlaceHolder의 Info를 한 번의 LLM 호출로 생성하는 노드 (실패 항목은 개별 호출, 개별 호출도 실패하면 failed_branches에 기록)"""
+    try:
+        batch = call_extractor(state, _placeholder_batch_prompt(state), PlaceHolderInfosBatch)
+    except RESPONSE_PARSE_ERRORS as error:
+        warnings.warn(f"Warning: 배치 Info 응답을 처리하지 못했습니다. 전체를 개별 생성합니다.\n{error}")
+        generated, retry = [], state["items"]
+    else:
+        generated, retry = _match_batch_infos(state, batch)
+
+    return _merge_item_results(generated, [_create_info_item(item) for item in retry])
+
+
+async def acreate_info_batch_node(state: Dict[str, Any]) -> Dict[str, Any]:
+    """create_info_batch_node의 비동기 버전 (실패 항목은 동시에 개별 호출)"""
+    try:
+        batch = await acall_extractor(
+            state, _placeholder_batch_prompt(state), PlaceHolderInfosBatch
+        )
+    except RESPONSE_PARSE_ERRORS as error:
+        warnings.warn(f"Warning: 배치 Info 응답을 처리하지 못했습니다. 전체를 개별 생성합니다.\n{error}")
+        generated, retry = [], state["items"]
+    else:
+        generated, retry = _match_batch_infos(state, batch)
+
+    results = await asyncio.gather(*(_acreate_info_item(item) for item in retry))
+    return _merge_item_results(generated, list(results))
+
+
 def update_graph_with_infos(state: Dict[str, Any]) -> Dict[str, Any]:
     """새로운 Character를 생성하고 입력받은 Info들을 연결하고 PlaceHolder 제거"""
     graph: CharacterNetwork = state["graph"]
@@ -81,10 +176,7 @@ def update_graph_with_infos(state: Dict[str, Any]) -> Dict[str, Any]:
         placeholder_role = placeholder_node.data.get("role", "Unknown")
 
         # PlaceHolder와 연결된 유효한 Event 목록 수집
-        valid_event_ids = set()
-        for edge_id in placeholder_node.edges:
-            if edge_id.startswith("event_"):
-                valid_event_ids.add(edge_id)
+        valid_event_ids = set(graph.get_neighbors(placeholder_id, NodeType.EVENT))
 
         char_id = graph.add_character(
             role=placeholder_role, created_at=current_iteration
@@ -120,12 +212,19 @@ def update_graph_with_infos(state: Dict[str, Any]) -> Dict[str, Any]:
 
 
 # ============ 조건부 엣지 함수들 ============
-def distribute_placeholder_info_creation(state: PlaceHolderReplaceState) -> List[Send]:
-    """Consolidate된 PlaceHolder들의 Info 생성을 위한 Send 분배"""
+def distribute_placeholder_info_creation(
+    state: PlaceHolderReplaceState, config: Optional[RunnableConfig] = None
+) -> List[Send]:
+    """Consolidate된 PlaceHolder들의 Info 생성을 위한 Send 분배
+
+    config["configurable"] 옵션:
+    - placeholder_batch_size: 한 번의 LLM 호출로 처리할 PlaceHolder 수 (기본 1 = PlaceHolder마다 호출)
+    """
     graph: CharacterNetwork = state["graph"]
     placeholders = state["placeholders"]
+    batch_size = (config or {}).get("configurable", {}).get("placeholder_batch_size", 1)
 
-    sends = []
+    send_states = []
     for placeholder_id, connected_events in placeholders:
         placeholder_node = graph.nodes[placeholder_id]
         placeholder_role = placeholder_node.data.get("role", "Unknown")
@@ -153,10 +252,26 @@ def distribute_placeholder_info_creation(state: PlaceHolderReplaceState) -> List
             "model": state.get("model"),
             "extractor_type": state.get("extractor_type"),
         }
+        send_states.append(send_state)
 
-        sends.append(Send("create_info_for_placeholder", send_state))
+    if batch_size <= 1:
+        return report_fanout(
+            [Send("create_info_for_placeholder", send_state) for send_state in send_states]
+        )
 
-    return sends
+    sends = []
+    for start in range(0, len(send_states), batch_size):
+        batch = send_states[start : start + batch_size]
+        if len(batch) == 1:
+            sends.append(Send("create_info_for_placeholder", batch[0]))
+            continue
+        batch_state = {
+            "items": batch,
+            "model": state.get("model"),
+            "extractor_type": state.get("extractor_type"),
+        }
+        sends.append(Send("create_info_batch", batch_state))
+    return report_fanout(sends)
 
 
 # ============ 서브그래프 구현 ============
@@ -165,11 +280,18 @@ def build_placeholder_replace_subgraph():
     subgraph = StateGraph(PlaceHolderReplaceState)
 
     # 노드 추가
-    subgraph.add_node("initialize_accumulated_state", initialize_accumulated_state)
-    subgraph.add_node("prepare_placeholders", prepare_placeholders_node)
-    subgraph.add_node("create_info_for_placeholder", create_info_for_placeholder_node)
-    subgraph.add_node("update_graph_with_infos", update_graph_with_infos)
-    subgraph.add_node("save_graph_to_file", save_graph_to_file)
+    subgraph.add_node("initialize_accumulated_state", progress_node(initialize_accumulated_state))
+    subgraph.add_node("prepare_placeholders", progress_node(prepare_placeholders_node))
+    subgraph.add_node(
+        "create_info_for_placeholder",
+        branch_node(create_info_for_placeholder_node, acreate_info_for_placeholder_node),
+    )
+    subgraph.add_node(
+        "create_info_batch",
+        branch_node(create_info_batch_node, acreate_info_batch_node),
+    )
+    subgraph.add_node("update_graph_with_infos", graph_update_node(update_graph_with_infos))
+    subgraph.add_node("save_graph_to_file", progress_node(save_graph_to_file))
 
     # # 엣지 구성
     subgraph.add_edge(START, "initialize_accumulated_state")
@@ -179,9 +301,10 @@ def build_placeholder_replace_subgraph():
     subgraph.add_conditional_edges(
         "prepare_placeholders",
         distribute_placeholder_info_creation,
-        ["create_info_for_placeholder"],
+        ["create_info_for_placeholder", "create_info_batch"],
     )
     subgraph.add_edge("create_info_for_placeholder", "update_graph_with_infos")
+    subgraph.add_edge("create_info_batch", "update_graph_with_infos")
     subgraph.add_edge("update_graph_with_infos", "save_graph_to_file")
     subgraph.add_edge("save_graph_to_file", END)
     return subgraph.compile()
@@ -5,8 +5,9 @@
 from typing import Any, Dict
 from langgraph.graph import END, START, StateGraph
 
-from nodes.stage1_nodes import design_structural_tempo_node
+from nodes.stage1_nodes import adesign_structural_tempo_node, design_structural_tempo_node
 from states.stage1_plot_states import StructuralTempoState
+from utils.llm_call import sync_async_node
 
 
 def build_structural_tempo_graph():
@@ -15,7 +16,10 @@ def build_structural_tempo_graph():
     workflow = StateGraph(StructuralTempoState)
     
     # 노드 추가
-    workflow.add_node("design_tempo", design_structural_tempo_node)
+    workflow.add_node(
+        "design_tempo",
+        sync_async_node(design_structural_tempo_node, adesign_structural_tempo_node),
+    )
     
     # 엣지 추가
     workflow.add_edge(START, "design_tempo")
@@ -5,8 +5,9 @@ Sub-theme 선정 서브그래프
 from typing import Any, Dict
 from langgraph.graph import END, START, StateGraph
 
-from nodes.stage1_nodes import select_sub_themes_node
+from nodes.stage1_nodes import aselect_sub_themes_node, select_sub_themes_node
 from states.stage1_plot_states import SubThemeState
+from utils.llm_call import sync_async_node
 
 
 def build_sub_theme_graph():
@@ -15,7 +16,7 @@ def build_sub_theme_graph():
     workflow = StateGraph(SubThemeState)
     
     # 노드 추가
-    workflow.add_node("select_themes", select_sub_themes_node)
+    workflow.add_node("select_themes", sync_async_node(select_sub_themes_node, aselect_sub_themes_node))
     
     # 엣지 추가  
     workflow.add_edge(START, "select_themes")
@@ -198,6 +198,55 @@ EVENT_PROMPT = """
 "placeholders": ["(믿었던 동료)"]
 """
 
+EVENT_BATCH_PROMPT = """
+# 역할: 백스토리 설계자
+
+캐릭터들의 현재 특성(Info)을 형성한 과거 사건을 특성마다 하나씩 설계합니다.
+모든 특성에는 원인이 되는 구체적 사건이 있어야 합니다.
+
+## 입력
+갈등: {conflict}
+분위기: {vibe}
+
+특성 목록 (info_id | 캐릭터 | 특성):
+{info_items}
+
+## 사건 설계 프로세스
+
+### 1. 인과관계 구축
+```
+과거 사건 → 감정적 영향 → 현재 특성
+```
+
+### 2. 분위기 결정
+- 역할이 vibe와 **일치**: 사건도 vibe와 일치
+- 역할이 vibe와 **대비**: 
+  - 옵션A: vibe적 사건 → 반작용으로 현재 성향
+  - 옵션B: 반-vibe적 사건 → 그 기억이 원동력
+
+### 3. PlaceHolder 설계
+사건에 필요한 타인을 "(형용사 명사)" 형식으로:
+- 예: "(믿었던 동료)", "(엄격한 스승)"
+- 각 PlaceHolder는 명확한 역할 수행
+
+## 출력 형식
+- 특성 목록의 **모든 info_id마다 정확히 하나의 사건**을 `events` 리스트로 응답합니다.
+- info_id: 입력 목록의 info_id를 그대로 사용합니다.
+- target_role: 해당 특성을 가진 캐릭터 역할명입니다.
+- summary: 사건에 대한 1-3 문장의 구체적인 서술입니다. (분량: 300자 이내)
+- placeholders: 사건에 관련된 인물들의 역할명을 담은 문자열 리스트입니다.
+- [매우 중요] `summary`에는 target_role과 `placeholders`에 명시된 인물이 반드시 한 번 이상 포함되어야 합니다.
+- 같은 캐릭터의 사건들은 서로 다른 PlaceHolder와 상황을 사용해 다양하게 설계합니다.
+
+## 예시
+- 입력: "info_3 | (순진한 신입) | fear - 타인 불신"
+- 올바른 출력 예시:
+"info_id": "info_3",
+"target_role": "(순진한 신입)",
+"summary": "(순진한 신입)을 지키려던 중요한 순간에 (믿었던 동료)가 배신하여 (순진한 신입)은 큰 손실을 입었고, 그 이후로 타인을 믿지 못하게 되었다.",
+"placeholders": ["(믿었던 동료)"]
+"""
+
 CONSOLIDATION_PREPARE_PROMPT = """
 # 역할: PlaceHolder 유사성 분석 전문가
 
@@ -346,6 +395,49 @@ Event 1개: 제자를 가혹하게 훈련
    - event_id: 미정
 """
 
+PLACEHOLDER_INFO_BATCH_PROMPT = """
+# 역할: PlaceHolder 심화 전문가
+
+여러 PlaceHolder를 실제 캐릭터로 전환하기 위한 Info를 PlaceHolder마다 생성합니다.
+
+## 입력
+{placeholder_items}
+
+## Info 생성 규칙
+
+### 개수 규칙 (PlaceHolder마다)
+- **1개 Event**: 2개 Info (1개는 event_id, 1개는 "미정")
+- **2개 Event**: 2개 Info (각각 event_id)
+- **3개+ Event**: 3-4개 Info (대부분 event_id, 최대 1개 "미정")
+
+### event_id 규칙
+- 각 Info의 event_id는 **해당 PlaceHolder의** 사용가능 event_id 중 하나 또는 "미정"
+- 한 PlaceHolder 안에서 event_id는 중복될 수 없음
+
+### 내용 규칙
+- 각 사건에서 역할과 행동 분석
+- 일관된 캐릭터 성격 구축
+- desire/fear/capability 등 다양한 type 사용
+
+## 출력 형식
+- 입력의 **모든 placeholder_id마다 정확히 하나의 항목**을 `placeholders` 리스트로 응답합니다.
+- placeholder_id: 입력의 placeholder_id를 그대로 사용합니다.
+- infos: 위 규칙에 따른 Info 목록입니다.
+
+## 예시
+PlaceHolder: placeholder_4 "(엄격한 스승)"
+관련 사건:
+- event_5: 제자를 가혹하게 훈련
+사용가능 event_id: ['event_5']
+
+출력:
+placeholder_id: placeholder_4
+1. desire: 제자를 강하게 만들려는 열망
+   - event_id: event_5
+2. fear: 제자가 나약해질 것에 대한 두려움
+   - event_id: 미정
+"""
+
 # ============ 새로운 추가: 빠른 검증 프롬프트 ============
 VALIDATION_PROMPT = """
 # 역할: 품질 검증자
@@ -4,9 +4,16 @@ Pydantic 모델 정의 - 워크플로우의 입출력 데이터 구조
 
 import re
 from enum import Enum
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import (
+    BaseModel,
+    Field,
+    SkipValidation,
+    ValidationError,
+    field_validator,
+    model_validator,
+)
 
 
 # ============ 공통 Enum 정의 ============
@@ -142,6 +149,32 @@ class Infos(BaseModel):
             raise ValueError("event_id가 중복되었습니다")
         return self
 
+
+class PlaceHolderInfos(BaseModel):
+    """
+    배치 생성용 PlaceHolder 하나의 속성 정보.
+
+    개수 / event_id 중복 규칙은 항목별로 Infos로 다시 검증하므로 여기서는 강제하지 않습니다.
+    """
+
+    placeholder_id: str = Field(
+        description="입력 목록의 PlaceHolder ID",
+        pattern=r"^placeholder_\d+$",
+        examples=["placeholder_3"],
+    )
+    infos: List[InfoWithEventId] = Field(
+        description="해당 PlaceHolder의 속성 정보들과 원인 사건 id"
+    )
+
+
+class PlaceHolderInfosBatch(BaseModel):
+    """여러 PlaceHolder의 속성 정보들 (PlaceHolder 하나당 항목 하나)"""
+
+    placeholders: List[PlaceHolderInfos] = Field(
+        description="입력된 각 PlaceHolder마다 정확히 하나씩 생성한 속성 정보 목록",
+        min_length=1,
+    )
+
 # ============ Create Character 노드 (v2 확장) ============
 class CharacterAnalysis(BaseModel):
     """
@@ -233,6 +266,46 @@ class Event(BaseModel):
         return self
 
 
+class EventWithInfoId(Event):
+    """
+    배치 생성용 사건.
+
+    어떤 Info(특성)를 형성한 사건인지 info_id로 추적합니다.
+    """
+
+    info_id: str = Field(
+        description="이 사건이 형성한 특성의 ID. 입력 목록의 info_id 중 하나",
+        pattern=r"^info_\d+$",
+        examples=["info_3", "info_12"],
+    )
+
+
+class Events(BaseModel):
+    """
+    여러 특성에 대한 사건들 (특성 하나당 사건 하나)
+
+    사건 하나가 잘못되어도 배치 전체가 실패하지 않도록 항목별로 검증한다.
+    검증에 실패한 항목은 원본 dict로 남겨 두고, 매칭 단계에서 개별 생성으로 돌린다.
+    """
+
+    events: List[SkipValidation[EventWithInfoId]] = Field(
+        description="입력된 각 특성(info_id)마다 정확히 하나씩 생성한 사건 목록",
+        min_length=1,
+    )
+
+    @field_validator("events")
+    @classmethod
+    def validate_each_event(cls, events: List[Any]) -> List[Any]:
+        """검증을 통과한 항목만 EventWithInfoId로 변환"""
+        validated = []
+        for event in events:
+            try:
+                validated.append(EventWithInfoId.model_validate(event))
+            except ValidationError:
+                validated.append(event)
+        return validated
+
+
 # ============ Consolidate 노드 ============
 class ConsolidationPrepareResult(BaseModel):
     """
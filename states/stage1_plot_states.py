@@ -48,6 +48,11 @@ class PlotWorkflowState(TypedDict, total=False):
     # 캐릭터 네트워크 그래프
     graph: Any
     
+    # 이전 단계 결과와 무관한 프롬프트 context (LLM 단계와 병렬로 준비)
+    main_characters_summary: Optional[str]
+    theme_list: Optional[str]
+    character_conflict_analysis: Optional[str]
+    
     # 각 단계 결과들
     narrative_poles: Optional[NarrativePoles]
     sub_themes: Optional[ActSubThemes]
@@ -67,6 +72,7 @@ class NarrativePolesState(TypedDict, total=False):
     extractor_type: Optional[str]
     
     graph: Any
+    character_network_analysis: Optional[str]
     narrative_poles: Optional[NarrativePoles]
 
 
@@ -80,6 +86,8 @@ class SubThemeState(TypedDict, total=False):
     extractor_type: Optional[str]
     
     graph: Any
+    main_characters_summary: Optional[str]
+    theme_list: Optional[str]
     narrative_poles: Optional[NarrativePoles]
     sub_themes: Optional[ActSubThemes]
 
@@ -94,6 +102,7 @@ class IncitingMacroState(TypedDict, total=False):
     extractor_type: Optional[str]
     
     graph: Any
+    character_conflict_analysis: Optional[str]
     narrative_poles: Optional[NarrativePoles]
     sub_themes: Optional[ActSubThemes]
     inciting_and_macro: Optional[IncitingAndMacroStructure]
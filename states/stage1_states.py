@@ -2,7 +2,7 @@
 LangGraph State 정의 - 워크플로우 상태 관리
 """
 
-from typing import Annotated, Any, List, Optional
+from typing import Annotated, Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field
 from typing_extensions import TypedDict
@@ -80,6 +80,9 @@ class WorkflowState(EssentialState):
     plots: Optional[Plot]
     plot_candidates: Optional[PlotCandidates]
 
+    # 재시도 한도를 넘겨 건너뛴 Send 분기 기록 (서브그래프 실행마다 누적)
+    failed_branches: Annotated[List[Dict[str, Any]], merge_lists]
+
 
 class CharacterCreationState(EssentialState):
     """캐릭터 생성용 임시 State"""
@@ -91,6 +94,7 @@ class CharacterCreationState(EssentialState):
     # is_contextual: bool
     # event_contexts: Optional[List[str]]
     generated_character: Annotated[List[Character], merge_lists]
+    failed_branches: Annotated[List[Dict[str, Any]], merge_lists]
     # current_character_id: Optional[str]
     # current_info_ids: Optional[List[str]]
     current_iteration: int
@@ -101,6 +105,7 @@ class EventCreationState(EssentialState):
     """이벤트 생성용 임시 State"""
 
     generated_event: Annotated[List[Event], merge_lists]
+    failed_branches: Annotated[List[Dict[str, Any]], merge_lists]
     current_iteration: int
     graph: Any
     topic: str
@@ -112,8 +117,12 @@ class ConsolidationState(EssentialState):
     """통합 작업용 임시 State"""
 
     graph: Any
+    consolidation_candidates: Optional[List[str]]  # LLM 통합 대상 (None이면 전체)
+    placeholder_shards: Optional[List[List[str]]]  # shard 분할 시 shard별 PlaceHolder id
+    shard_chunks: Annotated[List[List[str]], merge_lists]  # shard별 그룹 결과 누적
     chunked_placeholders: List[List[str]]
     consolidated_roles: Annotated[List[ConsolidatedRole], merge_lists]
+    failed_branches: Annotated[List[Dict[str, Any]], merge_lists]
     current_iteration: int
     topic: str
     conflict: str
@@ -128,6 +137,7 @@ class PlaceHolderReplaceState(EssentialState):
     generated_infos: Annotated[
         List, merge_lists
     ]  # (placeholder_id, infos: (event_id, info)) 형태
+    failed_branches: Annotated[List[Dict[str, Any]], merge_lists]
     current_iteration: int
     topic: str
     conflict: str
@@ -0,0 +1,131 @@
+"""
+Stage1 배치 실행 테스트 스크립트 - 동시 실행 / manifest / 부분 완료 배치 재개 검증 (API 호출 없음)
+"""
+
+import json
+import os
+
+import pytest
+
+import batch_stage1
+from character_network import CharacterNetwork
+from utils.checkpointer import SqliteCheckpointSaver
+from utils.extractor_factory import clear_extractor_cache
+from utils.model_factory import clear_model_pool
+from utils.response_cache import configure_response_cache, get_response_cache
+
+TOPICS = ["권력의 본질", "기억과 망각", "구원의 대가"]
+
+
+@pytest.fixture(autouse=True)
+def offline(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)  # saved_graphs 출력 위치
+    clear_model_pool()
+    clear_extractor_cache()
+    yield
+    clear_extractor_cache()
+
+
+def write_batch(path, topics):
+    with open(path, "w", encoding="utf-8") as f:
+        for index, topic in enumerate(topics):
+            record = {"topic": topic, "conflict": "개인과 집단", "vibe": "어두움", "model": "fake"}
+            if index == 0:
+                record["id"] = "first"
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        f.write("\n")
+
+
+def test_load_batch_validates(tmp_path):
+    path = tmp_path / "batch.jsonl"
+    write_batch(path, TOPICS)
+    runs = batch_stage1.load_batch(str(path))
+    assert [run_id for run_id, _ in runs][0] == "first"
+    assert runs[1][0].startswith("0002-") and "id" not in runs[0][1]
+    assert batch_stage1.load_batch(str(path)) == runs  # 같은 입력은 같은 run_id
+
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps({"conflict": "topic 없음"}) + "\n")
+    with pytest.raises(ValueError, match="batch.jsonl:5"):
+        batch_stage1.load_batch(str(path))
+
+
+def test_batch_runs_and_resumes(tmp_path, monkeypatch):
+    """실패한 실행만 다시 실행하고, 완료된 실행은 건너뜀"""
+    path = tmp_path / "batch.jsonl"
+    output_dir = str(tmp_path / "out")
+    write_batch(path, TOPICS)
+
+    original = batch_stage1.arun_workflow
+    started = []
+
+    async def flaky(inputs, thread_id, **kwargs):
+        started.append(thread_id)
+        if inputs["topic"] == TOPICS[1] and started.count(thread_id) == 1:
+            raise RuntimeError("중단")
+        return await original(inputs, thread_id, **kwargs)
+
+    monkeypatch.setattr(batch_stage1, "arun_workflow", flaky)
+
+    first = batch_stage1.run_batch(str(path), output_dir, concurrency=2, cache_responses=False)
+    assert first["summary"] == {"total": 3, "completed": 2, "failed": 1}
+    failed_id = next(run_id for run_id, entry in first["runs"].items() if entry["status"] == "failed")
+    assert "RuntimeError: 중단" in first["runs"][failed_id]["error"]
+
+    second = batch_stage1.run_batch(str(path), output_dir, concurrency=2, cache_responses=False)
+    assert second["summary"] == {"total": 3, "completed": 3, "failed": 0}
+    assert len(started) == 4 and started[-1] == failed_id
+
+    for entry in second["runs"].values():
+        graph = CharacterNetwork.load_from_file(os.path.join(output_dir, entry["graph_path"]))
+        assert graph.get_statistics()["total_nodes"] == entry["stats"]["total_nodes"] > 0
+
+    # 중간 저장 파일은 실행별 이름이라 동시 실행끼리 덮어쓰지 않음
+    saved = os.listdir("saved_graphs")
+    for run_id in second["runs"]:
+        assert any(name.startswith(f"story_graph_{run_id}_") for name in saved)
+    assert all(not name.endswith(".tmp") for name in saved)
+
+    # 완료된 실행의 checkpoint는 정리됨
+    checkpointer = SqliteCheckpointSaver(os.path.join(output_dir, batch_stage1.CHECKPOINT_FILENAME))
+    assert list(checkpointer.list(None)) == []
+    checkpointer.close()
+
+
+def test_rejects_shared_journal_path(tmp_path):
+    path = tmp_path / "batch.jsonl"
+    write_batch(path, TOPICS)
+    config = {"configurable": {"graph_journal": True, "graph_journal_path": "shared.journal.jsonl"}}
+    with pytest.raises(ValueError, match="graph_journal_path"):
+        batch_stage1.run_batch(str(path), str(tmp_path / "out"), config=config)
+
+
+def test_batch_response_cache(tmp_path, monkeypatch):
+    """cache_responses면 output_dir의 배치 전용 캐시를 쓰고, 모든 실행이 완료되면 삭제"""
+    path = tmp_path / "batch.jsonl"
+    output_dir = str(tmp_path / "out")
+    cache_path = os.path.join(output_dir, batch_stage1.RESPONSE_CACHE_FILENAME)
+    write_batch(path, TOPICS)
+    configure_response_cache("off")
+
+    original = batch_stage1.arun_workflow
+    caches = []
+
+    async def flaky(inputs, thread_id, **kwargs):
+        caches.append(get_response_cache())
+        if inputs["topic"] == TOPICS[1] and len(caches) <= len(TOPICS):
+            raise RuntimeError("중단")
+        return await original(inputs, thread_id, **kwargs)
+
+    monkeypatch.setattr(batch_stage1, "arun_workflow", flaky)
+
+    first = batch_stage1.run_batch(str(path), output_dir, cache_responses=True)
+    assert first["summary"]["failed"] == 1
+    assert {cache.path for cache in caches} == {cache_path}
+    assert os.path.exists(cache_path)  # 재개할 실행이 남아 있으므로 유지
+    assert get_response_cache() is None
+
+    second = batch_stage1.run_batch(str(path), output_dir, cache_responses=True)
+    assert second["summary"]["completed"] == len(TOPICS)
+    assert not os.path.exists(cache_path)
+    assert not os.path.exists(os.path.join(".cache", "llm_responses.sqlite"))
@@ -0,0 +1,97 @@
+"""
+Fan-out 분기 재시도 테스트 스크립트 - 실패한 Send 분기만 재시도하고 한도를 넘기면 건너뛰기 검증 (API 호출 없음)
+"""
+
+import warnings
+
+import pytest
+
+import nodes.stage1_create_event as create_event
+from character_network import CharacterNetwork
+from pydantics.stage1_pydantics import Event
+from utils.branch_retry import backoff_delay
+
+FAST_RETRY = {"branch_max_retries": 2, "branch_retry_base": 0}
+
+
+def build_event_state():
+    """캐릭터 1명, Event가 없는 Info 3개"""
+    graph = CharacterNetwork("테스트 주제")
+    char_id = graph.add_character(role="(주인공)")
+    info_ids = []
+    for content in ["복수를 원한다", "배신을 두려워한다", "인정받고 싶다"]:
+        info_id = graph.add_info(info_type="desire", content=content, owner_id=char_id)
+        graph.connect_nodes(info_id, char_id)
+        info_ids.append(info_id)
+    state = {
+        "graph": graph,
+        "current_iteration": 1,
+        "conflict": "개인과 집단",
+        "vibe": "어두움",
+        "model": "gpt-4o-mini",
+    }
+    return state, info_ids
+
+
+def fake_extractor(failures):
+    """info_content별로 failures 횟수만큼 실패한 뒤 Event 반환"""
+    calls = []
+
+    def fake_call_extractor(state, prompt, schema):
+        content = state["current_info_content"]
+        calls.append(content)
+        if calls.count(content) <= failures.get(content, 0):
+            raise RuntimeError(f"{content} 실패")
+        return Event.model_construct(
+            summary=f"{content} 사건", target_info_type="desire", placeholders=[]
+        )
+
+    return fake_call_extractor, calls
+
+
+def test_failed_branch_retried_and_skipped(monkeypatch):
+    """성공한 분기는 한 번만 호출, 일시 실패는 재시도로 복구, 계속 실패하면 기록 후 건너뜀"""
+    state, info_ids = build_event_state()
+    fake_call_extractor, calls = fake_extractor({"배신을 두려워한다": 1, "인정받고 싶다": 10})
+    monkeypatch.setattr(create_event, "call_extractor", fake_call_extractor)
+    monkeypatch.setattr(create_event, "save_graph_to_file", lambda state: {})
+
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        result = create_event.build_event_subgraph().invoke(
+            state, config={"configurable": FAST_RETRY}
+        )
+
+    assert calls.count("복수를 원한다") == 1
+    assert calls.count("배신을 두려워한다") == 2
+    assert calls.count("인정받고 싶다") == 3
+    assert sorted(info_id for _, info_id, _ in result["generated_event"]) == info_ids[:2]
+    assert len(result["graph"].get_events()) == 2
+
+    [record] = result["failed_branches"]
+    assert record["node"] == "create_event_node"
+    assert record["branch"]["info_id"] == info_ids[2]
+    assert record["attempts"] == 3
+    assert "인정받고 싶다 실패" in record["error"]
+    assert len(caught) == 1
+
+
+def test_failed_branch_raises_without_skip(monkeypatch):
+    """branch_skip_failed=False면 재시도 후 예외 전파"""
+    state, _ = build_event_state()
+    fake_call_extractor, calls = fake_extractor({"인정받고 싶다": 10})
+    monkeypatch.setattr(create_event, "call_extractor", fake_call_extractor)
+    monkeypatch.setattr(create_event, "save_graph_to_file", lambda state: {})
+
+    with pytest.raises(RuntimeError):
+        create_event.build_event_subgraph().invoke(
+            state, config={"configurable": {**FAST_RETRY, "branch_skip_failed": False}}
+        )
+    assert calls.count("인정받고 싶다") == 3
+
+
+def test_backoff_delay_bounds():
+    """대기 시간은 0 ~ min(cap, base * 2^attempt) 범위"""
+    delays = [backoff_delay(attempt, 1.0, 5.0) for attempt in range(6) for _ in range(20)]
+    assert all(0 <= delay <= 5.0 for delay in delays)
+    assert max(backoff_delay(0, 1.0, 5.0) for _ in range(50)) <= 1.0
@@ -0,0 +1,166 @@
+"""
+CharacterNetwork 테스트 스크립트 - 타입 인덱스 / 인접 인덱스 검증
+"""
+
+from character_network import CharacterNetwork, NodeType
+
+
+def build_sample_graph():
+    """캐릭터 1명, Info 2개, Event 1개, PlaceHolder 2개로 구성된 샘플 그래프"""
+    graph = CharacterNetwork("테스트 주제")
+    char_id = graph.add_character(role="(주인공)")
+    info_ids = []
+    for content in ["복수를 원한다", "배신을 두려워한다"]:
+        info_id = graph.add_info(info_type="desire", content=content, owner_id=char_id)
+        graph.connect_nodes(info_id, char_id)
+        info_ids.append(info_id)
+
+    event_id = graph.add_event(summary="(엄격한 아버지)와 충돌", owner_id=char_id)
+    graph.connect_nodes(info_ids[0], event_id)
+    ph_ids = []
+    for role in ["(엄격한 아버지)", "(어린 동생)"]:
+        ph_id = graph.add_placeholder(role=role, owner_id=event_id)
+        graph.connect_nodes(event_id, ph_id)
+        ph_ids.append(ph_id)
+    return graph, char_id, info_ids, event_id, ph_ids
+
+
+def test_typed_queries():
+    """타입별 노드 조회와 이웃 조회"""
+    graph, char_id, info_ids, event_id, ph_ids = build_sample_graph()
+
+    assert [node_id for node_id, _ in graph.get_characters()] == [char_id]
+    assert [node_id for node_id, _ in graph.get_events()] == [event_id]
+    assert [node_id for node_id, _ in graph.get_placeholders()] == ph_ids
+
+    assert {info["id"] for info in graph.get_character_infos(char_id)} == set(info_ids)
+    participants = graph.get_event_participants(event_id)
+    assert participants["infos"] == [info_ids[0]]
+    assert set(participants["placeholders"]) == set(ph_ids)
+    assert graph.get_neighbors(info_ids[1], NodeType.EVENT) == []
+    assert set(graph.get_neighbors(event_id)) == {info_ids[0], *ph_ids}
+
+
+def test_remove_node_updates_indexes():
+    """노드 제거 시 양방향 참조와 인덱스 정리"""
+    graph, char_id, info_ids, event_id, ph_ids = build_sample_graph()
+
+    graph.remove_node(ph_ids[0])
+
+    assert ph_ids[0] not in graph.nodes
+    assert ph_ids[0] not in graph.nodes[event_id].edges
+    assert graph.get_event_participants(event_id)["placeholders"] == [ph_ids[1]]
+    assert [node_id for node_id, _ in graph.get_placeholders()] == [ph_ids[1]]
+
+
+def test_merge_nodes_rewires_edges():
+    """merge_nodes가 source 연결을 target으로 옮기고 인덱스를 유지"""
+    graph, char_id, info_ids, event_id, ph_ids = build_sample_graph()
+
+    unified_id = graph.add_placeholder(role="(가족)", owner_id=[event_id])
+    assert graph.merge_nodes(ph_ids, unified_id)
+
+    assert all(ph_id not in graph.nodes for ph_id in ph_ids)
+    assert graph.get_neighbors(unified_id, NodeType.EVENT) == [event_id]
+    assert graph.get_event_participants(event_id)["placeholders"] == [unified_id]
+
+
+def test_load_from_file_rebuilds_indexes(tmp_path):
+    """JSON 저장/로드 후에도 인덱스 기반 조회가 동일"""
+    graph, char_id, info_ids, event_id, ph_ids = build_sample_graph()
+    filepath = tmp_path / "graph.json"
+    graph.save_to_file(str(filepath))
+
+    loaded = CharacterNetwork.load_from_file(str(filepath))
+
+    assert loaded.get_statistics() == graph.get_statistics()
+    assert {info["id"] for info in loaded.get_character_infos(char_id)} == set(info_ids)
+    assert set(loaded.get_event_participants(event_id)["placeholders"]) == set(ph_ids)
+
+
+def test_statistics_match_full_scan():
+    """증분 카운터 기반 통계가 전체 순회 결과와 일치"""
+    graph, char_id, info_ids, event_id, ph_ids = build_sample_graph()
+    unified_id = graph.add_placeholder(role="(가족)", owner_id=[event_id])
+    graph.merge_nodes(ph_ids, unified_id)
+    graph.remove_node(info_ids[1])
+
+    stats = graph.get_statistics()
+    expected_counts = {node_type.value: 0 for node_type in NodeType}
+    for node in graph.nodes.values():
+        expected_counts[node.type.value] += 1
+
+    assert stats["node_counts"] == expected_counts
+    assert stats["total_nodes"] == len(graph.nodes)
+    assert stats["total_edges"] == sum(len(n.edges) for n in graph.nodes.values()) // 2
+    assert stats["placeholders"] == stats["placeholder_count"] == 1
+
+
+def test_merge_node_groups_single_sweep():
+    """여러 그룹을 한 번에 통합하고 이벤트 summary를 한 번에 치환"""
+    graph, char_id, info_ids, event_id, ph_ids = build_sample_graph()
+    family_id = graph.add_placeholder(role="(가족)", owner_id=[event_id])
+    sibling_id = graph.add_placeholder(role="(형제)", owner_id=[event_id])
+
+    merged = graph.merge_node_groups([([ph_ids[0]], family_id), ([ph_ids[1]], sibling_id)])
+    updated = graph.replace_in_event_summaries(
+        {event_id: {"(엄격한 아버지)": "(가족)", "(가족)": "(잘못된 재치환)"}}
+    )
+
+    assert merged == 2
+    assert updated == 1
+    assert graph.nodes[event_id].data["summary"] == "(가족)와 충돌"
+    assert set(graph.get_event_participants(event_id)["placeholders"]) == {
+        family_id,
+        sibling_id,
+    }
+    assert graph.get_statistics()["placeholders"] == 2
+
+
+def test_compact_storage_edge_view():
+    """정수 인접 배열 기반 edges 뷰와 슬롯 재사용"""
+    graph, char_id, info_ids, event_id, ph_ids = build_sample_graph()
+    removed = graph.nodes[ph_ids[0]]
+    graph.remove_node(ph_ids[0])
+
+    # 분리된 노드는 빈 edges를 보여주고, 빈 슬롯은 새 노드가 재사용
+    assert len(removed.edges) == 0
+    new_ph_id = graph.add_placeholder(role="(새 인물)", owner_id=event_id)
+    graph.connect_nodes(event_id, new_ph_id)
+    assert graph.nodes[new_ph_id]._index == removed._index
+
+    event_edges = graph.nodes[event_id].edges
+    assert new_ph_id in event_edges
+    assert ph_ids[0] not in event_edges
+    assert event_edges == {info_ids[0], ph_ids[1], new_ph_id}
+    assert len(event_edges) == 3
+
+
+def test_binary_snapshot_roundtrip(tmp_path):
+    """.cnet 바이너리 스냅샷 저장/로드 후 노드, 연결, 통계가 동일"""
+    graph, char_id, info_ids, event_id, ph_ids = build_sample_graph()
+    graph.remove_node(info_ids[1])
+    filepath = tmp_path / "graph.cnet"
+    graph.save_to_file(str(filepath))
+
+    header = CharacterNetwork.read_snapshot_header(str(filepath))
+    loaded = CharacterNetwork.load_from_file(str(filepath))
+
+    assert header["topic"] == graph.topic
+    assert header["node_count"] == len(graph.nodes)
+    assert loaded.get_statistics() == graph.get_statistics()
+    assert loaded._node_id == graph._node_id
+    for node_id, node in graph.nodes.items():
+        assert loaded.nodes[node_id].type == node.type
+        assert loaded.nodes[node_id].data == node.data
+        assert loaded.nodes[node_id].edges == node.edges
+    assert [node_id for node_id, _ in loaded.get_placeholders()] == ph_ids
+
+
+def test_binary_snapshot_rejects_unknown_payload():
+    """잘못된 매직 넘버는 ValueError"""
+    try:
+        CharacterNetwork.from_bytes(b"JSON" + bytes(16))
+    except ValueError:
+        return
+    raise AssertionError("ValueError가 발생해야 합니다")
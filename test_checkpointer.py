@@ -0,0 +1,117 @@
+"""
+Checkpointer 테스트 스크립트 - CharacterNetwork 직렬화와 중단된 Stage1 실행 재개 검증 (API 호출 없음)
+"""
+
+import asyncio
+import threading
+
+from langgraph.types import Send
+
+import workflow_stage1
+from character_network import CharacterNetwork
+from test_character_network import build_sample_graph
+from utils.checkpointer import NETWORK_TYPE, NetworkSerializer, SqliteCheckpointSaver
+
+
+def test_serializer_round_trip():
+    """최상위 / Send 인자에 중첩된 CharacterNetwork 모두 pickle 없이 복원"""
+    graph, char_id, *_ = build_sample_graph()
+    serde = NetworkSerializer()
+
+    type_, payload = serde.dumps_typed(graph)
+    assert type_ == NETWORK_TYPE
+    assert serde.loads_typed((type_, payload)).get_statistics() == graph.get_statistics()
+
+    sends = [Send("prepare_consolidation_shard", {"graph": graph, "ids": ["placeholder_1"]})]
+    type_, payload = serde.dumps_typed(sends)
+    assert type_ != "pickle"
+    restored = serde.loads_typed((type_, payload))
+    assert restored[0].node == "prepare_consolidation_shard"
+    assert isinstance(restored[0].arg["graph"], CharacterNetwork)
+    assert restored[0].arg["graph"].nodes[char_id].data == graph.nodes[char_id].data
+    assert restored[0].arg["ids"] == ["placeholder_1"]
+
+
+class FakeSubgraph:
+    """호출 횟수를 세고, fail_once면 첫 호출에서 실패하는 서브그래프"""
+
+    def __init__(self, name, calls, fail_once=False):
+        self.name = name
+        self.calls = calls
+        self.fail_once = fail_once
+
+    def invoke(self, state):
+        self.calls.append(self.name)
+        if self.fail_once and self.calls.count(self.name) == 1:
+            raise RuntimeError(f"{self.name} 중단")
+        graph = state["graph"]
+        graph.add_character(role=f"({self.name})")
+        return {"graph": graph}
+
+
+def test_run_workflow_resumes(monkeypatch, tmp_path):
+    """중단된 thread는 완료된 노드를 건너뛰고 실패한 노드부터 재개"""
+    calls = []
+    for attribute, fail_once in [
+        ("character_subgraph", False),
+        ("event_subgraph", True),
+        ("consolidation_subgraph", False),
+        ("placeholder_replace_subgraph", False),
+    ]:
+        monkeypatch.setattr(
+            workflow_stage1, attribute, FakeSubgraph(attribute, calls, fail_once)
+        )
+    monkeypatch.setattr(workflow_stage1, "define_main_character_roles", lambda state: {"roles": []})
+
+    path = str(tmp_path / "checkpoints.sqlite")
+    inputs = {"topic": "테스트 주제", "conflict": "개인과 집단", "vibe": "어두움", "max_iterations": 1}
+
+    try:
+        workflow_stage1.run_workflow(
+            inputs, "run-1", SqliteCheckpointSaver(path), cache_responses=False
+        )
+    except RuntimeError:
+        pass
+    assert calls == ["character_subgraph", "event_subgraph"]
+
+    # 새 프로세스처럼 파일에서 다시 열어 재개
+    result = workflow_stage1.run_workflow(
+        inputs, "run-1", SqliteCheckpointSaver(path), cache_responses=False
+    )
+    assert calls == [
+        "character_subgraph",
+        "event_subgraph",
+        "event_subgraph",
+        "consolidation_subgraph",
+    ]
+    assert result["current_iteration"] == 1
+    assert len(result["graph"].get_characters()) == 3
+
+    # 완료된 thread는 다시 실행하지 않음
+    again = workflow_stage1.run_workflow(
+        inputs, "run-1", SqliteCheckpointSaver(path), cache_responses=False
+    )
+    assert len(calls) == 4
+    assert again["graph"].get_statistics() == result["graph"].get_statistics()
+
+
+def test_async_methods_run_off_loop(tmp_path, monkeypatch):
+    """비동기 메서드는 SQLite / 직렬화를 이벤트 루프 밖의 스레드에서 실행"""
+    checkpointer = SqliteCheckpointSaver(str(tmp_path / "checkpoints.sqlite"))
+    threads = []
+    original = SqliteCheckpointSaver.get_tuple
+    monkeypatch.setattr(
+        SqliteCheckpointSaver,
+        "get_tuple",
+        lambda self, config: threads.append(threading.get_ident()) or original(self, config),
+    )
+
+    async def run():
+        config = {"configurable": {"thread_id": "run-1", "checkpoint_ns": ""}}
+        assert await checkpointer.aget_tuple(config) is None
+        assert [item async for item in checkpointer.alist(config)] == []
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(run())
+    checkpointer.close()
+    assert threads and loop_thread not in threads
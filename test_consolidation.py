@@ -0,0 +1,202 @@
+"""
+Consolidation 테스트 스크립트 - 역할명 유사도 클러스터링, 중복 자동 통합, shard 분할, shard 간 정리 검증 (API 호출 없음)
+"""
+
+import warnings
+
+import nodes.stage1_consolidation as consolidation
+from character_network import CharacterNetwork
+from pydantics.stage1_pydantics import (
+    ConsolidatedRole,
+    ConsolidationPrepareResult,
+    ConsolidationResult,
+)
+from utils.role_similarity import RoleSimilarityIndex, pack_shards
+
+ROLES = ["(엄격한 아버지)", "(배신한 친구)", "(엄격한 아버지상)", "(믿었던 친구)", "(어린 동생)"]
+
+
+def build_consolidation_graph():
+    """캐릭터 2명이 각각 Event 하나에 ROLES PlaceHolder를 가진 그래프"""
+    graph = CharacterNetwork("테스트 주제")
+    ph_ids = []
+    for char_role in ["(주인공)", "(조력자)"]:
+        char_id = graph.add_character(role=char_role)
+        event_id = graph.add_event(summary=f"{char_role}의 사건", owner_id=char_id)
+        for role in ROLES:
+            ph_id = graph.add_placeholder(role=role, owner_id=event_id)
+            graph.connect_nodes(event_id, ph_id)
+            ph_ids.append(ph_id)
+    return graph, ph_ids
+
+
+def test_role_similarity_clusters():
+    """n-gram 유사도로 묶고, shard는 클러스터를 깨지 않음"""
+    index = RoleSimilarityIndex()
+    for i, role in enumerate(ROLES):
+        index.add(f"placeholder_{i}", role)
+
+    clusters = index.clusters(threshold=0.5)
+    assert ["placeholder_0", "placeholder_2"] in clusters
+    assert sum(len(cluster) for cluster in clusters) == len(ROLES)
+    assert pack_shards([["a", "b"], ["c", "d"], ["e"]], 3) == [["a", "b"], ["c", "d", "e"]]
+    assert pack_shards([["a", "b", "c", "d"]], 3) == [["a", "b", "c"], ["d"]]
+
+
+def test_shard_placeholders_node():
+    """shard_size 이하면 분할하지 않고, 넘으면 모든 PlaceHolder를 한 번씩 분배"""
+    graph, ph_ids = build_consolidation_graph()
+    state = {"graph": graph}
+
+    assert consolidation.shard_placeholders_node(state)["placeholder_shards"] is None
+    config = {"configurable": {"consolidation_shard_size": 4}}
+    shards = consolidation.shard_placeholders_node(state, config)["placeholder_shards"]
+
+    assert all(len(shard) <= 4 for shard in shards)
+    assert sorted(ph_id for shard in shards for ph_id in shard) == sorted(ph_ids)
+    shard_of = {ph_id: i for i, shard in enumerate(shards) for ph_id in shard}
+    assert shard_of[ph_ids[0]] == shard_of[ph_ids[2]]
+
+
+def test_reconcile_shard_chunks():
+    """다른 shard / 중복 id를 제외하고 2개 미만 그룹은 버림"""
+    state = {
+        "placeholder_shards": [["placeholder_1", "placeholder_2", "placeholder_3"], ["placeholder_4"]],
+        "shard_chunks": [
+            ["placeholder_1", "placeholder_2", "placeholder_4"],
+            ["placeholder_2", "placeholder_3"],
+        ],
+    }
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        result = consolidation.reconcile_shard_chunks_node(state)
+
+    assert result == {"chunked_placeholders": [["placeholder_1", "placeholder_2"]]}
+
+
+def test_reconcile_cross_shard_roles():
+    """같은 통합 역할명이라도 중심 인물이 겹칠 때만 shard 간 병합"""
+    graph, ph_ids = build_consolidation_graph()
+    shards = [ph_ids[:2], ph_ids[2:5], ph_ids[5:]]
+    roles = [
+        ConsolidatedRole(unified_role="(권위적인 부모)", original_placeholders={ph_ids[0]: ROLES[0]}),
+        ConsolidatedRole(unified_role="(권위적인 부모)", original_placeholders={ph_ids[2]: ROLES[2]}),
+        ConsolidatedRole(unified_role="(권위적인 부모)", original_placeholders={ph_ids[5]: ROLES[0]}),
+    ]
+
+    reconciled = consolidation.reconcile_cross_shard_roles(graph, roles, shards)
+
+    assert [list(role.original_placeholders) for role in reconciled] == [
+        [ph_ids[0], ph_ids[2]],
+        [ph_ids[5]],
+    ]
+
+
+def test_sharded_subgraph(monkeypatch):
+    """shard별 그룹화 호출 후 한 번만 consolidate를 분배하고 그래프에 반영"""
+    graph, ph_ids = build_consolidation_graph()
+    prepare_calls = []
+
+    def fake_call_extractor(state, prompt, schema):
+        if schema is ConsolidationPrepareResult:
+            prepare_calls.append(state["placeholder_ids"])
+            if ph_ids[0] in state["placeholder_ids"]:
+                return ConsolidationPrepareResult(chunked_placeholders=[[ph_ids[0], ph_ids[2]]])
+            return ConsolidationPrepareResult(chunked_placeholders=[])
+        return ConsolidationResult(
+            consolidated_roles=[
+                ConsolidatedRole(
+                    unified_role="(권위적인 부모)",
+                    original_placeholders={ph_ids[0]: ROLES[0], ph_ids[2]: ROLES[2]},
+                )
+            ]
+        )
+
+    monkeypatch.setattr(consolidation, "call_extractor", fake_call_extractor)
+    monkeypatch.setattr(consolidation, "save_graph_to_file", lambda state: {})
+    subgraph = consolidation.build_consolidation_subgraph()
+    result = subgraph.invoke(
+        {"graph": graph, "current_iteration": 1, "model": "gpt-4o-mini"},
+        config={"configurable": {"consolidation_shard_size": 4}},
+    )
+
+    assert len(prepare_calls) == 3
+    assert result["chunked_placeholders"] == [[ph_ids[0], ph_ids[2]]]
+    assert ph_ids[0] not in result["graph"].nodes
+    assert len(result["graph"].get_placeholders()) == len(ph_ids) - 1
+
+
+def test_auto_merge_placeholders():
+    """켜면 같은 중심 인물의 다른 Event에 있는 거의 같은 역할명만 LLM 없이 통합"""
+    graph, ph_ids = build_consolidation_graph()
+    char_id = graph.nodes[graph.nodes[ph_ids[0]].data["owner_id"]].data["owner_id"]
+    second_event = graph.add_event(summary="(엄격한 아버지)와 재회", owner_id=char_id)
+    duplicate = graph.add_placeholder(role="(엄격한 아버지)", owner_id=second_event)
+    isolated = graph.add_placeholder(role="(수상한 상인)", owner_id=second_event)
+    for ph_id in [duplicate, isolated]:
+        graph.connect_nodes(second_event, ph_id)
+
+    # ph_ids[2] (엄격한 아버지상)은 ph_ids[0]과 같은 Event라 함께 묶이지 않음
+    groups = consolidation.find_duplicate_placeholders(graph, _index(graph), 0.8)
+    assert groups == [[ph_ids[0], duplicate]]
+
+    state = {"graph": graph, "current_iteration": 1}
+    # 기본값은 자동 통합 / 후보 필터 모두 사용 안 함 (기존 실행 결과 유지)
+    assert consolidation.auto_merge_placeholders_node(state) == {"consolidation_candidates": None}
+    assert ph_ids[0] in graph.nodes and duplicate in graph.nodes
+
+    config = {
+        "configurable": {
+            "consolidation_auto_merge_similarity": 0.8,
+            "consolidation_llm_min_similarity": 0.5,
+        }
+    }
+    result = consolidation.auto_merge_placeholders_node(state, config)
+
+    assert ph_ids[0] not in graph.nodes and duplicate not in graph.nodes
+    merged_id, merged = graph.get_placeholders()[-1]
+    assert merged.data["role"] == "(엄격한 아버지)"
+    assert sorted(merged.data["owner_id"]) == sorted(
+        [graph.nodes[ph_ids[1]].data["owner_id"], second_event]
+    )
+    assert merged_id in result["consolidation_candidates"]
+    assert isolated not in result["consolidation_candidates"]
+
+
+def test_route_skips_llm_without_candidates():
+    """LLM 통합 후보가 2개 미만이면 바로 그래프 반영으로 이동"""
+    graph, ph_ids = build_consolidation_graph()
+    state = {"graph": graph, "consolidation_candidates": [ph_ids[0]]}
+
+    assert consolidation.route_prepare_consolidation(state) == "update_consolidation_graph"
+
+
+def test_conflicting_summary_replacements():
+    """같은 Event의 같은 역할명이 다른 통합 역할로 나뉘면 앞선 role의 치환만 반영하고 경고"""
+    graph = CharacterNetwork("테스트 주제")
+    char_id = graph.add_character(role="(주인공)")
+    event_id = graph.add_event(summary="(주인공)이 (동료)와 다른 (동료)에게 배신당했다", owner_id=char_id)
+    ph_ids = []
+    for _ in range(2):
+        ph_id = graph.add_placeholder(role="(동료)", owner_id=event_id)
+        graph.connect_nodes(event_id, ph_id)
+        ph_ids.append(ph_id)
+    roles = [
+        ConsolidatedRole(unified_role="(믿었던 동료)", original_placeholders={ph_ids[0]: "(동료)"}),
+        ConsolidatedRole(unified_role="(경쟁자)", original_placeholders={ph_ids[1]: "(동료)"}),
+    ]
+
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        consolidation.apply_consolidated_roles(graph, roles, current_iteration=1)
+
+    assert len(caught) == 1 and "(믿었던 동료)만 반영" in str(caught[0].message)
+    assert graph.nodes[event_id].data["summary"] == "(주인공)이 (믿었던 동료)와 다른 (믿었던 동료)에게 배신당했다"
+    assert sorted(node.data["role"] for _, node in graph.get_placeholders()) == ["(경쟁자)", "(믿었던 동료)"]
+
+
+def _index(graph):
+    index = RoleSimilarityIndex()
+    for ph_id, node in graph.get_placeholders():
+        index.add(ph_id, node.data["role"])
+    return index
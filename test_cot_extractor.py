@@ -0,0 +1,135 @@
+"""
+CoT Extractor 테스트 스크립트 - 조기 종료 / 요약 기반 context / 최종 extractor 재사용 / 수렴 점수 검증 (API 호출 없음)
+"""
+
+import asyncio
+import pickle
+from typing import List
+
+import pytest
+from langchain_core.messages import AIMessage, SystemMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+
+import utils.cot.extractor as cot_module
+from pydantics.stage1_pydantics import Character
+from utils.cot import create_cot_extractor
+from utils.cot.convergence import ConvergenceTracker, shingle_hashes, sketch, sketch_similarity
+from utils.fake_llm import FakeStructuredChatModel
+
+
+class ScriptedModel(FakeStructuredChatModel):
+    """사고 단계에는 정해진 응답을 순서대로, tool call에는 Fake 응답을 반환"""
+
+    replies: List[str] = []
+    prompts: List[str] = []
+    call_kwargs: List[dict] = []
+
+    def _generate(self, messages, stop=None, run_manager=None, tools=None, tool_choice=None, **kwargs):
+        if tools:
+            return super()._generate(messages, stop, run_manager, tools, tool_choice, **kwargs)
+        self.prompts.append(messages[-1].content)
+        self.call_kwargs.append(kwargs)
+        reply = self.replies[min(len(self.prompts), len(self.replies)) - 1]
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=reply))])
+
+
+def run(extractor, prompt="주제: 권력"):
+    return extractor.invoke([SystemMessage(content=prompt)])
+
+
+def test_stops_on_conclusion_and_reuses_final_extractor(monkeypatch):
+    """[결론]이 나오면 1단계에서 끝나고, 최종 extractor는 인스턴스당 한 번만 생성"""
+    built = []
+    original = cot_module.create_extractor
+    monkeypatch.setattr(
+        cot_module, "create_extractor", lambda *args, **kwargs: built.append(1) or original(*args, **kwargs)
+    )
+    model = ScriptedModel(replies=["[요약] 권력 주제 [결론] 야심가 캐릭터"])
+    extractor = create_cot_extractor(model, [Character], "Character", max_step_tokens=256)
+
+    result = run(extractor)
+    assert isinstance(result["responses"][0], Character)
+    assert (result["total_steps"], result["stop_reason"]) == (1, "concluded")
+    assert result["summary"] == "권력 주제"
+    assert model.call_kwargs[0]["max_tokens"] == 256
+
+    asyncio.run(extractor.ainvoke([SystemMessage(content="주제: 기억")]))
+    assert len(built) == 1
+
+
+def test_converges_after_single_similar_step():
+    """직전 사고와 한 번만 비슷해도 종료 (연속 두 번 조건 없음)"""
+    thought = "[요약] 요약 [사고] 주인공은 권력을 얻기 위해 동료를 배신한다"
+    model = ScriptedModel(replies=[thought])
+    result = run(create_cot_extractor(model, [Character], "Character", convergence_threshold=0.85))
+    assert (result["total_steps"], result["stop_reason"]) == (2, "converged")
+
+
+def test_context_uses_rolling_summary():
+    """다음 단계 / 최종 답변에는 전체 기록 대신 갱신된 요약과 직전 사고만 전달"""
+    replies = [f"[요약] 요약{index} [사고] 사고{index} " + "내용 " * index for index in range(1, 5)]
+    replies.append("형식 없는 응답 " + "가" * 50)
+    model = ScriptedModel(replies=replies)
+    extractor = create_cot_extractor(
+        model, [Character], "Character", max_thinking_steps=5, summary_max_chars=40
+    )
+    result = run(extractor, "주제: 권력")
+
+    assert (result["total_steps"], result["stop_reason"]) == (5, "max_steps")
+    assert "주제: 권력" in model.prompts[0] and "주제: 권력" not in model.prompts[3]
+    assert "요약3" in model.prompts[3] and "사고3" in model.prompts[3]
+    assert "사고1" not in model.prompts[3] and "사고2" not in model.prompts[3]
+    # 형식을 따르지 않은 응답은 이전 요약에 이어 붙이고 길이 제한
+    assert len(result["summary"]) == 40 and result["summary"].endswith("가")
+
+
+def test_pickle_after_use():
+    model = ScriptedModel(replies=["[결론] 끝"])
+    extractor = create_cot_extractor(model, [Character], "Character")
+    run(extractor)
+    restored = pickle.loads(pickle.dumps(extractor))
+    assert restored._final_extractor is None
+    assert isinstance(run(restored)["responses"][0], Character)
+
+
+def test_sketch_similarity():
+    """짧은 텍스트는 정확한 Jaccard, 긴 텍스트는 bottom-k 추정"""
+    a, b = "권력을 얻는다", "권력을 잃는다"
+    exact_a, exact_b = shingle_hashes(a), shingle_hashes(b)
+    exact = len(exact_a & exact_b) / len(exact_a | exact_b)
+    assert sketch_similarity(sketch(a), sketch(b)) == exact
+    assert sketch_similarity(sketch(a), sketch("  권력을   얻는다 ")) == 1.0
+
+    long_a = " ".join(f"{index}번째 장면에서 주인공은 권력을 시험한다" for index in range(300))
+    long_b = long_a.replace("시험한다", "포기한다")
+    exact_a, exact_b = shingle_hashes(long_a), shingle_hashes(long_b)
+    exact = len(exact_a & exact_b) / len(exact_a | exact_b)
+    assert len(sketch(long_a)) == 128
+    assert abs(sketch_similarity(sketch(long_a), sketch(long_b)) - exact) < 0.15
+
+
+def test_tracker_scores_against_window():
+    """직전 사고가 아니어도 window 안의 사고로 되돌아가면 높은 점수"""
+    tracker = ConvergenceTracker(window=2)
+    first = "주인공은 왕좌를 노리고 형제를 배신한다"
+    assert tracker.add(first) == 0.0
+    assert tracker.add("조력자는 북쪽 국경에서 반란군을 모은다") < 0.3
+    assert tracker.add(first) == 1.0
+    tracker.add("악역은 항구 도시의 상단을 장악한다")
+    tracker.add("마을 사람들은 축제를 준비하며 노래를 부른다")
+    assert tracker.add(first) < 0.3  # window 밖
+    assert len(tracker.scores) == 6
+
+
+def test_empty_step_stops_thinking():
+    """출력 한도에 걸려 빈 사고 단계가 오면 max_steps까지 반복하지 않고 최종 답변 생성"""
+    model = ScriptedModel(replies=["[요약] 권력 주제 [사고] 야심가를 떠올린다", ""])
+    extractor = create_cot_extractor(model, [Character], "Character", max_thinking_steps=10)
+    assert extractor.max_step_tokens is None
+
+    with pytest.warns(UserWarning, match="2번째 사고 단계 응답이 비어"):
+        result = run(extractor)
+    assert isinstance(result["responses"][0], Character)
+    assert (result["total_steps"], result["stop_reason"]) == (1, "empty")
+    assert result["summary"] == "권력 주제" and len(model.prompts) == 2
+    assert "max_tokens" not in model.call_kwargs[0]
@@ -0,0 +1,151 @@
+"""
+Event 생성 테스트 스크립트 - 배치 분배와 info_id 매칭 검증 (API 호출 없음)
+"""
+
+import warnings
+
+import pytest
+
+import nodes.stage1_create_event as create_event
+import utils.branch_retry as branch_retry
+from nodes.stage1_create_event import _match_batch_events, distribute_event_creation
+from pydantics.stage1_pydantics import Event, Events
+from test_character_network import build_sample_graph
+
+
+def build_event_state():
+    graph, char_id, info_ids, event_id, ph_ids = build_sample_graph()
+    second_char = graph.add_character(role="(조력자)")
+    for content in ["인정받고 싶어 한다", "혼자 남는 것을 두려워한다"]:
+        info_id = graph.add_info(info_type="desire", content=content, owner_id=second_char)
+        graph.connect_nodes(info_id, second_char)
+    state = {"graph": graph, "conflict": "개인과 집단", "vibe": "어두움", "model": "gpt-4o-mini"}
+    return state, char_id, second_char
+
+
+def test_distribute_without_batching():
+    """기본값은 Event가 없는 Info마다 create_event"""
+    state, _, _ = build_event_state()
+    sends = distribute_event_creation(state)
+
+    assert [send.node for send in sends] == ["create_event"] * 3
+
+
+def test_distribute_batches():
+    """event_batch_size만큼 묶고, by_character면 캐릭터 경계에서 나눔"""
+    state, char_id, second_char = build_event_state()
+
+    sends = distribute_event_creation(state, {"configurable": {"event_batch_size": 4}})
+    assert [send.node for send in sends] == ["create_event_batch"]
+    assert len(sends[0].arg["items"]) == 3
+
+    config = {"configurable": {"event_batch_size": 4, "event_batch_by_character": True}}
+    sends = distribute_event_creation(state, config)
+    assert [send.node for send in sends] == ["create_event", "create_event_batch"]
+    assert sends[0].arg["char_id"] == char_id
+    assert {item["char_id"] for item in sends[1].arg["items"]} == {second_char}
+
+
+def batch_event(info_id, **overrides):
+    return {
+        "info_id": info_id,
+        "target_role": "(조력자)",
+        "target_info_type": "desire",
+        "summary": "(조력자)가 (냉정한 상사)에게 외면당한 뒤 인정을 갈망하게 되었다",
+        "placeholders": [{"role": "(냉정한 상사)"}],
+        **overrides,
+    }
+
+
+def test_match_batch_events():
+    """응답 Event를 info_id로 매칭하고 누락/미요청 id는 경고, 누락 항목은 개별 생성 대상"""
+    state, _, second_char = build_event_state()
+    batch = distribute_event_creation(state, {"configurable": {"event_batch_size": 4}})[0].arg
+    requested = [item["info_id"] for item in batch["items"]]
+    events = Events(events=[batch_event(info_id) for info_id in [requested[1], "info_999"]])
+
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        generated, retry = _match_batch_events(batch, events)
+
+    assert [(char_id, info_id) for char_id, info_id, _ in generated] == [(second_char, requested[1])]
+    assert [item["info_id"] for item in retry] == [requested[0], requested[2]]
+    assert len(caught) == 2
+
+
+def test_match_batch_events_per_entry():
+    """잘못된 Event(객체가 아닌 값 포함) 하나가 배치 전체를 실패시키지 않고, 유형이 다른 Event와 함께 개별 생성으로 돌림"""
+    state, _, _ = build_event_state()
+    batch = distribute_event_creation(state, {"configurable": {"event_batch_size": 4}})[0].arg
+    requested = [item["info_id"] for item in batch["items"]]
+    events = Events(
+        events=[
+            batch_event(requested[0], summary="너무 짧음"),
+            batch_event(requested[1], target_info_type="fear"),
+            batch_event(requested[2]),
+            batch_event(requested[2]),
+            "info_1",
+            42,
+        ]
+    )
+
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        generated, retry = _match_batch_events(batch, events)
+
+    assert [info_id for _, info_id, _ in generated] == [requested[2]]
+    assert [item["info_id"] for item in retry] == requested[:2]
+    assert ["검증에 실패" in str(w.message) for w in caught] == [True, False, False, False, False]
+    assert "다른 유형" in str(caught[1].message) and "중복" in str(caught[2].message)
+    # JSON 값이 객체가 아니어도 배치 전체가 실패하지 않음
+    assert all("매칭할 수 없는" in str(w.message) for w in caught[3:])
+
+
+def test_batch_node_falls_back_to_single_calls(monkeypatch):
+    """개별 생성 대상은 create_event로 다시 생성해 모든 Info에 Event가 생김"""
+    state, _, _ = build_event_state()
+    batch = distribute_event_creation(state, {"configurable": {"event_batch_size": 4}})[0].arg
+    requested = [item["info_id"] for item in batch["items"]]
+    schemas = []
+
+    def fake_call_extractor(state, prompt, schema):
+        schemas.append(schema)
+        if schema is Events:
+            return Events(events=[batch_event(requested[0], target_info_type="fear")])
+        return Event.model_construct(summary="개별 사건", target_info_type="desire", placeholders=[])
+
+    monkeypatch.setattr(create_event, "call_extractor", fake_call_extractor)
+
+    with pytest.warns(UserWarning, match="개별 생성"):
+        result = create_event.create_event_batch_node(batch)
+
+    assert sorted(info_id for _, info_id, _ in result["generated_event"]) == sorted(requested)
+    assert schemas == [Events, Event, Event, Event]
+
+
+def test_batch_fallback_failures_isolated(monkeypatch):
+    """개별 생성이 계속 실패한 항목만 failed_branches에 기록하고, 배치 호출은 반복하지 않음"""
+    monkeypatch.setattr(branch_retry, "DEFAULT_BRANCH_RETRY_BASE", 0)
+    state, _, _ = build_event_state()
+    batch = distribute_event_creation(state, {"configurable": {"event_batch_size": 4}})[0].arg
+    requested = [item["info_id"] for item in batch["items"]]
+    schemas = []
+
+    def fake_call_extractor(state, prompt, schema):
+        schemas.append(schema)
+        if schema is Events:
+            return Events(events=[batch_event(requested[0])])
+        if state["info_id"] == requested[1]:
+            raise RuntimeError("개별 생성 실패")
+        return Event.model_construct(summary="개별 사건", target_info_type="desire", placeholders=[])
+
+    monkeypatch.setattr(create_event, "call_extractor", fake_call_extractor)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        result = create_event.create_event_batch_node(batch)
+
+    assert sorted(info_id for _, info_id, _ in result["generated_event"]) == [requested[0], requested[2]]
+    [record] = result["failed_branches"]
+    assert record["branch"]["info_id"] == requested[1] and record["attempts"] == 3
+    assert schemas.count(Events) == 1
@@ -0,0 +1,52 @@
+"""
+Extractor Factory 테스트 스크립트 - extractor 캐시 검증 (API 호출 없음)
+"""
+
+import pytest
+
+from pydantics.stage1_pydantics import Event, Infos
+from utils.extractor_factory import (
+    clear_extractor_cache,
+    create_unified_extractor,
+    get_extractor_cache_info,
+)
+from utils.model_factory import clear_model_pool
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    clear_model_pool()
+    clear_extractor_cache()
+    yield
+    clear_extractor_cache()
+    clear_model_pool()
+
+
+def test_repeated_calls_hit_cache():
+    """같은 조합은 캐시된 extractor를 재사용"""
+    first = create_unified_extractor(
+        model_name="gpt-4o-mini", tools=[Event], tool_choice="Event"
+    )
+    second = create_unified_extractor(
+        model_name="gpt-4o-mini", tools=[Event], tool_choice="Event"
+    )
+    other = create_unified_extractor(
+        model_name="gpt-4o-mini", tools=[Infos], tool_choice="Infos"
+    )
+
+    assert first is second
+    assert other is not first
+    info = get_extractor_cache_info()
+    assert (info["hits"], info["misses"], info["size"]) == (1, 2, 2)
+
+
+def test_model_pool_reset_invalidates_entry():
+    """모델 풀이 비워지면 새 모델 인스턴스로 extractor를 다시 생성"""
+    first = create_unified_extractor(model_name="gpt-4o-mini", extractor_type="plain")
+    clear_model_pool()
+    second = create_unified_extractor(model_name="gpt-4o-mini", extractor_type="plain")
+
+    assert first is not second
+    assert first.model is not second.model
+    assert get_extractor_cache_info()["hits"] == 0
@@ -0,0 +1,83 @@
+"""
+Fake LLM 테스트 스크립트 - 오프라인 모델의 스키마 준수 / 결정성 / 전체 워크플로우 실행 검증 (API 호출 없음)
+"""
+
+import time
+import warnings
+
+import pytest
+from langchain_core.messages import SystemMessage
+
+from nodes.stage1_consolidation import _prepare_consolidation_prompt
+from nodes.stage1_create_event import _event_batch_prompt
+from pydantics.stage1_plot_pydantics import NarrativePoles
+from pydantics.stage1_pydantics import Character, ConsolidationPrepareResult, Events
+from test_character_network import build_sample_graph
+from utils.extractor_factory import clear_extractor_cache, create_unified_extractor
+from utils.fake_llm import FakeStructuredChatModel, configure_fake_llm
+from utils.model_factory import clear_model_pool
+
+
+@pytest.fixture(autouse=True)
+def fresh_pool():
+    clear_model_pool()
+    clear_extractor_cache()
+    yield
+    configure_fake_llm(seed=0, latency=0)
+    clear_extractor_cache()
+
+
+def extract(schema, prompt, model=None):
+    extractor = create_unified_extractor(
+        model_name=None if model else "fake", model=model, tools=[schema], tool_choice=schema.__name__
+    )
+    return extractor.invoke([SystemMessage(content=prompt)])["responses"][0]
+
+
+def test_schema_valid_and_deterministic():
+    """같은 seed / 프롬프트는 같은 결과, seed가 바뀌면 다른 결과"""
+    character = extract(Character, "주제: 권력")
+    assert isinstance(character, Character)
+    assert 7 <= len(character.infos) <= 10
+    assert extract(Character, "주제: 권력") == character
+
+    configure_fake_llm(seed=1)
+    assert extract(Character, "주제: 권력") != character
+    assert isinstance(extract(NarrativePoles, "양극 분석"), NarrativePoles)
+
+
+def test_ids_come_from_prompt():
+    """배치 Event는 요청한 info_id마다, 통합 그룹은 요청한 PlaceHolder id로만 생성"""
+    graph, _, info_ids, _, ph_ids = build_sample_graph()
+    items = [
+        {"info_id": info_id, "role": "(주인공)", "current_info_type": "desire", "current_info_content": "내용"}
+        for info_id in info_ids
+    ]
+    events = extract(Events, _event_batch_prompt({"items": items, "conflict": "갈등", "vibe": "어두움"}))
+    assert sorted(event.info_id for event in events.events) == sorted(info_ids)
+
+    result = extract(ConsolidationPrepareResult, _prepare_consolidation_prompt({"graph": graph}))
+    assert {ph_id for group in result.chunked_placeholders for ph_id in group} <= set(ph_ids)
+
+
+def test_simulated_latency():
+    model = FakeStructuredChatModel(latency=0.05)
+    start = time.perf_counter()
+    model.invoke("안녕")
+    assert time.perf_counter() - start >= 0.05
+
+
+def test_stage1_workflow_offline(tmp_path, monkeypatch):
+    """model="fake"로 전체 Stage1 워크플로우가 경고 / 실패 분기 없이 완료"""
+    from workflow_stage1 import build_workflow
+
+    monkeypatch.chdir(tmp_path)  # saved_graphs 출력 위치
+    inputs = {"topic": "권력의 본질", "conflict": "개인과 집단", "vibe": "어두움", "model": "fake"}
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        result = build_workflow().invoke(inputs)
+
+    stats = result["graph"].get_statistics()
+    assert stats["characters"] > 3 and stats["events"] > 0
+    assert not result["failed_branches"]
+    assert not [w for w in caught if str(w.message).startswith("Warning")]
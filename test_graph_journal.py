@@ -0,0 +1,94 @@
+"""
+GraphJournal 테스트 스크립트 - 연산 저널 기록 / 재생 / compaction 검증
+"""
+
+from character_network import CharacterNetwork
+from graph_journal import GraphJournal
+from test_character_network import build_sample_graph
+
+
+def assert_same_graph(left: CharacterNetwork, right: CharacterNetwork):
+    assert left.get_statistics() == right.get_statistics()
+    assert left._node_id == right._node_id
+    for node_id, node in left.nodes.items():
+        assert right.nodes[node_id].data == node.data
+        assert right.nodes[node_id].edges == node.edges
+
+
+def run_iterations(graph: CharacterNetwork, journal: GraphJournal):
+    """iteration 0: 초기 그래프, 1: consolidation, 2: placeholder 치환"""
+    snapshots = {}
+    journal.checkpoint(graph, 0)
+    snapshots[0] = CharacterNetwork.from_bytes(graph.to_bytes())
+
+    event_id = graph.get_events()[0][0]
+    ph_ids = [node_id for node_id, _ in graph.get_placeholders()]
+    unified_id = graph.add_placeholder(role="(가족)", owner_id=[event_id], created_at=1)
+    graph.replace_in_event_summaries({event_id: {"(엄격한 아버지)": "(가족)"}})
+    graph.merge_node_groups([(ph_ids, unified_id)])
+    journal.checkpoint(graph, 1)
+    snapshots[1] = CharacterNetwork.from_bytes(graph.to_bytes())
+
+    char_id = graph.add_character(role="(가족)", created_at=2)
+    info_id = graph.add_info(info_type="fear", content="버려짐", owner_id=char_id)
+    graph.connect_nodes(info_id, event_id)
+    graph.connect_nodes(info_id, char_id)
+    graph.remove_node(unified_id)
+    journal.checkpoint(graph, 2)
+    snapshots[2] = CharacterNetwork.from_bytes(graph.to_bytes())
+    return snapshots
+
+
+def test_replay_each_iteration(tmp_path):
+    """저널 재생으로 각 iteration 시점의 그래프 복원"""
+    graph, *_ = build_sample_graph()
+    journal = GraphJournal(str(tmp_path / "graph.journal.jsonl"))
+    snapshots = run_iterations(graph, journal)
+
+    assert [c["iteration"] for c in journal.checkpoints()] == [0, 1, 2]
+    for iteration, expected in snapshots.items():
+        assert_same_graph(expected, journal.replay(iteration=iteration))
+    assert_same_graph(graph, journal.replay())
+    assert journal.replay(iteration=1).nodes["event_1"].data["summary"] == "(가족)와 충돌"
+
+
+def test_periodic_snapshot_and_compaction(tmp_path):
+    """snapshot_interval 초과 시 snapshot 재기록, compact 후 최근 checkpoint만 재생 가능"""
+    graph, *_ = build_sample_graph()
+    journal = GraphJournal(str(tmp_path / "graph.journal.jsonl"), snapshot_interval=3)
+    snapshots = run_iterations(graph, journal)
+
+    snapshot_count = sum(1 for record in journal.records() if record["op"] == "snapshot")
+    assert snapshot_count > 1
+
+    removed = journal.compact(keep_last=2)
+    assert removed > 0
+    assert [c["iteration"] for c in journal.checkpoints()] == [1, 2]
+    assert_same_graph(snapshots[1], journal.replay(iteration=1))
+    assert_same_graph(snapshots[2], journal.replay(iteration=2))
+
+    # compaction 이후에도 같은 그래프로 계속 덧붙일 수 있음
+    graph.add_character(role="(새 인물)")
+    journal.checkpoint(graph, 3)
+    assert journal.replay(iteration=3).get_statistics() == graph.get_statistics()
+
+
+def test_compact_only_periodically(tmp_path, monkeypatch):
+    """checkpoint가 keep_last + every개 쌓일 때만 파일을 다시 씀"""
+    graph, *_ = build_sample_graph()
+    journal = GraphJournal(str(tmp_path / "graph.journal.jsonl"))
+    compacted = []
+    original = GraphJournal.compact
+    monkeypatch.setattr(
+        GraphJournal, "compact", lambda self, keep_last: compacted.append(1) or original(self, keep_last)
+    )
+
+    for iteration in range(7):
+        graph.add_character(role=f"(인물 {iteration})")
+        journal.checkpoint(graph, iteration)
+        journal.compact_if_needed(graph, keep_last=2, every=3)
+
+    # 5번째 checkpoint에서 한 번 compact (최근 2개만 남김), 다음 compact는 다시 5개가 되는 8번째
+    assert len(compacted) == 1
+    assert [c["iteration"] for c in journal.checkpoints()] == [3, 4, 5, 6]
+    assert journal.replay().get_statistics() == graph.get_statistics()
@@ -0,0 +1,127 @@
+"""
+Graph Offload 테스트 스크립트 - 전용 스레드 / 워커 프로세스 실행 결과가 인라인 실행과 같은지 검증 (API 호출 없음)
+"""
+
+import asyncio
+import json
+import warnings
+
+import pytest
+
+import utils.graph_offload as graph_offload
+from character_network import CharacterNetwork
+from graph_journal import apply_journal_op
+from nodes.stage1_consolidation import update_graph_after_consolidation
+from nodes.stage1_placeholder_replace import update_graph_with_infos
+from pydantics.stage1_pydantics import ConsolidatedRole, InfoWithEventId
+from test_character_network import build_sample_graph
+from test_graph_journal import assert_same_graph
+from utils.extractor_factory import clear_extractor_cache
+from utils.graph_offload import run_graph_update, save_graph, shutdown_graph_offload
+from utils.model_factory import clear_model_pool
+
+PROCESS = {"configurable": {"graph_offload": "process"}}
+INPUTS = {"topic": "권력의 본질", "conflict": "개인과 집단", "vibe": "어두움", "model": "fake"}
+
+
+@pytest.fixture(autouse=True)
+def offline(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)  # saved_graphs 출력 위치
+    clear_model_pool()
+    clear_extractor_cache()
+    yield
+    clear_extractor_cache()
+    shutdown_graph_offload()
+
+
+def consolidation_state(graph, event_id, ph_ids):
+    role = ConsolidatedRole(
+        unified_role="(가족)",
+        original_placeholders={ph_ids[0]: "(엄격한 아버지)", ph_ids[1]: "(다른 역할)"},
+    )
+    return {"graph": graph, "consolidated_roles": [role], "current_iteration": 1}
+
+
+def infos_state(graph, event_id):
+    unified_id = graph.get_placeholders()[0][0]
+    infos = [
+        InfoWithEventId(type="fear", content="가족에게 버려질까 두렵다", event_id=event_id),
+        InfoWithEventId(type="desire", content="동료들에게 인정받고 싶다", event_id="미정"),
+    ]
+    return {"graph": graph, "generated_infos": [(unified_id, infos)], "current_iteration": 2}
+
+
+def mutate_inline(graph):
+    """오프로드 호출 사이에 원본 프로세스에서 직접 변경"""
+    char_id = graph.add_character(role="(방관자)", created_at=1)
+    info_id = graph.add_info(info_type="belief", content="침묵이 안전하다", owner_id=char_id)
+    graph.connect_nodes(info_id, char_id)
+
+
+def test_process_offload_matches_inline(tmp_path):
+    """워커 결과 / warnings / 저널 / 저장 파일이 인라인 실행과 같고, 두 번째 호출부터는 delta만 전송"""
+    graph, _, _, event_id, ph_ids = build_sample_graph()
+    expected = CharacterNetwork.from_bytes(graph.to_bytes())
+    initial = CharacterNetwork.from_bytes(graph.to_bytes())
+    graph.start_journal()
+
+    with pytest.warns(UserWarning, match="does not match"):
+        run_graph_update(
+            update_graph_after_consolidation, consolidation_state(graph, event_id, ph_ids), PROCESS
+        )
+    key = graph_offload._replica_keys[graph]
+    mutate_inline(graph)
+    result = run_graph_update(update_graph_with_infos, infos_state(graph, event_id), PROCESS)
+    assert result["graph"] is graph
+    assert graph_offload._replica_keys[graph] == key  # 스냅샷 재전송 없음
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        update_graph_after_consolidation(consolidation_state(expected, event_id, ph_ids))
+    mutate_inline(expected)
+    update_graph_with_infos(infos_state(expected, event_id))
+    assert_same_graph(expected, graph)
+    assert graph.drain_delta() == []  # 워커에서 돌려받은 연산은 다시 보내지 않음
+
+    # 워커 변경분도 저널에 남아 재생 가능
+    for record in graph.drain_journal():
+        apply_journal_op(initial, json.loads(record))
+    assert_same_graph(expected, initial)
+
+    path = str(tmp_path / "offloaded.json")
+    save_graph(graph, path, PROCESS)
+    assert_same_graph(expected, CharacterNetwork.load_from_file(path))
+
+
+@pytest.mark.filterwarnings("ignore:Warning")
+def test_resync_after_worker_restart():
+    """워커가 복제본을 잃으면 스냅샷을 다시 보내 재시도"""
+    graph, _, _, event_id, ph_ids = build_sample_graph()
+    run_graph_update(
+        update_graph_after_consolidation, consolidation_state(graph, event_id, ph_ids), PROCESS
+    )
+    key = graph_offload._replica_keys[graph]
+    shutdown_graph_offload()
+    graph_offload._replica_keys[graph] = key
+
+    run_graph_update(update_graph_with_infos, infos_state(graph, event_id), PROCESS)
+    assert graph_offload._replica_keys[graph] != key
+    assert not graph.get_placeholders()
+
+    with pytest.raises(ValueError, match="graph_offload"):
+        run_graph_update(update_graph_with_infos, {"graph": graph}, {"configurable": {"graph_offload": "gpu"}})
+
+
+def test_stage1_offload_matches_inline():
+    """전용 스레드 / 워커 프로세스(async 포함)로 실행해도 모든 iteration에서 같은 프롬프트 / 그래프"""
+    from workflow_stage1 import build_workflow
+
+    inline = build_workflow().invoke(INPUTS)["graph"]
+    # Enum은 값으로 저장되므로 재생된 그래프와 data가 같음
+    assert all(type(event.data["target_info_type"]) is str for _, event in inline.get_events())
+    expected = inline.to_bytes()
+    thread = build_workflow().invoke(INPUTS, {"configurable": {"graph_offload": "thread"}})
+    assert thread["graph"].to_bytes() == expected
+
+    process = asyncio.run(build_workflow().ainvoke(INPUTS, PROCESS))
+    assert process["graph"].to_bytes() == expected
@@ -0,0 +1,100 @@
+"""
+Instrumentation 테스트 스크립트 - extractor 호출별 토큰 / 지연 시간 / 캐시 / 재시도 기록 검증 (API 호출 없음)
+"""
+
+from itertools import cycle
+
+import pytest
+from langchain_core.language_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage, SystemMessage
+from langgraph.graph import END, START, StateGraph
+from typing_extensions import TypedDict
+
+from utils.extractor_factory import PlainLLMWrapper
+from utils.instrumentation import (
+    InstrumentedExtractor,
+    expensive_nodes,
+    load_summaries,
+    record_run,
+    retry_scope,
+)
+from utils.response_cache import CachedExtractor, configure_response_cache
+
+USAGE = {"input_tokens": 30, "output_tokens": 12, "total_tokens": 42}
+
+
+@pytest.fixture(autouse=True)
+def reset_cache():
+    yield
+    configure_response_cache("off")
+
+
+def build_extractor():
+    model = GenericFakeChatModel(messages=cycle([AIMessage(content="응답", usage_metadata=USAGE)]))
+    cached = CachedExtractor(PlainLLMWrapper(model), model, "plain", None, None)
+    return InstrumentedExtractor(cached, "fake-model", "plain", None)
+
+
+class State(TypedDict):
+    prompt: str
+
+
+def build_graph(extractor):
+    def create_event(state):
+        extractor.invoke([SystemMessage(content=state["prompt"])])
+        with retry_scope(1):
+            extractor.invoke([SystemMessage(content=state["prompt"] + " 다시")])
+        return {}
+
+    graph = StateGraph(State)
+    graph.add_node("create_event", create_event)
+    graph.add_edge(START, "create_event")
+    graph.add_edge("create_event", END)
+    return graph.compile()
+
+
+def test_records_tokens_retry_and_cache_hit(tmp_path):
+    """노드 이름, usage 토큰, 재시도 차수, 캐시 적중이 호출마다 기록됨"""
+    configure_response_cache("readwrite", str(tmp_path / "cache.sqlite"))
+    app = build_graph(build_extractor())
+
+    with record_run("run-1", export_dir=str(tmp_path / "metrics"), formats=("json", "prom")) as recorder:
+        app.invoke({"prompt": "주인공"})
+        app.invoke({"prompt": "주인공"})  # 같은 프롬프트는 캐시에서 재생
+
+    first, retried, hit, _ = recorder.records
+    assert first["node"] == "create_event"
+    assert (first["prompt_tokens"], first["completion_tokens"]) == (30, 12)
+    assert (first["retry"], first["cache_hit"]) == (0, False)
+    assert retried["retry"] == 1
+    assert hit["cache_hit"] and hit["prompt_tokens"] == 0
+
+    totals = recorder.summary()["nodes"]["create_event"]
+    assert (totals["calls"], totals["total_tokens"]) == (4, 84)
+    assert (totals["retries"], totals["cache_hits"]) == (2, 2)
+
+    prom = (tmp_path / "metrics").glob("run-1-*.prom")
+    text = next(prom).read_text(encoding="utf-8")
+    assert 'stage1_llm_prompt_tokens_total{run="run-1",node="create_event",model="fake-model"} 60' in text
+
+
+def test_passthrough_without_recorder():
+    """기록이 꺼져 있으면 원래 extractor 결과를 그대로 반환"""
+    response = build_extractor().invoke([SystemMessage(content="주인공")])
+    assert response["content"] == "응답"
+
+
+def test_expensive_nodes_across_resumed_runs(tmp_path):
+    """재개로 나뉜 요약 파일은 run_id별로 합산해 정렬"""
+    app = build_graph(build_extractor())
+    for _ in range(2):
+        with record_run("run-2", export_dir=str(tmp_path)):
+            app.invoke({"prompt": "조력자"})
+
+    summaries = load_summaries(str(tmp_path))["run-2"]
+    assert len(summaries) == 2
+    [top] = expensive_nodes(summaries, "total_tokens", top=1)
+    assert (top["node"], top["calls"], top["total_tokens"]) == ("create_event", 4, 168)
+
+    with pytest.raises(ValueError):
+        expensive_nodes(summaries, "cost")
@@ -0,0 +1,50 @@
+"""
+LLM 호출 공통 함수 테스트 스크립트 - 응답 파싱과 sync / async 노드 분기 검증 (API 호출 없음)
+"""
+
+import asyncio
+import operator
+from typing import Annotated, List
+
+from langchain_core.messages import AIMessage
+from langgraph.graph import END, START, StateGraph
+from typing_extensions import TypedDict
+
+from pydantics.stage1_pydantics import ConsolidationPrepareResult
+from utils.llm_call import parse_extractor_response, sync_async_node
+
+
+def test_parse_falls_back_to_tool_call_args():
+    """responses가 비어 있으면 tool call args로 schema 생성"""
+    args = {"chunked_placeholders": [["placeholder_1", "placeholder_5"]]}
+    message = AIMessage(
+        content="",
+        tool_calls=[{"id": "1", "name": "ConsolidationPrepareResult", "args": args}],
+    )
+    response = {"responses": [None], "messages": [message]}
+    parsed = parse_extractor_response(response, ConsolidationPrepareResult)
+
+    assert isinstance(parsed, ConsolidationPrepareResult)
+    assert parsed.chunked_placeholders == [["placeholder_1", "placeholder_5"]]
+
+
+def test_sync_async_node_dispatch():
+    """컴파일된 그래프의 invoke는 sync, ainvoke는 async 구현 실행"""
+
+    class State(TypedDict):
+        calls: Annotated[List[str], operator.add]
+
+    def node(state):
+        return {"calls": ["sync"]}
+
+    async def anode(state):
+        return {"calls": ["async"]}
+
+    workflow = StateGraph(State)
+    workflow.add_node("node", sync_async_node(node, anode))
+    workflow.add_edge(START, "node")
+    workflow.add_edge("node", END)
+    graph = workflow.compile()
+
+    assert graph.invoke({"calls": []})["calls"] == ["sync"]
+    assert asyncio.run(graph.ainvoke({"calls": []}))["calls"] == ["async"]
@@ -0,0 +1,65 @@
+"""
+Model Factory 테스트 스크립트 - 모델 클라이언트 풀 검증 (API 호출 없음)
+"""
+
+import asyncio
+
+import pytest
+
+from utils.model_factory import clear_model_pool, configure_http_pool, create_model
+
+
+@pytest.fixture(autouse=True)
+def fresh_pool(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    clear_model_pool()
+    yield
+    clear_model_pool()
+
+
+def test_same_kwargs_reuse_instance():
+    """같은 모델명/kwargs 조합은 같은 인스턴스"""
+    model = create_model("gpt-4o-mini")
+    assert create_model("gpt-4o-mini") is model
+    assert create_model("gpt-4o-mini", temperature=0.2) is not model
+    assert create_model("gpt-4o-mini", temperature=0.2) is create_model(
+        "gpt-4o-mini", temperature=0.2
+    )
+
+
+def test_models_share_http_pool():
+    """서로 다른 모델도 하나의 HTTP 클라이언트를 공유"""
+    first = create_model("gpt-4o-mini")
+    second = create_model("gpt-5-mini")
+    assert first.http_client is second.http_client
+    assert first.http_async_client is second.http_async_client
+
+
+def test_configure_http_pool_resets_pool():
+    """풀 설정 변경 시 이후 호출부터 새 클라이언트 사용"""
+    model = create_model("gpt-4o-mini")
+    settings = configure_http_pool(max_connections=7, keepalive_expiry=5.0)
+    assert settings["max_connections"] == 7
+    assert create_model("gpt-4o-mini") is not model
+
+
+def test_unsupported_model():
+    with pytest.raises(ValueError):
+        create_model("unknown-model")
+
+
+def test_async_connections_per_event_loop():
+    """async 커넥션 풀은 이벤트 루프별로 분리되어 asyncio.run을 반복해도 닫힌 루프의 풀을 쓰지 않음"""
+    transport = create_model("gpt-4o-mini").http_async_client._transport
+
+    async def current():
+        return transport._current()
+
+    first = asyncio.run(current())
+    second = asyncio.run(current())
+    assert first is not second
+
+    async def same_loop():
+        return await current() is await current()
+
+    assert asyncio.run(same_loop())
@@ -0,0 +1,158 @@
+"""
+PlaceHolder Info 생성 테스트 스크립트 - 배치 분배, placeholder_id 매칭, 개별 호출 fallback 검증 (API 호출 없음)
+"""
+
+import warnings
+
+import pytest
+
+import nodes.stage1_placeholder_replace as placeholder_replace
+import utils.branch_retry as branch_retry
+from nodes.stage1_placeholder_replace import (
+    _match_batch_infos,
+    distribute_placeholder_info_creation,
+    prepare_placeholders_node,
+)
+from pydantics.stage1_pydantics import Infos, PlaceHolderInfosBatch
+from test_character_network import build_sample_graph
+
+
+def build_placeholder_state():
+    graph, char_id, info_ids, event_id, ph_ids = build_sample_graph()
+    state = {"graph": graph, "model": "gpt-4o-mini", "extractor_type": "default"}
+    state.update(prepare_placeholders_node(state))
+    return state, event_id, ph_ids
+
+
+def make_infos(event_id):
+    return [
+        {"type": "desire", "content": "가문의 명예를 지키고 싶다", "event_id": event_id},
+        {"type": "fear", "content": "자식이 실패할까 두렵다", "event_id": "미정"},
+    ]
+
+
+def test_distribute_batches():
+    """기본값은 PlaceHolder마다 호출, placeholder_batch_size면 묶어서 호출"""
+    state, event_id, ph_ids = build_placeholder_state()
+
+    sends = distribute_placeholder_info_creation(state)
+    assert [send.node for send in sends] == ["create_info_for_placeholder"] * 2
+
+    sends = distribute_placeholder_info_creation(
+        state, {"configurable": {"placeholder_batch_size": 4}}
+    )
+    assert [send.node for send in sends] == ["create_info_batch"]
+    items = sends[0].arg["items"]
+    assert [item["placeholder_id"] for item in items] == ph_ids
+    assert all(item["valid_event_ids"] == [event_id] for item in items)
+
+
+def test_match_batch_infos():
+    """검증 실패 / 누락 항목은 개별 호출 대상으로, 미요청 id는 경고 후 무시"""
+    state, event_id, ph_ids = build_placeholder_state()
+    batch_state = distribute_placeholder_info_creation(
+        state, {"configurable": {"placeholder_batch_size": 4}}
+    )[0].arg
+    batch_state["items"].append({**batch_state["items"][0], "placeholder_id": "placeholder_99"})
+    duplicated = [dict(info, event_id=event_id) for info in make_infos(event_id)]
+    batch = PlaceHolderInfosBatch(
+        placeholders=[
+            {"placeholder_id": ph_ids[0], "infos": make_infos(event_id)},
+            {"placeholder_id": ph_ids[1], "infos": duplicated},
+            {"placeholder_id": "placeholder_50", "infos": make_infos(event_id)},
+        ]
+    )
+
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        generated, retry = _match_batch_infos(batch_state, batch)
+
+    assert [placeholder_id for placeholder_id, _ in generated] == [ph_ids[0]]
+    assert [item["placeholder_id"] for item in retry] == [ph_ids[1], "placeholder_99"]
+    assert len(caught) == 3
+
+
+def test_batch_node_falls_back_to_single_calls(monkeypatch):
+    """배치에서 검증에 실패한 PlaceHolder만 개별 호출로 다시 생성"""
+    state, event_id, ph_ids = build_placeholder_state()
+    batch_state = distribute_placeholder_info_creation(
+        state, {"configurable": {"placeholder_batch_size": 4}}
+    )[0].arg
+    calls = []
+
+    def fake_call_extractor(call_state, prompt, schema):
+        calls.append(schema)
+        if schema is PlaceHolderInfosBatch:
+            return PlaceHolderInfosBatch(
+                placeholders=[{"placeholder_id": ph_ids[0], "infos": make_infos(event_id)}]
+            )
+        return Infos(infos=make_infos(event_id))
+
+    monkeypatch.setattr(placeholder_replace, "call_extractor", fake_call_extractor)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        result = placeholder_replace.create_info_batch_node(batch_state)
+
+    assert calls == [PlaceHolderInfosBatch, Infos]
+    assert [placeholder_id for placeholder_id, _ in result["generated_infos"]] == ph_ids
+
+
+def test_batch_rejects_other_placeholders_event_ids(monkeypatch):
+    """다른 PlaceHolder의 event_id를 쓴 항목은 개별 호출, 응답 파싱 실패는 전체 개별 호출"""
+    state, event_id, ph_ids = build_placeholder_state()
+    batch_state = distribute_placeholder_info_creation(
+        state, {"configurable": {"placeholder_batch_size": 4}}
+    )[0].arg
+    batch_state["items"][1]["valid_event_ids"] = ["event_99"]
+    batch = PlaceHolderInfosBatch(
+        placeholders=[
+            {"placeholder_id": placeholder_id, "infos": make_infos(event_id)}
+            for placeholder_id in ph_ids
+        ]
+    )
+    with pytest.warns(UserWarning, match="event_1"):
+        generated, retry = _match_batch_infos(batch_state, batch)
+    assert [placeholder_id for placeholder_id, _ in generated] == [ph_ids[0]]
+    assert [item["placeholder_id"] for item in retry] == [ph_ids[1]]
+
+    calls = []
+
+    def fake_call_extractor(call_state, prompt, schema):
+        calls.append(schema)
+        if schema is PlaceHolderInfosBatch:
+            raise IndexError("tool call 없음")
+        return Infos(infos=make_infos(event_id))
+
+    monkeypatch.setattr(placeholder_replace, "call_extractor", fake_call_extractor)
+    with pytest.warns(UserWarning, match="개별 생성"):
+        result = placeholder_replace.create_info_batch_node(batch_state)
+    assert calls == [PlaceHolderInfosBatch, Infos, Infos]
+    assert [placeholder_id for placeholder_id, _ in result["generated_infos"]] == ph_ids
+
+
+def test_batch_fallback_failures_isolated(monkeypatch):
+    """개별 생성이 계속 실패한 PlaceHolder만 failed_branches에 기록하고, 배치 결과는 유지"""
+    monkeypatch.setattr(branch_retry, "DEFAULT_BRANCH_RETRY_BASE", 0)
+    state, event_id, ph_ids = build_placeholder_state()
+    batch_state = distribute_placeholder_info_creation(
+        state, {"configurable": {"placeholder_batch_size": 4}}
+    )[0].arg
+    calls = []
+
+    def fake_call_extractor(call_state, prompt, schema):
+        calls.append(schema)
+        if schema is PlaceHolderInfosBatch:
+            return PlaceHolderInfosBatch(
+                placeholders=[{"placeholder_id": ph_ids[0], "infos": make_infos(event_id)}]
+            )
+        raise RuntimeError("개별 생성 실패")
+
+    monkeypatch.setattr(placeholder_replace, "call_extractor", fake_call_extractor)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        result = placeholder_replace.create_info_batch_node(batch_state)
+
+    assert calls == [PlaceHolderInfosBatch, Infos, Infos, Infos]
+    assert [placeholder_id for placeholder_id, _ in result["generated_infos"]] == [ph_ids[0]]
+    [record] = result["failed_branches"]
+    assert record["branch"]["placeholder_id"] == ph_ids[1] and record["attempts"] == 3
@@ -3,9 +3,8 @@ Plot v2 테스트 스크립트
 Stage1 결과를 사용하여 플롯을 생성하는 테스트
 """
 
-import json
 import os
-from character_network import CharacterNetwork, Node, NodeType
+from character_network import CharacterNetwork
 
 
 def load_latest_graph():
@@ -26,25 +25,10 @@ def load_latest_graph():
     
     print(f"로드할 파일: {filepath}")
     
-    with open(filepath, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    # CharacterNetwork 재구성 (타입/인접 인덱스 포함)
+    graph = CharacterNetwork.load_from_file(filepath)
     
-    # CharacterNetwork 재구성
-    graph = CharacterNetwork(data["topic"])
-    
-    if "_node_id" in data:
-        graph._node_id = data["_node_id"]
-    
-    for node_id, node_data in data["nodes"].items():
-        node = Node(
-            id=node_data["id"],
-            type=NodeType(node_data["type"]),
-            data=node_data["data"],
-        )
-        node.edges = set(node_data["edges"])
-        graph.nodes[node_id] = node
-    
-    return graph, data.get("topic", "")
+    return graph, graph.topic
 
 
 def test_plot_generation():
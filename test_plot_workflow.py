@@ -0,0 +1,89 @@
+"""
+Plot v2 워크플로우 DAG 테스트 스크립트 - 단계별 입력과 context 병렬 준비 검증 (API 호출 없음)
+"""
+
+import time
+
+import workflow_plot_v2
+from nodes.stage1_nodes import (
+    build_character_network_analysis,
+    build_main_characters_summary,
+    load_theme_list,
+)
+from test_character_network import build_sample_graph
+
+STEP_OUTPUTS = {
+    "narrative_poles_subgraph": "narrative_poles",
+    "sub_themes_subgraph": "sub_themes",
+    "inciting_macro_subgraph": "inciting_and_macro",
+    "structural_tempo_subgraph": "structural_tempo",
+    "integrated_plot_subgraph": "integrated_plot",
+}
+
+
+class FakeSubgraph:
+    """입력을 기록하고 단계 결과 대신 문자열을 반환하는 서브그래프"""
+
+    def __init__(self, output_key, calls, delay=0.0):
+        self.output_key = output_key
+        self.calls = calls
+        self.delay = delay
+
+    def invoke(self, state):
+        self.calls[self.output_key] = dict(state)
+        time.sleep(self.delay)
+        self.calls[f"{self.output_key}_finished"] = time.monotonic()
+        return {**state, self.output_key: f"<{self.output_key}>"}
+
+
+def test_plot_workflow_dag(monkeypatch, tmp_path):
+    """각 단계가 필요한 이전 결과를 받고, context 준비는 양극 분석과 동시에 실행"""
+    graph, *_ = build_sample_graph()
+    filepath = str(tmp_path / "graph.json")
+    graph.save_to_file(filepath)
+
+    calls = {}
+    prepared = {}
+    for attribute, output_key in STEP_OUTPUTS.items():
+        delay = 0.3 if output_key == "narrative_poles" else 0.0
+        monkeypatch.setattr(workflow_plot_v2, attribute, FakeSubgraph(output_key, calls, delay))
+
+    prepare_conflict_analysis = workflow_plot_v2.prepare_conflict_analysis
+
+    def recording_prepare(state):
+        prepared["finished"] = time.monotonic()
+        return prepare_conflict_analysis(state)
+
+    monkeypatch.setattr(workflow_plot_v2, "prepare_conflict_analysis", recording_prepare)
+    monkeypatch.setattr(workflow_plot_v2, "save_plot_to_file", lambda state: {})
+
+    result = workflow_plot_v2.build_plot_workflow().invoke(
+        {"graph_filepath": filepath, "topic": "테스트 주제", "conflict": "개인과 집단", "vibe": "어두움"}
+    )
+
+    assert result["integrated_plot"] == "<integrated_plot>"
+    # context 준비는 양극 분석 결과를 기다리지 않음
+    assert prepared["finished"] < calls["narrative_poles_finished"]
+    sub_theme_input = calls["sub_themes"]
+    assert sub_theme_input["narrative_poles"] == "<narrative_poles>"
+    assert sub_theme_input["theme_list"] == load_theme_list()
+    assert sub_theme_input["main_characters_summary"] == build_main_characters_summary(graph)
+    inciting_input = calls["inciting_and_macro"]
+    assert inciting_input["sub_themes"] == "<sub_themes>"
+    assert "character_conflict_analysis" in inciting_input
+    tempo_input = calls["structural_tempo"]
+    assert tempo_input["inciting_and_macro"] == "<inciting_and_macro>"
+
+
+def test_context_uses_info_type():
+    """주연 요약에는 desire / fear Info만, 네트워크 분석에는 모든 Info가 유형과 함께 들어감"""
+    graph, char_id, *_ = build_sample_graph()
+    info_id = graph.add_info(info_type="talent", content="거짓말을 잘한다", owner_id=char_id)
+    graph.connect_nodes(info_id, char_id)
+
+    summary = build_main_characters_summary(graph).splitlines()
+    assert summary == [
+        "(주인공) - desire: 복수를 원한다",
+        "(주인공) - desire: 배신을 두려워한다",
+    ]
+    assert "talent: 거짓말을 잘한다" in build_character_network_analysis(graph)
@@ -0,0 +1,95 @@
+"""
+Progress 이벤트 테스트 스크립트 - custom stream으로 전달되는 진행 이벤트 / 누적 집계 검증 (API 호출 없음)
+"""
+
+import asyncio
+from collections import Counter
+
+import pytest
+
+from utils.extractor_factory import clear_extractor_cache
+from utils.model_factory import clear_model_pool
+from utils.progress import astream_progress, progress_node, stream_progress
+
+INPUTS = {"topic": "권력의 본질", "conflict": "개인과 집단", "vibe": "어두움", "model": "fake"}
+
+
+@pytest.fixture(autouse=True)
+def offline(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)  # saved_graphs 출력 위치
+    clear_model_pool()
+    clear_extractor_cache()
+    yield
+    clear_extractor_cache()
+
+
+def test_stage1_progress_events(capsys):
+    """노드 / 분기 / LLM 호출 이벤트가 오고, 저장 / 완료 통계는 print 대신 이벤트로 전달"""
+    from workflow_stage1 import build_workflow
+
+    async def collect():
+        return [event async for event in astream_progress(build_workflow(), INPUTS)]
+
+    events = asyncio.run(collect())
+    kinds = Counter(event["event"] for event in events)
+    assert kinds["node_start"] == kinds["node_finish"] > 0
+    assert kinds["workflow_finished"] == 1 and kinds["graph_saved"] >= 1
+    assert "워크플로우 완료" not in capsys.readouterr().out
+
+    totals = events[-1]["totals"]
+    assert totals["llm_calls"] == kinds["llm_call"] > 0
+    assert totals["total_tokens"] > 0
+    assert totals["branches_done"] == totals["branches_total"] == kinds["branch_done"]
+
+    fanouts = [event for event in events if event["event"] == "fanout"]
+    assert fanouts[0]["namespace"].startswith("run_character_subgraph")
+    assert fanouts[0]["targets"] == {"create_character": fanouts[0]["width"]}
+
+    # 캐릭터 그래프 갱신 노드의 변경량 = 새 캐릭터 수
+    update = next(
+        event
+        for event in events
+        if event["event"] == "node_finish" and event["node"] == "update_character_graph"
+    )
+    assert update["graph_delta"]["character"] == fanouts[0]["width"]
+
+    finished = next(event for event in events if event["event"] == "workflow_finished")
+    assert finished["stats"]["characters"] >= update["graph_delta"]["character"]
+
+
+def test_progress_off_by_default(capsys):
+    """stream_progress 없이 실행하면 이벤트 없이 기존 print 출력"""
+    from workflow_stage1 import build_workflow
+
+    chunks = list(build_workflow().stream(INPUTS, stream_mode="custom"))
+    assert chunks == []
+    assert "워크플로우 완료" in capsys.readouterr().out
+
+
+def test_progress_node_keeps_input_schema():
+    """함수 노드를 감싸도 첫 인자 타입(입력 schema)과 config 전달이 유지됨"""
+    from langgraph.graph import END, START, StateGraph
+    from pydantic import BaseModel
+    from typing_extensions import TypedDict
+
+    class Input(BaseModel):
+        name: str
+
+    class State(TypedDict, total=False):
+        name: str
+        greeting: str
+
+    def greet(state: Input, config=None) -> State:
+        return {"greeting": f"{state.name} {config['configurable']['suffix']}"}
+
+    graph = StateGraph(State, input_schema=Input)
+    graph.add_node("greet", progress_node(greet))
+    graph.add_edge(START, "greet")
+    graph.add_edge("greet", END)
+    app = graph.compile()
+
+    config = {"configurable": {"suffix": "!"}}
+    events = list(stream_progress(app, {"name": "a"}, config))
+    assert [event["event"] for event in events] == ["node_start", "node_finish"]
+    assert events[-1]["node"] == "greet"
+    assert app.invoke({"name": "a"}, config)["greeting"] == "a !"
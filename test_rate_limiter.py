@@ -0,0 +1,87 @@
+"""
+Rate Limiter 테스트 스크립트 - 동시 호출 제한 / token bucket / 429 backoff 검증 (API 호출 없음)
+"""
+
+import threading
+import time
+
+from langchain_core.messages import SystemMessage
+from langgraph.graph import END, START, StateGraph
+from typing_extensions import TypedDict
+
+from utils import llm_call, rate_limiter
+from utils.rate_limiter import ModelRateLimiter, get_rate_limit_stats
+
+
+def test_concurrency_cap():
+    """동시에 슬롯을 잡는 호출 수가 max_concurrency를 넘지 않음"""
+    limiter = ModelRateLimiter(max_concurrency=2)
+    active, peak = [0], [0]
+    lock = threading.Lock()
+
+    def call():
+        with limiter.slot(10):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.05)
+            with lock:
+                active[0] -= 1
+
+    threads = [threading.Thread(target=call) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert peak[0] == 2
+    assert limiter.stats["calls"] == 6
+
+
+def test_request_bucket_delays_excess_calls():
+    """분당 요청 수를 넘는 호출은 refill까지 대기"""
+    limiter = ModelRateLimiter(requests_per_minute=60)
+    limiter._requests.tokens = 1
+
+    start = time.monotonic()
+    with limiter.slot(1):
+        pass
+    with limiter.slot(1):
+        pass
+
+    assert time.monotonic() - start >= 0.9
+
+
+def test_rate_limit_backoff_through_graph(monkeypatch):
+    """config의 rate_limits가 적용되고 429 발생 시 동시 호출 한도를 줄인 뒤 재시도"""
+    monkeypatch.setattr(rate_limiter, "BACKOFF_BASE", 0.01)
+
+    class RateLimitError(Exception):
+        pass
+
+    class FlakyExtractor:
+        calls = 0
+
+        def invoke(self, messages):
+            FlakyExtractor.calls += 1
+            if FlakyExtractor.calls == 1:
+                raise RateLimitError("429 Too Many Requests")
+            return {"responses": ["ok"]}
+
+    class State(TypedDict):
+        result: str
+
+    def node(state):
+        response = llm_call._invoke(FlakyExtractor(), [SystemMessage(content="x")], "flaky")
+        return {"result": response["responses"][0]}
+
+    workflow = StateGraph(State)
+    workflow.add_node("node", node)
+    workflow.add_edge(START, "node")
+    workflow.add_edge("node", END)
+    config = {"configurable": {"rate_limits": {"flaky": {"max_concurrency": 4}}}}
+
+    assert workflow.compile().invoke({"result": ""}, config=config)["result"] == "ok"
+    stats = get_rate_limit_stats()["flaky"]
+    assert stats["rate_limited"] == 1
+    assert stats["concurrency_limit"] == 2
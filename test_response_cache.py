@@ -0,0 +1,87 @@
+"""
+Response Cache 테스트 스크립트 - 디스크 응답 캐시 검증 (API 호출 없음)
+"""
+
+import asyncio
+
+import pytest
+from langchain_core.language_models import FakeListChatModel
+from langchain_core.messages import SystemMessage
+
+from utils.extractor_factory import PlainLLMWrapper
+from utils.response_cache import (
+    CachedExtractor,
+    ResponseCache,
+    ResponseCacheMissError,
+    configure_response_cache,
+    enable_response_cache,
+    get_response_cache,
+)
+
+
+@pytest.fixture
+def plain_extractor():
+    model = FakeListChatModel(responses=["첫 번째 응답", "두 번째 응답"])
+    return CachedExtractor(PlainLLMWrapper(model), model, "plain", None, None)
+
+
+@pytest.fixture(autouse=True)
+def reset_cache():
+    yield
+    configure_response_cache("off")
+
+
+def test_readwrite_then_replay(tmp_path, plain_extractor):
+    """readwrite로 저장한 응답을 replay 모드에서 그대로 재사용"""
+    path = str(tmp_path / "cache.sqlite")
+    messages = [SystemMessage(content="주인공을 만들어줘")]
+
+    configure_response_cache("readwrite", path)
+    first = plain_extractor.invoke(messages)
+    assert plain_extractor.invoke(messages)["content"] == first["content"] == "첫 번째 응답"
+
+    cache = configure_response_cache("replay", path)
+    assert plain_extractor.invoke(messages)["content"] == "첫 번째 응답"
+    with pytest.raises(ResponseCacheMissError):
+        plain_extractor.invoke([SystemMessage(content="다른 프롬프트")])
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_size_eviction_and_ttl(tmp_path):
+    """크기 상한 초과 시 오래된 항목 제거, TTL 지난 항목은 미스"""
+    cache = ResponseCache(str(tmp_path / "cache.sqlite"), max_bytes=300)
+    cache.put("old", "x" * 200)
+    cache.put("new", "y" * 200)
+
+    assert cache.get("old") is None
+    assert cache.get("new") == "y" * 200
+
+    cache.ttl = 1e-9
+    assert cache.get("new") is None
+    assert cache.get_statistics()["entries"] == 0
+
+
+def test_ainvoke_shares_cache(tmp_path, plain_extractor):
+    """ainvoke도 invoke와 같은 캐시 키를 사용"""
+    configure_response_cache("readwrite", str(tmp_path / "cache.sqlite"))
+    messages = [SystemMessage(content="주인공을 만들어줘")]
+
+    first = asyncio.run(plain_extractor.ainvoke(messages))
+    assert plain_extractor.invoke(messages)["content"] == first["content"] == "첫 번째 응답"
+
+
+def test_enable_response_cache_restores(tmp_path, monkeypatch):
+    """꺼져 있던 캐시는 겹친 블록이 모두 끝나면 다시 꺼지고, 이미 켜진 캐시는 건드리지 않음"""
+    monkeypatch.chdir(tmp_path)
+    configure_response_cache("off")
+    with enable_response_cache() as outer:
+        assert outer is not None and outer.mode == "readwrite"
+        with enable_response_cache() as inner:
+            assert inner is outer
+        assert get_response_cache() is outer
+    assert get_response_cache() is None
+
+    configured = configure_response_cache("replay", str(tmp_path / "cache.sqlite"))
+    with enable_response_cache() as cache:
+        assert cache is configured
+    assert get_response_cache() is configured
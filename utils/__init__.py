@@ -2,13 +2,37 @@
 Utility 모듈
 """
 
+from utils.checkpointer import SqliteCheckpointSaver, create_checkpointer
 from utils.cot import create_cot_extractor
-from utils.extractor_factory import create_unified_extractor
-from utils.model_factory import create_model
+from utils.extractor_factory import (
+    clear_extractor_cache,
+    create_unified_extractor,
+    get_extractor_cache_info,
+)
+from utils.instrumentation import add_sink, record_run
+from utils.model_factory import clear_model_pool, configure_http_pool, create_model
+from utils.rate_limiter import get_rate_limit_stats
+from utils.response_cache import (
+    ResponseCacheMissError,
+    configure_response_cache,
+    get_response_cache,
+)
 
 __all__ = [
     "create_cot_extractor",
     "create_unified_extractor",
+    "get_extractor_cache_info",
+    "clear_extractor_cache",
     "create_model",
+    "configure_http_pool",
+    "clear_model_pool",
+    "configure_response_cache",
+    "get_response_cache",
+    "ResponseCacheMissError",
+    "get_rate_limit_stats",
+    "record_run",
+    "add_sink",
+    "create_checkpointer",
+    "SqliteCheckpointSaver",
     "get_model_from_state",
 ]
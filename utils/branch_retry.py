@@ -0,0 +1,162 @@
+"""
+Branch Retry - Send fan-out 분기별 재시도와 실패 분기 건너뛰기
+
+Send로 분배된 노드 하나가 예외를 던지면 LangGraph는 같은 superstep의 다른 분기 결과까지
+버리고 서브그래프 전체를 실패시킨다. branch_node로 등록한 노드는 실패한 분기만 jitter backoff로
+다시 실행하고, 재시도 한도를 넘기면 예외 대신 failed_branches 기록을 반환해 나머지 분기 결과를 유지한다.
+    >>> subgraph.add_node("create_event", branch_node(create_event_node, acreate_event_node))
+
+config["configurable"] 옵션:
+- branch_max_retries: 분기별 재시도 횟수 (기본 2, 0이면 재시도 없음)
+- branch_retry_base: 첫 재시도 대기 상한(초, 기본 1.0). 매 재시도마다 2배,
+  실제 대기 시간은 0 ~ 상한 사이 무작위 (full jitter)
+- branch_retry_max: 대기 상한의 최댓값(초, 기본 30)
+- branch_skip_failed: 한도를 넘긴 분기를 건너뛰고 기록 (기본 True, False면 예외 전파)
+
+stream_progress가 켜져 있으면 분기가 끝날 때마다 branch_done 이벤트(attempts, failed)를 보낸다.
+"""
+
+import asyncio
+import functools
+import random
+import time
+import warnings
+from typing import Any, Awaitable, Callable, Dict, Tuple
+
+from langchain_core.runnables import RunnableLambda
+from langgraph.config import get_config
+from langgraph.errors import GraphBubbleUp
+
+from utils.instrumentation import retry_scope
+from utils.llm_call import sync_async_node
+from utils.progress import emit_progress
+from utils.response_cache import ResponseCacheMissError
+
+DEFAULT_BRANCH_MAX_RETRIES = 2
+DEFAULT_BRANCH_RETRY_BASE = 1.0
+DEFAULT_BRANCH_RETRY_MAX = 30.0
+# 다시 실행해도 결과가 같은 예외 (interrupt 등 LangGraph 제어 흐름 포함)
+NON_RETRYABLE_ERRORS = (GraphBubbleUp, ResponseCacheMissError)
+
+
+def _branch_settings() -> Tuple[int, float, float, bool]:
+    """실행 중인 그래프 config에서 (재시도 횟수, 대기 base, 대기 max, 건너뛰기 여부) 조회"""
+    try:
+        configurable = get_config().get("configurable", {})
+    except RuntimeError:  # 그래프 밖에서 직접 호출한 경우
+        configurable = {}
+    return (
+        configurable.get("branch_max_retries", DEFAULT_BRANCH_MAX_RETRIES),
+        configurable.get("branch_retry_base", DEFAULT_BRANCH_RETRY_BASE),
+        configurable.get("branch_retry_max", DEFAULT_BRANCH_RETRY_MAX),
+        configurable.get("branch_skip_failed", True),
+    )
+
+
+def backoff_delay(attempt: int, base: float, cap: float) -> float:
+    """attempt번째 재시도 전 대기 시간 (full jitter exponential backoff)"""
+    return random.uniform(0, min(cap, base * 2**attempt))
+
+
+def branch_summary(state: Dict[str, Any]) -> Dict[str, Any]:
+    """실패 기록용 분기 식별 정보 (*_id / *_ids 값, 배치면 항목별 id)"""
+    summary = {
+        key: value
+        for key, value in state.items()
+        if key.endswith("_id") or key.endswith("_ids")
+    }
+    if isinstance(state.get("items"), list):
+        summary["items"] = [
+            {key: value for key, value in item.items() if key.endswith("_id")}
+            for item in state["items"]
+        ]
+    return summary
+
+
+def _give_up(
+    name: str, state: Dict[str, Any], error: Exception, attempts: int, skip: bool, report: bool
+):
+    if not skip:
+        raise error
+    if report:
+        emit_progress("branch_done", attempts=attempts, failed=True)
+    record = {
+        "node": name,
+        "branch": branch_summary(state),
+        "error": f"{type(error).__name__}: {error}",
+        "attempts": attempts,
+    }
+    warnings.warn(
+        f"Warning: {name} 분기가 {attempts}회 실패해 건너뜁니다: {record['branch']} ({record['error']})"
+    )
+    return {"failed_branches": [record]}
+
+
+def retry_branch(
+    func: Callable[..., Dict[str, Any]], report_progress: bool = True
+) -> Callable[..., Dict[str, Any]]:
+    """
+    실패한 분기만 다시 실행하고, 한도를 넘기면 failed_branches를 반환하는 sync 래퍼
+
+    report_progress=False는 배치 분기 안에서 항목별로 호출하는 경우 (branch_done 이벤트를 보내지 않음)
+    """
+
+    @functools.wraps(func)
+    def wrapper(state: Dict[str, Any]) -> Dict[str, Any]:
+        max_retries, base, cap, skip = _branch_settings()
+        for attempt in range(max_retries + 1):
+            try:
+                with retry_scope(attempt):
+                    result = func(state)
+                if report_progress:
+                    emit_progress("branch_done", attempts=attempt + 1, failed=False)
+                return result
+            except NON_RETRYABLE_ERRORS:
+                raise
+            except Exception as error:
+                if attempt == max_retries:
+                    return _give_up(
+                        func.__name__, state, error, attempt + 1, skip, report_progress
+                    )
+                time.sleep(backoff_delay(attempt, base, cap))
+
+    return wrapper
+
+
+def aretry_branch(
+    afunc: Callable[..., Awaitable[Dict[str, Any]]], report_progress: bool = True
+) -> Callable[..., Awaitable[Dict[str, Any]]]:
+    """retry_branch의 비동기 버전"""
+
+    @functools.wraps(afunc)
+    async def wrapper(state: Dict[str, Any]) -> Dict[str, Any]:
+        max_retries, base, cap, skip = _branch_settings()
+        for attempt in range(max_retries + 1):
+            try:
+                with retry_scope(attempt):
+                    result = await afunc(state)
+                if report_progress:
+                    emit_progress("branch_done", attempts=attempt + 1, failed=False)
+                return result
+            except NON_RETRYABLE_ERRORS:
+                raise
+            except Exception as error:
+                if attempt == max_retries:
+                    return _give_up(
+                        afunc.__name__, state, error, attempt + 1, skip, report_progress
+                    )
+                await asyncio.sleep(backoff_delay(attempt, base, cap))
+
+    return wrapper
+
+
+def branch_node(
+    func: Callable[..., Dict[str, Any]],
+    afunc: Callable[..., Awaitable[Dict[str, Any]]],
+) -> RunnableLambda:
+    """
+    Send fan-out 대상 노드용 sync_async_node (분기별 재시도 + 실패 분기 건너뛰기)
+
+    State에 failed_branches (merge_lists) 키가 있어야 실패 기록이 누적된다.
+    """
+    return sync_async_node(retry_branch(func), aretry_branch(afunc))
@@ -0,0 +1,90 @@
+"""
+CoT 수렴 판단 - 사고 단계 텍스트의 shingle MinHash(bottom-k) 유사도
+
+사고 하나는 추가될 때 한 번만 문자 n-gram(shingle)으로 나눠 해시하고, 가장 작은 k개 해시(bottom-k sketch)만 보관한다.
+이후 점수 계산은 sketch끼리만 비교하므로 사고 길이와 무관하게 O(k)이다 (window 3, k 128에서 0.1ms 미만).
+    >>> tracker = ConvergenceTracker(window=3)
+    >>> tracker.add("주인공은 권력을 얻기 위해 동료를 배신한다")
+    0.0
+    >>> round(tracker.add("주인공은 권력을 얻기 위해 동료를 배신한다."), 2)
+    0.95
+
+한국어는 조사 / 어미 때문에 공백 단위 단어가 쉽게 달라지므로 단어 대신 문자 n-gram을 사용한다.
+"""
+
+import heapq
+import re
+import zlib
+from collections import deque
+from typing import Deque, FrozenSet, List
+
+DEFAULT_SHINGLE_SIZE = 3
+DEFAULT_SKETCH_SIZE = 128
+DEFAULT_WINDOW = 3
+
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def shingle_hashes(text: str, n: int = DEFAULT_SHINGLE_SIZE) -> FrozenSet[int]:
+    """공백을 정규화한 텍스트의 문자 n-gram 해시 집합 (프로세스와 무관하게 같은 값인 crc32 사용)"""
+    normalized = _WHITESPACE_PATTERN.sub(" ", text).strip().lower()
+    if len(normalized) <= n:
+        return frozenset([zlib.crc32(normalized.encode())]) if normalized else frozenset()
+    grams = {normalized[i : i + n] for i in range(len(normalized) - n + 1)}
+    return frozenset(zlib.crc32(gram.encode()) for gram in grams)
+
+
+def sketch(text: str, n: int = DEFAULT_SHINGLE_SIZE, k: int = DEFAULT_SKETCH_SIZE) -> FrozenSet[int]:
+    """bottom-k MinHash sketch (shingle 해시 중 가장 작은 k개)"""
+    hashes = shingle_hashes(text, n)
+    if len(hashes) <= k:
+        return hashes
+    return frozenset(heapq.nsmallest(k, hashes))
+
+
+def sketch_similarity(a: FrozenSet[int], b: FrozenSet[int], k: int = DEFAULT_SKETCH_SIZE) -> float:
+    """
+    두 sketch의 Jaccard 유사도 추정치
+
+    합집합에서 가장 작은 k개 해시 중 양쪽 모두에 있는 비율 (양쪽 shingle이 k개 이하면 정확한 Jaccard)
+    """
+    if not a or not b:
+        return 0.0
+    union = sorted(a | b)[:k]
+    shared = sum(1 for value in union if value in a and value in b)
+    return shared / len(union)
+
+
+class ConvergenceTracker:
+    """
+    사고 단계별 수렴 점수 계산기 (CoTExtractor 호출 하나당 하나)
+
+    새 사고의 점수 = 최근 window개 사고와의 sketch 유사도 중 최댓값.
+    직전 사고뿐 아니라 그 전 사고로 되돌아가는 반복도 수렴으로 본다.
+    """
+
+    def __init__(
+        self,
+        window: int = DEFAULT_WINDOW,
+        n: int = DEFAULT_SHINGLE_SIZE,
+        k: int = DEFAULT_SKETCH_SIZE,
+    ):
+        self.n = n
+        self.k = k
+        self._recent: Deque[FrozenSet[int]] = deque(maxlen=window)
+        self.scores: List[float] = []
+
+    def score(self, thought_sketch: FrozenSet[int]) -> float:
+        """최근 window개 사고와 비교한 점수 (기록하지 않음)"""
+        return max(
+            (sketch_similarity(thought_sketch, previous, self.k) for previous in self._recent),
+            default=0.0,
+        )
+
+    def add(self, thought: str) -> float:
+        """사고를 sketch로 바꿔 점수를 계산하고 window에 추가"""
+        thought_sketch = sketch(thought, self.n, self.k)
+        score = self.score(thought_sketch)
+        self._recent.append(thought_sketch)
+        self.scores.append(score)
+        return score
@@ -1,15 +1,27 @@
 """
 CoT(Chain of Thought) Extractor - 서브그래프 없는 단순 구현
 Pickle 가능하도록 설계
+
+사고 단계는 전체 기록 대신 모델이 매 단계 갱신하는 요약([요약])과 직전 사고만 다음 단계로 넘기고,
+모델이 [결론]을 쓰거나 최근 사고들과의 수렴 점수(utils.cot.convergence)가 임계값을 넘으면 바로 최종 답변 단계로 넘어간다.
 """
 
-from typing import Any, Dict, List, Type
+import re
+import warnings
+from typing import Any, Dict, List, Optional, Tuple, Type
 
 from langchain_core.language_models import BaseChatModel
 from langchain_core.messages import BaseMessage, SystemMessage
 from pydantic import BaseModel
 from trustcall import create_extractor
 
+from utils.cot.convergence import DEFAULT_WINDOW, ConvergenceTracker
+
+SUMMARY_MARKER = "[요약]"
+THOUGHT_MARKER = "[사고]"
+CONCLUSION_MARKER = "[결론]"
+_SECTION_PATTERN = re.compile(r"(\[요약\]|\[사고\]|\[결론\])")
+
 
 class CoTExtractor:
     """
@@ -25,6 +37,9 @@ class CoTExtractor:
         tool_choice: str,
         max_thinking_steps: int = 10,
         convergence_threshold: float = 0.85,
+        max_step_tokens: Optional[int] = None,
+        summary_max_chars: int = 1500,
+        convergence_window: int = DEFAULT_WINDOW,
         **kwargs,
     ):
         """
@@ -34,6 +49,11 @@ class CoTExtractor:
             tool_choice: 사용할 tool 이름
             max_thinking_steps: 최대 사고 단계 수 (기본값: 10)
             convergence_threshold: 수렴 임계값 (기본값: 0.85)
+            max_step_tokens: 사고 단계 호출당 최대 출력 토큰 (기본값: None = 제한 없음).
+                추론 모델(gpt-5 / o 시리즈)은 reasoning 토큰도 이 한도에 포함되므로, 작게 잡으면
+                출력 없이 끝날 수 있다 (빈 단계가 나오면 사고를 멈추고 최종 답변으로 넘어감)
+            summary_max_chars: 다음 단계 / 최종 답변에 넘기는 요약의 최대 길이 (기본값: 1500자)
+            convergence_window: 수렴 점수를 계산할 때 비교하는 최근 사고 수 (기본값: 3)
             **kwargs: trustcall create_extractor의 추가 파라미터
         """
         self.model = model
@@ -41,7 +61,42 @@ class CoTExtractor:
         self.tool_choice = tool_choice
         self.max_thinking_steps = max_thinking_steps
         self.convergence_threshold = convergence_threshold
+        self.max_step_tokens = max_step_tokens
+        self.summary_max_chars = summary_max_chars
+        self.convergence_window = convergence_window
         self.extra_kwargs = kwargs
+        self._thinking_model = None
+        self._final_extractor = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # bind된 모델 / 컴파일된 trustcall 그래프는 pickle하지 않고 unpickle 후 다시 생성
+        state = self.__dict__.copy()
+        state["_thinking_model"] = None
+        state["_final_extractor"] = None
+        return state
+
+    @property
+    def thinking_model(self):
+        """사고 단계용 모델 (max_step_tokens로 출력 길이 제한)"""
+        if self._thinking_model is None:
+            if self.max_step_tokens:
+                self._thinking_model = self.model.bind(max_tokens=self.max_step_tokens)
+            else:
+                self._thinking_model = self.model
+        return self._thinking_model
+
+    @property
+    def final_extractor(self):
+        """최종 답변용 trustcall extractor (인스턴스당 한 번만 생성)"""
+        if self._final_extractor is None:
+            # Tool binding으로 최종 답변 생성
+            self._final_extractor = create_extractor(
+                self.model,
+                tools=self.tools,
+                tool_choice=self.tool_choice,
+                **self.extra_kwargs,
+            )
+        return self._final_extractor
 
     def invoke(self, messages: List[BaseMessage]) -> Dict[str, Any]:
         """
@@ -57,69 +112,153 @@ class CoTExtractor:
                 - thinking_process: CoT 사고 과정
                 - convergence_scores: 각 단계의 수렴 점수
                 - total_steps: 실제 수행한 단계 수
+                - summary: 최종 답변에 사용한 사고 요약
+                - stop_reason: "concluded" / "converged" / "empty" / "max_steps"
         """
         original_prompt = messages[0].content if messages else ""
 
         # 1단계: CoT 초기 프롬프트
-        current_thought = f"""
-다음 문제를 단계적으로 해결하세요.
-
-문제: {original_prompt}
-
-먼저 문제를 분석하고, 필요한 정보를 파악한 후, 단계별로 사고하세요.
-"""
+        summary, current_thought = "", self._initial_thought(original_prompt)
 
         # 2단계: 사고 단계 반복
         thinking_process = []
-        convergence_scores = []
+        tracker = ConvergenceTracker(self.convergence_window)
+        stop_reason = None
 
         for step in range(self.max_thinking_steps):
-            step_prompt = f"""
-Step {step + 1}/{self.max_thinking_steps} (최대):
-{current_thought}
-
-이전 단계의 사고를 바탕으로 다음 단계를 진행하세요.
-만약 충분히 깊이 사고했다면, 결론을 정리하세요.
-"""
             # LLM 호출
-            thinking_response = self.model.invoke([SystemMessage(content=step_prompt)])
-            thinking_content = thinking_response.content
-            thinking_process.append(thinking_content)
+            thinking_response = self.thinking_model.invoke(
+                [SystemMessage(content=self._step_prompt(step, summary, current_thought))]
+            )
+            summary, current_thought, stop_reason = self._record_step(
+                thinking_process, tracker, summary, thinking_response.content
+            )
+            if stop_reason:
+                break  # 결론 / 수렴 완료
+        stop_reason = stop_reason or "max_steps"
 
-            # 수렴 점수 계산
-            convergence_score = self._calculate_convergence(thinking_process, thinking_content)
-            convergence_scores.append(convergence_score)
+        # 3단계: 최종 답변 생성 (tool call)
+        final_response = self.final_extractor.invoke(
+            [SystemMessage(content=self._final_prompt(summary, current_thought, original_prompt))]
+        )
+        return self._build_result(
+            final_response, thinking_process, tracker.scores, summary, stop_reason
+        )
 
-            # 수렴 판단
-            if step >= 1 and len(convergence_scores) >= 2:
-                recent_scores = convergence_scores[-2:]
-                if all(score >= self.convergence_threshold for score in recent_scores):
-                    break  # 수렴 완료
+    async def ainvoke(self, messages: List[BaseMessage]) -> Dict[str, Any]:
+        """invoke의 비동기 버전 (model.ainvoke 사용)"""
+        original_prompt = messages[0].content if messages else ""
+        summary, current_thought = "", self._initial_thought(original_prompt)
 
-            current_thought = thinking_content
+        thinking_process = []
+        tracker = ConvergenceTracker(self.convergence_window)
+        stop_reason = None
 
-        # 3단계: 최종 답변 생성 (tool call)
-        formatted_thinking = "\n\n".join(
-            [f"[단계 {i + 1}]\n{thought}" for i, thought in enumerate(thinking_process)]
+        for step in range(self.max_thinking_steps):
+            thinking_response = await self.thinking_model.ainvoke(
+                [SystemMessage(content=self._step_prompt(step, summary, current_thought))]
+            )
+            summary, current_thought, stop_reason = self._record_step(
+                thinking_process, tracker, summary, thinking_response.content
+            )
+            if stop_reason:
+                break
+        stop_reason = stop_reason or "max_steps"
+
+        final_response = await self.final_extractor.ainvoke(
+            [SystemMessage(content=self._final_prompt(summary, current_thought, original_prompt))]
+        )
+        return self._build_result(
+            final_response, thinking_process, tracker.scores, summary, stop_reason
         )
 
-        final_prompt = f"""
-다음은 단계별 사고 과정입니다:
-{formatted_thinking}
+    # ============ invoke / ainvoke 공통 단계 ============
+    @staticmethod
+    def _initial_thought(original_prompt: str) -> str:
+        return f"""
+다음 문제를 단계적으로 해결하세요.
+
+문제: {original_prompt}
+
+먼저 문제를 분석하고, 필요한 정보를 파악한 후, 단계별로 사고하세요.
+"""
+
+    def _step_prompt(self, step: int, summary: str, current_thought: str) -> str:
+        summary_section = f"지금까지의 요약:\n{summary}\n\n" if summary else ""
+        return f"""
+Step {step + 1}/{self.max_thinking_steps} (최대):
+{summary_section}{current_thought}
+
+이전 단계의 사고를 바탕으로 다음 단계를 진행하세요. 다음 형식으로 답하세요.
+{SUMMARY_MARKER} 문제의 요구사항과 지금까지의 핵심 추론 ({self.summary_max_chars}자 이내)
+{THOUGHT_MARKER} 이번 단계의 사고
+만약 충분히 깊이 사고했다면, {THOUGHT_MARKER} 대신 {CONCLUSION_MARKER} 뒤에 결론을 정리하세요.
+"""
+
+    def _parse_step(self, previous_summary: str, content: str) -> Tuple[str, str, bool]:
+        """
+        사고 단계 응답을 (요약, 사고, 결론 여부)로 분리
+
+        형식을 따르지 않은 응답은 전체를 사고로 보고, 요약은 이전 요약 + 이번 사고의 끝부분으로 대체한다.
+        """
+        parts = _SECTION_PATTERN.split(content)
+        sections = {marker: text.strip() for marker, text in zip(parts[1::2], parts[2::2])}
+        concluded = CONCLUSION_MARKER in sections
+        thought = sections.get(CONCLUSION_MARKER) or sections.get(THOUGHT_MARKER) or content.strip()
+        summary = sections.get(SUMMARY_MARKER) or f"{previous_summary}\n{thought}".strip()
+        # 길이 제한은 최근 내용을 남기도록 앞부분을 자름
+        return summary[-self.summary_max_chars :], thought, concluded
+
+    def _record_step(
+        self,
+        thinking_process: List[str],
+        tracker: ConvergenceTracker,
+        summary: str,
+        content: str,
+    ) -> Tuple[str, str, Optional[str]]:
+        """사고 단계 기록 후 (요약, 사고, 종료 사유 또는 None) 반환"""
+        if not content.strip():
+            # 출력 한도를 reasoning 토큰이 다 쓴 경우 등. 같은 한도로 반복해도 빈 응답이므로 지금까지의 요약으로 답변
+            warnings.warn(
+                f"Warning: {len(thinking_process) + 1}번째 사고 단계 응답이 비어 있어 최종 답변으로 넘어갑니다 "
+                f"(max_step_tokens={self.max_step_tokens})"
+            )
+            return summary, thinking_process[-1] if thinking_process else "", "empty"
+        summary, thought, concluded = self._parse_step(summary, content)
+        thinking_process.append(thought)
+
+        # 수렴 점수 계산 (최근 convergence_window개 사고와의 최대 유사도)
+        convergence_score = tracker.add(thought)
+
+        # 모델이 결론을 냈거나 최근 사고를 되풀이하면 더 진행해도 얻을 것이 없음
+        if concluded:
+            return summary, thought, "concluded"
+        if convergence_score >= self.convergence_threshold:
+            return summary, thought, "converged"
+        return summary, thought, None
+
+    @staticmethod
+    def _final_prompt(summary: str, last_thought: str, original_prompt: str) -> str:
+        return f"""
+다음은 단계별 사고 과정의 요약과 마지막 단계입니다:
+[요약]
+{summary}
+
+[마지막 단계]
+{last_thought}
 
 위 사고 과정을 바탕으로 최종 답변을 구조화된 형식으로 제공하세요.
 원래 질문: {original_prompt}
 """
 
-        # Tool binding으로 최종 답변 생성
-        extractor = create_extractor(
-            self.model,
-            tools=self.tools,
-            tool_choice=self.tool_choice,
-            **self.extra_kwargs,
-        )
-        final_response = extractor.invoke([SystemMessage(content=final_prompt)])
-
+    def _build_result(
+        self,
+        final_response: Dict[str, Any],
+        thinking_process: List[str],
+        convergence_scores: List[float],
+        summary: str,
+        stop_reason: str,
+    ) -> Dict[str, Any]:
         # 파싱
         if hasattr(final_response, "responses") and final_response["responses"][0]:
             parsed = final_response["responses"][0]
@@ -134,33 +273,10 @@ Step {step + 1}/{self.max_thinking_steps} (최대):
             "thinking_process": thinking_process,
             "convergence_scores": convergence_scores,
             "total_steps": len(thinking_process),
+            "summary": summary,
+            "stop_reason": stop_reason,
         }
 
-    def _calculate_convergence(self, thinking_process: List[str], new_thought: str) -> float:
-        """수렴 점수 계산 (Jaccard similarity 기반)"""
-        if len(thinking_process) < 2:
-            return 0.0
-
-        last_thought = thinking_process[-2]  # 이전 사고
-
-        # 길이 비율
-        length_ratio = min(len(new_thought), len(last_thought)) / max(
-            len(new_thought), len(last_thought), 1
-        )
-
-        # 공통 단어 비율
-        last_words = set(last_thought.split())
-        new_words = set(new_thought.split())
-        if not last_words or not new_words:
-            return 0.0
-
-        intersection = len(last_words & new_words)
-        union = len(last_words | new_words)
-        word_similarity = intersection / union if union > 0 else 0.0
-
-        # 종합 점수
-        return (length_ratio + word_similarity) / 2
-
 
 def create_cot_extractor(
     model: BaseChatModel,
@@ -168,6 +284,9 @@ def create_cot_extractor(
     tool_choice: str,
     max_thinking_steps: int = 10,
     convergence_threshold: float = 0.85,
+    max_step_tokens: Optional[int] = None,
+    summary_max_chars: int = 1500,
+    convergence_window: int = DEFAULT_WINDOW,
     **kwargs,
 ) -> CoTExtractor:
     """
@@ -179,11 +298,22 @@ def create_cot_extractor(
         tool_choice: 사용할 tool 이름
         max_thinking_steps: 최대 사고 단계 수
         convergence_threshold: 수렴 임계값 (0~1)
+        max_step_tokens: 사고 단계 호출당 최대 출력 토큰 (None이면 제한 없음, 추론 모델은 reasoning 토큰 포함)
+        summary_max_chars: 단계 사이에 넘기는 요약의 최대 길이
+        convergence_window: 수렴 점수 비교 대상 최근 사고 수
         **kwargs: trustcall create_extractor의 추가 파라미터
 
     Returns:
         CoTExtractor 인스턴스
     """
     return CoTExtractor(
-        model, tools, tool_choice, max_thinking_steps, convergence_threshold, **kwargs
-    )
\ No newline at end of file
+        model,
+        tools,
+        tool_choice,
+        max_thinking_steps,
+        convergence_threshold,
+        max_step_tokens,
+        summary_max_chars,
+        convergence_window,
+        **kwargs,
+    )
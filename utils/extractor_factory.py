@@ -1,9 +1,17 @@
 """
 Unified Extractor Factory
 모델명과 extractor 타입으로 최적의 extractor 반환
+
+생성된 extractor는 (모델, extractor_type, tools, tool_choice, kwargs) 단위로 LRU 캐시에
+보관되어, 같은 조합의 노드 호출은 tool binding / JSON 스키마 생성을 건너뛴다.
+모든 extractor는 CachedExtractor로 감싸져 응답 캐시(utils.response_cache)를 거치고,
+가장 바깥의 InstrumentedExtractor가 호출별 토큰 / 지연 시간을 기록한다(utils.instrumentation).
 """
 
-from typing import Any, Dict, List, Optional, Type, Union
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Tuple, Type, Union
 
 from langchain_core.language_models import BaseChatModel
 from langchain_core.messages import BaseMessage
@@ -11,6 +19,8 @@ from pydantic import BaseModel
 from trustcall import create_extractor
 
 from utils.cot import create_cot_extractor
+from utils.instrumentation import InstrumentedExtractor
+from utils.response_cache import CachedExtractor
 
 
 class PlainLLMWrapper:
@@ -42,6 +52,69 @@ class PlainLLMWrapper:
             "content": response.content,
         }
 
+    async def ainvoke(self, messages: List[BaseMessage]) -> Dict[str, Any]:
+        """invoke의 비동기 버전"""
+        response = await self.model.ainvoke(messages)
+        return {
+            "responses": None,
+            "messages": [response],
+            "content": response.content,
+        }
+
+
+# ============ Extractor 캐시 ============
+EXTRACTOR_CACHE_SIZE = int(os.getenv("EXTRACTOR_CACHE_SIZE", "128"))
+
+_cache_lock = threading.Lock()
+# key -> (model, extractor). model 참조를 함께 보관해 id 재사용으로 인한 오탐을 막는다
+_extractor_cache: "OrderedDict[Hashable, Tuple[BaseChatModel, Any]]" = OrderedDict()
+_cache_stats = {"hits": 0, "misses": 0}
+
+
+def _cache_key(
+    model: BaseChatModel,
+    extractor_type: str,
+    tools: Optional[List[Type[BaseModel]]],
+    tool_choice: Optional[str],
+    kwargs: Dict[str, Any],
+) -> Optional[Hashable]:
+    """캐시 키 생성 (해시 불가능한 kwargs가 있으면 None → 캐시하지 않음)"""
+    key = (
+        id(model),
+        extractor_type,
+        tuple(tools) if tools is not None else None,
+        tool_choice,
+        tuple(sorted(kwargs.items())),
+    )
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def get_extractor_cache_info() -> Dict[str, int]:
+    """
+    Extractor 캐시 상태 조회
+
+    Returns:
+        hits, misses, size, maxsize
+    """
+    with _cache_lock:
+        return {
+            **_cache_stats,
+            "size": len(_extractor_cache),
+            "maxsize": EXTRACTOR_CACHE_SIZE,
+        }
+
+
+def clear_extractor_cache():
+    """캐시된 extractor와 hit/miss 카운터 초기화"""
+    with _cache_lock:
+        _extractor_cache.clear()
+        _cache_stats["hits"] = 0
+        _cache_stats["misses"] = 0
+
 
 def create_unified_extractor(
     model_name: Optional[str] = None,
@@ -50,10 +123,14 @@ def create_unified_extractor(
     tools: Optional[List[Type[BaseModel]]] = None,
     tool_choice: Optional[str] = None,
     **kwargs,
-) -> Union[Any, PlainLLMWrapper]:
+) -> InstrumentedExtractor:
     """
     통합 Extractor Factory
 
+    같은 모델 인스턴스와 파라미터 조합은 캐시된 extractor를 반환한다
+    (캐시 크기: EXTRACTOR_CACHE_SIZE 환경 변수, 기본 128).
+    invoke 응답은 LLM_CACHE_MODE 설정에 따라 디스크 응답 캐시를 거친다.
+
     Args:
         model_name: 모델 이름 (예: "gpt-4o-mini", "gpt-5-mini")
         model: 이미 생성된 LLM 객체 (model_name과 함께 사용 불가)
@@ -64,11 +141,12 @@ def create_unified_extractor(
         tools: Pydantic 모델 리스트 (structured output용)
         tool_choice: 사용할 tool 이름
         **kwargs: 추가 파라미터
-            - CoT용: max_thinking_steps, convergence_threshold
+            - CoT용: max_thinking_steps, convergence_threshold, max_step_tokens, summary_max_chars,
+              convergence_window
             - trustcall용: enable_inserts 등
 
     Returns:
-        Extractor 인스턴스
+        Extractor 인스턴스 (InstrumentedExtractor(CachedExtractor(...))로 감싸짐)
 
     Raises:
         ValueError: 잘못된 파라미터 조합
@@ -115,6 +193,50 @@ def create_unified_extractor(
 
         model = create_model(model_name)
 
+    key = _cache_key(model, extractor_type, tools, tool_choice, kwargs)
+    if key is None or EXTRACTOR_CACHE_SIZE <= 0:
+        return _build_cached_extractor(model, extractor_type, tools, tool_choice, **kwargs)
+
+    with _cache_lock:
+        entry = _extractor_cache.get(key)
+        if entry is not None and entry[0] is model:
+            _extractor_cache.move_to_end(key)
+            _cache_stats["hits"] += 1
+            return entry[1]
+        _cache_stats["misses"] += 1
+
+    extractor = _build_cached_extractor(model, extractor_type, tools, tool_choice, **kwargs)
+
+    with _cache_lock:
+        _extractor_cache[key] = (model, extractor)
+        _extractor_cache.move_to_end(key)
+        while len(_extractor_cache) > EXTRACTOR_CACHE_SIZE:
+            _extractor_cache.popitem(last=False)
+    return extractor
+
+
+def _build_cached_extractor(
+    model: BaseChatModel,
+    extractor_type: str,
+    tools: Optional[List[Type[BaseModel]]],
+    tool_choice: Optional[str],
+    **kwargs,
+) -> InstrumentedExtractor:
+    """extractor 생성 후 응답 캐시 / 기록 Wrapper 적용"""
+    extractor = _build_extractor(model, extractor_type, tools, tool_choice, **kwargs)
+    cached = CachedExtractor(extractor, model, extractor_type, tools, tool_choice, **kwargs)
+    model_name = getattr(model, "model_name", None) or type(model).__name__
+    return InstrumentedExtractor(cached, model_name, extractor_type, tool_choice)
+
+
+def _build_extractor(
+    model: BaseChatModel,
+    extractor_type: str,
+    tools: Optional[List[Type[BaseModel]]],
+    tool_choice: Optional[str],
+    **kwargs,
+) -> Union[Any, PlainLLMWrapper]:
+    """캐시를 거치지 않고 extractor 생성"""
     # Extractor 타입별 생성
     if extractor_type == "plain":
         # Plain LLM (no structured output)
@@ -136,6 +258,9 @@ def create_unified_extractor(
         # CoT 전용 파라미터 분리
         max_thinking_steps = kwargs.pop("max_thinking_steps", 10)
         convergence_threshold = kwargs.pop("convergence_threshold", 0.85)
+        max_step_tokens = kwargs.pop("max_step_tokens", None)
+        summary_max_chars = kwargs.pop("summary_max_chars", 1500)
+        convergence_window = kwargs.pop("convergence_window", 3)
 
         return create_cot_extractor(
             model,
@@ -143,6 +268,9 @@ def create_unified_extractor(
             tool_choice=tool_choice,
             max_thinking_steps=max_thinking_steps,
             convergence_threshold=convergence_threshold,
+            max_step_tokens=max_step_tokens,
+            summary_max_chars=summary_max_chars,
+            convergence_window=convergence_window,
             **kwargs,  # 나머지는 trustcall 옵션
         )
 
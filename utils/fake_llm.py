@@ -0,0 +1,390 @@
+"""
+Fake LLM - API 호출 없이 스키마에 맞는 결과를 결정적으로 생성하는 오프라인 모델
+
+SUPPORTED_MODELS의 "fake"로 등록되어 있어 State의 model만 바꾸면 전체 파이프라인이 그대로 실행된다.
+    >>> run_workflow({"topic": ..., "conflict": ..., "vibe": ..., "model": "fake"}, thread_id="bench")
+
+- bind_tools로 받은 JSON 스키마(trustcall 형식)에 맞춰 tool call 인자를 생성한다.
+  길이 / 개수 / 범위 / enum / 역할명 패턴을 지키고, Stage1 스키마의 검증 규칙
+  (Event 요약에 역할 포함, 요청한 info_id / event_id / placeholder_id만 사용 등)은 스키마별 builder가 맞춘다.
+- 같은 (seed, tool, 프롬프트)에는 항상 같은 결과를 반환한다 (동시 실행 순서와 무관).
+- latency (+ latency_jitter)만큼 호출마다 대기해 실제 API 지연을 흉내낸다 (ainvoke는 asyncio.sleep).
+- usage_metadata에 대략적인 토큰 수를 채워 instrumentation / rate limiter가 그대로 동작한다.
+
+환경 변수 (또는 configure_fake_llm):
+    FAKE_LLM_SEED, FAKE_LLM_LATENCY (초), FAKE_LLM_LATENCY_JITTER (초)
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import random
+import re
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from langchain_core.callbacks import AsyncCallbackManagerForLLMRun, CallbackManagerForLLMRun
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.utils.function_calling import convert_to_openai_tool
+
+# create_model("fake")에 기본으로 전달되는 설정
+FAKE_LLM_SETTINGS = {
+    "seed": int(os.getenv("FAKE_LLM_SEED", "0")),
+    "latency": float(os.getenv("FAKE_LLM_LATENCY", "0")),
+    "latency_jitter": float(os.getenv("FAKE_LLM_LATENCY_JITTER", "0")),
+}
+
+CHARS_PER_TOKEN = 2  # 한국어 위주 텍스트 기준 대략치
+ROLE_PATTERN = r"^\(.+\)$"
+EXAMPLE_HEADER = "## 예시"  # 프롬프트의 few-shot 예시는 요청 항목으로 보지 않음
+
+_ADJECTIVES = [
+    "냉정한", "충실한", "배신한", "엄격한", "상처받은", "야심 있는", "침묵하는",
+    "떠나간", "숨어 있는", "몰락한", "집요한", "자애로운", "의심 많은", "순진한",
+]
+_NOUNS = [
+    "스승", "동료", "형제", "연인", "조언자", "경쟁자", "후원자", "감시자",
+    "제자", "친구", "상관", "이웃", "증인", "적",
+]
+_WORDS = [
+    "기억", "약속", "배신", "권력", "상처", "비밀", "희생", "욕망", "두려움", "선택",
+    "침묵", "복수", "신념", "용서", "고립", "책임", "유산", "거짓", "질서", "구원",
+]
+
+
+def configure_fake_llm(
+    seed: Optional[int] = None,
+    latency: Optional[float] = None,
+    latency_jitter: Optional[float] = None,
+) -> Dict[str, Any]:
+    """
+    create_model("fake") 기본 설정 변경
+
+    풀에 보관된 모델은 폐기되어 이후 호출부터 새 설정이 적용된다.
+
+    Returns:
+        적용된 설정
+    """
+    from utils.model_factory import clear_model_pool
+
+    if seed is not None:
+        FAKE_LLM_SETTINGS["seed"] = seed
+    if latency is not None:
+        FAKE_LLM_SETTINGS["latency"] = latency
+    if latency_jitter is not None:
+        FAKE_LLM_SETTINGS["latency_jitter"] = latency_jitter
+    clear_model_pool()
+    return dict(FAKE_LLM_SETTINGS)
+
+
+# ============ 스키마 기반 값 생성 ============
+def _text(rng: random.Random, min_length: int = 0, max_length: Optional[int] = None) -> str:
+    target = max(min_length, min(max_length or 60, 40))
+    words = []
+    while len(" ".join(words)) < target:
+        words.append(rng.choice(_WORDS))
+    text = " ".join(words)
+    return text[:max_length] if max_length else text
+
+
+def _role(rng: random.Random) -> str:
+    return f"({rng.choice(_ADJECTIVES)} {rng.choice(_NOUNS)})"
+
+
+def _pattern_value(rng: random.Random, pattern: str, schema: Dict[str, Any]) -> str:
+    if pattern == ROLE_PATTERN:
+        return _role(rng)
+    if "미정" in pattern:
+        return "미정"
+    match = re.search(r"([a-z]+)_\\d", pattern)
+    if match:
+        return f"{match.group(1)}_{rng.randint(1, 99)}"
+    return _text(rng, schema.get("minLength", 0), schema.get("maxLength"))
+
+
+def fake_value(rng: random.Random, schema: Dict[str, Any], defs: Dict[str, Any]) -> Any:
+    """JSON 스키마 하나에 맞는 값 생성 (길이 / 개수 / 범위 / enum / 패턴 제약 준수)"""
+    if "$ref" in schema:
+        return fake_value(rng, defs[schema["$ref"].rsplit("/", 1)[-1]], defs)
+    if "allOf" in schema:
+        return fake_value(rng, schema["allOf"][0], defs)
+    if "anyOf" in schema:
+        options = [option for option in schema["anyOf"] if option.get("type") != "null"]
+        return fake_value(rng, options[0], defs) if options else None
+    if "const" in schema:
+        return schema["const"]
+    if "enum" in schema:
+        return rng.choice(schema["enum"])
+
+    schema_type = schema.get("type", "string")
+    if schema_type == "object":
+        properties = schema.get("properties", {})
+        if not properties and isinstance(schema.get("default"), dict):
+            # Dict[str, X] 필드는 기본값의 키를 그대로 채움 (노드가 키를 직접 참조하는 경우)
+            values = schema.get("additionalProperties", {"type": "string"})
+            return {key: fake_value(rng, values, defs) for key in schema["default"]}
+        return {name: fake_value(rng, prop, defs) for name, prop in properties.items()}
+    if schema_type == "array":
+        # 개수 제한이 없거나 0개부터 허용해도 최소 1개는 만들어 파이프라인이 계속 진행되게 함
+        min_items = max(schema.get("minItems", 1), 1)
+        max_items = min(schema.get("maxItems", min_items + 2), min_items + 2)
+        items = schema.get("items", {"type": "string"})
+        return [fake_value(rng, items, defs) for _ in range(rng.randint(min_items, max_items))]
+    if schema_type == "integer":
+        return rng.randint(schema.get("minimum", 1), schema.get("maximum", 10))
+    if schema_type == "number":
+        return round(rng.uniform(schema.get("minimum", 0.0), schema.get("maximum", 1.0)), 2)
+    if schema_type == "boolean":
+        return rng.random() < 0.5
+    if "pattern" in schema:
+        return _pattern_value(rng, schema["pattern"], schema)
+    return _text(rng, schema.get("minLength", 0), schema.get("maxLength"))
+
+
+# ============ Stage1 스키마별 builder ============
+# 스키마 제약만으로 표현되지 않는 검증 규칙(model_validator)과 프롬프트의 id 참조를 맞춘다
+def _request_text(prompt: str) -> str:
+    return prompt.split(EXAMPLE_HEADER, 1)[0]
+
+
+def _ids(text: str, prefix: str) -> List[str]:
+    """text에 등장한 {prefix}_N id (등장 순서, 중복 제거)"""
+    return list(dict.fromkeys(re.findall(rf"\b{prefix}_\d+\b", text)))
+
+
+def _valid_event_ids(text: str) -> List[str]:
+    # 프롬프트 규칙 설명의 예시 id와 섞이지 않도록 입력 항목의 "사용가능 event_id" 줄만 사용
+    return _ids(" ".join(re.findall(r"사용가능 event_id: (\[.*?\])", text)), "event")
+
+
+def _items_schema(schema: Dict[str, Any], defs: Dict[str, Any], field: str) -> Dict[str, Any]:
+    items = schema["properties"][field]["items"]
+    if "$ref" in items:
+        return defs[items["$ref"].rsplit("/", 1)[-1]]
+    return items
+
+
+def _event_args(rng: random.Random, schema: Dict[str, Any], defs: Dict[str, Any]) -> Dict[str, Any]:
+    """summary에 target_role과 모든 PlaceHolder 역할이 들어간 Event"""
+    event = fake_value(rng, schema, defs)
+    roles = " ".join(placeholder["role"] for placeholder in event["placeholders"])
+    summary = f"{event['target_role']}의 {_text(rng, 10, 40)} 사건에 {roles}가 얽혔다"
+    event["summary"] = summary[:300]
+    return event
+
+
+def _build_event(rng, schema, defs, prompt):
+    return _event_args(rng, schema, defs)
+
+
+def _build_events(rng, schema, defs, prompt):
+    event_schema = _items_schema(schema, defs, "events")
+    requested = re.findall(r"^- (info_\d+) \|.*?\| (\w+) - ", _request_text(prompt), re.M) or [("info_1", None)]
+    info_types = defs["InfoType"]["enum"]
+    events = []
+    for info_id, info_type in requested:
+        event = {**_event_args(rng, event_schema, defs), "info_id": info_id}
+        # 요청한 Info의 유형을 대상으로 하는 사건 (알 수 없는 유형이면 임의 값 유지)
+        if info_type in info_types:
+            event["target_info_type"] = info_type
+        events.append(event)
+    return {"events": events}
+
+
+def _infos_for(rng, info_schema, defs, event_ids: List[str]) -> List[Dict[str, Any]]:
+    # event_id는 중복될 수 없으므로 최대 3개 사건 + "미정" 하나
+    return [
+        {**fake_value(rng, info_schema, defs), "event_id": event_id}
+        for event_id in event_ids[:3] + ["미정"]
+    ]
+
+
+def _build_infos(rng, schema, defs, prompt):
+    info_schema = _items_schema(schema, defs, "infos")
+    return {"infos": _infos_for(rng, info_schema, defs, _valid_event_ids(_request_text(prompt)))}
+
+
+def _build_placeholder_infos_batch(rng, schema, defs, prompt):
+    entry_schema = _items_schema(schema, defs, "placeholders")
+    info_schema = _items_schema(entry_schema, defs, "infos")
+    text = _request_text(prompt)
+    placeholders = {}
+    for match in re.finditer(
+        r"PlaceHolder: (placeholder_\d+)(.*?)(?=PlaceHolder: placeholder_\d+|\Z)", text, re.S
+    ):
+        placeholders.setdefault(match.group(1), _valid_event_ids(match.group(2)))
+    return {
+        "placeholders": [
+            {"placeholder_id": placeholder_id, "infos": _infos_for(rng, info_schema, defs, event_ids)}
+            for placeholder_id, event_ids in placeholders.items()
+        ]
+    }
+
+
+def _build_consolidation_prepare(rng, schema, defs, prompt):
+    """요청된 PlaceHolder 중 일부를 2~3개씩 겹치지 않게 그룹화"""
+    placeholder_ids = list(dict.fromkeys(re.findall(r"\(id: (placeholder_\d+)\)", prompt)))
+    rng.shuffle(placeholder_ids)
+    chunks = []
+    while len(placeholder_ids) >= 2:
+        size = min(rng.choice((2, 2, 3)), len(placeholder_ids))
+        group, placeholder_ids = placeholder_ids[:size], placeholder_ids[size:]
+        if rng.random() < 0.4:
+            chunks.append(group)
+    return {"chunked_placeholders": chunks}
+
+
+def _build_consolidation(rng, schema, defs, prompt):
+    """요청된 PlaceHolder 전체를 하나의 역할로 통합"""
+    originals = dict(
+        (placeholder_id, role)
+        for role, placeholder_id in re.findall(
+            r"^- (\(.+?\)) \(id: (placeholder_\d+)\)", _request_text(prompt), re.M
+        )
+    )
+    if len(originals) < 2:
+        return {"consolidated_roles": []}
+    unified_role = next(iter(originals.values()))
+    return {"consolidated_roles": [{"unified_role": unified_role, "original_placeholders": originals}]}
+
+
+def _build_plot(rng, schema, defs, prompt):
+    """플롯 포인트는 시간 순서, 하나 이상은 긴장감 8 이상"""
+    plot = fake_value(rng, schema, defs)
+    for sequence, point in enumerate(plot["plot_points"], start=1):
+        point["sequence"] = sequence
+    plot["plot_points"][-1]["tension_level"] = 9
+    return plot
+
+
+SCHEMA_BUILDERS: Dict[str, Callable[..., Dict[str, Any]]] = {
+    "Event": _build_event,
+    "Events": _build_events,
+    "Infos": _build_infos,
+    "PlaceHolderInfosBatch": _build_placeholder_infos_batch,
+    "ConsolidationPrepareResult": _build_consolidation_prepare,
+    "ConsolidationResult": _build_consolidation,
+    "Plot": _build_plot,
+}
+
+
+def fake_tool_args(seed: int, tool: Dict[str, Any], prompt: str) -> Dict[str, Any]:
+    """(seed, tool, prompt)로 결정되는 tool call 인자"""
+    function = tool["function"]
+    schema = function.get("parameters", {})
+    rng = random.Random(_digest(seed, function["name"], prompt))
+    builder = SCHEMA_BUILDERS.get(function["name"])
+    if builder is None:
+        return fake_value(rng, schema, schema.get("$defs", {}))
+    return builder(rng, schema, schema.get("$defs", {}), prompt)
+
+
+def _digest(*parts: Any) -> str:
+    return hashlib.sha256("\x00".join(map(str, parts)).encode("utf-8")).hexdigest()
+
+
+# ============ Chat Model ============
+class FakeStructuredChatModel(BaseChatModel):
+    """
+    tool이 bind되어 있으면 스키마에 맞는 tool call을, 아니면 결정적인 텍스트를 반환하는 Chat Model
+
+    Example:
+        >>> model = FakeStructuredChatModel(seed=1, latency=0.2)
+        >>> extractor = create_unified_extractor(model=model, tools=[Character], tool_choice="Character")
+    """
+
+    model_name: str = "fake"
+    seed: int = 0
+    latency: float = 0.0
+    latency_jitter: float = 0.0
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-structured"
+
+    @property
+    def _identifying_params(self) -> Dict[str, Any]:
+        return {"model_name": self.model_name, "seed": self.seed}
+
+    def bind_tools(self, tools: Sequence[Any], *, tool_choice: Optional[Any] = None, **kwargs):
+        formatted = [convert_to_openai_tool(tool) for tool in tools]
+        return self.bind(tools=formatted, tool_choice=tool_choice, **kwargs)
+
+    def _delay(self, prompt: str) -> float:
+        if not self.latency and not self.latency_jitter:
+            return 0.0
+        rng = random.Random(_digest(self.seed, "latency", prompt))
+        return max(self.latency + rng.uniform(-1, 1) * self.latency_jitter, 0.0)
+
+    def _respond(
+        self,
+        messages: List[BaseMessage],
+        tools: Optional[List[Dict[str, Any]]],
+        tool_choice: Optional[Any],
+    ) -> ChatResult:
+        prompt = "\n".join(str(message.content) for message in messages)
+        if tools:
+            tool = _select_tool(tools, tool_choice)
+            args = fake_tool_args(self.seed, tool, prompt)
+            name = tool["function"]["name"]
+            call_id = f"call_{_digest(self.seed, name, prompt)[:16]}"
+            output = json.dumps(args, ensure_ascii=False)
+            message = AIMessage(
+                content="", tool_calls=[{"name": name, "args": args, "id": call_id, "type": "tool_call"}]
+            )
+        else:
+            rng = random.Random(_digest(self.seed, "text", prompt))
+            output = _text(rng, 80, 200)
+            message = AIMessage(content=output)
+
+        input_tokens = len(prompt) // CHARS_PER_TOKEN + 1
+        output_tokens = len(output) // CHARS_PER_TOKEN + 1
+        message.usage_metadata = {
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "total_tokens": input_tokens + output_tokens,
+        }
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        tool_choice: Optional[Any] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        result = self._respond(messages, tools, tool_choice)
+        delay = self._delay(str(messages[-1].content))
+        if delay:
+            time.sleep(delay)
+        return result
+
+    async def _agenerate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        tool_choice: Optional[Any] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        result = self._respond(messages, tools, tool_choice)
+        delay = self._delay(str(messages[-1].content))
+        if delay:
+            await asyncio.sleep(delay)
+        return result
+
+
+def _select_tool(tools: List[Dict[str, Any]], tool_choice: Optional[Any]) -> Dict[str, Any]:
+    """tool_choice로 지정된 tool (이름 / OpenAI dict 형식, "any" / "auto"면 첫 번째)"""
+    if isinstance(tool_choice, dict):
+        tool_choice = tool_choice.get("function", {}).get("name")
+    for tool in tools:
+        if tool["function"]["name"] == tool_choice:
+            return tool
+    return tools[0]
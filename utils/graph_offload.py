@@ -0,0 +1,234 @@
+"""
+Graph Offload - 그래프 변경 노드 / 그래프 저장을 전용 스레드 또는 워커 프로세스에서 실행
+
+큰 그래프에서는 update_graph_with_event / update_graph_after_consolidation / update_graph_with_infos와
+save_to_file 직렬화가 CPU를 오래 잡아, 같은 프로세스에서 동시에 진행 중인 다른 실행(batch_stage1)의
+LLM 호출 처리까지 GIL을 기다리게 된다. config로 이 작업들을 다른 곳에서 실행할 수 있다:
+
+    >>> app.invoke(inputs, config={"configurable": {"graph_offload": "process"}})
+
+config["configurable"] 옵션:
+- graph_offload: None(기본, 노드 안에서 바로 실행) / "thread" / "process"
+    - "thread": 프로세스 전역 전용 스레드 하나에서 실행. 그래프 변경이 한 줄로 직렬화되며 복사 비용이 없다.
+    - "process": 워커 프로세스에서 실행. 워커는 그래프 복제본을 보관하고,
+      호출마다 마지막 동기화 이후의 변경 연산(CharacterNetwork delta)만 전달받는다.
+      워커에서 생긴 변경도 연산 목록으로 돌려받아 원본 그래프에 재생하므로
+      CharacterNetwork 전체를 매번 pickle하지 않는다 (첫 호출 / 복제본 유실 시에만 to_bytes 스냅샷 전송).
+- graph_offload_workers: "process" 워커 수 (기본 1, 처음 사용할 때 고정). 같은 그래프는 항상 같은 워커로 보낸다.
+
+"process"로 실행하는 함수는 그래프를 저널에 기록되는 CharacterNetwork 메서드로만 변경해야 한다
+(node.data 직접 수정은 원본에 반영되지 않음). 워커에서 발생한 warnings는 원본 프로세스에서 다시 발생시킨다.
+"""
+
+import json
+import multiprocessing
+import threading
+import uuid
+import warnings
+import weakref
+import zlib
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from langchain_core.runnables import RunnableConfig
+
+from character_network import CharacterNetwork
+from graph_journal import apply_journal_op
+from utils.progress import inherit_signature, progress_node
+
+OFFLOAD_MODES = ("thread", "process")
+DEFAULT_PROCESS_WORKERS = 1
+# 워커 하나가 보관하는 그래프 복제본 수 (넘치면 오래된 것부터 버리고, 다음 호출에서 스냅샷을 다시 받음)
+MAX_REPLICAS_PER_WORKER = 16
+
+_executor_lock = threading.Lock()
+_thread_executor: Optional[ThreadPoolExecutor] = None
+_process_executors: List[ProcessPoolExecutor] = []
+# 원본 그래프 → 워커 복제본 key (그래프가 GC되면 함께 사라짐)
+_replica_keys: "weakref.WeakKeyDictionary[CharacterNetwork, str]" = weakref.WeakKeyDictionary()
+
+
+class ReplicaMissing(Exception):
+    """워커에 해당 key의 그래프 복제본이 없음 (스냅샷을 다시 보내야 함)"""
+
+
+def offload_mode(config: Optional[RunnableConfig]) -> Optional[str]:
+    """config의 graph_offload 값 (검증 포함)"""
+    mode = (config or {}).get("configurable", {}).get("graph_offload")
+    if mode and mode not in OFFLOAD_MODES:
+        raise ValueError(f"지원하지 않는 graph_offload: {mode}. 지원: {OFFLOAD_MODES}")
+    return mode or None
+
+
+# ============ Executor ============
+def _get_thread_executor() -> ThreadPoolExecutor:
+    global _thread_executor
+    with _executor_lock:
+        if _thread_executor is None:
+            _thread_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="graph-offload")
+        return _thread_executor
+
+
+def _get_process_executor(key: str, workers: int) -> ProcessPoolExecutor:
+    """key에 고정된 단일 프로세스 executor (복제본이 있는 워커로 항상 라우팅)"""
+    with _executor_lock:
+        if not _process_executors:
+            # fork는 실행 중인 스레드(이벤트 루프, HTTP client)의 lock 상태까지 복사하므로 spawn 사용
+            context = multiprocessing.get_context("spawn")
+            for _ in range(max(1, workers)):
+                _process_executors.append(ProcessPoolExecutor(max_workers=1, mp_context=context))
+        return _process_executors[zlib.crc32(key.encode()) % len(_process_executors)]
+
+
+def shutdown_graph_offload():
+    """전용 스레드 / 워커 프로세스 종료 (다음 사용 시 다시 생성, 복제본은 모두 사라짐)"""
+    global _thread_executor
+    with _executor_lock:
+        executors = [_thread_executor] if _thread_executor else []
+        executors.extend(_process_executors)
+        _thread_executor = None
+        _process_executors.clear()
+        _replica_keys.clear()
+    for executor in executors:
+        executor.shutdown(wait=True)
+
+
+# ============ 워커 프로세스 ============
+_replicas: "OrderedDict[str, CharacterNetwork]" = OrderedDict()
+
+
+def _sync_replica(key: str, snapshot: Optional[bytes], ops: List[str]) -> CharacterNetwork:
+    """스냅샷 또는 delta로 복제본을 원본과 같은 상태로 맞추고 delta 기록 시작"""
+    if snapshot is not None:
+        replica = CharacterNetwork.from_bytes(snapshot)
+        _replicas[key] = replica
+        while len(_replicas) > MAX_REPLICAS_PER_WORKER:
+            _replicas.popitem(last=False)
+    elif key in _replicas:
+        replica = _replicas[key]
+        _replicas.move_to_end(key)
+    else:
+        raise ReplicaMissing(key)
+    for op in ops:
+        apply_journal_op(replica, json.loads(op))
+    replica.start_delta()
+    return replica
+
+
+def _worker_update(
+    key: str,
+    snapshot: Optional[bytes],
+    ops: List[str],
+    func: Callable[[Dict[str, Any]], Dict[str, Any]],
+    state: Dict[str, Any],
+) -> Tuple[Dict[str, Any], List[str], List[Tuple[str, type]]]:
+    """복제본에 func 실행 후 (graph를 뺀 결과, 변경 연산, warnings) 반환"""
+    replica = _sync_replica(key, snapshot, ops)
+    try:
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            result = func({**state, "graph": replica})
+    except BaseException:
+        # 일부만 반영된 복제본은 원본과 달라졌으므로 버림 (원본은 다음 호출에서 스냅샷을 다시 보냄)
+        _replicas.pop(key, None)
+        raise
+    result = {name: value for name, value in (result or {}).items() if name != "graph"}
+    return result, replica.drain_delta(), [(str(w.message), w.category) for w in caught]
+
+
+def _worker_save(key: str, snapshot: Optional[bytes], ops: List[str], path: str) -> None:
+    _sync_replica(key, snapshot, ops).save_to_file(path)
+
+
+# ============ 원본 프로세스 ============
+def _submit_to_process(graph: CharacterNetwork, workers: int, worker_func: Callable, *args) -> Future:
+    """복제본 동기화 인자(스냅샷 또는 delta)와 함께 graph의 워커에 제출"""
+    key = _replica_keys.get(graph)
+    if key is None:
+        key = _replica_keys[graph] = uuid.uuid4().hex
+        graph.start_delta()
+        snapshot, ops = graph.to_bytes(), []
+    else:
+        snapshot, ops = None, graph.drain_delta()
+    return _get_process_executor(key, workers).submit(worker_func, key, snapshot, ops, *args)
+
+
+def _apply_worker_ops(graph: CharacterNetwork, ops: List[str]):
+    """워커에서 기록된 연산을 원본에 재생 (복제본에는 이미 반영됐으므로 delta에는 남기지 않음)"""
+    with graph._journal_suspended():
+        for op in ops:
+            apply_journal_op(graph, json.loads(op))
+    if graph.is_journaling:
+        graph._journal.extend(ops)
+
+
+def _finish_update(
+    graph: CharacterNetwork,
+    outcome: Tuple[Dict[str, Any], List[str], List[Tuple[str, type]]],
+) -> Dict[str, Any]:
+    result, ops, caught = outcome
+    _apply_worker_ops(graph, ops)
+    for message, category in caught:
+        warnings.warn(message, category)
+    return {**result, "graph": graph}
+
+
+def _process_call(graph: CharacterNetwork, workers: int, worker_func: Callable, *args) -> Any:
+    """복제본이 없으면 스냅샷으로 한 번 재시도, 실패하면 다음 호출에서 스냅샷부터 다시 동기화"""
+    for attempt in range(2):
+        try:
+            return _submit_to_process(graph, workers, worker_func, *args).result()
+        except ReplicaMissing:
+            _replica_keys.pop(graph, None)
+            if attempt:
+                raise
+        except BaseException:
+            _replica_keys.pop(graph, None)
+            raise
+
+
+def _workers(config: Optional[RunnableConfig]) -> int:
+    return (config or {}).get("configurable", {}).get("graph_offload_workers", DEFAULT_PROCESS_WORKERS)
+
+
+def run_graph_update(
+    func: Callable[[Dict[str, Any]], Dict[str, Any]],
+    state: Dict[str, Any],
+    config: Optional[RunnableConfig] = None,
+) -> Dict[str, Any]:
+    """state["graph"]를 변경하는 func를 graph_offload 설정에 따라 실행"""
+    mode = offload_mode(config)
+    if mode is None:
+        return func(state)
+    if mode == "thread":
+        return _get_thread_executor().submit(func, state).result()
+    graph: CharacterNetwork = state["graph"]
+    state = {name: value for name, value in state.items() if name != "graph"}
+    return _finish_update(graph, _process_call(graph, _workers(config), _worker_update, func, state))
+
+
+def save_graph(graph: CharacterNetwork, path: str, config: Optional[RunnableConfig] = None):
+    """graph.save_to_file(path)를 graph_offload 설정에 따라 실행 ("process"면 워커의 복제본이 저장)"""
+    mode = offload_mode(config)
+    if mode is None:
+        graph.save_to_file(path)
+    elif mode == "thread":
+        _get_thread_executor().submit(graph.save_to_file, path).result()
+    else:
+        _process_call(graph, _workers(config), _worker_save, path)
+
+
+def graph_update_node(func: Callable[[Dict[str, Any]], Dict[str, Any]]) -> Any:
+    """
+    graph_offload 설정을 따르는 그래프 변경 노드 (progress_node 포함)
+
+    async 실행에서도 LangGraph가 executor에서 실행하므로, 결과를 기다리는 동안 이벤트 루프를 막지 않는다.
+    "process"에서는 func가 pickle 가능해야 한다 (모듈 최상위 함수).
+        >>> subgraph.add_node("update_event_graph", graph_update_node(update_graph_with_event))
+    """
+
+    def run(state: Dict[str, Any], config: RunnableConfig) -> Dict[str, Any]:
+        return run_graph_update(func, state, config)
+
+    return progress_node(inherit_signature(run, func))
@@ -0,0 +1,402 @@
+"""
+LLM Instrumentation - extractor 호출별 토큰 / 지연 시간 기록과 실행 단위 요약
+
+create_unified_extractor가 반환하는 모든 extractor(trustcall / CoT / plain)는 InstrumentedExtractor로
+감싸져, 기록이 켜져 있으면 호출마다 다음 항목을 남긴다.
+    node, model, extractor_type, tool, prompt_tokens, completion_tokens,
+    latency (초), retry (재시도 차수), cache_hit, error
+
+토큰은 LangChain callback(configure hook)으로 extractor 내부의 모든 모델 호출에서 합산하므로
+CoT의 사고 단계 호출과 trustcall 내부 재시도도 포함된다.
+
+사용:
+    >>> with record_run("run-1", export_dir="metrics", formats=("json", "prom")) as recorder:
+    ...     app.invoke(inputs)
+    >>> recorder.summary()["nodes"]["create_event"]["total_tokens"]
+
+    # 다른 수집기로 보내려면 sink 등록 (record dict를 받는 callable)
+    >>> add_sink(lambda record: print(record["node"], record["latency"]))
+
+CLI (저장된 JSON 요약에서 실행별 비용이 큰 노드 조회):
+    python -m utils.instrumentation metrics --top 5 --sort total_tokens
+"""
+
+import argparse
+import glob
+import json
+import os
+import re
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, LLMResult
+from langchain_core.tracers.context import register_configure_hook
+from langgraph.config import get_config
+
+from utils.progress import emit_progress, progress_enabled
+
+EXPORT_FORMATS = ("json", "prom")
+SORT_KEYS = ("total_tokens", "prompt_tokens", "completion_tokens", "latency", "calls")
+METRIC_PREFIX = "stage1_llm"
+# Prometheus 출력 항목: (summary 키, metric 이름, 설명)
+PROMETHEUS_METRICS = [
+    ("calls", "calls_total", "extractor 호출 수"),
+    ("prompt_tokens", "prompt_tokens_total", "입력 토큰 수"),
+    ("completion_tokens", "completion_tokens_total", "출력 토큰 수"),
+    ("latency", "latency_seconds_total", "누적 호출 시간(초)"),
+    ("retries", "retries_total", "재시도 호출 수"),
+    ("cache_hits", "cache_hits_total", "응답 캐시 적중 수"),
+    ("errors", "errors_total", "실패한 호출 수"),
+]
+
+
+# ============ 호출 단위 상태 (ContextVar) ============
+class _UsageHandler(BaseCallbackHandler):
+    """extractor 호출 하나 동안 발생한 모델 호출의 usage_metadata 합산"""
+
+    def __init__(self):
+        super().__init__()
+        self._lock = threading.Lock()
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.llm_calls = 0
+
+    def on_llm_end(self, response: LLMResult, **kwargs: Any) -> None:
+        for generations in response.generations:
+            for generation in generations:
+                if not isinstance(generation, ChatGeneration):
+                    continue
+                message = generation.message
+                usage = message.usage_metadata if isinstance(message, AIMessage) else None
+                with self._lock:
+                    self.llm_calls += 1
+                    if usage:
+                        self.prompt_tokens += usage.get("input_tokens", 0)
+                        self.completion_tokens += usage.get("output_tokens", 0)
+
+
+_usage_var: ContextVar[Optional[_UsageHandler]] = ContextVar("stage1_llm_usage", default=None)
+register_configure_hook(_usage_var, inheritable=True)
+
+_cache_hit_var: ContextVar[Optional[List[bool]]] = ContextVar("stage1_llm_cache_hit", default=None)
+_retry_var: ContextVar[int] = ContextVar("stage1_llm_retry", default=0)
+
+
+def mark_cache_hit():
+    """현재 기록 중인 호출을 응답 캐시 적중으로 표시 (CachedExtractor에서 호출)"""
+    flag = _cache_hit_var.get()
+    if flag is not None:
+        flag[0] = True
+
+
+@contextmanager
+def retry_scope(attempt: int) -> Iterator[None]:
+    """블록 안의 호출을 attempt번째 재시도로 기록 (바깥 재시도 차수에 더해짐)"""
+    token = _retry_var.set(_retry_var.get() + attempt)
+    try:
+        yield
+    finally:
+        _retry_var.reset(token)
+
+
+# ============ 실행 단위 수집 ============
+def _empty_totals() -> Dict[str, Any]:
+    return {
+        "calls": 0,
+        "prompt_tokens": 0,
+        "completion_tokens": 0,
+        "total_tokens": 0,
+        "latency": 0.0,
+        "retries": 0,
+        "cache_hits": 0,
+        "errors": 0,
+    }
+
+
+def _add_record(totals: Dict[str, Any], record: Dict[str, Any]):
+    totals["calls"] += 1
+    totals["prompt_tokens"] += record["prompt_tokens"]
+    totals["completion_tokens"] += record["completion_tokens"]
+    totals["total_tokens"] += record["prompt_tokens"] + record["completion_tokens"]
+    totals["latency"] += record["latency"]
+    totals["retries"] += 1 if record["retry"] else 0
+    totals["cache_hits"] += 1 if record["cache_hit"] else 0
+    totals["errors"] += 1 if record["error"] else 0
+
+
+class CallRecorder:
+    """실행 하나(run_id)의 호출 기록 수집과 JSON / Prometheus 요약 출력"""
+
+    def __init__(self, run_id: str):
+        self.run_id = run_id
+        self.started_at = time.time()
+        self.records: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def record(self, record: Dict[str, Any]):
+        with self._lock:
+            self.records.append(record)
+
+    def summary(self) -> Dict[str, Any]:
+        """전체 / 노드별 / (노드, 모델)별 합계"""
+        with self._lock:
+            records = list(self.records)
+        totals = _empty_totals()
+        nodes: Dict[str, Dict[str, Any]] = {}
+        by_model: Dict[str, Dict[str, Any]] = {}
+        for record in records:
+            _add_record(totals, record)
+            _add_record(nodes.setdefault(record["node"], _empty_totals()), record)
+            key = f"{record['node']}|{record['model']}"
+            _add_record(by_model.setdefault(key, _empty_totals()), record)
+        return {
+            "run_id": self.run_id,
+            "started_at": self.started_at,
+            "totals": totals,
+            "nodes": nodes,
+            "node_models": by_model,
+        }
+
+    def to_prometheus(self) -> str:
+        """(노드, 모델)별 counter를 Prometheus text format으로 출력"""
+        node_models = self.summary()["node_models"]
+        lines = []
+        for key, name, help_text in PROMETHEUS_METRICS:
+            metric = f"{METRIC_PREFIX}_{name}"
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} counter")
+            for node_model, totals in node_models.items():
+                node, model = node_model.split("|", 1)
+                labels = f'run="{_label(self.run_id)}",node="{_label(node)}",model="{_label(model)}"'
+                lines.append(f"{metric}{{{labels}}} {totals[key]}")
+        return "\n".join(lines) + "\n"
+
+    def export(self, export_dir: str, formats=("json",)) -> List[str]:
+        """export_dir에 {run_id}-{시작 시각}-{임의 suffix}.json / .prom 저장. 저장한 경로 반환"""
+        unknown = set(formats) - set(EXPORT_FORMATS)
+        if unknown:
+            raise ValueError(f"지원하지 않는 출력 형식: {sorted(unknown)}. 지원 형식: {list(EXPORT_FORMATS)}")
+
+        os.makedirs(export_dir, exist_ok=True)
+        # 같은 run_id를 연달아 재개해도 파일이 겹치지 않도록 suffix 추가
+        stem = f"{_filename(self.run_id)}-{int(self.started_at * 1000)}-{uuid.uuid4().hex[:6]}"
+        paths = []
+        for fmt in formats:
+            path = os.path.join(export_dir, f"{stem}.{fmt}")
+            with open(path, "w", encoding="utf-8") as f:
+                if fmt == "json":
+                    json.dump(self.summary(), f, ensure_ascii=False, indent=2)
+                else:
+                    f.write(self.to_prometheus())
+            paths.append(path)
+        return paths
+
+
+def _label(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _filename(value: str) -> str:
+    return re.sub(r"[^\w.-]+", "_", value)
+
+
+_recorder_var: ContextVar[Optional[CallRecorder]] = ContextVar("stage1_llm_recorder", default=None)
+_sinks: List[Callable[[Dict[str, Any]], None]] = []
+_sinks_lock = threading.Lock()
+
+
+def add_sink(sink: Callable[[Dict[str, Any]], None]):
+    """모든 호출 기록을 받을 sink 등록 (record_run 밖의 호출도 전달됨)"""
+    with _sinks_lock:
+        _sinks.append(sink)
+
+
+def remove_sink(sink: Callable[[Dict[str, Any]], None]):
+    with _sinks_lock:
+        _sinks.remove(sink)
+
+
+@contextmanager
+def record_run(
+    run_id: str, export_dir: Optional[str] = None, formats=("json",)
+) -> Iterator[CallRecorder]:
+    """
+    블록 안의 extractor 호출을 run_id 기록으로 수집 (Send fan-out 스레드 / async task 포함)
+
+    Args:
+        run_id: 실행 식별자 (보통 thread_id)
+        export_dir: 지정하면 블록이 끝날 때 (예외로 끝나도) 요약 파일 저장
+        formats: "json", "prom" 중 저장할 형식
+    """
+    recorder = CallRecorder(run_id)
+    token = _recorder_var.set(recorder)
+    try:
+        yield recorder
+    finally:
+        _recorder_var.reset(token)
+        if export_dir:
+            recorder.export(export_dir, formats)
+
+
+def _is_recording() -> bool:
+    return _recorder_var.get() is not None or bool(_sinks) or progress_enabled()
+
+
+def _current_node() -> str:
+    try:
+        metadata = get_config().get("metadata", {})
+    except RuntimeError:  # 그래프 밖에서 직접 호출한 경우
+        return "unknown"
+    return metadata.get("langgraph_node", "unknown")
+
+
+def _emit(record: Dict[str, Any]):
+    recorder = _recorder_var.get()
+    if recorder is not None:
+        record["run_id"] = recorder.run_id
+        recorder.record(record)
+    with _sinks_lock:
+        sinks = list(_sinks)
+    for sink in sinks:
+        sink(record)
+    emit_progress(
+        "llm_call",
+        model=record["model"],
+        prompt_tokens=record["prompt_tokens"],
+        completion_tokens=record["completion_tokens"],
+        latency=record["latency"],
+        retry=record["retry"],
+        cache_hit=record["cache_hit"],
+        error=record["error"],
+    )
+
+
+# ============ Extractor Wrapper ============
+class InstrumentedExtractor:
+    """
+    extractor.invoke / ainvoke마다 호출 기록을 남기는 Wrapper
+
+    기록이 꺼져 있으면 (record_run 밖이고 sink도 없고 stream_progress도 꺼져 있으면)
+    원래 extractor를 그대로 호출한다. stream_progress가 켜져 있으면 호출마다 llm_call 이벤트도 보낸다.
+    """
+
+    def __init__(self, extractor: Any, model_name: str, extractor_type: str, tool_choice: Optional[str]):
+        self.extractor = extractor
+        self.model_name = model_name
+        self.extractor_type = extractor_type
+        self.tool_choice = tool_choice
+
+    def __getattr__(self, name: str) -> Any:
+        # unpickle 중에는 extractor가 아직 없으므로 재귀 방지
+        if name == "extractor":
+            raise AttributeError(name)
+        return getattr(self.extractor, name)
+
+    @contextmanager
+    def _track(self) -> Iterator[None]:
+        handler = _UsageHandler()
+        cache_hit = [False]
+        usage_token = _usage_var.set(handler)
+        cache_token = _cache_hit_var.set(cache_hit)
+        error = None
+        start = time.perf_counter()
+        try:
+            yield
+        except BaseException as exc:
+            error = f"{type(exc).__name__}: {exc}"
+            raise
+        finally:
+            latency = time.perf_counter() - start
+            _usage_var.reset(usage_token)
+            _cache_hit_var.reset(cache_token)
+            _emit(
+                {
+                    "node": _current_node(),
+                    "model": self.model_name,
+                    "extractor_type": self.extractor_type,
+                    "tool": self.tool_choice,
+                    "prompt_tokens": handler.prompt_tokens,
+                    "completion_tokens": handler.completion_tokens,
+                    "llm_calls": handler.llm_calls,
+                    "latency": latency,
+                    "retry": _retry_var.get(),
+                    "cache_hit": cache_hit[0],
+                    "error": error,
+                    "timestamp": time.time(),
+                }
+            )
+
+    def invoke(self, inputs: Any, *args, **kwargs) -> Any:
+        if not _is_recording():
+            return self.extractor.invoke(inputs, *args, **kwargs)
+        with self._track():
+            return self.extractor.invoke(inputs, *args, **kwargs)
+
+    async def ainvoke(self, inputs: Any, *args, **kwargs) -> Any:
+        if not _is_recording():
+            return await self.extractor.ainvoke(inputs, *args, **kwargs)
+        with self._track():
+            return await self.extractor.ainvoke(inputs, *args, **kwargs)
+
+
+# ============ 리포트 ============
+def load_summaries(export_dir: str) -> Dict[str, List[Dict[str, Any]]]:
+    """export_dir의 JSON 요약을 run_id별로 묶어 반환 (재개된 실행은 여러 파일)"""
+    runs: Dict[str, List[Dict[str, Any]]] = {}
+    for path in sorted(glob.glob(os.path.join(export_dir, "*.json"))):
+        with open(path, "r", encoding="utf-8") as f:
+            summary = json.load(f)
+        runs.setdefault(summary["run_id"], []).append(summary)
+    return runs
+
+
+def expensive_nodes(
+    summaries: List[Dict[str, Any]], sort_key: str = "total_tokens", top: int = 5
+) -> List[Dict[str, Any]]:
+    """같은 실행의 요약들을 노드별로 합산해 sort_key 내림차순 상위 top개 반환"""
+    if sort_key not in SORT_KEYS:
+        raise ValueError(f"지원하지 않는 정렬 기준: {sort_key}. 지원 기준: {list(SORT_KEYS)}")
+
+    nodes: Dict[str, Dict[str, Any]] = {}
+    for summary in summaries:
+        for node, totals in summary["nodes"].items():
+            merged = nodes.setdefault(node, _empty_totals())
+            for key, value in totals.items():
+                merged[key] += value
+    ranked = sorted(nodes.items(), key=lambda item: item[1][sort_key], reverse=True)
+    return [{"node": node, **totals} for node, totals in ranked[:top]]
+
+
+def report(export_dir: str, run_id: Optional[str] = None, sort_key: str = "total_tokens", top: int = 5):
+    """실행별 비용이 큰 노드 출력"""
+    runs = load_summaries(export_dir)
+    if run_id is not None:
+        runs = {run_id: runs.get(run_id, [])}
+    for current_run, summaries in runs.items():
+        print(f"\n=== {current_run} ({len(summaries)}개 요약) ===")
+        print(
+            f"{'node':<32} {'calls':>6} {'prompt':>9} {'completion':>11} "
+            f"{'latency s':>10} {'retries':>8} {'cache':>6}"
+        )
+        for row in expensive_nodes(summaries, sort_key, top):
+            print(
+                f"{row['node']:<32} {row['calls']:>6} {row['prompt_tokens']:>9} "
+                f"{row['completion_tokens']:>11} {row['latency']:>10.2f} "
+                f"{row['retries']:>8} {row['cache_hits']:>6}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="실행별 LLM 비용 상위 노드 리포트")
+    parser.add_argument("export_dir", help="record_run(export_dir=...)로 저장한 디렉토리")
+    parser.add_argument("--run", default=None, help="특정 run_id만 출력")
+    parser.add_argument("--sort", default="total_tokens", choices=SORT_KEYS)
+    parser.add_argument("--top", type=int, default=5)
+    args = parser.parse_args()
+    report(args.export_dir, args.run, args.sort, args.top)
@@ -0,0 +1,150 @@
+"""
+LLM 호출 공통 함수 - 노드의 sync / async 실행 경로가 같은 호출 로직을 공유하도록 분리
+
+노드는 프롬프트만 만들고 call_extractor / acall_extractor로 구조화된 결과를 받는다.
+config["configurable"]["rate_limits"]가 있으면 모델별 동시 호출 / 분당 한도와
+429 backoff(utils.rate_limiter)가 이 지점에서 적용된다. 재시도 차수는 호출 기록(utils.instrumentation)에 남는다.
+sync_async_node로 두 버전을 묶어 add_node에 넘기면 컴파일된 그래프의 invoke는
+sync 함수를, ainvoke / astream은 async 함수를 실행한다.
+"""
+
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Type, TypeVar
+
+from langchain_core.messages import BaseMessage, SystemMessage
+from langchain_core.runnables import RunnableLambda
+from langgraph.config import get_config
+from pydantic import BaseModel
+
+from utils.extractor_factory import create_unified_extractor
+from utils.instrumentation import retry_scope
+from utils.progress import progress_node
+from utils.rate_limiter import (
+    DEFAULT_MAX_RETRIES,
+    ModelRateLimiter,
+    estimate_tokens,
+    get_rate_limiter,
+    is_rate_limit_error,
+    resolve_rate_limits,
+)
+
+SchemaT = TypeVar("SchemaT", bound=BaseModel)
+
+# 응답 파싱 / 검증 실패 (tool call 누락, 스키마 불일치). 배치 노드는 이 경우 개별 호출로 fallback한다
+RESPONSE_PARSE_ERRORS = (ValueError, KeyError, IndexError, TypeError, AttributeError)
+
+
+def parse_extractor_response(response: Dict[str, Any], schema: Type[SchemaT]) -> SchemaT:
+    """extractor 응답에서 schema 인스턴스 추출"""
+    if hasattr(response, "responses") and response["responses"][0]:
+        return response["responses"][0]
+    # trustcall의 emtpy response 문제 때문에 임시 처리
+    args = response["messages"][0].tool_calls[0]["args"]
+    return schema(**args)
+
+
+def _state_extractor(state: Dict[str, Any], schema: Type[BaseModel]):
+    return create_unified_extractor(
+        model_name=state.get("model"),
+        extractor_type=state.get("extractor_type", "default"),
+        tools=[schema],
+        tool_choice=schema.__name__,
+    )
+
+
+def _current_limiter(model_name: Optional[str]) -> Tuple[Optional[ModelRateLimiter], int]:
+    """실행 중인 그래프 config에서 모델별 limiter와 최대 재시도 횟수 조회"""
+    try:
+        configurable = get_config().get("configurable", {})
+    except RuntimeError:  # 그래프 밖에서 직접 호출한 경우
+        return None, 0
+    settings = resolve_rate_limits(configurable, model_name)
+    if not any(settings.values()):
+        return None, 0
+    limiter = get_rate_limiter(model_name or "default", settings)
+    return limiter, configurable.get("max_retries", DEFAULT_MAX_RETRIES)
+
+
+def _used_tokens(response: Any) -> Optional[int]:
+    try:
+        return response["messages"][0].usage_metadata["total_tokens"]
+    except (KeyError, IndexError, TypeError, AttributeError):
+        return None
+
+
+def _invoke(extractor: Any, messages: List[BaseMessage], model_name: Optional[str]) -> Any:
+    limiter, max_retries = _current_limiter(model_name)
+    if limiter is None:
+        return extractor.invoke(messages)
+
+    tokens = estimate_tokens(messages[0].content)
+    for attempt in range(max_retries + 1):
+        with limiter.slot(tokens) as usage:
+            try:
+                with retry_scope(attempt):
+                    response = extractor.invoke(messages)
+            except Exception as error:
+                if not is_rate_limit_error(error) or attempt == max_retries:
+                    raise
+                limiter.record_rate_limit()  # 다음 slot 획득이 cooldown만큼 대기
+                continue
+            usage["used_tokens"] = _used_tokens(response)
+        limiter.record_success()
+        return response
+
+
+async def _ainvoke(extractor: Any, messages: List[BaseMessage], model_name: Optional[str]) -> Any:
+    limiter, max_retries = _current_limiter(model_name)
+    if limiter is None:
+        return await extractor.ainvoke(messages)
+
+    tokens = estimate_tokens(messages[0].content)
+    for attempt in range(max_retries + 1):
+        async with limiter.aslot(tokens) as usage:
+            try:
+                with retry_scope(attempt):
+                    response = await extractor.ainvoke(messages)
+            except Exception as error:
+                if not is_rate_limit_error(error) or attempt == max_retries:
+                    raise
+                limiter.record_rate_limit()
+                continue
+            usage["used_tokens"] = _used_tokens(response)
+        limiter.record_success()
+        return response
+
+
+def call_extractor(state: Dict[str, Any], prompt: str, schema: Type[SchemaT]) -> SchemaT:
+    """
+    State의 model / extractor_type으로 extractor를 만들어 prompt를 실행
+
+    Args:
+        state: model, extractor_type을 담은 State
+        prompt: SystemMessage로 전달할 프롬프트
+        schema: 출력 Pydantic 모델 (tool_choice는 클래스 이름)
+
+    Returns:
+        schema 인스턴스
+    """
+    extractor = _state_extractor(state, schema)
+    response = _invoke(extractor, [SystemMessage(content=prompt)], state.get("model"))
+    return parse_extractor_response(response, schema)
+
+
+async def acall_extractor(state: Dict[str, Any], prompt: str, schema: Type[SchemaT]) -> SchemaT:
+    """call_extractor의 비동기 버전 (extractor.ainvoke 사용)"""
+    extractor = _state_extractor(state, schema)
+    response = await _ainvoke(extractor, [SystemMessage(content=prompt)], state.get("model"))
+    return parse_extractor_response(response, schema)
+
+
+def sync_async_node(
+    func: Callable[..., Dict[str, Any]],
+    afunc: Callable[..., Awaitable[Dict[str, Any]]],
+) -> RunnableLambda:
+    """
+    sync / async 구현을 하나의 그래프 노드로 묶음 (stream_progress가 켜져 있으면 node_start / node_finish 이벤트 전송)
+
+    Example:
+        >>> subgraph.add_node("create_event", sync_async_node(create_event_node, acreate_event_node))
+    """
+    return progress_node(func, afunc)
@@ -1,7 +1,17 @@
 """
 Model Factory - 문자열 model name에서 실제 LLM 객체 생성
+
+생성된 모델은 (model_name, kwargs) 단위로 프로세스 전역 풀에 보관되어 재사용되며,
+모든 OpenAI 클라이언트는 하나의 HTTP 커넥션 풀을 공유한다 (async 커넥션은 이벤트 루프별로 분리).
 """
 
+import asyncio
+import os
+import threading
+import weakref
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+import httpx
 from langchain_core.language_models import BaseChatModel
 from langchain_openai import ChatOpenAI
 
@@ -13,15 +23,148 @@ SUPPORTED_MODELS = {
     "gpt-5-mini": {"provider": "openai", "model": "gpt-5-mini"},
     "gpt-4-turbo": {"provider": "openai", "model": "gpt-4-turbo"},
     "gpt-3.5-turbo": {"provider": "openai", "model": "gpt-3.5-turbo"},
+    # 오프라인 Fake 모델 (API 호출 없음, 테스트 / 벤치마크용. utils.fake_llm 참고)
+    "fake": {"provider": "fake", "model": "fake"},
     # Anthropic models (추후 확장)
     # "claude-3-5-sonnet": {"provider": "anthropic", "model": "claude-3-5-sonnet-20241022"},
 }
 
+# HTTP 커넥션 풀 설정 (환경 변수 또는 configure_http_pool로 변경)
+HTTP_POOL_SETTINGS = {
+    "max_connections": int(os.getenv("MODEL_POOL_MAX_CONNECTIONS", "100")),
+    "max_keepalive_connections": int(os.getenv("MODEL_POOL_MAX_KEEPALIVE", "20")),
+    "keepalive_expiry": float(os.getenv("MODEL_POOL_KEEPALIVE_EXPIRY", "60")),
+}
+
+_pool_lock = threading.Lock()
+_model_pool: Dict[Tuple[str, Hashable], BaseChatModel] = {}
+_http_clients: Optional[Tuple[httpx.Client, httpx.AsyncClient]] = None
+
+
+def _pool_key(model_name: str, kwargs: Dict[str, Any]) -> Optional[Tuple[str, Hashable]]:
+    """풀 키 생성 (해시 불가능한 kwargs가 있으면 None → 풀링하지 않음)"""
+    key = (model_name, tuple(sorted(kwargs.items())))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+class _LoopLocalTransport(httpx.AsyncBaseTransport):
+    """
+    실행 중인 이벤트 루프마다 별도의 커넥션 풀을 쓰는 async transport
+
+    async 커넥션은 처음 사용한 이벤트 루프에 묶이므로, 하나의 풀을 공유하면 같은 프로세스에서
+    asyncio.run을 다시 호출했을 때(run_batch 반복 등) 닫힌 루프의 커넥션을 재사용하다 실패한다.
+    루프가 GC되면 그 루프의 풀도 함께 사라진다.
+    """
+
+    def __init__(self, limits: httpx.Limits):
+        self._limits = limits
+        self._lock = threading.Lock()
+        self._transports: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncHTTPTransport]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def _current(self) -> httpx.AsyncHTTPTransport:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            transport = self._transports.get(loop)
+            if transport is None:
+                transport = self._transports[loop] = httpx.AsyncHTTPTransport(limits=self._limits)
+            return transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._current().handle_async_request(request)
+
+    async def aclose(self) -> None:
+        """현재 루프의 커넥션 풀만 닫음 (다른 루프의 커넥션은 그 루프에서만 닫을 수 있음)"""
+        with self._lock:
+            transport = self._transports.pop(asyncio.get_running_loop(), None)
+        if transport is not None:
+            await transport.aclose()
+
+
+def _get_http_clients() -> Tuple[httpx.Client, httpx.AsyncClient]:
+    """공유 HTTP 클라이언트 (sync, async) 반환. 최초 호출 시 생성"""
+    global _http_clients
+    if _http_clients is None:
+        limits = httpx.Limits(**HTTP_POOL_SETTINGS)
+        _http_clients = (
+            httpx.Client(limits=limits),
+            httpx.AsyncClient(transport=_LoopLocalTransport(limits)),
+        )
+    return _http_clients
+
+
+def configure_http_pool(
+    max_connections: Optional[int] = None,
+    max_keepalive_connections: Optional[int] = None,
+    keepalive_expiry: Optional[float] = None,
+) -> Dict[str, Any]:
+    """
+    공유 HTTP 커넥션 풀 설정 변경
+
+    기존 풀과 풀에 보관된 모델은 폐기되고, 이후 create_model 호출부터 새 설정이 적용된다.
+
+    Returns:
+        적용된 설정
+    """
+    with _pool_lock:
+        if max_connections is not None:
+            HTTP_POOL_SETTINGS["max_connections"] = max_connections
+        if max_keepalive_connections is not None:
+            HTTP_POOL_SETTINGS["max_keepalive_connections"] = max_keepalive_connections
+        if keepalive_expiry is not None:
+            HTTP_POOL_SETTINGS["keepalive_expiry"] = keepalive_expiry
+        _reset_pool()
+    return dict(HTTP_POOL_SETTINGS)
+
+
+def clear_model_pool():
+    """풀에 보관된 모델과 HTTP 클라이언트 폐기"""
+    with _pool_lock:
+        _reset_pool()
+
+
+def _reset_pool():
+    global _http_clients
+    _model_pool.clear()
+    if _http_clients is not None:
+        # AsyncClient는 이벤트 루프 밖에서 닫을 수 없으므로 참조만 끊고 GC에 맡김
+        _http_clients[0].close()
+        _http_clients = None
+
+
+def _build_model(model_name: str, **kwargs) -> BaseChatModel:
+    """풀을 거치지 않고 모델 객체 생성"""
+    model_config = SUPPORTED_MODELS[model_name]
+    provider = model_config["provider"]
+
+    if provider == "openai":
+        http_client, http_async_client = _get_http_clients()
+        kwargs.setdefault("http_client", http_client)
+        kwargs.setdefault("http_async_client", http_async_client)
+        return ChatOpenAI(model=model_config["model"], **kwargs)
+    elif provider == "fake":
+        from utils.fake_llm import FAKE_LLM_SETTINGS, FakeStructuredChatModel
+
+        return FakeStructuredChatModel(model_name=model_config["model"], **{**FAKE_LLM_SETTINGS, **kwargs})
+    # elif provider == "anthropic":
+    #     from langchain_anthropic import ChatAnthropic
+    #     return ChatAnthropic(model=model_config["model"], **kwargs)
+    else:
+        raise ValueError(f"Unsupported provider: {provider}")
+
 
 def create_model(model_name: str, **kwargs) -> BaseChatModel:
     """
     문자열 model name으로부터 LLM 객체 생성
 
+    같은 model_name과 kwargs 조합은 프로세스 전역 풀에서 같은 인스턴스를 반환하므로
+    Send fan-out마다 새 HTTP 클라이언트를 만들지 않고 warm connection을 재사용한다.
+
     Args:
         model_name: 모델 이름 (예: "gpt-4o-mini", "gpt-5-mini")
         **kwargs: 모델 생성 시 추가 파라미터 (temperature, max_tokens 등)
@@ -35,6 +178,8 @@ def create_model(model_name: str, **kwargs) -> BaseChatModel:
     Example:
         >>> model = create_model("gpt-4o-mini")
         >>> model = create_model("gpt-5-mini", temperature=0.7)
+        >>> create_model("gpt-5-mini", temperature=0.7) is model  # 풀에서 재사용
+        True
     """
 
     if model_name not in SUPPORTED_MODELS:
@@ -43,13 +188,12 @@ def create_model(model_name: str, **kwargs) -> BaseChatModel:
             f"Supported models: {list(SUPPORTED_MODELS.keys())}"
         )
 
-    model_config = SUPPORTED_MODELS[model_name]
-    provider = model_config["provider"]
+    key = _pool_key(model_name, kwargs)
+    if key is None:
+        return _build_model(model_name, **kwargs)
 
-    if provider == "openai":
-        return ChatOpenAI(model=model_config["model"], **kwargs)
-    # elif provider == "anthropic":
-    #     from langchain_anthropic import ChatAnthropic
-    #     return ChatAnthropic(model=model_config["model"], **kwargs)
-    else:
-        raise ValueError(f"Unsupported provider: {provider}")
+    with _pool_lock:
+        model = _model_pool.get(key)
+        if model is None:
+            model = _model_pool[key] = _build_model(model_name, **kwargs)
+    return model
@@ -0,0 +1,234 @@
+"""
+Progress Events - Stage1 / 플롯 워크플로우 진행 상황을 LangGraph custom stream으로 전달
+
+config["configurable"]["stream_progress"]가 True인 실행에서만 이벤트를 만든다 (기본 꺼짐, 오버헤드 없음).
+켜져 있으면 진행 상황을 print하던 노드도 print 대신 이벤트를 보낸다.
+
+이벤트 (dict, "type": "progress"):
+    node_start / node_finish: 노드 시작 / 종료 (소요 시간, 그래프 변경량 graph_delta 포함)
+    fanout: Send 분배 폭 (대상 노드별 분기 수)
+    branch_done: Send 분기 하나 완료 (재시도 횟수, 실패 여부)
+    llm_call: extractor 호출 하나의 토큰 / 지연 시간
+    graph_loaded / graph_saved / plot_saved / stage_done / workflow_finished: 기존 print 출력 내용
+
+공통 필드: event, node, namespace (서브그래프 경로, 예: "run_event_subgraph/create_event"), ts
+
+사용:
+    >>> async for event in astream_progress(app, inputs):
+    ...     print(event["event"], event["node"], event["totals"]["total_tokens"])
+
+    # 직접 astream을 쓰는 경우
+    >>> config = {"configurable": {"stream_progress": True}}
+    >>> async for namespace, event in app.astream(inputs, config, stream_mode="custom", subgraphs=True):
+    ...     ...
+"""
+
+import inspect
+import time
+from collections import Counter
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, List, Optional, get_type_hints
+
+from langchain_core.runnables import RunnableConfig, RunnableLambda
+from langchain_core.runnables.utils import accepts_config
+from langgraph.config import get_config, get_stream_writer
+from langgraph.types import Send
+
+PROGRESS_EVENT_TYPE = "progress"
+
+
+def _namespace(metadata: Dict[str, Any]) -> str:
+    checkpoint_ns = metadata.get("langgraph_checkpoint_ns", "")
+    return "/".join(part.split(":")[0] for part in checkpoint_ns.split("|") if part)
+
+
+def progress_enabled() -> bool:
+    """현재 그래프 실행에서 progress 이벤트를 보내는지 여부"""
+    try:
+        configurable = get_config().get("configurable", {})
+    except RuntimeError:  # 그래프 밖에서 직접 호출한 경우
+        return False
+    return bool(configurable.get("stream_progress"))
+
+
+def emit_progress(event: str, **payload) -> bool:
+    """
+    progress 이벤트를 custom stream으로 전송
+
+    Returns:
+        전송했으면 True (stream_progress가 꺼져 있거나 그래프 밖이면 False → 호출자가 print로 대체)
+    """
+    if not progress_enabled():
+        return False
+    metadata = get_config().get("metadata", {})
+    get_stream_writer()(
+        {
+            "type": PROGRESS_EVENT_TYPE,
+            "event": event,
+            "node": metadata.get("langgraph_node"),
+            "namespace": _namespace(metadata),
+            "ts": time.time(),
+            **payload,
+        }
+    )
+    return True
+
+
+def report_fanout(sends: List[Send]) -> List[Send]:
+    """Send 분배 결과를 fanout 이벤트로 알리고 그대로 반환 (조건부 엣지 함수의 return에 사용)"""
+    emit_progress("fanout", width=len(sends), targets=dict(Counter(send.node for send in sends)))
+    return sends
+
+
+# ============ 노드 Wrapper ============
+def _graph_counts(state: Any) -> Optional[Dict[str, int]]:
+    graph = state.get("graph") if isinstance(state, dict) else None
+    if not hasattr(graph, "get_statistics"):
+        return None
+    stats = graph.get_statistics()
+    return {**stats["node_counts"], "edges": stats["total_edges"]}
+
+
+def _graph_delta(before: Optional[Dict[str, int]], state: Any) -> Optional[Dict[str, int]]:
+    """노드 실행 전후의 노드 타입별 / 엣지 수 변화량 (변화가 없으면 None)"""
+    if before is None:
+        return None
+    after = _graph_counts(state)
+    delta = {key: after[key] - before.get(key, 0) for key in after if after[key] != before.get(key, 0)}
+    return delta or None
+
+
+def _call(func: Callable[..., Any], state: Any, config: RunnableConfig) -> Any:
+    if accepts_config(func):
+        return func(state, config=config)
+    return func(state)
+
+
+def inherit_signature(wrapper: Callable[..., Any], func: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    func의 이름 / state 타입 힌트를 wrapper에 복사 (노드 wrapper용, 예: progress_node / graph_update_node)
+
+    add_node는 함수 노드의 첫 인자 타입으로 input schema를 추론하므로 (예: InputState),
+    감싼 뒤에도 같은 입력을 받도록 유지한다. config 인자는 wrapper의 것을 쓴다.
+    """
+    try:
+        hints = get_type_hints(func)
+    except Exception:  # 해석할 수 없는 forward reference
+        hints = {}
+    first = next(iter(inspect.signature(func).parameters), None)
+    annotations = {}
+    if first in hints:
+        annotations["state"] = hints[first]
+    if "return" in hints:
+        annotations["return"] = hints["return"]
+    wrapper.__name__ = func.__name__
+    wrapper.__qualname__ = func.__qualname__
+    wrapper.__doc__ = func.__doc__
+    wrapper.__annotations__ = annotations
+    return wrapper
+
+
+def progress_node(
+    func: Callable[..., Dict[str, Any]],
+    afunc: Optional[Callable[..., Awaitable[Dict[str, Any]]]] = None,
+) -> Any:
+    """
+    노드 실행 전후로 node_start / node_finish 이벤트를 보내는 그래프 노드
+
+    func / afunc가 config 인자를 받으면 그대로 전달한다.
+    afunc가 없으면 func와 같은 입력 타입의 함수 노드를 반환한다 (async 실행 시 LangGraph가 executor에서 실행).
+        >>> subgraph.add_node("update_event_graph", progress_node(update_graph_with_event))
+    """
+
+    def run(state: Dict[str, Any], config: RunnableConfig) -> Dict[str, Any]:
+        if not progress_enabled():
+            return _call(func, state, config)
+        before = _graph_counts(state)
+        emit_progress("node_start")
+        start = time.perf_counter()
+        result = _call(func, state, config)
+        emit_progress(
+            "node_finish",
+            seconds=time.perf_counter() - start,
+            graph_delta=_graph_delta(before, state),
+        )
+        return result
+
+    if afunc is None:
+        return inherit_signature(run, func)
+
+    async def arun(state: Dict[str, Any], config: RunnableConfig) -> Dict[str, Any]:
+        if not progress_enabled():
+            return await _call(afunc, state, config)
+        before = _graph_counts(state)
+        emit_progress("node_start")
+        start = time.perf_counter()
+        result = await _call(afunc, state, config)
+        emit_progress(
+            "node_finish",
+            seconds=time.perf_counter() - start,
+            graph_delta=_graph_delta(before, state),
+        )
+        return result
+
+    return RunnableLambda(run, afunc=arun, name=func.__name__)
+
+
+# ============ Consumer ============
+class ProgressTotals:
+    """이벤트 흐름에서 누적 토큰 / 호출 수 / 분기 진행률 집계"""
+
+    def __init__(self):
+        self.totals = {
+            "llm_calls": 0,
+            "prompt_tokens": 0,
+            "completion_tokens": 0,
+            "total_tokens": 0,
+            "branches_total": 0,
+            "branches_done": 0,
+            "branches_failed": 0,
+            "nodes_finished": 0,
+        }
+
+    def update(self, event: Dict[str, Any]) -> Dict[str, Any]:
+        """이벤트를 반영하고 totals 사본을 붙인 이벤트 반환"""
+        totals = self.totals
+        kind = event.get("event")
+        if kind == "llm_call":
+            totals["llm_calls"] += 1
+            totals["prompt_tokens"] += event["prompt_tokens"]
+            totals["completion_tokens"] += event["completion_tokens"]
+            totals["total_tokens"] += event["prompt_tokens"] + event["completion_tokens"]
+        elif kind == "fanout":
+            totals["branches_total"] += event["width"]
+        elif kind == "branch_done":
+            totals["branches_done"] += 1
+            totals["branches_failed"] += 1 if event["failed"] else 0
+        elif kind == "node_finish":
+            totals["nodes_finished"] += 1
+        return {**event, "totals": dict(totals)}
+
+
+def _progress_config(config: Optional[RunnableConfig]) -> RunnableConfig:
+    config = dict(config or {})
+    config["configurable"] = {**config.get("configurable", {}), "stream_progress": True}
+    return config
+
+
+def stream_progress(app: Any, inputs: Any, config: Optional[RunnableConfig] = None) -> Iterator[Dict[str, Any]]:
+    """app.stream을 실행하며 누적 totals가 붙은 progress 이벤트를 순서대로 반환"""
+    tracker = ProgressTotals()
+    for _, chunk in app.stream(inputs, _progress_config(config), stream_mode="custom", subgraphs=True):
+        if isinstance(chunk, dict) and chunk.get("type") == PROGRESS_EVENT_TYPE:
+            yield tracker.update(chunk)
+
+
+async def astream_progress(
+    app: Any, inputs: Any, config: Optional[RunnableConfig] = None
+) -> AsyncIterator[Dict[str, Any]]:
+    """stream_progress의 비동기 버전 (app.astream 사용)"""
+    tracker = ProgressTotals()
+    async for _, chunk in app.astream(
+        inputs, _progress_config(config), stream_mode="custom", subgraphs=True
+    ):
+        if isinstance(chunk, dict) and chunk.get("type") == PROGRESS_EVENT_TYPE:
+            yield tracker.update(chunk)
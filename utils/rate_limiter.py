@@ -0,0 +1,256 @@
+"""
+Rate Limiter - Send fan-out으로 동시에 발생하는 LLM 호출을 모델별로 제한
+
+모든 LLM 노드는 utils.llm_call을 거치므로 여기서 모델별로
+    - 동시 호출 수 (max_concurrency)
+    - 분당 요청 수 / 토큰 수 token bucket (requests_per_minute, tokens_per_minute)
+    - 429 응답 시 지수 backoff + 동시 호출 수 절반 감소 (성공이 이어지면 1씩 회복)
+을 적용한다.
+
+설정은 워크플로우 config로 전달한다 (모델 이름별, 없으면 "default"):
+    >>> graph.invoke(inputs, config={"configurable": {"rate_limits": {
+    ...     "default": {"max_concurrency": 8},
+    ...     "gpt-4o-mini": {"max_concurrency": 16, "requests_per_minute": 500,
+    ...                     "tokens_per_minute": 200000},
+    ... }, "max_retries": 6}})
+"""
+
+import asyncio
+import math
+import random
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+# 한글 프롬프트 기준 대략적인 문자/토큰 비율 (사전 차감용, 호출 후 실제 사용량으로 보정)
+CHARS_PER_TOKEN = 2
+# 출력 토큰 사전 예약량
+EXPECTED_OUTPUT_TOKENS = 1000
+
+DEFAULT_MAX_RETRIES = 5
+BACKOFF_BASE = 1.0
+BACKOFF_MAX = 60.0
+# 동시 호출 한도를 1 회복하기 위한 연속 성공 횟수
+RECOVERY_SUCCESSES = 10
+# 동시 호출 슬롯 대기 시 polling 간격 (sync / async 공용 한도라 Condition 대신 polling)
+_POLL_INTERVAL = 0.05
+
+
+def estimate_tokens(text: str) -> int:
+    """프롬프트 토큰 수 대략 추정 (입력 + 예상 출력)"""
+    return math.ceil(len(text) / CHARS_PER_TOKEN) + EXPECTED_OUTPUT_TOKENS
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """429 / rate limit 예외 여부"""
+    if getattr(error, "status_code", None) == 429:
+        return True
+    if type(error).__name__ == "RateLimitError":
+        return True
+    return "rate limit" in str(error).lower()
+
+
+class _TokenBucket:
+    """분당 capacity만큼 연속적으로 채워지는 token bucket"""
+
+    def __init__(self, per_minute: float):
+        self.capacity = per_minute
+        self.tokens = per_minute
+        self.rate = per_minute / 60.0
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """amount를 꺼내기까지 남은 시간 (0이면 즉시 가능)"""
+        self._refill(now)
+        # capacity보다 큰 요청은 bucket이 가득 찼을 때 통과시킨다
+        amount = min(amount, self.capacity)
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) / self.rate
+
+    def take(self, amount: float):
+        self.tokens -= amount
+
+    def refund(self, amount: float):
+        self.tokens = min(self.capacity, self.tokens + amount)
+
+
+class ModelRateLimiter:
+    """
+    모델 하나에 대한 동시 호출 / 분당 요청 / 분당 토큰 제한
+
+    sync 노드(스레드)와 async 노드(이벤트 루프)가 같은 한도를 공유하도록
+    상태는 threading.Lock으로만 보호하고, 대기는 각자 time.sleep / asyncio.sleep으로 한다.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: Optional[int] = None,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+    ):
+        self.max_concurrency = max_concurrency
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        # 429 이후 줄어든 동시 호출 한도 (None이면 제한 없음)
+        self._concurrency_limit = max_concurrency
+        self._successes = 0
+        self._cooldown_until = 0.0
+        self._backoff = BACKOFF_BASE
+        self._requests = _TokenBucket(requests_per_minute) if requests_per_minute else None
+        self._tokens = _TokenBucket(tokens_per_minute) if tokens_per_minute else None
+
+        self.stats = {"calls": 0, "rate_limited": 0, "waited_seconds": 0.0}
+
+    @property
+    def settings(self) -> Dict[str, Any]:
+        return {
+            "max_concurrency": self.max_concurrency,
+            "requests_per_minute": self.requests_per_minute,
+            "tokens_per_minute": self.tokens_per_minute,
+        }
+
+    @property
+    def concurrency_limit(self) -> Optional[int]:
+        """현재 적용 중인 동시 호출 한도 (backoff 반영)"""
+        return self._concurrency_limit
+
+    def _try_acquire(self, tokens: int) -> float:
+        """슬롯 획득 시도. 성공하면 0, 아니면 다시 시도하기까지 대기할 시간"""
+        now = time.monotonic()
+        with self._lock:
+            wait = self._cooldown_until - now
+            if self._concurrency_limit is not None and self._in_flight >= self._concurrency_limit:
+                wait = max(wait, _POLL_INTERVAL)
+            if self._requests is not None:
+                wait = max(wait, self._requests.wait_time(1, now))
+            if self._tokens is not None:
+                wait = max(wait, self._tokens.wait_time(tokens, now))
+            if wait > 0:
+                self.stats["waited_seconds"] += wait
+                return wait
+
+            self._in_flight += 1
+            if self._requests is not None:
+                self._requests.take(1)
+            if self._tokens is not None:
+                self._tokens.take(min(tokens, self._tokens.capacity))
+            self.stats["calls"] += 1
+            return 0.0
+
+    def acquire(self, tokens: int):
+        """슬롯을 얻을 때까지 블로킹 대기"""
+        while True:
+            wait = self._try_acquire(tokens)
+            if wait <= 0:
+                return
+            time.sleep(wait)
+
+    async def aacquire(self, tokens: int):
+        """슬롯을 얻을 때까지 이벤트 루프를 막지 않고 대기"""
+        while True:
+            wait = self._try_acquire(tokens)
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
+
+    def release(self, reserved_tokens: int, used_tokens: Optional[int] = None):
+        """슬롯 반환. 실제 사용 토큰이 예약보다 적으면 차이만큼 환급"""
+        with self._lock:
+            self._in_flight -= 1
+            if self._tokens is not None and used_tokens is not None:
+                reserved = min(reserved_tokens, self._tokens.capacity)
+                self._tokens.refund(max(0, reserved - used_tokens))
+
+    def record_success(self):
+        with self._lock:
+            self._backoff = BACKOFF_BASE
+            if self._concurrency_limit is None:
+                return
+            self._successes += 1
+            below_max = self.max_concurrency is None or self._concurrency_limit < self.max_concurrency
+            if self._successes >= RECOVERY_SUCCESSES and below_max:
+                self._concurrency_limit += 1
+                self._successes = 0
+
+    def record_rate_limit(self) -> float:
+        """429 발생 시 cooldown 설정 및 동시 호출 한도 절반 감소. 대기 시간 반환"""
+        with self._lock:
+            self.stats["rate_limited"] += 1
+            delay = self._backoff * (1 + random.random())
+            self._backoff = min(self._backoff * 2, BACKOFF_MAX)
+            self._cooldown_until = max(self._cooldown_until, time.monotonic() + delay)
+            limit = self._concurrency_limit if self._concurrency_limit is not None else self._in_flight
+            self._concurrency_limit = max(1, limit // 2)
+            self._successes = 0
+            return delay
+
+    @contextmanager
+    def slot(self, tokens: int) -> Iterator[Dict[str, Any]]:
+        """
+        동시 호출 슬롯 컨텍스트
+
+        yield한 dict의 "used_tokens"에 실제 사용량을 넣으면 release 시 보정한다.
+        """
+        self.acquire(tokens)
+        usage: Dict[str, Any] = {"used_tokens": None}
+        try:
+            yield usage
+        finally:
+            self.release(tokens, usage["used_tokens"])
+
+    @asynccontextmanager
+    async def aslot(self, tokens: int):
+        """slot의 비동기 버전"""
+        await self.aacquire(tokens)
+        usage: Dict[str, Any] = {"used_tokens": None}
+        try:
+            yield usage
+        finally:
+            self.release(tokens, usage["used_tokens"])
+
+
+# ============ 모델별 limiter 레지스트리 ============
+_registry_lock = threading.Lock()
+_limiters: Dict[str, ModelRateLimiter] = {}
+
+
+def get_rate_limiter(model_name: str, settings: Dict[str, Any]) -> ModelRateLimiter:
+    """
+    모델별 limiter 반환 (프로세스 전역 공유)
+
+    설정이 바뀌면 새 limiter로 교체한다. 이미 진행 중인 호출은 기존 limiter에서 반환된다.
+    """
+    settings = {
+        "max_concurrency": settings.get("max_concurrency"),
+        "requests_per_minute": settings.get("requests_per_minute"),
+        "tokens_per_minute": settings.get("tokens_per_minute"),
+    }
+    with _registry_lock:
+        limiter = _limiters.get(model_name)
+        if limiter is None or limiter.settings != settings:
+            limiter = _limiters[model_name] = ModelRateLimiter(**settings)
+        return limiter
+
+
+def get_rate_limit_stats() -> Dict[str, Dict[str, Any]]:
+    """모델별 limiter 통계 (호출 수, 429 횟수, 누적 대기 시간, 현재 동시 호출 한도)"""
+    with _registry_lock:
+        return {
+            model_name: {**limiter.stats, "concurrency_limit": limiter.concurrency_limit}
+            for model_name, limiter in _limiters.items()
+        }
+
+
+def resolve_rate_limits(configurable: Dict[str, Any], model_name: Optional[str]) -> Dict[str, Any]:
+    """config["configurable"]["rate_limits"]에서 모델 설정 선택 (없으면 "default")"""
+    rate_limits = configurable.get("rate_limits") or {}
+    return rate_limits.get(model_name) or rate_limits.get("default") or {}
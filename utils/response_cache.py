@@ -0,0 +1,354 @@
+"""
+LLM Response Cache - extractor 응답을 로컬 디스크(SQLite)에 저장/재사용
+
+키: 모델 설정 + extractor 타입 + tool 스키마 + 입력 메시지의 SHA-256 해시
+동일한 입력으로 워크플로우를 다시 실행하면 LLM 호출 없이 저장된 응답을 반환한다.
+
+모드:
+    - "off": 캐시 사용 안 함 (기본값)
+    - "readwrite": 적중 시 저장된 응답 반환, 미스 시 호출 후 저장
+    - "replay": 저장된 응답만 사용, 미스 시 ResponseCacheMissError
+
+환경 변수 (또는 configure_response_cache):
+    LLM_CACHE_MODE, LLM_CACHE_PATH, LLM_CACHE_TTL (초, 0이면 무제한),
+    LLM_CACHE_MAX_BYTES (0이면 무제한)
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Type
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.load import dumps
+from pydantic import BaseModel
+
+from utils.instrumentation import mark_cache_hit
+
+CACHE_MODES = ("off", "readwrite", "replay")
+DEFAULT_CACHE_PATH = os.path.join(".cache", "llm_responses.sqlite")
+
+
+class ResponseCacheMissError(LookupError):
+    """replay 모드에서 캐시에 없는 요청이 들어온 경우"""
+
+
+class ResponseCache:
+    """
+    SQLite 기반 응답 캐시 (TTL + 크기 기반 LRU eviction)
+
+    여러 Send fan-out 스레드에서 동시에 접근하므로 하나의 connection을 lock으로 보호한다.
+    """
+
+    def __init__(
+        self,
+        path: str = DEFAULT_CACHE_PATH,
+        mode: str = "readwrite",
+        ttl: float = 0,
+        max_bytes: int = 0,
+    ):
+        """
+        Args:
+            path: SQLite 파일 경로
+            mode: "readwrite" 또는 "replay"
+            ttl: 항목 유효 시간(초). 0이면 만료 없음
+            max_bytes: 저장 payload 총 크기 상한. 0이면 제한 없음
+        """
+        if mode not in CACHE_MODES or mode == "off":
+            raise ValueError(f"지원하지 않는 캐시 모드: {mode}. 지원 모드: 'readwrite', 'replay'")
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.path = path
+        self.mode = mode
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY,"
+            " created REAL NOT NULL,"
+            " accessed REAL NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " payload BLOB NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_accessed ON responses (accessed)")
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[Any]:
+        """저장된 응답 반환 (없거나 만료되면 None)"""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT created, payload FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None and self.ttl and row[0] + self.ttl < now:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._conn.commit()
+                row = None
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            self._conn.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+        return pickle.loads(row[1])
+
+    def put(self, key: str, value: Any):
+        """응답 저장 후 크기 상한을 넘으면 오래 사용되지 않은 항목부터 제거"""
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, created, accessed, size, payload)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (key, now, now, len(payload), payload),
+            )
+            if self.max_bytes:
+                self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for key, size in self._conn.execute(
+            "SELECT key, size FROM responses ORDER BY accessed"
+        ).fetchall():
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+    def purge_expired(self) -> int:
+        """만료된 항목 일괄 제거. 제거된 항목 수 반환"""
+        if not self.ttl:
+            return 0
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM responses WHERE created < ?", (time.time() - self.ttl,)
+            )
+            self._conn.commit()
+            return cursor.rowcount
+
+    def clear(self):
+        """모든 항목 제거"""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """캐시 통계"""
+        with self._lock:
+            count, total = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        return {
+            "mode": self.mode,
+            "entries": count,
+            "bytes": total,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+# ============ 전역 캐시 설정 ============
+_cache_lock = threading.Lock()
+_response_cache: Optional[ResponseCache] = None
+_cache_configured = False
+# enable_response_cache 블록이 켠 캐시와 그 블록 수 (겹친 블록이 모두 끝나면 끔)
+_scoped_cache: Optional[ResponseCache] = None
+_scope_count = 0
+
+
+def configure_response_cache(
+    mode: str = "readwrite",
+    path: str = DEFAULT_CACHE_PATH,
+    ttl: float = 0,
+    max_bytes: int = 0,
+) -> Optional[ResponseCache]:
+    """
+    전역 응답 캐시 설정 (환경 변수보다 우선)
+
+    Args:
+        mode: "off", "readwrite", "replay"
+        path: SQLite 파일 경로
+        ttl: 항목 유효 시간(초). 0이면 만료 없음
+        max_bytes: 저장 payload 총 크기 상한. 0이면 제한 없음
+
+    Returns:
+        설정된 ResponseCache (mode="off"면 None)
+
+    Example:
+        >>> configure_response_cache("replay")  # 저장된 응답으로만 재실행
+    """
+    with _cache_lock:
+        return _set_response_cache(mode, path, ttl, max_bytes)
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """현재 전역 응답 캐시 반환. 최초 호출 시 환경 변수로 초기화"""
+    if _cache_configured:
+        return _response_cache
+    with _cache_lock:
+        if _cache_configured:
+            return _response_cache
+        return _set_response_cache(
+            mode=os.getenv("LLM_CACHE_MODE", "off"),
+            path=os.getenv("LLM_CACHE_PATH", DEFAULT_CACHE_PATH),
+            ttl=float(os.getenv("LLM_CACHE_TTL", "0")),
+            max_bytes=int(os.getenv("LLM_CACHE_MAX_BYTES", "0")),
+        )
+
+
+@contextmanager
+def enable_response_cache(
+    mode: str = "readwrite", path: str = DEFAULT_CACHE_PATH
+) -> Iterator[Optional[ResponseCache]]:
+    """
+    전역 응답 캐시가 꺼져 있으면 블록 동안만 path의 캐시를 mode로 켬
+
+    이미 켜져 있으면(환경 변수 / configure_response_cache) 그대로 사용하고 건드리지 않는다.
+    동시에 진행 중인 실행(batch_stage1)의 블록이 겹치면 마지막 블록이 끝날 때 다시 끈다.
+        >>> with enable_response_cache():
+        ...     app.invoke(inputs, config)
+    """
+    global _scoped_cache, _scope_count
+    get_response_cache()  # 환경 변수 설정을 먼저 반영
+    with _cache_lock:
+        owned = _scope_count > 0 and _response_cache is _scoped_cache
+        if not owned and _response_cache is None:
+            _scoped_cache = _set_response_cache(mode, path, 0, 0)
+            owned = True
+        if owned:
+            _scope_count += 1
+        cache = _response_cache
+    try:
+        yield cache
+    finally:
+        if owned:
+            with _cache_lock:
+                _scope_count -= 1
+                # 블록 안에서 다른 설정으로 바뀌었으면 그 설정을 유지
+                if _scope_count == 0 and _response_cache is _scoped_cache:
+                    _set_response_cache("off", DEFAULT_CACHE_PATH, 0, 0)
+                if _scope_count == 0:
+                    _scoped_cache = None
+
+
+def _set_response_cache(
+    mode: str, path: str, ttl: float, max_bytes: int
+) -> Optional[ResponseCache]:
+    global _response_cache, _cache_configured
+    if mode not in CACHE_MODES:
+        raise ValueError(f"지원하지 않는 캐시 모드: {mode}. 지원 모드: {list(CACHE_MODES)}")
+
+    if _response_cache is not None:
+        _response_cache.close()
+    _response_cache = None if mode == "off" else ResponseCache(path, mode, ttl, max_bytes)
+    _cache_configured = True
+    return _response_cache
+
+
+# ============ Extractor Wrapper ============
+class CachedExtractor:
+    """
+    extractor.invoke 결과를 응답 캐시에 저장/재사용하는 Wrapper
+
+    create_unified_extractor가 반환하는 모든 extractor를 감싸며, 캐시가 꺼져 있으면
+    원래 extractor를 그대로 호출한다.
+    """
+
+    def __init__(
+        self,
+        extractor: Any,
+        model: BaseChatModel,
+        extractor_type: str,
+        tools: Optional[List[Type[BaseModel]]],
+        tool_choice: Optional[str],
+        **kwargs,
+    ):
+        self.extractor = extractor
+        self._fingerprint_source = (model, extractor_type, tools, tool_choice, kwargs)
+        self._fingerprint: Optional[str] = None
+
+    def __getattr__(self, name: str) -> Any:
+        # unpickle 중에는 extractor가 아직 없으므로 재귀 방지
+        if name == "extractor":
+            raise AttributeError(name)
+        return getattr(self.extractor, name)
+
+    @property
+    def fingerprint(self) -> str:
+        """모델 설정 + extractor 타입 + tool 스키마 해시 (최초 접근 시 계산)"""
+        if self._fingerprint is None:
+            model, extractor_type, tools, tool_choice, kwargs = self._fingerprint_source
+            source = {
+                "model": getattr(model, "_identifying_params", type(model).__name__),
+                "extractor_type": extractor_type,
+                "tools": [tool.model_json_schema() for tool in tools or []],
+                "tool_choice": tool_choice,
+                "kwargs": kwargs,
+            }
+            encoded = json.dumps(source, sort_keys=True, default=str, ensure_ascii=False)
+            self._fingerprint = hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+        return self._fingerprint
+
+    def cache_key(self, inputs: Any) -> str:
+        """입력 메시지를 포함한 캐시 키"""
+        digest = hashlib.sha256(self.fingerprint.encode("ascii"))
+        digest.update(dumps(inputs, sort_keys=True, ensure_ascii=False).encode("utf-8"))
+        return digest.hexdigest()
+
+    def invoke(self, inputs: Any, *args, **kwargs) -> Any:
+        cache = get_response_cache()
+        if cache is None:
+            return self.extractor.invoke(inputs, *args, **kwargs)
+
+        key, cached = self._lookup(cache, inputs)
+        if cached is not None:
+            mark_cache_hit()
+            return cached
+
+        response = self.extractor.invoke(inputs, *args, **kwargs)
+        cache.put(key, response)
+        return response
+
+    async def ainvoke(self, inputs: Any, *args, **kwargs) -> Any:
+        cache = get_response_cache()
+        if cache is None:
+            return await self.extractor.ainvoke(inputs, *args, **kwargs)
+
+        key, cached = self._lookup(cache, inputs)
+        if cached is not None:
+            mark_cache_hit()
+            return cached
+
+        response = await self.extractor.ainvoke(inputs, *args, **kwargs)
+        cache.put(key, response)
+        return response
+
+    def _lookup(self, cache: ResponseCache, inputs: Any) -> Tuple[str, Optional[Any]]:
+        """캐시 조회. replay 모드에서 미스면 ResponseCacheMissError"""
+        key = self.cache_key(inputs)
+        cached = cache.get(key)
+        if cached is None and cache.mode == "replay":
+            raise ResponseCacheMissError(f"replay 모드에서 캐시 미스: {key}")
+        return key, cached
@@ -0,0 +1,129 @@
+"""
+Role Similarity - PlaceHolder 역할명의 로컬 유사도 인덱스 (LLM 호출 없음)
+
+역할명을 괄호/공백 제거 후 문자 n-gram 집합으로 바꾸고, n-gram → id 역색인으로
+공통 n-gram이 있는 후보끼리만 Jaccard 유사도를 계산한다.
+    >>> index = RoleSimilarityIndex()
+    >>> index.add("placeholder_1", "(엄격한 아버지)")
+    >>> index.add("placeholder_2", "(엄격한 아버지상)")
+    >>> index.clusters(threshold=0.5)
+    [['placeholder_1', 'placeholder_2']]
+"""
+
+import re
+from collections import defaultdict
+from typing import Dict, FrozenSet, Iterator, List, Tuple
+
+_STRIP_PATTERN = re.compile(r"[\s()\[\]]+")
+
+
+def normalize_role(role: str) -> str:
+    """비교용 역할명 정규화 (괄호 / 공백 제거)"""
+    return _STRIP_PATTERN.sub("", role or "")
+
+
+def char_ngrams(text: str, n: int = 2) -> FrozenSet[str]:
+    """문자 n-gram 집합 (n보다 짧으면 문자열 자체)"""
+    if len(text) <= n:
+        return frozenset([text]) if text else frozenset()
+    return frozenset(text[i : i + n] for i in range(len(text) - n + 1))
+
+
+class RoleSimilarityIndex:
+    """문자 n-gram 역색인 기반 역할명 유사도 인덱스"""
+
+    def __init__(self, n: int = 2):
+        self.n = n
+        self._grams: Dict[str, FrozenSet[str]] = {}
+        self._order: Dict[str, int] = {}
+        self._postings: Dict[str, List[str]] = defaultdict(list)
+
+    def __len__(self) -> int:
+        return len(self._grams)
+
+    def __contains__(self, item_id: str) -> bool:
+        return item_id in self._grams
+
+    def ids(self) -> List[str]:
+        """추가된 순서의 id 목록"""
+        return list(self._grams)
+
+    def order(self, item_id: str) -> int:
+        """id가 추가된 순서"""
+        return self._order[item_id]
+
+    def add(self, item_id: str, role: str):
+        """항목 추가 (같은 id는 한 번만 추가 가능)"""
+        if item_id in self._grams:
+            raise ValueError(f"이미 인덱스에 있는 id: {item_id}")
+        grams = char_ngrams(normalize_role(role), self.n)
+        self._order[item_id] = len(self._grams)
+        self._grams[item_id] = grams
+        for gram in grams:
+            self._postings[gram].append(item_id)
+
+    def similarity(self, a: str, b: str) -> float:
+        """두 항목의 n-gram Jaccard 유사도"""
+        grams_a, grams_b = self._grams[a], self._grams[b]
+        if not grams_a or not grams_b:
+            return 0.0
+        overlap = len(grams_a & grams_b)
+        return overlap / (len(grams_a) + len(grams_b) - overlap)
+
+    def similar_pairs(self, threshold: float) -> Iterator[Tuple[str, str, float]]:
+        """유사도가 threshold 이상인 (a, b, score) 쌍 (a가 먼저 추가된 항목)"""
+        order = self._order
+        for item_id, grams in self._grams.items():
+            # 공통 n-gram 개수를 역색인으로 한 번에 집계
+            overlaps: Dict[str, int] = defaultdict(int)
+            for gram in grams:
+                for other in self._postings[gram]:
+                    if order[other] > order[item_id]:
+                        overlaps[other] += 1
+            for other, overlap in overlaps.items():
+                score = overlap / (len(grams) + len(self._grams[other]) - overlap)
+                if score >= threshold:
+                    yield item_id, other, score
+
+    def clusters(self, threshold: float) -> List[List[str]]:
+        """유사 쌍을 연결 요소로 묶은 클러스터 (단독 항목 포함, 추가 순서 유지)"""
+        parent = {item_id: item_id for item_id in self._grams}
+
+        def find(item_id: str) -> str:
+            while parent[item_id] != item_id:
+                parent[item_id] = parent[parent[item_id]]
+                item_id = parent[item_id]
+            return item_id
+
+        for a, b, _ in self.similar_pairs(threshold):
+            root_a, root_b = find(a), find(b)
+            if root_a != root_b:
+                parent[root_b] = root_a
+
+        groups: Dict[str, List[str]] = {}
+        for item_id in self._grams:
+            groups.setdefault(find(item_id), []).append(item_id)
+        return list(groups.values())
+
+
+def pack_shards(clusters: List[List[str]], shard_size: int) -> List[List[str]]:
+    """
+    클러스터를 깨지 않고 shard_size 이하의 shard로 순서대로 채움
+
+    shard_size보다 큰 클러스터만 shard_size 단위로 나눈다.
+    """
+    if shard_size < 1:
+        raise ValueError(f"shard_size는 1 이상이어야 합니다: {shard_size}")
+
+    shards: List[List[str]] = []
+    current: List[str] = []
+    for cluster in clusters:
+        for start in range(0, len(cluster), shard_size):
+            part = cluster[start : start + shard_size]
+            if current and len(current) + len(part) > shard_size:
+                shards.append(current)
+                current = []
+            current.extend(part)
+    if current:
+        shards.append(current)
+    return shards
@@ -7,7 +7,7 @@ from typing import Any, Dict, Optional
 
 from flask import Flask, jsonify, render_template, request
 
-from character_network import CharacterNetwork, Node, NodeType
+from character_network import BINARY_SNAPSHOT_EXTENSION, CharacterNetwork, NodeType
 
 
 class WebStoryGraphVisualizer:
@@ -29,29 +29,19 @@ class WebStoryGraphVisualizer:
         self.setup_routes()
 
     def load_graph_from_file(self, filename: str) -> CharacterNetwork:
-        """저장된 JSON 파일에서 CharacterNetwork 로드"""
-        with open(filename, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        # CharacterNetwork 인스턴스 생성
-        graph = CharacterNetwork(data["topic"])
-
-        # 노드 복원
-        for node_id, node_data in data["nodes"].items():
-            # Node 객체로 변환
-            node = Node(
-                id=node_data["id"],
-                type=NodeType(node_data["type"]),  # str -> Enum
-                data=node_data["data"],
-            )
-            # edges는 set으로 변환
-            node.edges = set(node_data["edges"])
-            graph.nodes[node_id] = node
-
-        return graph
+        """저장된 JSON 파일에서 CharacterNetwork 로드 (인덱스 포함)"""
+        return CharacterNetwork.load_from_file(filename)
 
     def load_file_metadata(self, filename: str) -> Dict[str, Any]:
         """파일 메타데이터 로드"""
+        if filename.endswith(BINARY_SNAPSHOT_EXTENSION):
+            header = CharacterNetwork.read_snapshot_header(filename)
+            return {
+                "topic": header.get("topic", "Unknown"),
+                "filename": os.path.basename(filename),
+                "node_count": header.get("node_count", 0),
+            }
+
         with open(filename, "r", encoding="utf-8") as f:
             data = json.load(f)
         return {
@@ -75,6 +65,21 @@ class WebStoryGraphVisualizer:
                 return jsonify([])
 
             files = []
+            for filename in glob.glob(f"{saved_dir}/*{BINARY_SNAPSHOT_EXTENSION}"):
+                try:
+                    header = CharacterNetwork.read_snapshot_header(filename)
+                    files.append(
+                        {
+                            "filename": os.path.basename(filename),
+                            "path": filename,
+                            "topic": header.get("topic", "Unknown"),
+                            "node_count": header.get("node_count", 0),
+                            "node_counter": header.get("_node_counter", {}),
+                        }
+                    )
+                except Exception as e:
+                    print(f"Error reading {filename}: {e}")
+
             for filename in glob.glob(f"{saved_dir}/*.json"):
                 try:
                     with open(filename, "r", encoding="utf-8") as f:
@@ -2,13 +2,12 @@
 저장된 그래프 파일을 불러와서 플롯 생성 부분만 실험하기 위한 워크플로우
 """
 
-import json
 from typing import Optional
 
 from langgraph.graph import END, START, StateGraph
 from pydantic import Field
 
-from character_network import CharacterNetwork, Node, NodeType
+from character_network import CharacterNetwork
 # from nodes.stage1_nodes import create_plot_candidates_node
 from states.stage1_states import InputState, WorkflowState
 
@@ -41,25 +40,8 @@ def initialize_from_file(state: PlotInputState) -> WorkflowState:
 
 # ============ 유틸리티 함수 ============
 def load_graph_from_file(filename: str) -> CharacterNetwork:
-    """저장된 JSON 파일에서 CharacterNetwork 로드"""
-    with open(filename, "r", encoding="utf-8") as f:
-        data = json.load(f)
-
-    graph = CharacterNetwork(data["topic"])
-
-    if "_node_id" in data:
-        graph._node_id = data["_node_id"]
-
-    for node_id, node_data in data["nodes"].items():
-        node = Node(
-            id=node_data["id"],
-            type=NodeType(node_data["type"]),
-            data=node_data["data"],
-        )
-        node.edges = set(node_data["edges"])
-        graph.nodes[node_id] = node
-
-    return graph
+    """저장된 JSON 파일에서 CharacterNetwork 로드 (인덱스 포함)"""
+    return CharacterNetwork.load_from_file(filename)
 
 
 # ============ 워크플로우 노드 함수들 ============
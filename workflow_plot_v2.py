@@ -2,6 +2,7 @@
 플롯 생성 v2 워크플로우
 새로운 플롯 생성 프롬프트를 사용하여 단계별로 플롯을 구성
 TypedDict 기반으로 workflow_stage1.py와 일관성 유지
+invoke / ainvoke / astream 모두 지원 (ainvoke 시 서브그래프와 LLM 노드도 비동기로 실행)
 """
 import os
 from typing import Any, Dict
@@ -14,8 +15,15 @@ from nodes.stage1_inciting_macro import build_inciting_macro_graph
 from nodes.stage1_structural_tempo import build_structural_tempo_graph
 from nodes.stage1_integrated_plot import build_integrated_plot_graph
 from states.stage1_plot_states import PlotInputState, PlotWorkflowState
-from nodes.stage1_nodes import save_plot_to_file
-from character_network import CharacterNetwork
+from nodes.stage1_nodes import (
+    build_character_conflict_analysis,
+    build_main_characters_summary,
+    load_theme_list,
+    save_plot_to_file,
+)
+from character_network import BINARY_SNAPSHOT_EXTENSION, CharacterNetwork
+from utils.llm_call import sync_async_node
+from utils.progress import emit_progress, progress_enabled, progress_node
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
@@ -46,7 +54,10 @@ def initialize_and_load_graph(state: PlotInputState) -> Dict[str, Any]:
         else:
             saved_graphs_dir = os.path.join(BASE_DIR, "saved_graphs")
             if os.path.exists(saved_graphs_dir):
-                available_files = [f for f in os.listdir(saved_graphs_dir) if f.endswith('.json')]
+                available_files = [
+                    f for f in os.listdir(saved_graphs_dir)
+                    if f.endswith(('.json', BINARY_SNAPSHOT_EXTENSION))
+                ]
                 error_msg = f"그래프 파일을 찾을 수 없습니다: {filepath}\n\n사용 가능한 파일 목록:\n"
                 error_msg += "\n".join(f"  - {f}" for f in available_files[:10])
                 if len(available_files) > 10:
@@ -55,24 +66,30 @@ def initialize_and_load_graph(state: PlotInputState) -> Dict[str, Any]:
                 error_msg = f"그래프 파일을 찾을 수 없습니다: {filepath}\nsaved_graphs 디렉토리도 존재하지 않습니다."
             raise FileNotFoundError(error_msg)
     
-    print(f"\n{'='*60}")
-    print(f"그래프 로딩 중...")
-    print(f"파일 경로: {filepath}")
-    print(f"{'='*60}\n")
+    # stream_progress가 켜져 있으면 print 대신 graph_loaded 이벤트로 전달
+    streaming = progress_enabled()
+    if not streaming:
+        print(f"\n{'='*60}")
+        print(f"그래프 로딩 중...")
+        print(f"파일 경로: {filepath}")
+        print(f"{'='*60}\n")
     
     # 3. 파일 경로로 객체를 로드합니다.
     try:
         graph_object = CharacterNetwork.load_from_file(filepath)
+    except Exception as e:
+        raise ValueError(f"그래프 파일 로드 중 오류 발생: {filepath}\n오류 내용: {str(e)}")
+    stats = graph_object.get_statistics()
+    if streaming:
+        emit_progress("graph_loaded", path=filepath, topic=graph_object.topic, stats=stats)
+    else:
         print(f"✓ 그래프 로드 성공!")
         print(f"  - Topic: {graph_object.topic}")
-        stats = graph_object.get_statistics()
         print(f"  - 총 노드: {stats['total_nodes']}개")
         print(f"  - Characters: {stats['characters']}개")
         print(f"  - Events: {stats['events']}개")
         print(f"  - Infos: {stats['infos']}개")
         print(f"  - PlaceHolders: {stats['placeholders']}개\n")
-    except Exception as e:
-        raise ValueError(f"그래프 파일 로드 중 오류 발생: {filepath}\n오류 내용: {str(e)}")
 
     # TypedDict로 반환
     return {
@@ -85,78 +102,124 @@ def initialize_and_load_graph(state: PlotInputState) -> Dict[str, Any]:
     }
 
 # ============ 워크플로우 노드 함수들 ============
+# 서브그래프별 입력 키 (sync / async 래퍼 공통) - 각 단계는 실제로 사용하는 이전 결과만 받는다
+BASE_INPUT_KEYS = ("topic", "conflict", "vibe", "model", "extractor_type")
+NARRATIVE_POLES_INPUT_KEYS = BASE_INPUT_KEYS + ("graph",)
+SUB_THEMES_INPUT_KEYS = BASE_INPUT_KEYS + (
+    "graph",
+    "main_characters_summary",
+    "theme_list",
+    "narrative_poles",
+)
+INCITING_MACRO_INPUT_KEYS = BASE_INPUT_KEYS + (
+    "graph",
+    "character_conflict_analysis",
+    "narrative_poles",
+    "sub_themes",
+)
+STRUCTURAL_TEMPO_INPUT_KEYS = BASE_INPUT_KEYS + (
+    "narrative_poles",
+    "sub_themes",
+    "inciting_and_macro",
+)
+INTEGRATED_PLOT_INPUT_KEYS = STRUCTURAL_TEMPO_INPUT_KEYS + ("structural_tempo",)
+
+
+def _subgraph_input(state: PlotWorkflowState, keys) -> Dict[str, Any]:
+    return {key: state[key] for key in keys}
+
+
+def _subgraph_output(result: Dict[str, Any], key: str) -> Dict[str, Any]:
+    # 병렬 분기와 같은 키를 동시에 쓰지 않도록 단계 결과만 반환
+    return {key: result[key]}
+
+
+def prepare_theme_context(state: PlotWorkflowState) -> Dict[str, Any]:
+    """Sub-theme 선정용 context 준비 (서사적 양극 분석과 병렬 실행)"""
+    return {
+        "main_characters_summary": build_main_characters_summary(state["graph"]),
+        "theme_list": load_theme_list(),
+    }
+
+
+def prepare_conflict_analysis(state: PlotWorkflowState) -> Dict[str, Any]:
+    """기폭사건 생성용 Event / PlaceHolder 갈등 분석 준비 (서사적 양극 분석과 병렬 실행)"""
+    return {"character_conflict_analysis": build_character_conflict_analysis(state["graph"])}
+
+
 def run_narrative_poles(state: PlotWorkflowState) -> Dict[str, Any]:
     """서사적 양극 분석 서브그래프 실행"""
-    subgraph_input = {
-        "graph": state["graph"],
-        "topic": state["topic"],
-        "conflict": state["conflict"],
-        "vibe": state["vibe"],
-        "model": state["model"],
-        "extractor_type": state["extractor_type"]
-    }
-    return narrative_poles_subgraph.invoke(subgraph_input)
+    result = narrative_poles_subgraph.invoke(_subgraph_input(state, NARRATIVE_POLES_INPUT_KEYS))
+    return _subgraph_output(result, "narrative_poles")
+
+
+async def arun_narrative_poles(state: PlotWorkflowState) -> Dict[str, Any]:
+    """run_narrative_poles의 비동기 버전"""
+    result = await narrative_poles_subgraph.ainvoke(
+        _subgraph_input(state, NARRATIVE_POLES_INPUT_KEYS)
+    )
+    return _subgraph_output(result, "narrative_poles")
 
 
 def run_sub_themes(state: PlotWorkflowState) -> Dict[str, Any]:
     """Sub-theme 선정 서브그래프 실행"""
-    subgraph_input = {
-        "topic": state["topic"],
-        "conflict": state["conflict"],
-        "vibe": state["vibe"],
-        "narrative_poles": state["narrative_poles"],
-        "graph": state["graph"],
-        "model": state["model"],
-        "extractor_type": state["extractor_type"]
-    }
-    return sub_themes_subgraph.invoke(subgraph_input)
+    result = sub_themes_subgraph.invoke(_subgraph_input(state, SUB_THEMES_INPUT_KEYS))
+    return _subgraph_output(result, "sub_themes")
+
+
+async def arun_sub_themes(state: PlotWorkflowState) -> Dict[str, Any]:
+    """run_sub_themes의 비동기 버전"""
+    result = await sub_themes_subgraph.ainvoke(_subgraph_input(state, SUB_THEMES_INPUT_KEYS))
+    return _subgraph_output(result, "sub_themes")
 
 
 def run_inciting_macro(state: PlotWorkflowState) -> Dict[str, Any]:
     """기폭사건 및 Macro Cliffhanger 서브그래프 실행"""
-    subgraph_input = {
-        "topic": state["topic"],
-        "conflict": state["conflict"],
-        "vibe": state["vibe"],
-        "narrative_poles": state["narrative_poles"],
-        "graph": state["graph"],
-        "model": state["model"],
-        "extractor_type": state["extractor_type"]
-    }
-    return inciting_macro_subgraph.invoke(subgraph_input)
+    result = inciting_macro_subgraph.invoke(_subgraph_input(state, INCITING_MACRO_INPUT_KEYS))
+    return _subgraph_output(result, "inciting_and_macro")
+
+
+async def arun_inciting_macro(state: PlotWorkflowState) -> Dict[str, Any]:
+    """run_inciting_macro의 비동기 버전"""
+    result = await inciting_macro_subgraph.ainvoke(
+        _subgraph_input(state, INCITING_MACRO_INPUT_KEYS)
+    )
+    return _subgraph_output(result, "inciting_and_macro")
 
 
 def run_structural_tempo(state: PlotWorkflowState) -> Dict[str, Any]:
     """구조적 템포 서브그래프 실행"""
-    subgraph_input = {
-        "topic": state["topic"],
-        "conflict": state["conflict"],
-        "vibe": state["vibe"],
-        "narrative_poles": state["narrative_poles"],
-        "graph": state["graph"],
-        "model": state["model"],
-        "extractor_type": state["extractor_type"]
-    }
-    return structural_tempo_subgraph.invoke(subgraph_input)
+    result = structural_tempo_subgraph.invoke(_subgraph_input(state, STRUCTURAL_TEMPO_INPUT_KEYS))
+    return _subgraph_output(result, "structural_tempo")
+
+
+async def arun_structural_tempo(state: PlotWorkflowState) -> Dict[str, Any]:
+    """run_structural_tempo의 비동기 버전"""
+    result = await structural_tempo_subgraph.ainvoke(
+        _subgraph_input(state, STRUCTURAL_TEMPO_INPUT_KEYS)
+    )
+    return _subgraph_output(result, "structural_tempo")
 
 
 def run_integrated_plot(state: PlotWorkflowState) -> Dict[str, Any]:
     """통합 플롯 서브그래프 실행"""
-    subgraph_input = {
-        "topic": state["topic"],
-        "conflict": state["conflict"],
-        "vibe": state["vibe"],
-        "narrative_poles": state["narrative_poles"],
-        "graph": state["graph"],
-        "model": state["model"],
-        "extractor_type": state["extractor_type"]
-    }
-    return integrated_plot_subgraph.invoke(subgraph_input)
+    result = integrated_plot_subgraph.invoke(_subgraph_input(state, INTEGRATED_PLOT_INPUT_KEYS))
+    return _subgraph_output(result, "integrated_plot")
+
+
+async def arun_integrated_plot(state: PlotWorkflowState) -> Dict[str, Any]:
+    """run_integrated_plot의 비동기 버전"""
+    result = await integrated_plot_subgraph.ainvoke(
+        _subgraph_input(state, INTEGRATED_PLOT_INPUT_KEYS)
+    )
+    return _subgraph_output(result, "integrated_plot")
 
 
 def print_progress(stage: str):
     """진행 상황 출력 함수"""
     def progress_node(state: PlotWorkflowState) -> Dict[str, Any]:
+        if emit_progress("stage_done", stage=stage):
+            return {}
         print(f"\n{'='*50}")
         print(f">>> {stage} 완료")
         print(f"{'='*50}")
@@ -191,23 +254,36 @@ def print_progress(stage: str):
 
 # ============ 메인 워크플로우 구성 ============
 def build_plot_workflow() -> StateGraph:
-    """플롯 v2 워크플로우 구성"""
+    """
+    플롯 v2 워크플로우 구성 (의존성 DAG)
+
+    LLM 단계는 앞 단계 결과를 프롬프트에 쓰므로 순서대로 실행되고,
+    이전 결과와 무관한 context 준비는 서사적 양극 분석과 병렬로 실행된다.
+
+        initialize_and_load ─┬─ analyze_poles ─────────┬─ select_themes ─┬─ create_inciting ─ design_tempo ─ generate_plot ─ save_plot
+                             ├─ prepare_theme_context ─┘                 │
+                             └─ prepare_conflict_analysis ───────────────┘
+    """
     workflow = StateGraph(PlotWorkflowState, input_schema=PlotInputState)
 
     # 노드 추가
-    workflow.add_node("initialize_and_load", initialize_and_load_graph)
-    workflow.add_node("analyze_poles", run_narrative_poles)
-    workflow.add_node("select_themes", run_sub_themes)
-    workflow.add_node("create_inciting", run_inciting_macro)
-    workflow.add_node("design_tempo", run_structural_tempo)
-    workflow.add_node("generate_plot", run_integrated_plot)
-    workflow.add_node("save_plot", save_plot_to_file)
-
-    # 엣지 추가 (순차 실행)
+    workflow.add_node("initialize_and_load", progress_node(initialize_and_load_graph))
+    workflow.add_node("prepare_theme_context", progress_node(prepare_theme_context))
+    workflow.add_node("prepare_conflict_analysis", progress_node(prepare_conflict_analysis))
+    workflow.add_node("analyze_poles", sync_async_node(run_narrative_poles, arun_narrative_poles))
+    workflow.add_node("select_themes", sync_async_node(run_sub_themes, arun_sub_themes))
+    workflow.add_node("create_inciting", sync_async_node(run_inciting_macro, arun_inciting_macro))
+    workflow.add_node("design_tempo", sync_async_node(run_structural_tempo, arun_structural_tempo))
+    workflow.add_node("generate_plot", sync_async_node(run_integrated_plot, arun_integrated_plot))
+    workflow.add_node("save_plot", progress_node(save_plot_to_file))
+
+    # 엣지 추가 (list 소스는 모든 선행 노드가 끝난 뒤 실행)
     workflow.add_edge(START, "initialize_and_load")
     workflow.add_edge("initialize_and_load", "analyze_poles")
-    workflow.add_edge("analyze_poles", "select_themes")
-    workflow.add_edge("select_themes", "create_inciting")
+    workflow.add_edge("initialize_and_load", "prepare_theme_context")
+    workflow.add_edge("initialize_and_load", "prepare_conflict_analysis")
+    workflow.add_edge(["analyze_poles", "prepare_theme_context"], "select_themes")
+    workflow.add_edge(["select_themes", "prepare_conflict_analysis"], "create_inciting")
     workflow.add_edge("create_inciting", "design_tempo")
     workflow.add_edge("design_tempo", "generate_plot")
     workflow.add_edge("generate_plot", "save_plot")
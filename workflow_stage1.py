@@ -1,9 +1,19 @@
 """
 메인 LangGraph 워크플로우 구현
+invoke / ainvoke / astream 모두 지원 (ainvoke 시 서브그래프와 LLM 노드도 비동기로 실행)
+
+재개 모드: build_resumable_workflow / run_workflow는 로컬 SQLite checkpointer로
+thread_id별 진행 상태를 저장하고, 중단된 실행을 마지막으로 완료된 노드부터 이어서 실행한다.
+    >>> run_workflow({"topic": ..., "conflict": ..., "vibe": ...}, thread_id="run-1")
+
+여러 주제를 한 프로세스에서 동시에 실행하려면 batch_stage1.py 참고.
 """
 
-from typing import Any, Dict
+from contextlib import nullcontext
+from typing import Any, Dict, Optional
 
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.graph import END, START, StateGraph
 
 from character_network import CharacterNetwork
@@ -14,7 +24,7 @@ from nodes import (
     build_placeholder_replace_subgraph,
 )
 # from nodes.stage1_nodes import create_plot_candidates_node, define_main_character_roles
-from nodes.stage1_nodes import define_main_character_roles
+from nodes.stage1_nodes import adefine_main_character_roles, define_main_character_roles
 from states.stage1_states import (
     CharacterCreationState,
     ConsolidationState,
@@ -23,6 +33,11 @@ from states.stage1_states import (
     PlaceHolderReplaceState,
     WorkflowState,
 )
+from utils.checkpointer import create_checkpointer
+from utils.instrumentation import EXPORT_FORMATS, record_run
+from utils.llm_call import sync_async_node
+from utils.progress import emit_progress, progress_node
+from utils.response_cache import enable_response_cache
 
 
 # ============ 워크플로우 초기화 ============
@@ -64,18 +79,33 @@ def run_character_subgraph(state: CharacterCreationState) -> Dict[str, Any]:
     return result
 
 
+async def arun_character_subgraph(state: CharacterCreationState) -> Dict[str, Any]:
+    """캐릭터 서브그래프 비동기 실행"""
+    return await character_subgraph.ainvoke(state)
+
+
 def run_event_subgraph(state: EventCreationState) -> Dict[str, Any]:
     """이벤트 서브그래프 실행"""
     result = event_subgraph.invoke(state)
     return result
 
 
+async def arun_event_subgraph(state: EventCreationState) -> Dict[str, Any]:
+    """이벤트 서브그래프 비동기 실행"""
+    return await event_subgraph.ainvoke(state)
+
+
 def run_consolidation_subgraph(state: ConsolidationState) -> Dict[str, Any]:
     """Consolidation 서브그래프 실행"""
     result = consolidation_subgraph.invoke(state)
     return result
 
 
+async def arun_consolidation_subgraph(state: ConsolidationState) -> Dict[str, Any]:
+    """Consolidation 서브그래프 비동기 실행"""
+    return await consolidation_subgraph.ainvoke(state)
+
+
 def run_placeholder_replace_subgraph(
     state: PlaceHolderReplaceState,
 ) -> Dict[str, Any]:
@@ -84,6 +114,13 @@ def run_placeholder_replace_subgraph(
     return result
 
 
+async def arun_placeholder_replace_subgraph(
+    state: PlaceHolderReplaceState,
+) -> Dict[str, Any]:
+    """PlaceHolder 분석 및 처리 서브그래프 비동기 실행"""
+    return await placeholder_replace_subgraph.ainvoke(state)
+
+
 # ============ 워크플로우 노드 래퍼 함수들 ============
 def increment_iteration(state: WorkflowState) -> WorkflowState:
     """반복 카운터 증가"""
@@ -97,6 +134,14 @@ def finalize_workflow(state: WorkflowState) -> WorkflowState:
     """워크플로우 종료 처리"""
     # 통계 출력
     stats = state["graph"].get_statistics()
+    if emit_progress(
+        "workflow_finished",
+        topic=state["topic"],
+        stats=stats,
+        plot_points=len(state["plots"].plot_points) if state.get("plots") else 0,
+        failed_branches=state.get("failed_branches") or [],
+    ):
+        return state
     print("\n=== 워크플로우 완료 ===")
     print(f"주제: {state['topic']}")
     print(f"총 노드: {stats['total_nodes']}")
@@ -109,27 +154,148 @@ def finalize_workflow(state: WorkflowState) -> WorkflowState:
     if state.get("plots"):
         print(f"\n생성된 플롯 포인트: {len(state['plots'].plot_points)}개")
 
+    if state.get("failed_branches"):
+        print(f"\n건너뛴 분기: {len(state['failed_branches'])}개")
+        for record in state["failed_branches"]:
+            print(f"- {record['node']} {record['branch']}: {record['error']}")
+
     return state
 
 
 # ============ 메인 워크플로우 구성 ============
 def build_workflow() -> StateGraph:
     """메인 워크플로우 구성"""
+    return _build_graph().compile()
+
+
+def build_resumable_workflow(checkpointer: Optional[BaseCheckpointSaver] = None):
+    """
+    checkpointer를 붙인 메인 워크플로우 (실행 시 config["configurable"]["thread_id"] 필요)
+
+    checkpointer가 없으면 create_checkpointer()의 로컬 SQLite 파일을 사용한다.
+    재개하면 완료된 superstep은 건너뛰지만, 중단된 superstep(fan-out 단계의 Send 작업 포함)은 처음부터 다시 실행한다.
+    그 안에서 이미 끝난 LLM 호출은 응답 캐시가 켜져 있을 때만 재생된다 (run_workflow의 cache_responses 참고).
+    """
+    return _build_graph().compile(checkpointer=checkpointer or create_checkpointer())
+
+
+def run_workflow(
+    inputs: Dict[str, Any],
+    thread_id: str,
+    checkpointer: Optional[BaseCheckpointSaver] = None,
+    config: Optional[RunnableConfig] = None,
+    cache_responses: bool = False,
+    metrics_dir: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    thread_id의 저장된 진행 상태에 따라 새로 실행 / 이어서 실행 / 완료된 결과 반환
+
+    서브그래프 안의 fan-out 단계에서 중단되면 LangGraph는 그 단계의 Send 작업을 모두 다시 실행한다.
+    cache_responses면 응답 캐시가 꺼져 있을 때 실행 동안만 readwrite로 켜서, 이미 끝난 작업은 LLM 호출 없이 재생한다
+    (반환 시 원래대로 끔, utils.response_cache.enable_response_cache).
+    캐시 키에는 thread_id가 없으므로 같은 입력으로 새로 실행해도 이전 응답이 재생된다. 기본값은 끔.
+
+    Args:
+        inputs: InputState 필드 (새로 실행할 때만 사용)
+        thread_id: 실행 식별자. 같은 값으로 다시 호출하면 중단된 지점부터 재개
+        checkpointer: 저장소 (없으면 create_checkpointer())
+        config: 추가 config (configurable 옵션 등)
+        cache_responses: 응답 캐시가 꺼져 있으면 실행 동안 readwrite 모드로 켤지 여부 (재개 전용)
+        metrics_dir: 지정하면 LLM 호출 토큰 / 지연 시간 요약을 {thread_id}-*.json / .prom으로 저장
+            (python -m utils.instrumentation metrics_dir 로 비용 상위 노드 조회)
+    """
+    with enable_response_cache() if cache_responses else nullcontext():
+        return _run_workflow(inputs, thread_id, checkpointer, config, metrics_dir)
+
+
+def _run_workflow(
+    inputs: Dict[str, Any],
+    thread_id: str,
+    checkpointer: Optional[BaseCheckpointSaver],
+    config: Optional[RunnableConfig],
+    metrics_dir: Optional[str],
+) -> Dict[str, Any]:
+    app = build_resumable_workflow(checkpointer)
+    config = dict(config or {})
+    config["configurable"] = {**config.get("configurable", {}), "thread_id": thread_id}
+
+    snapshot = app.get_state(config)
+    if snapshot.values and not snapshot.next:
+        print(f"[{thread_id}] 이미 완료된 실행")
+        return snapshot.values
+
+    with record_run(thread_id, metrics_dir, formats=EXPORT_FORMATS):
+        if snapshot.next:
+            print(f"[{thread_id}] 중단된 실행 재개: {', '.join(snapshot.next)}")
+            return app.invoke(None, config)
+        return app.invoke(inputs, config)
+
+
+async def arun_workflow(
+    inputs: Dict[str, Any],
+    thread_id: str,
+    checkpointer: Optional[BaseCheckpointSaver] = None,
+    config: Optional[RunnableConfig] = None,
+    cache_responses: bool = False,
+    metrics_dir: Optional[str] = None,
+) -> Dict[str, Any]:
+    """run_workflow의 비동기 버전 (ainvoke 사용, 같은 checkpointer로 여러 실행을 동시에 진행 가능)"""
+    with enable_response_cache() if cache_responses else nullcontext():
+        return await _arun_workflow(inputs, thread_id, checkpointer, config, metrics_dir)
+
+
+async def _arun_workflow(
+    inputs: Dict[str, Any],
+    thread_id: str,
+    checkpointer: Optional[BaseCheckpointSaver],
+    config: Optional[RunnableConfig],
+    metrics_dir: Optional[str],
+) -> Dict[str, Any]:
+    app = build_resumable_workflow(checkpointer)
+    config = dict(config or {})
+    config["configurable"] = {**config.get("configurable", {}), "thread_id": thread_id}
+
+    snapshot = await app.aget_state(config)
+    if snapshot.values and not snapshot.next:
+        print(f"[{thread_id}] 이미 완료된 실행")
+        return snapshot.values
+
+    with record_run(thread_id, metrics_dir, formats=EXPORT_FORMATS):
+        if snapshot.next:
+            print(f"[{thread_id}] 중단된 실행 재개: {', '.join(snapshot.next)}")
+            return await app.ainvoke(None, config)
+        return await app.ainvoke(inputs, config)
+
+
+def _build_graph() -> StateGraph:
+    """메인 워크플로우 StateGraph (compile 전)"""
     configs = {"configurable": {"max_retries": 10}}
     workflow = StateGraph(WorkflowState, input_schema=InputState, config=configs)
 
     # 노드 추가
-    workflow.add_node("initialize", initialize_workflow)
-    workflow.add_node("define_roles", define_main_character_roles)
-    workflow.add_node("run_character_subgraph", run_character_subgraph)
-    workflow.add_node("run_event_subgraph", run_event_subgraph)
-    workflow.add_node("run_consolidation_subgraph", run_consolidation_subgraph)
+    workflow.add_node("initialize", progress_node(initialize_workflow))
+    workflow.add_node(
+        "define_roles",
+        sync_async_node(define_main_character_roles, adefine_main_character_roles),
+    )
+    workflow.add_node(
+        "run_character_subgraph",
+        sync_async_node(run_character_subgraph, arun_character_subgraph),
+    )
+    workflow.add_node(
+        "run_event_subgraph", sync_async_node(run_event_subgraph, arun_event_subgraph)
+    )
+    workflow.add_node(
+        "run_consolidation_subgraph",
+        sync_async_node(run_consolidation_subgraph, arun_consolidation_subgraph),
+    )
     workflow.add_node(
-        "run_placeholder_replace_subgraph", run_placeholder_replace_subgraph
+        "run_placeholder_replace_subgraph",
+        sync_async_node(run_placeholder_replace_subgraph, arun_placeholder_replace_subgraph),
     )
-    workflow.add_node("increment_iteration", increment_iteration)
-    workflow.add_node("finalize", finalize_workflow)
-    # workflow.add_node("create_plot_candidates", create_plot_candidates_node)
+    workflow.add_node("increment_iteration", progress_node(increment_iteration))
+    workflow.add_node("finalize", progress_node(finalize_workflow))
+    # workflow.add_node("create_plot_candidates", progress_node(create_plot_candidates_node))
     # candidate 어차피 안씀
 
     # 엣지 구성
@@ -171,4 +337,4 @@ def build_workflow() -> StateGraph:
     # workflow.add_edge("create_plot", "finalize")
     workflow.add_edge("finalize", END)
 
-    return workflow.compile()
+    return workflow